@@ -0,0 +1,56 @@
+"""add execution aggregates
+
+Materialized per-pipeline/day/status totals for the dashboard. After
+upgrading, backfill once with the ``rebuild_execution_aggregates`` Celery
+task (it also runs nightly).
+
+Revision ID: 20260420_exec_aggregates
+Revises: 20260415_langfuse_trace
+Create Date: 2026-04-20 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20260420_exec_aggregates"
+down_revision = "20260415_langfuse_trace"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "execution_aggregates",
+        sa.Column("pipeline_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("execution_count", sa.Integer(), nullable=False),
+        sa.Column("total_cost", sa.Float(), nullable=False),
+        sa.Column("realized_pnl", sa.Float(), nullable=False),
+        sa.Column("realized_count", sa.Integer(), nullable=False),
+        sa.Column("unrealized_pnl", sa.Float(), nullable=False),
+        sa.Column("unrealized_count", sa.Integer(), nullable=False),
+        sa.Column("trade_count", sa.Integer(), nullable=False),
+        sa.Column("win_count", sa.Integer(), nullable=False),
+        sa.Column("loss_count", sa.Integer(), nullable=False),
+        sa.Column("win_pnl", sa.Float(), nullable=False),
+        sa.Column("loss_pnl", sa.Float(), nullable=False),
+        sa.Column("best_trade", sa.Float(), nullable=False),
+        sa.Column("worst_trade", sa.Float(), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.Column("duration_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["pipeline_id"], ["pipelines.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("pipeline_id", "day", "status"),
+    )
+    op.create_index(op.f("ix_execution_aggregates_user_id"), "execution_aggregates", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_execution_aggregates_user_id"), table_name="execution_aggregates")
+    op.drop_table("execution_aggregates")
@@ -0,0 +1,79 @@
+"""add generated execution summary columns
+
+Stored generated columns derived from ``reports`` and ``agent_states`` so
+execution lists can show P&L and agent progress without detoasting the
+large JSONB payloads, plus a (user_id, created_at) index for the
+paginated execution history. Adding the columns rewrites the executions
+table once.
+
+Revision ID: 20260424_exec_summary_cols
+Revises: 20260420_exec_aggregates
+Create Date: 2026-04-24 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20260424_exec_summary_cols"
+down_revision = "20260420_exec_aggregates"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "executions",
+        sa.Column(
+            "trade_manager_report",
+            postgresql.JSONB(),
+            sa.Computed(
+                """jsonb_path_query_first(reports, '$.* ? (@.agent_type == "trade_manager_agent")'::jsonpath)""",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "executions",
+        sa.Column(
+            "agent_count",
+            sa.Integer(),
+            sa.Computed(
+                "CASE WHEN jsonb_typeof(agent_states) = 'array' "
+                "THEN jsonb_array_length(agent_states) ELSE 0 END",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "executions",
+        sa.Column(
+            "agents_completed",
+            sa.Integer(),
+            sa.Computed(
+                "CASE WHEN jsonb_typeof(agent_states) = 'array' "
+                """THEN jsonb_array_length(jsonb_path_query_array(agent_states, '$[*] ? (@.status == "completed")'::jsonpath)) """
+                "ELSE 0 END",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    # Per-user history pages: WHERE user_id = ? ORDER BY created_at DESC
+    op.create_index(
+        "ix_executions_user_created_at",
+        "executions",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_executions_user_created_at", table_name="executions")
+    op.drop_column("executions", "agents_completed")
+    op.drop_column("executions", "agent_count")
+    op.drop_column("executions", "trade_manager_report")
@@ -0,0 +1,32 @@
+"""add packed pipeline state column
+
+Binary PipelineState snapshot written by the compact codec
+(``app.orchestration.state_codec``). The JSONB ``pipeline_state`` column is
+kept as a read fallback; existing executions move over the next time their
+state is saved.
+
+Revision ID: 20260502_packed_pipeline_state
+Revises: 20260424_exec_summary_cols
+Create Date: 2026-05-02 09:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20260502_packed_pipeline_state"
+down_revision = "20260424_exec_summary_cols"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "executions",
+        sa.Column("pipeline_state_packed", sa.LargeBinary(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("executions", "pipeline_state_packed")
@@ -15,7 +15,7 @@ from app.schemas.pipeline_state import PipelineState, BiasResult
 from app.services.langfuse_service import trace_agent_execution
 from app.tools.openai_tools import build_openai_tools, tool_handler_map, tool_schemas
 from app.services.agent_runner import AgentRunner
-from app.services.llm_provider import create_openai_client, get_llm_provider, resolve_chat_model
+from app.services.llm_provider import get_llm_provider
 from app.config import settings
 from app.services.model_registry import model_registry
 from app.database import SessionLocal
@@ -616,13 +616,7 @@ Original text:
 
 Provide ONLY the cleaned, professional analysis text. Do not add any preamble or explanation."""
 
-            client = create_openai_client()
-            response = client.chat.completions.create(
-                model=resolve_chat_model(self.config.get("model", settings.OPENAI_MODEL)),
-                messages=[{"role": "user", "content": synthesis_prompt}],
-                temperature=0.3
-            )
-            cleaned = response.choices[0].message.content.strip()
+            cleaned = self.runner.complete(synthesis_prompt, temperature=0.3)
             
             logger.info("llm_synthesis_applied", 
                        original_length=len(raw_text), 
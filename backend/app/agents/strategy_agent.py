@@ -17,7 +17,7 @@ from app.tools.openai_tools import build_openai_tools
 from app.services.chart_annotation_builder import ChartAnnotationBuilder
 from app.services.model_registry import model_registry
 from app.services.agent_runner import AgentRunner
-from app.services.llm_provider import create_openai_client, get_llm_provider, resolve_chat_model
+from app.services.llm_provider import get_llm_provider
 from app.config import settings
 from app.database import SessionLocal
 from app.services.skill_registry import skill_registry
@@ -1144,15 +1144,7 @@ Original analysis:
 
 Provide ONLY the cleaned, formatted analysis. Keep all specific prices and pattern descriptions intact."""
 
-            client = create_openai_client()
-            synthesis_model = resolve_chat_model(self.model)
-            
-            response = client.chat.completions.create(
-                model=synthesis_model,
-                messages=[{"role": "user", "content": synthesis_prompt}],
-                temperature=0.3
-            )
-            cleaned = response.choices[0].message.content.strip()
+            cleaned = self.runner.complete(synthesis_prompt, temperature=0.3)
             
             logger.info("llm_synthesis_applied", 
                        original_length=len(raw_text), 
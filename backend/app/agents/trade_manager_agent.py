@@ -301,9 +301,8 @@ class TradeManagerAgent(BaseAgent):
             return state
         
         # Create broker instance once (avoid duplicate instantiation)
-        from app.services.brokers.factory import broker_factory
         try:
-            broker = broker_factory.from_tool_config(broker_tool)
+            broker = self._broker_for(broker_tool)
         except Exception as e:
             self.log(state, f"❌ Failed to create broker instance: {str(e)}", level="error")
             self._handle_api_error(state, f"Failed to create broker: {str(e)}")
@@ -1158,10 +1157,7 @@ class TradeManagerAgent(BaseAgent):
             - API_ERROR: could not check (network/API failure)
         """
         try:
-            from app.services.brokers.factory import broker_factory
-            
-            # Create broker service from tool config
-            broker = broker_factory.from_tool_config(broker_tool)
+            broker = self._broker_for(broker_tool)
             
             # Get position
             position = broker.get_position(symbol)
@@ -1185,7 +1181,8 @@ class TradeManagerAgent(BaseAgent):
                 
                 # ⚠️ FIX #2: Extract trade_id based on broker type
                 # OANDA stores tradeIDs in the long/short position sections
-                if hasattr(broker, '__class__') and 'Oanda' in broker.__class__.__name__:
+                # (unwrap shared account snapshots to see the real broker class)
+                if 'Oanda' in type(getattr(broker, "wrapped", broker)).__name__:
                     side_key = "long" if position.side == "long" else "short"
                     side_data = broker_data.get(side_key, {})
                     trade_ids = side_data.get("tradeIDs", [])
@@ -1221,10 +1218,7 @@ class TradeManagerAgent(BaseAgent):
     def _close_position(self, symbol: str, broker_tool, reason: str):
         """Close position at market."""
         try:
-            from app.services.brokers.factory import broker_factory
-            
-            # Create broker service from tool config
-            broker = broker_factory.from_tool_config(broker_tool)
+            broker = self._broker_for(broker_tool)
             
             # Close position
             result = broker.close_position(symbol)
@@ -2338,6 +2332,25 @@ class TradeManagerAgent(BaseAgent):
                 return tool
         return None
     
+    def use_broker(self, broker) -> None:
+        """
+        Serve this agent's broker calls from a shared broker instance.
+
+        Used by batched position monitoring to hand every execution on one
+        broker account the same ``BrokerAccountSnapshot`` instead of letting
+        each one build its own broker and poll it separately.
+        """
+        self._shared_broker = broker
+
+    def _broker_for(self, broker_tool):
+        """Return the shared broker if one was provided, else build one from the tool config."""
+        shared = getattr(self, "_shared_broker", None)
+        if shared is not None:
+            return shared
+
+        from app.services.brokers.factory import broker_factory
+        return broker_factory.from_tool_config(broker_tool)
+
     def _get_broker_tool(self):
         """Get any attached broker tool (Alpaca, Oanda, or Tradier)."""
         broker_types = ["alpaca_broker", "oanda_broker", "tradier_broker"]
@@ -2379,16 +2392,17 @@ class TradeManagerAgent(BaseAgent):
         stop_loss: Optional[float]
     ):
         """
-        Send Telegram notification for trade execution.
+        Queue a Telegram notification for trade execution.
         
-        Only sends if:
+        Only queues if:
         1. User has Telegram enabled
         2. Pipeline has notifications enabled
         3. "trade_executed" is in notification events
         """
         try:
             # Import here to avoid circular dependency
-            from app.services.telegram_notifier import telegram_notifier
+            from app.services.notification_outbox import NotificationEvent, notification_outbox
+            from app.services.telegram_notifier import TelegramNotifier
             from sqlalchemy.orm import Session
             from app.models.user import User as UserModel
             from app.models.pipeline import Pipeline as PipelineModel
@@ -2419,24 +2433,28 @@ class TradeManagerAgent(BaseAgent):
                 if "trade_executed" not in notification_events:
                     return
                 
-                # Send notification
-                telegram_notifier.send_trade_alert(
-                    bot_token=user.telegram_bot_token,
-                    chat_id=user.telegram_chat_id,
-                    symbol=state.symbol,
-                    action=strategy.action,
-                    entry_price=entry_price,
-                    stop_loss=stop_loss or 0.0,
-                    take_profit=take_profit or 0.0,
-                    position_size=risk.position_size,
-                    pipeline_name=pipeline.name
-                )
+                # Queue notification; the outbox dispatcher sends it
+                notification_outbox.enqueue(NotificationEvent(
+                    channel="telegram",
+                    user_id=str(state.user_id),
+                    event="trade_executed",
+                    message=TelegramNotifier.trade_alert_message(
+                        symbol=state.symbol,
+                        action=strategy.action,
+                        entry_price=entry_price,
+                        stop_loss=stop_loss or 0.0,
+                        take_profit=take_profit or 0.0,
+                        position_size=risk.position_size,
+                        pipeline_name=pipeline.name
+                    ),
+                    dedupe_key=f"trade_executed:{state.execution_id}",
+                ))
                 
                 logger.info(
-                    "telegram_notification_sent",
+                    "telegram_notification_queued",
                     user_id=str(state.user_id),
                     pipeline_id=str(state.pipeline_id),
-                    event="trade_executed"
+                    notification_event="trade_executed"
                 )
                 
             finally:
@@ -34,6 +34,7 @@ from app.schemas.backtest import (
     BacktestTimelineResponse,
 )
 from app.orchestration.tasks.launch_backtest_runtime import launch_backtest_runtime
+from app.services.llm_governor import LLMPriority
 from app.services.llm_provider import create_openai_client, get_llm_api_key, resolve_chat_model
 
 router = APIRouter(prefix="/backtests", tags=["backtests"])
@@ -494,7 +495,7 @@ async def _generate_optional_llm_analysis(summary: dict[str, Any], sections: lis
     if not get_llm_api_key():
         return None
 
-    client = create_openai_client(async_client=True)
+    client = create_openai_client(async_client=True, priority=LLMPriority.BACKTEST)
     prompt = (
         "You are reviewing a completed trading backtest. Produce concise JSON with keys "
         "`executive_summary`, `strengths`, `weaknesses`, and `recommendations`. "
@@ -19,7 +19,14 @@ from zoneinfo import ZoneInfo
 from app.database import get_db
 from app.models.user import User
 from app.models.pipeline import Pipeline, TriggerMode
-from app.models.execution import Execution, ExecutionStatus
+from app.models.execution import Execution, ExecutionStatus, lean_load
+from app.models.execution_aggregate import ExecutionAggregate
+from app.services.execution_aggregates import (
+    ACTIVE_POSITION_STATUSES,
+    LIVE_STATUSES,
+    ExecutionTotals,
+    extract_pnl,
+)
 from app.api.dependencies import get_current_user
 
 logger = structlog.get_logger()
@@ -81,46 +88,9 @@ def _broker_display_name(tool_type: str) -> str:
     return names.get(tool_type, tool_type.replace("_", " ").title())
 
 
-def _extract_pnl(execution: Execution) -> Optional[Dict[str, Any]]:
-    """
-    Extract P&L from an execution.
-    
-    Checks final_pnl (completed) and reports (monitoring) in that order.
-    
-    Args:
-        execution: Execution model instance
-        
-    Returns:
-        Dict with value, percent, and type or None
-    """
-    result = execution.result or {}
-    
-    # Check final P&L (completed trades)
-    if result.get("final_pnl") is not None:
-        return {
-            "value": result["final_pnl"],
-            "percent": result.get("final_pnl_percent"),
-            "type": "realized",
-        }
-    
-    # Check monitoring reports (live trades)
-    reports = execution.reports or {}
-    for agent_id, report in reports.items():
-        if isinstance(report, dict) and report.get("agent_type") == "trade_manager_agent":
-            data = report.get("data", {})
-            if data and data.get("unrealized_pl") is not None:
-                return {
-                    "value": data["unrealized_pl"],
-                    "percent": data.get("pnl_percent"),
-                    "type": "unrealized",
-                }
-    
-    return None
-
-
 def _extract_trade_info(execution: Execution) -> Optional[Dict[str, Any]]:
     """
-    Extract trade information from execution reports for active positions.
+    Extract trade information from the Trade Manager report for active positions.
     
     Args:
         execution: Execution model instance
@@ -128,27 +98,25 @@ def _extract_trade_info(execution: Execution) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with trade details or None
     """
-    reports = execution.reports or {}
+    report = execution.trade_manager_report
     trade_info = None
     
-    # First, try to get from trade_manager_agent reports
-    for agent_id, report in reports.items():
-        if isinstance(report, dict) and report.get("agent_type") == "trade_manager_agent":
-            data = report.get("data", {})
-            if data:
-                trade_info = {
-                    "order_status": data.get("order_status"),
-                    "order_type": data.get("order_type"),
-                    "side": data.get("side"),
-                    "entry_price": data.get("entry_price"),
-                    "current_price": data.get("current_price"),
-                    "quantity": data.get("quantity") or data.get("units"),
-                    "unrealized_pl": data.get("unrealized_pl"),
-                    "pnl_percent": data.get("pnl_percent"),
-                    "take_profit": data.get("take_profit"),
-                    "stop_loss": data.get("stop_loss"),
-                }
-                break
+    # First, try to get from the trade_manager_agent report
+    if isinstance(report, dict):
+        data = report.get("data", {})
+        if data:
+            trade_info = {
+                "order_status": data.get("order_status"),
+                "order_type": data.get("order_type"),
+                "side": data.get("side"),
+                "entry_price": data.get("entry_price"),
+                "current_price": data.get("current_price"),
+                "quantity": data.get("quantity") or data.get("units"),
+                "unrealized_pl": data.get("unrealized_pl"),
+                "pnl_percent": data.get("pnl_percent"),
+                "take_profit": data.get("take_profit"),
+                "stop_loss": data.get("stop_loss"),
+            }
     
     # If side is missing, try to get it from strategy in result
     if trade_info and not trade_info.get("side"):
@@ -162,14 +130,14 @@ def _extract_trade_info(execution: Execution) -> Optional[Dict[str, Any]]:
     
     # If still no side, try to get from pipeline_state
     if trade_info and not trade_info.get("side"):
-        if execution.pipeline_state:
-            pipeline_state = execution.pipeline_state
-            if isinstance(pipeline_state, dict):
-                strategy = pipeline_state.get("strategy")
-                if strategy and isinstance(strategy, dict):
-                    action = strategy.get("action")
-                    if action:
-                        trade_info["side"] = "LONG" if action.upper() == "BUY" else "SHORT" if action.upper() == "SELL" else action.upper()
+        from app.orchestration.tasks._helpers import load_pipeline_state_dict
+
+        pipeline_state = load_pipeline_state_dict(execution)
+        strategy = pipeline_state.get("strategy")
+        if strategy and isinstance(strategy, dict):
+            action = strategy.get("action")
+            if action:
+                trade_info["side"] = "LONG" if action.upper() == "BUY" else "SHORT" if action.upper() == "SELL" else action.upper()
     
     return trade_info
 
@@ -204,33 +172,64 @@ async def get_dashboard(
     signal_pipelines = len([p for p in pipelines if p.trigger_mode == TriggerMode.SIGNAL])
     periodic_pipelines = len([p for p in pipelines if p.trigger_mode == TriggerMode.PERIODIC])
     
-    # ── 2. Load all executions ─────────────────────────────────
-    exec_result = await db.execute(
+    # ── 2. Execution totals ────────────────────────────────────
+    # Terminal executions come from the materialized aggregates; live ones
+    # (few, and changing on every monitoring tick) are loaded without their
+    # heavy JSONB columns and folded in with the same rules.
+    aggregate_result = await db.execute(
+        select(ExecutionAggregate).where(ExecutionAggregate.user_id == current_user.id)
+    )
+    # key = (pipeline_id, day, status)
+    buckets: Dict[tuple, ExecutionTotals] = {
+        (str(row.pipeline_id), row.day, row.status): ExecutionTotals.from_aggregate(row)
+        for row in aggregate_result.scalars().all()
+    }
+    
+    live_result = await db.execute(
         select(Execution, Pipeline.name.label("pipeline_name"))
         .join(Pipeline, Execution.pipeline_id == Pipeline.id)
-        .where(Execution.user_id == current_user.id)
+        .where(
+            Execution.user_id == current_user.id,
+            Execution.status.in_(LIVE_STATUSES),
+        )
+        .options(*lean_load("pipeline_state", "pipeline_state_packed"))
         .order_by(Execution.created_at.desc())
     )
-    rows = exec_result.all()
+    live_executions_with_names = [(row[0], row[1]) for row in live_result.all()]
+    for execution, _ in live_executions_with_names:
+        key = (str(execution.pipeline_id), execution.created_at.date(), execution.status.value)
+        buckets.setdefault(key, ExecutionTotals()).add_execution(execution)
+    
+    all_totals = ExecutionTotals()
+    status_totals: Dict[str, ExecutionTotals] = {}
+    pipeline_totals: Dict[str, ExecutionTotals] = {}
+    pipeline_status_counts: Dict[tuple, int] = {}
+    for (pipeline_id, day, status), bucket in buckets.items():
+        all_totals.add(bucket)
+        status_totals.setdefault(status, ExecutionTotals()).add(bucket)
+        pipeline_totals.setdefault(pipeline_id, ExecutionTotals()).add(bucket)
+        pipeline_status_counts[(pipeline_id, status)] = (
+            pipeline_status_counts.get((pipeline_id, status), 0) + bucket.execution_count
+        )
     
-    executions_with_names = [(row[0], row[1]) for row in rows]
-    all_executions = [row[0] for row in rows]
+    def _status_count(status: ExecutionStatus) -> int:
+        return status_totals[status.value].execution_count if status.value in status_totals else 0
     
-    total_executions = len(all_executions)
-    running_count = len([e for e in all_executions if e.status == ExecutionStatus.RUNNING])
-    monitoring_count = len([e for e in all_executions if e.status == ExecutionStatus.MONITORING])
-    needs_reconciliation_count = len([e for e in all_executions if e.status == ExecutionStatus.NEEDS_RECONCILIATION])
-    completed_count = len([e for e in all_executions if e.status == ExecutionStatus.COMPLETED])
-    failed_count = len([e for e in all_executions if e.status == ExecutionStatus.FAILED])
+    total_executions = all_totals.execution_count
+    running_count = _status_count(ExecutionStatus.RUNNING)
+    monitoring_count = _status_count(ExecutionStatus.MONITORING)
+    needs_reconciliation_count = _status_count(ExecutionStatus.NEEDS_RECONCILIATION)
+    completed_count = _status_count(ExecutionStatus.COMPLETED)
+    failed_count = _status_count(ExecutionStatus.FAILED)
     
-    total_cost = sum(e.cost or 0 for e in all_executions)
+    total_cost = all_totals.total_cost
     
     finished = completed_count + failed_count
     success_rate = completed_count / finished if finished > 0 else 0.0
     
     # ── 3. P&L aggregation ─────────────────────────────────────
-    total_realized_pnl = 0.0
-    total_unrealized_pnl = 0.0
+    total_realized_pnl = all_totals.realized_pnl
+    total_unrealized_pnl = all_totals.unrealized_pnl
     
     # Map pipeline → broker info for later grouping
     pipeline_broker_map: Dict[str, Dict[str, Any]] = {}
@@ -243,20 +242,13 @@ async def get_dashboard(
     # key = (broker_name, account_id, account_type)
     broker_pnl: Dict[tuple, Dict[str, Any]] = {}
     
-    for execution in all_executions:
-        pnl = _extract_pnl(execution)
-        if pnl is None:
+    for p in pipelines:
+        totals = pipeline_totals.get(str(p.id))
+        if totals is None or totals.pnl_count == 0:
             continue
         
-        pnl_value = pnl["value"] or 0
-        
-        if pnl["type"] == "realized":
-            total_realized_pnl += pnl_value
-        else:
-            total_unrealized_pnl += pnl_value
-        
         # Group by broker
-        broker = pipeline_broker_map.get(str(execution.pipeline_id))
+        broker = pipeline_broker_map.get(str(p.id))
         if broker:
             key = (broker["broker_name"], broker["account_id"], broker["account_type"])
             if key not in broker_pnl:
@@ -273,14 +265,11 @@ async def get_dashboard(
                 }
             
             entry = broker_pnl[key]
-            entry["total_trades"] += 1
-            entry["pipeline_ids"].add(str(execution.pipeline_id))
-            
-            if pnl["type"] == "realized":
-                entry["realized_pnl"] += pnl_value
-            else:
-                entry["unrealized_pnl"] += pnl_value
-                entry["active_positions"] += 1
+            entry["total_trades"] += totals.pnl_count
+            entry["pipeline_ids"].add(str(p.id))
+            entry["realized_pnl"] += totals.realized_pnl
+            entry["unrealized_pnl"] += totals.unrealized_pnl
+            entry["active_positions"] += totals.unrealized_count
     
     # Finalize broker accounts list
     broker_accounts = []
@@ -312,12 +301,12 @@ async def get_dashboard(
     
     # ── 4. Active positions ────────────────────────────────────
     active_positions = []
-    for execution, pipeline_name in executions_with_names:
-        if execution.status not in (ExecutionStatus.MONITORING, ExecutionStatus.RUNNING, ExecutionStatus.NEEDS_RECONCILIATION):
+    for execution, pipeline_name in live_executions_with_names:
+        if execution.status not in ACTIVE_POSITION_STATUSES:
             continue
         
         trade_info = _extract_trade_info(execution)
-        pnl = _extract_pnl(execution)
+        pnl = extract_pnl(execution)
         
         active_positions.append({
             "execution_id": str(execution.id),
@@ -333,14 +322,22 @@ async def get_dashboard(
         })
     
     # ── 5. Recent completed executions (only with valid P&L) ─────────────────────────
+    recent_result = await db.execute(
+        select(Execution, Pipeline.name.label("pipeline_name"))
+        .join(Pipeline, Execution.pipeline_id == Pipeline.id)
+        .where(Execution.user_id == current_user.id)
+        .options(*lean_load())
+        .order_by(Execution.created_at.desc())
+        .limit(50)  # Check more to find 10 with P&L
+    )
     recent_executions = []
-    for execution, pipeline_name in executions_with_names[:50]:  # Check more to find 10 with P&L
+    for execution, pipeline_name in recent_result.all():
         if execution.status not in (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED):
             continue
         if len(recent_executions) >= 10:
             break
         
-        pnl = _extract_pnl(execution)
+        pnl = extract_pnl(execution)
         
         # Only include executions with valid P&L (not None, not 0, or explicitly 0 from a closed trade)
         # This filters out executions that never resulted in a trade (rejected, skipped, etc.)
@@ -400,17 +397,14 @@ async def get_dashboard(
     pipeline_list = []
     for p in pipelines:
         # Count executions per pipeline
-        p_execs = [e for e in all_executions if str(e.pipeline_id) == str(p.id)]
-        p_active = len([e for e in p_execs if e.status in (ExecutionStatus.MONITORING, ExecutionStatus.RUNNING, ExecutionStatus.NEEDS_RECONCILIATION)])
-        p_completed = len([e for e in p_execs if e.status == ExecutionStatus.COMPLETED])
-        p_failed = len([e for e in p_execs if e.status == ExecutionStatus.FAILED])
+        pid = str(p.id)
+        p_totals = pipeline_totals.get(pid) or ExecutionTotals()
+        p_active = sum(pipeline_status_counts.get((pid, status.value), 0) for status in ACTIVE_POSITION_STATUSES)
+        p_completed = pipeline_status_counts.get((pid, ExecutionStatus.COMPLETED.value), 0)
+        p_failed = pipeline_status_counts.get((pid, ExecutionStatus.FAILED.value), 0)
         
         # P&L for this pipeline
-        pipeline_pnl = 0.0
-        for e in p_execs:
-            pnl = _extract_pnl(e)
-            if pnl:
-                pipeline_pnl += pnl["value"] or 0
+        pipeline_pnl = p_totals.pnl
         
         broker = pipeline_broker_map.get(str(p.id))
         
@@ -420,7 +414,7 @@ async def get_dashboard(
             "is_active": p.is_active,
             "trigger_mode": p.trigger_mode.value if p.trigger_mode else "periodic",
             "broker": broker,
-            "total_executions": len(p_execs),
+            "total_executions": p_totals.execution_count,
             "active_executions": p_active,
             "completed_executions": p_completed,
             "failed_executions": p_failed,
@@ -446,8 +440,18 @@ async def get_dashboard(
     # - Completed trades: Must be BOTH created AND completed TODAY in user's local timezone
     #   This prevents yesterday evening trades from showing up if they completed after midnight local time
     # - Active trades: Must be created today in user's local timezone
+    # Only today's rows are needed here (both rules require created today)
+    today_result = await db.execute(
+        select(Execution)
+        .where(
+            Execution.user_id == current_user.id,
+            Execution.created_at >= today_start_utc,
+            Execution.created_at < today_end_utc,
+        )
+        .options(*lean_load())
+    )
     today_execs = []
-    for e in all_executions:
+    for e in today_result.scalars().all():
         # For completed trades, require BOTH created_at and completed_at to be today
         # Convert UTC timestamps to user's timezone for comparison
         if e.status == ExecutionStatus.COMPLETED:
@@ -484,7 +488,7 @@ async def get_dashboard(
     
     # Only process completed executions for P&L and trade stats
     for e in today_completed:
-        pnl = _extract_pnl(e)
+        pnl = extract_pnl(e)
         if pnl and pnl["value"] is not None:
             pnl_val = pnl["value"]
             today_pnl += pnl_val
@@ -522,16 +526,11 @@ async def get_dashboard(
         cost_history[day] = 0.0
         pnl_history[day] = 0.0
     
-    for e in all_executions:
-        if not e.created_at or e.created_at < history_start:
-            continue
-        day_key = e.created_at.strftime("%Y-%m-%d")
+    for (pipeline_id, day, status), bucket in buckets.items():
+        day_key = day.strftime("%Y-%m-%d")
         if day_key in cost_history:
-            cost_history[day_key] += e.cost or 0
-        
-        pnl = _extract_pnl(e)
-        if pnl and day_key in pnl_history:
-            pnl_history[day_key] += pnl["value"] or 0
+            cost_history[day_key] += bucket.total_cost
+            pnl_history[day_key] += bucket.pnl
     
     cost_history_list = [
         {"date": d, "cost": round(v, 4)} for d, v in sorted(cost_history.items())
@@ -541,64 +540,40 @@ async def get_dashboard(
     ]
     
     # ── 9. Trade stats (win/loss analysis) ────────────────────
-    winning_trades: List[float] = []
-    losing_trades: List[float] = []
+    # Real-trade filter is the same as recent executions (see is_real_trade)
+    completed_totals = status_totals.get(ExecutionStatus.COMPLETED.value) or ExecutionTotals()
+    win_count = completed_totals.win_count
+    loss_count = completed_totals.loss_count
 
-    for e in all_executions:
-        if e.status != ExecutionStatus.COMPLETED:
-            continue
-        pnl = _extract_pnl(e)
-        if pnl is None:
-            continue
-        pnl_val = pnl["value"]
-        if pnl_val is None:
-            continue
-        # Only count real trades (same filter as recent executions)
-        result_data = e.result or {}
-        trade_outcome = result_data.get("trade_outcome")
-        if trade_outcome and isinstance(trade_outcome, dict):
-            if trade_outcome.get("status") not in ("executed", "cancelled"):
-                continue
-        elif pnl_val == 0:
-            continue
-
-        if pnl_val > 0:
-            winning_trades.append(pnl_val)
-        elif pnl_val < 0:
-            losing_trades.append(pnl_val)
-
-    total_trades_counted = len(winning_trades) + len(losing_trades)
+    total_trades_counted = win_count + loss_count
     trade_stats = {
         "total_trades": total_trades_counted,
-        "winning_trades": len(winning_trades),
-        "losing_trades": len(losing_trades),
-        "win_rate": round(len(winning_trades) / total_trades_counted, 4) if total_trades_counted > 0 else 0.0,
-        "avg_win": round(sum(winning_trades) / len(winning_trades), 2) if winning_trades else 0.0,
-        "avg_loss": round(sum(losing_trades) / len(losing_trades), 2) if losing_trades else 0.0,
-        "best_trade": round(max(winning_trades), 2) if winning_trades else 0.0,
-        "worst_trade": round(min(losing_trades), 2) if losing_trades else 0.0,
+        "winning_trades": win_count,
+        "losing_trades": loss_count,
+        "win_rate": round(win_count / total_trades_counted, 4) if total_trades_counted > 0 else 0.0,
+        "avg_win": round(completed_totals.win_pnl / win_count, 2) if win_count else 0.0,
+        "avg_loss": round(completed_totals.loss_pnl / loss_count, 2) if loss_count else 0.0,
+        "best_trade": round(completed_totals.best_trade, 2) if win_count else 0.0,
+        "worst_trade": round(completed_totals.worst_trade, 2) if loss_count else 0.0,
         "profit_factor": round(
-            abs(sum(winning_trades) / sum(losing_trades)), 2
-        ) if losing_trades and sum(losing_trades) != 0 else 0.0,
+            abs(completed_totals.win_pnl / completed_totals.loss_pnl), 2
+        ) if loss_count and completed_totals.loss_pnl != 0 else 0.0,
     }
 
     # ── 10. Equity by Broker (cumulative P&L per broker, 30 days) ──
     broker_equity_buckets: Dict[str, Dict[str, float]] = {}
-    for e in all_executions:
-        if not e.created_at or e.created_at < history_start:
+    for (pipeline_id, day, status), bucket in buckets.items():
+        if day < history_start.date() or bucket.pnl_count == 0:
             continue
-        broker = pipeline_broker_map.get(str(e.pipeline_id))
+        broker = pipeline_broker_map.get(pipeline_id)
         if not broker:
             continue
-        pnl = _extract_pnl(e)
-        if not pnl or pnl["value"] is None:
-            continue
         bname = broker["broker_name"]
-        day_key = e.created_at.strftime("%Y-%m-%d")
+        day_key = day.strftime("%Y-%m-%d")
         if bname not in broker_equity_buckets:
             broker_equity_buckets[bname] = {}
         broker_equity_buckets[bname][day_key] = (
-            broker_equity_buckets[bname].get(day_key, 0.0) + (pnl["value"] or 0)
+            broker_equity_buckets[bname].get(day_key, 0.0) + bucket.pnl
         )
 
     equity_by_broker = []
@@ -614,18 +589,14 @@ async def get_dashboard(
     # ── 11. Equity by Pipeline (cumulative P&L per pipeline, 30 days) ──
     pipeline_name_map = {str(p.id): p.name for p in pipelines}
     pipeline_equity_buckets: Dict[str, Dict[str, float]] = {}
-    for e in all_executions:
-        if not e.created_at or e.created_at < history_start:
-            continue
-        pnl = _extract_pnl(e)
-        if not pnl or pnl["value"] is None:
+    for (pid, day, status), bucket in buckets.items():
+        if day < history_start.date() or bucket.pnl_count == 0:
             continue
-        pid = str(e.pipeline_id)
-        day_key = e.created_at.strftime("%Y-%m-%d")
+        day_key = day.strftime("%Y-%m-%d")
         if pid not in pipeline_equity_buckets:
             pipeline_equity_buckets[pid] = {}
         pipeline_equity_buckets[pid][day_key] = (
-            pipeline_equity_buckets[pid].get(day_key, 0.0) + (pnl["value"] or 0)
+            pipeline_equity_buckets[pid].get(day_key, 0.0) + bucket.pnl
         )
 
     equity_by_pipeline = []
@@ -656,40 +627,19 @@ async def get_dashboard(
             "wins": 0, "losses": 0, "best_trade": 0.0, "worst_trade": 0.0,
         }
 
-    for e in all_executions:
-        if e.status != ExecutionStatus.COMPLETED:
-            continue
-        if not e.created_at or e.created_at < calendar_start:
-            continue
-        pnl = _extract_pnl(e)
-        if not pnl or pnl["value"] is None:
+    for (pipeline_id, day, status), bucket in buckets.items():
+        if status != ExecutionStatus.COMPLETED.value or bucket.trade_count == 0:
             continue
-        pnl_val = pnl["value"]
-        result_data = e.result or {}
-        trade_outcome = result_data.get("trade_outcome")
-        is_real = False
-        if trade_outcome and isinstance(trade_outcome, dict):
-            if trade_outcome.get("status") in ("executed", "cancelled"):
-                is_real = True
-        elif pnl_val != 0:
-            is_real = True
-        if not is_real:
-            continue
-
-        day_key = e.created_at.strftime("%Y-%m-%d")
+        day_key = day.strftime("%Y-%m-%d")
         if day_key not in cal_buckets:
             continue
-        bucket = cal_buckets[day_key]
-        bucket["pnl"] += pnl_val
-        bucket["trades"] += 1
-        if pnl_val > 0:
-            bucket["wins"] += 1
-        elif pnl_val < 0:
-            bucket["losses"] += 1
-        if pnl_val > bucket["best_trade"]:
-            bucket["best_trade"] = pnl_val
-        if pnl_val < bucket["worst_trade"]:
-            bucket["worst_trade"] = pnl_val
+        cal = cal_buckets[day_key]
+        cal["pnl"] += bucket.win_pnl + bucket.loss_pnl
+        cal["trades"] += bucket.trade_count
+        cal["wins"] += bucket.win_count
+        cal["losses"] += bucket.loss_count
+        cal["best_trade"] = max(cal["best_trade"], bucket.best_trade)
+        cal["worst_trade"] = min(cal["worst_trade"], bucket.worst_trade)
 
     calendar_data = []
     for day_key in sorted(cal_buckets.keys()):
@@ -7,12 +7,16 @@ Provides endpoints for:
 - Listing executions
 - Stopping running executions
 - Generating executive reports
+- Serving strategy charts (ETag-validated)
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import hashlib
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func, case, not_
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 from pathlib import Path
@@ -20,7 +24,7 @@ import structlog
 
 from app.database import get_db
 from app.models.user import User
-from app.models.execution import Execution, ExecutionStatus
+from app.models.execution import Execution, ExecutionStatus, lean_load
 from app.models.pipeline import Pipeline
 from app.schemas.execution import ExecutionInDB, ExecutionCreate, ExecutionSummary, ExecutionStats
 from app.api.dependencies import get_current_user
@@ -28,6 +32,14 @@ from app.orchestration.tasks import execute_pipeline, stop_execution
 from app.orchestration.validator import PipelineValidator
 from app.services.executive_report_generator import executive_report_generator
 from app.services.trade_analysis_generator import trade_analysis_generator
+from app.services.execution_reports import (
+    build_execution_data,
+    build_executive_report,
+    cached_report,
+    is_failed_report,
+    report_state_hash,
+)
+from app.services.chart_annotation_builder import chart_etag, expand_chart
 from app.services.langfuse_service import activate_observation, resume_execution_trace, span_context
 from app.backtesting.backtest_broker import BacktestBroker
 
@@ -53,6 +65,39 @@ def _extract_broker_tool(config: Optional[dict]) -> Optional[dict]:
     return None
 
 
+def _strategy_chart(result: Optional[dict]) -> Optional[dict]:
+    if not isinstance(result, dict):
+        return None
+    return (result.get("execution_artifacts") or {}).get("strategy_chart")
+
+
+def _with_chart(result: Optional[dict], chart: Any) -> Optional[dict]:
+    """Copy of an execution result with the strategy chart replaced (ORM value untouched)."""
+    artifacts = dict(result.get("execution_artifacts") or {})
+    artifacts["strategy_chart"] = chart
+    return {**result, "execution_artifacts": artifacts}
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+
+
+def _set_cache_headers(response: Response, etag: str) -> None:
+    # Always revalidate; unchanged payloads come back as 304 without a body
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def _payload_etag(payload: Dict[str, Any]) -> str:
+    digest = hashlib.sha1(
+        json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
 def _normalize_account_type(account_type: Optional[str]) -> str:
     value = str(account_type or "").strip().lower()
     if value in {"sandbox", "paper", "practice", "demo"}:
@@ -271,33 +316,38 @@ async def get_execution_stats(
     Returns:
         Execution statistics
     """
-    from sqlalchemy import func
+    from app.models.execution_aggregate import ExecutionAggregate
+    from app.services.execution_aggregates import LIVE_STATUSES, ExecutionTotals
     
-    # Get all executions for the user
-    result = await db.execute(
-        select(Execution).where(Execution.user_id == current_user.id)
+    # Terminal executions from the materialized aggregates, live ones directly
+    aggregate_result = await db.execute(
+        select(ExecutionAggregate).where(ExecutionAggregate.user_id == current_user.id)
+    )
+    live_result = await db.execute(
+        select(Execution)
+        .where(Execution.user_id == current_user.id, Execution.status.in_(LIVE_STATUSES))
+        .options(*lean_load())
     )
-    executions = result.scalars().all()
-    
-    total_executions = len(executions)
-    running_executions = len([e for e in executions if e.status == ExecutionStatus.RUNNING])
-    completed_executions = len([e for e in executions if e.status == ExecutionStatus.COMPLETED])
-    failed_executions = len([e for e in executions if e.status == ExecutionStatus.FAILED])
-    
-    total_cost = sum(e.cost for e in executions)
-    
-    # Calculate average duration for completed executions
-    completed_with_duration = [
-        e for e in executions 
-        if e.status == ExecutionStatus.COMPLETED and e.started_at and e.completed_at
-    ]
     
-    if completed_with_duration:
-        durations = [
-            (e.completed_at - e.started_at).total_seconds() 
-            for e in completed_with_duration
-        ]
-        avg_duration_seconds = sum(durations) / len(durations)
+    totals = ExecutionTotals()
+    status_counts: dict = {}
+    for row in aggregate_result.scalars().all():
+        totals.add(ExecutionTotals.from_aggregate(row))
+        status_counts[row.status] = status_counts.get(row.status, 0) + row.execution_count
+    for execution in live_result.scalars().all():
+        totals.add_execution(execution)
+        status_counts[execution.status.value] = status_counts.get(execution.status.value, 0) + 1
+    
+    total_executions = totals.execution_count
+    running_executions = status_counts.get(ExecutionStatus.RUNNING.value, 0)
+    completed_executions = status_counts.get(ExecutionStatus.COMPLETED.value, 0)
+    failed_executions = status_counts.get(ExecutionStatus.FAILED.value, 0)
+    
+    total_cost = totals.total_cost
+    
+    # Average duration for completed executions
+    if totals.duration_count:
+        avg_duration_seconds = totals.duration_seconds / totals.duration_count
     else:
         avg_duration_seconds = 0.0
     
@@ -319,14 +369,22 @@ async def get_execution_stats(
 @router.get("/{execution_id}", response_model=dict)
 async def get_execution(
     execution_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> dict:
+):
     """
     Get execution details by ID.
+
+    The response carries an ETag; polling with If-None-Match gets a 304
+    while nothing changed. The strategy chart contributes its revision
+    ETag instead of its candles, so unchanged charts are never re-hashed.
     
     Args:
         execution_id: Execution UUID
+        request: Incoming request (If-None-Match)
+        response: Outgoing response (ETag headers)
         current_user: Authenticated user
         db: Database session
         
@@ -391,6 +449,20 @@ async def get_execution(
         "pipeline_config": pipeline_config,
     }
 
+    chart = _strategy_chart(execution.result)
+    if chart:
+        etag = _payload_etag({
+            **execution_dict,
+            "result": _with_chart(execution.result, chart_etag(chart)),
+        })
+    else:
+        etag = _payload_etag(execution_dict)
+    if _not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    if chart:
+        execution_dict["result"] = _with_chart(execution.result, expand_chart(chart))
+    _set_cache_headers(response, etag)
     return execution_dict
 
 
@@ -413,6 +485,10 @@ async def list_executions(
     affected by limit/offset pagination.  Historical executions are paginated
     normally.  The response includes a ``total`` count so the frontend can
     build proper pagination controls.
+
+    Rows are summaries: the large JSONB payloads (logs, agent states,
+    reports, pipeline state) are not loaded, and ``reports`` only carries the
+    Trade Manager report. Use ``GET /executions/{id}`` for the full record.
     
     Args:
         pipeline_id: Optional pipeline ID filter
@@ -451,6 +527,9 @@ async def list_executions(
         .join(Pipeline, Execution.pipeline_id == Pipeline.id)
         .outerjoin(Scanner, Pipeline.scanner_id == Scanner.id)
         .where(*base_filters)
+        # Summary rows only: P&L and agent progress come from the generated
+        # columns, so the payload JSONB is never read for the list
+        .options(*lean_load())
     )
     
     # ── 1. Always fetch ALL active executions ──────────────────────────
@@ -512,9 +591,10 @@ async def list_executions(
         if execution.started_at and execution.completed_at:
             duration_seconds = (execution.completed_at - execution.started_at).total_seconds()
         
-        agent_states = execution.agent_states or []
-        agent_count = len(agent_states)
-        agents_completed = len([a for a in agent_states if a.get('status') == 'completed'])
+        agent_count = execution.agent_count or 0
+        agents_completed = execution.agents_completed or 0
+        trade_manager_report = execution.trade_manager_report
+        reports = {"trade_manager": trade_manager_report} if isinstance(trade_manager_report, dict) else {}
         
         # Extract strategy result for quick view
         strategy_action = None
@@ -598,13 +678,10 @@ async def list_executions(
                 ExecutionStatus.MONITORING, ExecutionStatus.RUNNING,
                 ExecutionStatus.COMMUNICATION_ERROR
             ):
-                if execution.reports and isinstance(execution.reports, dict):
-                    for agent_id, report in execution.reports.items():
-                        if isinstance(report, dict) and report.get('agent_type') == 'trade_manager_agent':
-                            data = report.get('data', {})
-                            if data.get('unrealized_pl') is not None or data.get('position_size'):
-                                trade_outcome = 'executed'
-                                break
+                if trade_manager_report:
+                    data = trade_manager_report.get('data') or {}
+                    if data.get('unrealized_pl') is not None or data.get('position_size'):
+                        trade_outcome = 'executed'
             
             # FINAL OVERRIDE 2: For completed executions with real P&L, the trade
             # was actually filled — override 'pending'/'accepted' to 'executed'.
@@ -629,14 +706,10 @@ async def list_executions(
                         pass
                 
                 # Check reports for unrealized_pl (reconciled trades captured P&L here)
-                if not has_real_pnl and execution.reports and isinstance(execution.reports, dict):
-                    for agent_id, report in execution.reports.items():
-                        if isinstance(report, dict) and report.get('agent_type') == 'trade_manager_agent':
-                            data = report.get('data', {})
-                            upl = data.get('unrealized_pl')
-                            if upl is not None and upl != 0:
-                                has_real_pnl = True
-                                break
+                if not has_real_pnl and trade_manager_report:
+                    upl = (trade_manager_report.get('data') or {}).get('unrealized_pl')
+                    if upl is not None and upl != 0:
+                        has_real_pnl = True
                 
                 if has_real_pnl:
                     trade_outcome = 'executed'
@@ -661,7 +734,7 @@ async def list_executions(
             strategy_confidence=strategy_confidence,
             trade_outcome=trade_outcome,
             result=result_data,  # Include full result for P&L
-            reports=execution.reports  # Include reports for monitoring P&L
+            reports=reports  # Trade Manager report only, for monitoring P&L
         ))
     
     return {
@@ -1490,7 +1563,7 @@ async def resume_monitoring_endpoint(
             pipeline_state.trade_outcome = None
             pipeline_state.communication_error = False
             save_pipeline_state(execution, pipeline_state)
-            flag_modified(execution, 'pipeline_state')
+            flag_modified(execution, 'pipeline_state_packed')
     except Exception as e:
         logger.warning(
             "failed_to_reset_pipeline_state_on_resume",
@@ -1502,11 +1575,8 @@ async def resume_monitoring_endpoint(
     
     # Schedule immediate monitoring check
     try:
-        from app.orchestration.tasks.monitoring import schedule_monitoring_check
-        schedule_monitoring_check.apply_async(
-            args=[str(execution.id)],
-            countdown=15  # 15 seconds
-        )
+        from app.orchestration.tasks.monitoring import _schedule_next_check
+        _schedule_next_check(str(execution.id), countdown=15)
     except Exception as e:
         logger.error(
             "failed_to_schedule_monitoring",
@@ -1764,27 +1834,17 @@ async def generate_executive_report(
             detail=f"Cannot generate report for execution with status: {execution.status.value}"
         )
     
-    # Return saved executive report if available
-    if execution.executive_report:
-        return execution.executive_report
-    
-    # Otherwise, generate report on-demand (for backward compatibility with old executions)
-    # Build execution data for report generator
-    execution_data = {
-        "id": str(execution.id),
-        "pipeline_name": pipeline_name,
-        "symbol": execution.symbol,
-        "mode": execution.mode,
-        "status": execution.status.value,
-        "started_at": execution.started_at.isoformat() if execution.started_at else None,
-        "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
-        "duration_seconds": (execution.completed_at - execution.started_at).total_seconds() if execution.started_at and execution.completed_at else None,
-        "cost": execution.cost,
-        "reports": execution.reports or {},
-        "result": execution.result or {},
-        "agent_states": execution.agent_states or [],
-    }
+    execution_data = build_execution_data(execution, pipeline_name)
+    state_hash = report_state_hash(execution_data)
+
+    # Return the saved report if it was built from the current execution state
+    # (normally rendered by the reports worker right after completion)
+    cached = cached_report(execution.executive_report, state_hash)
+    if cached:
+        return cached
     
+    # Otherwise, generate report on-demand (worker still busy, or state changed)
+
     trace = resume_execution_trace(
         trace_id=execution.langfuse_trace_id,
         session_id=str(execution_id),
@@ -1802,33 +1862,17 @@ async def generate_executive_report(
             parent=trace,
             metadata={"execution_id": str(execution_id)},
         ) as report_span:
-            report = await executive_report_generator.generate_executive_summary(
+            summary = await executive_report_generator.generate_executive_summary(
                 execution_data,
                 langfuse_trace=report_span
             )
     
-    # Add execution context to report
-    report["execution_context"] = {
-        "id": str(execution.id),
-        "pipeline_name": pipeline_name,
-        "symbol": execution.symbol,
-        "mode": execution.mode,
-        "started_at": execution.started_at.isoformat() if execution.started_at else None,
-        "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
-        "duration_seconds": execution_data["duration_seconds"],
-        "total_cost": execution.cost,
-    }
-    
-    # Include all agent reports
-    report["agent_reports"] = execution.reports or {}
-    
-    # Include execution artifacts (charts, etc.)
-    if execution.result and isinstance(execution.result, dict):
-        report["execution_artifacts"] = execution.result.get("execution_artifacts", {})
-        report["strategy"] = execution.result.get("strategy")
-        report["bias"] = execution.result.get("biases")
-        report["risk_assessment"] = execution.result.get("risk_assessment")
-        report["trade_execution"] = execution.result.get("trade_execution")
+    report = build_executive_report(execution_data, summary, state_hash)
+
+    # Cache under the state hash (failed generations are retried next time)
+    if not is_failed_report(summary):
+        execution.executive_report = report
+        await db.commit()
     
     return report
 
@@ -1854,16 +1898,20 @@ async def get_trade_analysis(
         Trade analysis with grade, lessons, and recommendations
     """
     result = await db.execute(
-        select(Execution).where(Execution.id == execution_id)
+        select(Execution, Pipeline.name)
+        .join(Pipeline, Execution.pipeline_id == Pipeline.id)
+        .where(Execution.id == execution_id)
     )
-    execution = result.scalar_one_or_none()
+    row = result.first()
 
-    if not execution:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Execution not found",
         )
 
+    execution, pipeline_name = row
+
     if execution.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1876,17 +1924,13 @@ async def get_trade_analysis(
             detail=f"Cannot generate trade analysis for execution with status: {execution.status.value}",
         )
 
-    # Return cached analysis if available
-    if execution.trade_analysis:
-        return execution.trade_analysis
+    execution_data = build_execution_data(execution, pipeline_name)
+    state_hash = report_state_hash(execution_data)
 
-    # Build execution data for the generator
-    execution_data = {
-        "id": str(execution.id),
-        "symbol": execution.symbol,
-        "mode": execution.mode,
-        "result": execution.result or {},
-    }
+    # Return cached analysis if it was built from the current execution state
+    cached = cached_report(execution.trade_analysis, state_hash)
+    if cached:
+        return cached
 
     trace = resume_execution_trace(
         trace_id=execution.langfuse_trace_id,
@@ -1907,9 +1951,11 @@ async def get_trade_analysis(
                 execution_data, langfuse_trace=report_span
             )
 
-    # Cache the result
-    execution.trade_analysis = analysis
-    await db.commit()
+    # Cache the result under the state hash
+    if not is_failed_report(analysis):
+        analysis = analysis | {"state_hash": state_hash}
+        execution.trade_analysis = analysis
+        await db.commit()
 
     return analysis
 
@@ -2016,3 +2062,62 @@ async def get_candles(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Failed to fetch candles from data plane: {str(e)}",
         )
+
+
+@router.get("/{execution_id}/chart", response_model=dict)
+async def get_execution_chart(
+    execution_id: UUID,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the strategy chart of an execution.
+
+    The chart is built once by the strategy agent and only extended
+    afterwards (new candles, trade events), each change bumping its
+    revision. The ETag is derived from that revision, so a repeat view or
+    poll with If-None-Match gets a 304 without the chart being decoded.
+
+    Args:
+        execution_id: Execution UUID
+        request: Incoming request (If-None-Match)
+        response: Outgoing response (ETag headers)
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Chart data (meta, candles, annotations)
+    """
+    result = await db.execute(
+        select(Execution.user_id, Execution.result).where(Execution.id == execution_id)
+    )
+    row = result.first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Execution not found"
+        )
+
+    user_id, execution_result = row
+    if user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view this execution"
+        )
+
+    chart = _strategy_chart(execution_result)
+    if not chart:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Execution has no strategy chart"
+        )
+
+    etag = chart_etag(chart)
+    if _not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    _set_cache_headers(response, etag)
+    return expand_chart(chart)
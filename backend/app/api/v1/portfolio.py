@@ -53,8 +53,10 @@ async def portfolio_risk_summary(
     strategy_counts: Dict[str, int] = {}
     symbol_set: Dict[str, Dict[str, Any]] = {}
 
+    from app.orchestration.tasks._helpers import load_pipeline_state_dict
+
     for ex in monitoring:
-        state = ex.pipeline_state or {}
+        state = load_pipeline_state_dict(ex)
         trade_exec = state.get("trade_execution") or {}
         strategy   = state.get("strategy") or {}
         risk       = state.get("risk_assessment") or {}
@@ -26,9 +26,11 @@ async def websocket_executions(
     Connect to receive updates about pipeline executions.
     
     Message types sent to client:
-    - execution_update: Status changes
-    - execution_log: Log entries
+    - execution_update: Status and agent progress (all of the user's executions)
+    - execution_pnl: Open-position P&L ticks (all of the user's executions)
+    - execution_log: New log entries (subscribed executions only)
     - execution_complete: Final results
+    - resync: Updates were dropped because the client fell behind — refetch
     
     Message types received from client:
     - subscribe: {"action": "subscribe", "execution_id": "uuid"}
@@ -51,8 +53,9 @@ async def websocket_executions(
     await manager.connect(websocket, user.id)
     
     try:
-        # Send welcome message
-        await websocket.send_json({
+        # Send welcome message (replies go through the connection's outbox
+        # so they never interleave with pushed events)
+        manager.send(websocket, {
             "type": "connected",
             "message": "Connected to execution updates",
             "user_id": str(user.id)
@@ -64,13 +67,13 @@ async def websocket_executions(
             action = data.get("action")
             
             if action == "ping":
-                await websocket.send_json({"type": "pong"})
+                manager.send(websocket, {"type": "pong"})
                 
             elif action == "subscribe":
                 execution_id = data.get("execution_id")
                 if execution_id:
                     await manager.subscribe_to_execution(UUID(execution_id), user.id)
-                    await websocket.send_json({
+                    manager.send(websocket, {
                         "type": "subscribed",
                         "execution_id": execution_id
                     })
@@ -79,12 +82,12 @@ async def websocket_executions(
                 execution_id = data.get("execution_id")
                 if execution_id:
                     await manager.unsubscribe_from_execution(UUID(execution_id), user.id)
-                    await websocket.send_json({
+                    manager.send(websocket, {
                         "type": "unsubscribed",
                         "execution_id": execution_id
                     })
             else:
-                await websocket.send_json({
+                manager.send(websocket, {
                     "type": "error",
                     "message": f"Unknown action: {action}"
                 })
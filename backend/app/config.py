@@ -5,7 +5,7 @@ This module defines all configuration settings for the application using
 Pydantic Settings for validation and environment variable loading.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
 
@@ -83,6 +83,32 @@ class Settings(BaseSettings):
         default="CloverCharts",
         description="Optional X-Title header for OpenRouter requests"
     )
+
+    # LLM request governor (app/services/llm_governor.py)
+    LLM_GOVERNOR_ENABLED: bool = Field(
+        default=True,
+        description="Route LLM calls through the request governor (budgets, priorities, coalescing)"
+    )
+    LLM_MODEL_RPM_LIMIT: int = Field(
+        default=500,
+        description="Cluster-wide requests per minute per model"
+    )
+    LLM_MODEL_TPM_LIMIT: int = Field(
+        default=200000,
+        description="Cluster-wide tokens per minute per model"
+    )
+    LLM_MODEL_LIMITS: Dict[str, Dict[str, int]] = Field(
+        default={},
+        description='Per-model overrides, e.g. {"gpt-4o": {"rpm": 300, "tpm": 150000}}'
+    )
+    LLM_MAX_CONCURRENT_REQUESTS: int = Field(
+        default=16,
+        description="Max in-flight LLM requests per process"
+    )
+    LLM_GOVERNOR_MAX_WAIT_SECONDS: float = Field(
+        default=90.0,
+        description="Max time a call waits for budget before it fails with LLMBudgetExhausted"
+    )
     
     # Langfuse (Tracing & Observability)
     LANGFUSE_SECRET_KEY: Optional[str] = Field(default=None, description="Langfuse secret key")
@@ -96,6 +122,25 @@ class Settings(BaseSettings):
         description="Langfuse host URL (v4 SDK reads this from env automatically)"
     )
     LANGFUSE_ENABLED: bool = Field(default=False, description="Enable Langfuse tracing")
+
+    # Trace export (app/services/trace_export.py)
+    TRACE_EXPORT_QUEUE_SIZE: int = Field(
+        default=5000,
+        description="Max trace events buffered per process before new ones are dropped"
+    )
+    TRACE_EXPORT_BATCH_SIZE: int = Field(default=100, description="Trace events exported per batch")
+    TRACE_EXPORT_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        description="Max time a trace event waits before its batch is exported"
+    )
+    TRACE_EXPORT_SAMPLE_RATE_UNDER_PRESSURE: float = Field(
+        default=0.1,
+        description="Share of tool-call events kept while the trace queue is over half full"
+    )
+    TRACE_EXPORT_FILE_PATH: Optional[str] = Field(
+        default=None,
+        description="Also write trace events as JSON lines to this file (offline runs)"
+    )
     
     # Market Data (Finnhub)
     FINNHUB_API_KEY: Optional[str] = Field(default=None, description="Finnhub API key")
@@ -201,6 +246,95 @@ class Settings(BaseSettings):
         description="Port used by the sandbox-local signal-generator replay API"
     )
     
+    # Position monitoring
+    MONITORING_BATCH_ENABLED: bool = Field(
+        default=True,
+        description=(
+            "Drive position monitoring from a Beat sweep that batches due executions "
+            "per broker account, instead of one self-rescheduling task per trade"
+        )
+    )
+    MONITORING_SWEEP_SECONDS: float = Field(
+        default=10.0,
+        description="How often the monitoring sweep looks for due executions"
+    )
+    MONITORING_CLAIM_SECONDS: int = Field(
+        default=120,
+        description="Lease on next_check_at while a batched check is in flight (re-dispatched after expiry)"
+    )
+
+    # Broker quote cache
+    BROKER_QUOTE_CACHE_TTL_SECONDS: float = Field(
+        default=2.0,
+        description="How long a broker quote is reused across callers (0 = no caching, coalescing only)"
+    )
+    BROKER_CANDLE_CACHE_TTL_SECONDS: float = Field(
+        default=10.0,
+        description="How long recent broker candles are reused across callers"
+    )
+    BROKER_QUOTE_CACHE_REDIS_ENABLED: bool = Field(
+        default=False,
+        description="Mirror cached broker quotes to Redis so other worker processes reuse them"
+    )
+    BROKER_QUOTE_STREAMING_ENABLED: bool = Field(
+        default=False,
+        description="Feed the quote cache from broker streaming endpoints where supported"
+    )
+    BROKER_QUOTE_STREAM_STALE_SECONDS: float = Field(
+        default=10.0,
+        description="How long a streamed quote stays valid before REST polling takes over again"
+    )
+    BROKER_QUOTE_STREAM_IDLE_SECONDS: float = Field(
+        default=300.0,
+        description="Stop a quote stream after this long without any reader"
+    )
+
+    # Worker caches (app/services/worker_cache.py)
+    WORKER_CACHE_VERSION_CHECK_SECONDS: float = Field(
+        default=15.0,
+        description="How often workers check Redis for cache invalidations"
+    )
+    MODEL_REGISTRY_CACHE_TTL_SECONDS: float = Field(
+        default=300.0,
+        description="How long a worker reuses the LLM model catalog before re-reading it"
+    )
+    TOOL_DETECTION_CACHE_TTL_SECONDS: float = Field(
+        default=86400.0,
+        description="How long tool detection results are reused for unchanged instructions (0 = off)"
+    )
+    TOOL_DETECTION_CACHE_MAX_ENTRIES: int = Field(
+        default=1024,
+        description="Tool detection results kept per worker"
+    )
+
+    # Notification outbox (app/services/notification_outbox.py)
+    NOTIFICATION_DISPATCH_INTERVAL_SECONDS: float = Field(
+        default=10.0,
+        description="How often queued Telegram/SMS notifications are dispatched (and digested)"
+    )
+    NOTIFICATION_DEDUPE_WINDOW_SECONDS: float = Field(
+        default=600.0,
+        description="Repeats of the same notification within this window are dropped (0 = off)"
+    )
+    NOTIFICATION_RATE_LIMITS: Dict[str, int] = Field(
+        default={"telegram": 600, "sms": 60},
+        description="Messages per minute per channel across all workers; the rest wait for the next run"
+    )
+
+    # WebSocket event bus
+    EXECUTION_EVENTS_ENABLED: bool = Field(
+        default=True,
+        description="Publish execution progress, logs and P&L from workers to Redis for WebSocket fan-out"
+    )
+    WEBSOCKET_OUTBOX_MAX_MESSAGES: int = Field(
+        default=200,
+        description="Messages queued per WebSocket before the oldest are dropped (client is told to resync)"
+    )
+    WEBSOCKET_SEND_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        description="Close a WebSocket whose client stops reading for this long"
+    )
+
     # PDF Reports
     PDF_STORAGE_PATH: str = Field(
         default="/app/data/reports",
@@ -35,6 +35,7 @@ async def lifespan(app: FastAPI):
     - Database connection pool initialization
     - Redis connection initialization
     - OpenTelemetry setup
+    - Execution event relay (Redis pub/sub → local WebSockets)
     - Cleanup on shutdown
     """
     logger.info("application_starting", environment=settings.ENV)
@@ -53,11 +54,24 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("telemetry_initialization_failed", error=str(e), exc_info=True)
     
+    # Fan out worker execution events to this replica's WebSockets
+    relay = None
+    if settings.EXECUTION_EVENTS_ENABLED:
+        from app.websocket import get_connection_manager
+        from app.websocket.event_bus import ExecutionEventRelay
+
+        manager = get_connection_manager()
+        relay = ExecutionEventRelay(manager)
+        manager.relay = relay
+        await relay.start()
+    
     # Startup logic here
     yield
     
     # Shutdown logic here
     logger.info("application_shutting_down")
+    if relay is not None:
+        await relay.stop()
 
 
 # Create FastAPI application
@@ -11,6 +11,7 @@ from app.models.user import User
 from app.models.scanner import Scanner, ScannerType
 from app.models.pipeline import Pipeline
 from app.models.execution import Execution, ExecutionStatus
+from app.models.execution_aggregate import ExecutionAggregate
 from app.models.cost_tracking import CostTracking, UserBudget
 from app.models.llm_model import LLMModel
 from app.models.user_device import UserDevice
@@ -27,6 +28,7 @@ __all__ = [
     "Pipeline",
     "Execution",
     "ExecutionStatus",
+    "ExecutionAggregate",
     "CostTracking",
     "UserBudget",
     "LLMModel",
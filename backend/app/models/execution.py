@@ -3,9 +3,9 @@ Execution model for tracking pipeline execution runs.
 """
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Float, Enum, Integer
+from sqlalchemy import Column, Computed, String, DateTime, ForeignKey, Text, Float, Enum, Integer, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import defer, relationship
 import uuid
 
 from ..database import Base
@@ -26,6 +26,21 @@ class ExecutionStatus(str, PyEnum):
     AWAITING_APPROVAL = "AWAITING_APPROVAL"  # Paused waiting for human approval before trade execution
 
 
+# Large JSONB columns — a long monitoring run can grow these to hundreds of
+# KB. List endpoints and periodic scans leave them out with ``lean_load()``
+# and read the generated summary columns below instead.
+PAYLOAD_COLUMNS = (
+    "pipeline_state",
+    "pipeline_state_packed",
+    "logs",
+    "agent_states",
+    "reports",
+    "cost_breakdown",
+    "executive_report",
+    "trade_analysis",
+)
+
+
 class Execution(Base):
     """
     Execution model representing a single execution run of a pipeline.
@@ -42,6 +57,8 @@ class Execution(Base):
         started_at: Timestamp when execution started
         completed_at: Timestamp when execution completed
         created_at: Timestamp of execution record creation
+        trade_manager_report: Trade Manager entry of ``reports`` (generated)
+        agent_count / agents_completed: Counts over ``agent_states`` (generated)
     """
     __tablename__ = "executions"
 
@@ -52,7 +69,8 @@ class Execution(Base):
     mode = Column(String(20), default="paper", nullable=False)  # live, paper, simulation, validation
     symbol = Column(String(20), nullable=True)
     result = Column(JSONB, nullable=True, default=dict)
-    pipeline_state = Column(JSONB, nullable=True)  # Full PipelineState snapshot for monitoring round-trips
+    pipeline_state = Column(JSONB, nullable=True)  # Legacy JSON PipelineState snapshot (read-only fallback)
+    pipeline_state_packed = Column(LargeBinary, nullable=True)  # Full PipelineState snapshot (orchestration.state_codec)
     error_message = Column(Text, nullable=True)
     cost = Column(Float, default=0.0, nullable=False)
     logs = Column(JSONB, nullable=True, default=list)  # List of log entries
@@ -64,6 +82,33 @@ class Execution(Base):
     executive_report = Column(JSONB, nullable=True)  # Comprehensive AI-generated report
     trade_analysis = Column(JSONB, nullable=True)  # AI post-trade analysis
 
+    # Summaries generated by Postgres from the payload columns, so list views
+    # never have to detoast ``reports``/``agent_states``
+    trade_manager_report = Column(
+        JSONB,
+        Computed(
+            """jsonb_path_query_first(reports, '$.* ? (@.agent_type == "trade_manager_agent")'::jsonpath)""",
+            persisted=True,
+        ),
+    )
+    agent_count = Column(
+        Integer,
+        Computed(
+            "CASE WHEN jsonb_typeof(agent_states) = 'array' "
+            "THEN jsonb_array_length(agent_states) ELSE 0 END",
+            persisted=True,
+        ),
+    )
+    agents_completed = Column(
+        Integer,
+        Computed(
+            "CASE WHEN jsonb_typeof(agent_states) = 'array' "
+            """THEN jsonb_array_length(jsonb_path_query_array(agent_states, '$[*] ? (@.status == "completed")'::jsonpath)) """
+            "ELSE 0 END",
+            persisted=True,
+        ),
+    )
+
     # Position monitoring fields (Trade Manager)
     execution_phase = Column(String(20), default="execute", nullable=False)  # "execute" or "monitoring"
     next_check_at = Column(DateTime, nullable=True)  # When to check position next
@@ -90,3 +135,16 @@ class Execution(Base):
 
     def __repr__(self):
         return f"<Execution(id={self.id}, pipeline_id={self.pipeline_id}, status={self.status})>"
+
+
+def lean_load(*keep: str) -> list:
+    """
+    Loader options that defer every payload column except ``keep``.
+
+    Deferred columns lazy-load on access, which raises under AsyncSession —
+    only use this where the code below the query doesn't touch them.
+
+    Example:
+        select(Execution).options(*lean_load("pipeline_state"))
+    """
+    return [defer(getattr(Execution, name)) for name in PAYLOAD_COLUMNS if name not in keep]
@@ -0,0 +1,56 @@
+"""
+Execution aggregate model — materialized dashboard totals.
+
+One row per (pipeline, UTC day of ``created_at``, status) over *terminal*
+executions (completed, failed, cancelled, skipped). Rows are recomputed
+from the executions table whenever an execution in the bucket changes, so
+the dashboard reads constant-size rows instead of every execution.
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from ..database import Base
+
+
+class ExecutionAggregate(Base):
+    """
+    Per-pipeline, per-day, per-status execution totals.
+
+    P&L fields follow the dashboard's definitions: ``realized_*`` is
+    ``result.final_pnl``; ``unrealized_*`` is the Trade Manager's last
+    ``unrealized_pl`` for executions that never recorded a final P&L.
+    ``trade_*``/``win_*``/``loss_*`` only count real trades (executed or
+    cancelled outcome, or a non-zero P&L without an outcome).
+    """
+    __tablename__ = "execution_aggregates"
+
+    pipeline_id = Column(UUID(as_uuid=True), ForeignKey("pipelines.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(String(32), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    execution_count = Column(Integer, default=0, nullable=False)
+    total_cost = Column(Float, default=0.0, nullable=False)
+
+    realized_pnl = Column(Float, default=0.0, nullable=False)
+    realized_count = Column(Integer, default=0, nullable=False)
+    unrealized_pnl = Column(Float, default=0.0, nullable=False)
+    unrealized_count = Column(Integer, default=0, nullable=False)
+
+    trade_count = Column(Integer, default=0, nullable=False)
+    win_count = Column(Integer, default=0, nullable=False)
+    loss_count = Column(Integer, default=0, nullable=False)
+    win_pnl = Column(Float, default=0.0, nullable=False)
+    loss_pnl = Column(Float, default=0.0, nullable=False)
+    best_trade = Column(Float, default=0.0, nullable=False)
+    worst_trade = Column(Float, default=0.0, nullable=False)
+
+    duration_seconds = Column(Float, default=0.0, nullable=False)  # Completed executions with start/end
+    duration_count = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ExecutionAggregate(pipeline_id={self.pipeline_id}, day={self.day}, status={self.status})>"
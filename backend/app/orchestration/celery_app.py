@@ -4,9 +4,10 @@ Celery Application Configuration
 Configures Celery for asynchronous task execution and scheduling.
 """
 import logging
+from datetime import timedelta
 from celery import Celery
 from celery.schedules import crontab
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_process_shutdown
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -22,12 +23,15 @@ celery_app = Celery(
         "app.orchestration.tasks.reconciliation",
         "app.orchestration.tasks.monitoring",
         "app.orchestration.tasks.maintenance",
+        "app.orchestration.tasks.dashboard_aggregates",
         "app.orchestration.tasks.stop_execution",
         "app.orchestration.tasks.approval",
         "app.orchestration.tasks.liquidate_positions",
         "app.orchestration.tasks.check_pipeline_schedules_active_hours",
         "app.orchestration.tasks.launch_backtest_runtime",
         "app.orchestration.tasks.run_backtest",
+        "app.orchestration.tasks.reports",
+        "app.orchestration.tasks.notifications",
     ]
 )
 
@@ -66,6 +70,13 @@ celery_app.conf.update(
         'socket_connect_timeout': 5,
         'socket_keepalive': True,
     },
+
+    # Report rendering (LLM summaries + PDF) runs on its own low-priority
+    # worker pool: `celery worker -Q reports`. Everything else stays on the
+    # default "celery" queue.
+    task_routes={
+        "app.orchestration.tasks.generate_execution_reports": {"queue": "reports"},
+    },
 )
 
 # Celery Beat schedule for periodic tasks
@@ -75,16 +86,31 @@ celery_app.conf.beat_schedule = {
         "task": "app.orchestration.tasks.check_scheduled_pipelines",
         "schedule": crontab(minute="*"),  # Every minute
     },
-    # Reconcile trades per user (master scheduler spawns per-user tasks)
+    # Reconcile trades per broker account (master scheduler spawns per-account tasks)
     "schedule-user-reconciliation": {
         "task": "app.orchestration.tasks.schedule_user_reconciliation",
         "schedule": crontab(minute="*/5"),  # Every 5 minutes (safety net, not primary monitoring)
     },
+    # Batched position monitoring: claim due executions and fan out per broker account
+    "dispatch-due-monitoring": {
+        "task": "app.orchestration.tasks.dispatch_due_monitoring",
+        "schedule": timedelta(seconds=settings.MONITORING_SWEEP_SECONDS),
+    },
+    # Send queued Telegram/SMS notifications (deduped, digested, rate-limited)
+    "dispatch-notifications": {
+        "task": "app.orchestration.tasks.dispatch_notifications",
+        "schedule": timedelta(seconds=settings.NOTIFICATION_DISPATCH_INTERVAL_SECONDS),
+    },
     # Clean up old executions daily
     "cleanup-old-executions": {
         "task": "app.orchestration.tasks.cleanup_old_executions",
         "schedule": crontab(hour=3, minute=0),  # 3 AM daily
     },
+    # Rebuild dashboard aggregates after cleanup (bulk deletes bypass the session hooks)
+    "rebuild-execution-aggregates": {
+        "task": "app.orchestration.tasks.rebuild_execution_aggregates",
+        "schedule": crontab(hour=3, minute=30),  # 3:30 AM daily
+    },
     # Fail stale RUNNING/PENDING executions every minute (prevents pipeline-wide blocking)
     "cleanup-stale-running-executions": {
         "task": "app.orchestration.tasks.cleanup_stale_running_executions",
@@ -122,3 +148,14 @@ def init_worker_telemetry(**kwargs):
         logger.info("Celery worker telemetry initialized")
     except Exception as e:
         logger.error(f"Failed to initialize Celery worker telemetry: {e}")
+
+
+# Prefork children exit via os._exit, so atexit never drains their trace queue
+@worker_process_shutdown.connect
+def flush_worker_traces(**kwargs):
+    """Export trace events still queued in this worker process."""
+    try:
+        from app.services.trace_export import trace_exporter
+        trace_exporter.close()
+    except Exception as e:
+        logger.error(f"Failed to flush trace events on worker shutdown: {e}")
@@ -26,6 +26,7 @@ from app.services.langfuse_service import (
     span_context,
     start_or_resume_trace,
 )
+from app.websocket.event_bus import publish_execution_event
 
 logger = structlog.get_logger()
 
@@ -771,6 +772,7 @@ class PipelineExecutor:
         
         # Track execution metrics
         start_time = time.time()
+        self._published_log_count = 0
         
         # Use prometheus_client histogram and counter for metrics tracking
         from app.telemetry import pipeline_duration_histogram, pipeline_executions_counter
@@ -913,6 +915,7 @@ class PipelineExecutor:
                 flag_modified(execution, "agent_states")
                 flag_modified(execution, "logs")
                 db_session.commit()
+                self._publish_progress(execution, agent_states, state)
 
                 self.logger.info(
                     "executing_agent",
@@ -967,6 +970,7 @@ class PipelineExecutor:
                     execution.version += 1
                     
                     db_session.commit()
+                    self._publish_progress(execution, agent_states, state)
                     
                     self.logger.info(
                         "agent_completed",
@@ -1114,6 +1118,15 @@ class PipelineExecutor:
         execution.version += 1
         
         db_session.commit()
+        self._publish_progress(execution, agent_states, state)
+        if execution.status != ExecutionStatus.MONITORING:
+            publish_execution_event(self.user_id, execution.id, "execution_complete", {
+                "status": execution.status.value,
+                "cost": execution.cost,
+                "final_pnl": execution.result.get("final_pnl"),
+                "final_pnl_percent": execution.result.get("final_pnl_percent"),
+                "errors": state.errors,
+            })
         
         self.logger.info(
             "pipeline_execution_completed",
@@ -1123,26 +1136,28 @@ class PipelineExecutor:
             trigger_met=state.trigger_met
         )
         
-        # Generate PDF report if execution completed successfully
+        # Hand report generation (LLM summary, trade analysis, PDF) to the
+        # low-priority reports queue so this worker slot frees up right away
         if execution.status == ExecutionStatus.COMPLETED and self.mode != "backtest":
-            self._generate_pdf_report_sync(execution, db_session, trace=pipeline_trace)
+            self._enqueue_reports(execution)
         
         # Persist full PipelineState snapshot so monitoring/reconciliation
         # can round-trip state without lossy reconstruction from execution.result.
         if execution.status == ExecutionStatus.MONITORING:
+            from app.config import settings
             from app.orchestration.tasks._helpers import save_pipeline_state
+            if settings.MONITORING_BATCH_ENABLED:
+                # First check on the next monitoring sweep
+                execution.next_check_at = datetime.utcnow()
             save_pipeline_state(execution, state, db=db_session)
             db_session.commit()
 
         # Schedule monitoring task if entering monitoring mode
         if execution.status == ExecutionStatus.MONITORING:
-            from app.orchestration.tasks import schedule_monitoring_check
+            from app.orchestration.tasks.monitoring import _schedule_next_check
             # Schedule first check immediately (countdown=0) so UI shows P&L right away
             # Subsequent checks will use the configured interval
-            schedule_monitoring_check.apply_async(
-                args=[str(execution.id)],
-                countdown=0  # First check happens immediately
-            )
+            _schedule_next_check(str(execution.id), countdown=0)
             self.logger.info(
                 "monitoring_scheduled",
                 execution_id=str(execution.id),
@@ -1154,6 +1169,20 @@ class PipelineExecutor:
         flush_langfuse()
         return execution
     
+    def _publish_progress(self, execution, agent_states, state):
+        """Push agent progress and any new log entries to the user's WebSockets."""
+        publish_execution_event(self.user_id, execution.id, "execution_update", {
+            "status": execution.status.value if execution.status else None,
+            "agent_states": agent_states,
+            "cost": state.total_cost,
+        })
+        new_logs = state.execution_log[self._published_log_count:]
+        if new_logs:
+            publish_execution_event(self.user_id, execution.id, "execution_log", {
+                "entries": self._serialize_logs(new_logs),
+            })
+            self._published_log_count = len(state.execution_log)
+
     def _serialize_logs(self, logs):
         """Convert execution logs to JSON-serializable format."""
         serialized = []
@@ -1183,74 +1212,14 @@ class PipelineExecutor:
             return {k: self._serialize_value(v) for k, v in value.items()}
         return value
     
-    def _generate_pdf_report_sync(self, execution: Any, db_session: Any, trace: Optional[Any] = None):
-        """
-        Generate PDF report for completed execution (synchronous version).
-        
-        Runs in background to avoid blocking execution completion.
-        """
+    def _enqueue_reports(self, execution: Any):
+        """Queue report generation for a completed execution (never fails the execution)."""
         try:
-            from app.services.pdf_generator import pdf_generator
-            from app.services.executive_report_generator import executive_report_generator
-            from sqlalchemy.orm.attributes import flag_modified
-            
-            self.logger.info("generating_pdf_report", execution_id=str(execution.id))
-            
-            # Prepare execution data
-            execution_data = {
-                "id": str(execution.id),
-                "pipeline_name": self.pipeline.name if hasattr(self.pipeline, 'name') else "Unknown",
-                "symbol": execution.symbol,
-                "mode": execution.mode,
-                "status": execution.status.value,
-                "started_at": execution.started_at.isoformat() if execution.started_at else None,
-                "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
-                "duration_seconds": (execution.completed_at - execution.started_at).total_seconds() if execution.started_at and execution.completed_at else None,
-                "cost": execution.cost,
-                "trigger_source": getattr(self, 'trigger_source', 'N/A'),
-                "reports": execution.reports or {},
-                "result": execution.result or {},
-            }
-            
-            # Try to generate AI summary (optional - don't fail if it errors)
-            # NOTE: executive_report_generator methods are synchronous
-            executive_summary = None
-            try:
-                with span_context(
-                    name="report:executive_summary",
-                    parent=trace,
-                    metadata={"execution_id": str(execution.id)},
-                ) as report_span:
-                    executive_summary = executive_report_generator.generate_executive_summary_sync(
-                        execution_data,
-                        langfuse_trace=report_span
-                    )
-            except Exception as e:
-                self.logger.warning("executive_summary_generation_failed", error=str(e))
-            
-            # Generate PDF (synchronous)
-            with span_context(
-                name="report:pdf_generation",
-                parent=trace,
-                metadata={"execution_id": str(execution.id)},
-            ):
-                pdf_path = pdf_generator.generate_execution_report(
-                    execution_id=str(execution.id),
-                    execution_data=execution_data,
-                    executive_summary=executive_summary
-                )
-            
-            # Update execution record with PDF path
-            execution.report_pdf_path = pdf_path
-            flag_modified(execution, "report_pdf_path")
-            db_session.commit()
-            
-            self.logger.info("pdf_report_generated_successfully", 
-                           execution_id=str(execution.id),
-                           pdf_path=pdf_path)
-            
+            from app.orchestration.tasks.reports import generate_execution_reports
+
+            generate_execution_reports.apply_async(args=[str(execution.id)])
+            self.logger.info("execution_reports_enqueued", execution_id=str(execution.id))
         except Exception as e:
-            # Log error but don't fail the execution
-            self.logger.error("pdf_generation_failed", 
+            self.logger.error("execution_reports_enqueue_failed",
                             execution_id=str(execution.id),
                             error=str(e))
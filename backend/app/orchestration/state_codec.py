@@ -0,0 +1,228 @@
+"""
+Compact binary codec for PipelineState snapshots.
+
+The executor, approval flow, monitoring and reconciliation tasks persist the
+full PipelineState between steps. As JSON, most of that snapshot is the
+candle history in ``market_data.timeframes``: one object per candle with
+repeated keys and ISO timestamps. This codec stores the snapshot as msgpack
+instead:
+
+  - Everything except the candles is the same JSON-mode dump as before
+    (UUIDs and datetimes as strings), so it round-trips through the same
+    Pydantic validation.
+  - Candles are stored per timeframe as columns — little-endian float64 /
+    int64 arrays for prices, volumes, epoch-microsecond timestamps and
+    indicators (NaN for missing values).
+  - The candle columns are a separately packed blob. ``decode_state`` leaves
+    it packed and returns a ``PackedMarketData`` that decodes it on first
+    access to ``timeframes``, so agents and tasks that never read raw
+    candles don't pay for them. Re-encoding a state whose candles were never
+    touched reuses the blob as-is.
+"""
+import math
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import msgpack
+from pydantic import PrivateAttr, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from app.schemas.pipeline_state import MarketData, PipelineState, TimeframeData
+
+# Bump when the layout changes; older versions must stay decodable
+CODEC_VERSION = 1
+
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+_INDICATOR_COLUMNS = (
+    "sma_20",
+    "sma_50",
+    "ema_12",
+    "ema_26",
+    "rsi",
+    "macd",
+    "macd_signal",
+    "bollinger_upper",
+    "bollinger_middle",
+    "bollinger_lower",
+)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SWAP_BYTES = sys.byteorder != "little"
+_CANDLE_LIST = TypeAdapter(List[TimeframeData])
+
+
+class PackedMarketData(MarketData):
+    """MarketData whose candle history is decoded on first access."""
+
+    _packed_timeframes: Optional[bytes] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_packed(cls, fields: Dict[str, Any], packed_timeframes: bytes) -> "PackedMarketData":
+        market_data = cls.model_validate(fields)
+        # Leave the field unset so attribute access falls through to __getattr__
+        del market_data.__dict__["timeframes"]
+        market_data._packed_timeframes = packed_timeframes
+        return market_data
+
+    @property
+    def candles_decoded(self) -> bool:
+        return "timeframes" in self.__dict__
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "timeframes":
+            timeframes = _unpack_timeframes(self._packed_timeframes)
+            self.__dict__["timeframes"] = timeframes
+            return timeframes
+        return super().__getattr__(name)
+
+
+def encode_state(state: PipelineState) -> bytes:
+    """Serialize a PipelineState to the compact binary format."""
+    market = None
+    if state.market_data is not None:
+        market = _encode_market_data(state.market_data)
+    return msgpack.packb(
+        {
+            "v": CODEC_VERSION,
+            "state": state.model_dump(mode="json", exclude={"market_data"}),
+            "market": market,
+        },
+        use_bin_type=True,
+    )
+
+
+def decode_state_dict(data: bytes) -> Dict[str, Any]:
+    """
+    JSON-mode dict of a packed state, without candles.
+
+    For callers that only need a few fields (broker config, symbol) and
+    don't want a validated PipelineState.
+    """
+    payload = _unpack_envelope(data)
+    state_dict = payload["state"]
+    market = payload.get("market")
+    state_dict["market_data"] = dict(market["fields"]) if market else None
+    return state_dict
+
+
+def decode_state(data: bytes) -> PipelineState:
+    """Deserialize a packed PipelineState; candles stay packed until read."""
+    payload = _unpack_envelope(data)
+    state = PipelineState.model_validate(payload["state"])
+    market = payload.get("market")
+    if market:
+        state.market_data = PackedMarketData.from_packed(market["fields"], market["timeframes"])
+    return state
+
+
+def _unpack_envelope(data: bytes) -> Dict[str, Any]:
+    payload = msgpack.unpackb(data, raw=False)
+    version = payload.get("v")
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported pipeline state codec version: {version}")
+    return payload
+
+
+def _encode_market_data(market_data: MarketData) -> Dict[str, Any]:
+    fields = to_jsonable_python({
+        name: getattr(market_data, name)
+        for name in MarketData.model_fields
+        if name != "timeframes"
+    })
+    if isinstance(market_data, PackedMarketData) and not market_data.candles_decoded:
+        packed = market_data._packed_timeframes
+    else:
+        packed = _pack_timeframes(market_data.timeframes)
+    return {"fields": fields, "timeframes": packed}
+
+
+def _pack_timeframes(timeframes: Dict[str, List[TimeframeData]]) -> bytes:
+    return msgpack.packb(
+        {key: _pack_candles(candles) for key, candles in timeframes.items()},
+        use_bin_type=True,
+    )
+
+
+def _unpack_timeframes(packed: Optional[bytes]) -> Dict[str, List[TimeframeData]]:
+    if not packed:
+        return {}
+    columns_by_key = msgpack.unpackb(packed, raw=False)
+    return {key: _unpack_candles(columns) for key, columns in columns_by_key.items()}
+
+
+def _pack_candles(candles: List[Any]) -> Dict[str, Any]:
+    rows = [
+        candle if isinstance(candle, TimeframeData) else TimeframeData.model_validate(candle)
+        for candle in candles
+    ]
+    timestamps = array("q")
+    aware = array("b")
+    for row in rows:
+        ts = row.timestamp
+        aware.append(1 if ts.tzinfo is not None else 0)
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        delta = ts - _EPOCH
+        timestamps.append((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds)
+
+    labels = {row.timeframe for row in rows}
+    columns: Dict[str, Any] = {
+        "n": len(rows),
+        "timeframe": labels.pop() if len(labels) == 1 else [row.timeframe for row in rows],
+        "timestamp": _to_bytes(timestamps),
+        "aware": aware.tobytes(),
+        "volume": _to_bytes(array("q", (row.volume for row in rows))),
+    }
+    for name in _PRICE_COLUMNS:
+        columns[name] = _to_bytes(array("d", (getattr(row, name) for row in rows)))
+    for name in _INDICATOR_COLUMNS:
+        values = [getattr(row, name) for row in rows]
+        if all(value is None for value in values):
+            continue
+        columns[name] = _to_bytes(array("d", (math.nan if value is None else value for value in values)))
+    return columns
+
+
+def _unpack_candles(columns: Dict[str, Any]) -> List[TimeframeData]:
+    count = columns["n"]
+    label = columns["timeframe"]
+    labels = label if isinstance(label, list) else [label] * count
+    names = ["timeframe", "timestamp", "volume"]
+    values = [labels, _decode_timestamps(columns), _from_bytes("q", columns["volume"]).tolist()]
+    for name in _PRICE_COLUMNS:
+        names.append(name)
+        values.append(_from_bytes("d", columns[name]).tolist())
+    for name in _INDICATOR_COLUMNS:
+        if name in columns:
+            names.append(name)
+            values.append([
+                None if math.isnan(value) else value
+                for value in _from_bytes("d", columns[name]).tolist()
+            ])
+    # One bulk validation is much cheaper than building candles one by one
+    return _CANDLE_LIST.validate_python([dict(zip(names, row)) for row in zip(*values)])
+
+
+def _decode_timestamps(columns: Dict[str, Any]) -> List[datetime]:
+    naive_epoch = _EPOCH.replace(tzinfo=None)
+    timestamps = []
+    for micros, aware in zip(_from_bytes("q", columns["timestamp"]).tolist(), columns["aware"]):
+        ts = naive_epoch + timedelta(microseconds=micros)
+        timestamps.append(ts.replace(tzinfo=timezone.utc) if aware else ts)
+    return timestamps
+
+
+def _to_bytes(values: array) -> bytes:
+    if _SWAP_BYTES:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values
@@ -6,11 +6,16 @@ __all__ = [
     "execute_pipeline",
     "check_scheduled_pipelines",
     "reconcile_user_trades",
+    "reconcile_broker_account",
     "schedule_user_reconciliation",
     "schedule_monitoring_check",
+    "dispatch_due_monitoring",
+    "monitor_broker_account",
     "cleanup_old_executions",
     "cleanup_stale_running_executions",
     "reset_daily_budgets",
+    "refresh_execution_aggregates",
+    "rebuild_execution_aggregates",
     "stop_execution",
     "resume_approved_execution",
     "check_approval_timeout",
@@ -18,6 +23,8 @@ __all__ = [
     "check_pipeline_schedules_active_hours",
     "launch_backtest_runtime",
     "run_backtest",
+    "generate_execution_reports",
+    "dispatch_notifications",
 ]
 
 
@@ -30,20 +37,30 @@ def __getattr__(name):
         from app.orchestration.tasks.check_scheduled_pipelines import check_scheduled_pipelines
 
         return check_scheduled_pipelines
-    if name in {"reconcile_user_trades", "schedule_user_reconciliation"}:
+    if name in {"reconcile_user_trades", "reconcile_broker_account", "schedule_user_reconciliation"}:
         from app.orchestration.tasks.reconciliation import (
             reconcile_user_trades,
+            reconcile_broker_account,
             schedule_user_reconciliation,
         )
 
         return {
             "reconcile_user_trades": reconcile_user_trades,
+            "reconcile_broker_account": reconcile_broker_account,
             "schedule_user_reconciliation": schedule_user_reconciliation,
         }[name]
-    if name == "schedule_monitoring_check":
-        from app.orchestration.tasks.monitoring import schedule_monitoring_check
+    if name in {"schedule_monitoring_check", "dispatch_due_monitoring", "monitor_broker_account"}:
+        from app.orchestration.tasks.monitoring import (
+            schedule_monitoring_check,
+            dispatch_due_monitoring,
+            monitor_broker_account,
+        )
 
-        return schedule_monitoring_check
+        return {
+            "schedule_monitoring_check": schedule_monitoring_check,
+            "dispatch_due_monitoring": dispatch_due_monitoring,
+            "monitor_broker_account": monitor_broker_account,
+        }[name]
     if name in {
         "cleanup_old_executions",
         "cleanup_stale_running_executions",
@@ -60,6 +77,16 @@ def __getattr__(name):
             "cleanup_stale_running_executions": cleanup_stale_running_executions,
             "reset_daily_budgets": reset_daily_budgets,
         }[name]
+    if name in {"refresh_execution_aggregates", "rebuild_execution_aggregates"}:
+        from app.orchestration.tasks.dashboard_aggregates import (
+            refresh_execution_aggregates,
+            rebuild_execution_aggregates,
+        )
+
+        return {
+            "refresh_execution_aggregates": refresh_execution_aggregates,
+            "rebuild_execution_aggregates": rebuild_execution_aggregates,
+        }[name]
     if name == "stop_execution":
         from app.orchestration.tasks.stop_execution import stop_execution
 
@@ -92,4 +119,12 @@ def __getattr__(name):
         from app.orchestration.tasks.run_backtest import run_backtest
 
         return run_backtest
+    if name == "generate_execution_reports":
+        from app.orchestration.tasks.reports import generate_execution_reports
+
+        return generate_execution_reports
+    if name == "dispatch_notifications":
+        from app.orchestration.tasks.notifications import dispatch_notifications
+
+        return dispatch_notifications
     raise AttributeError(name)
@@ -3,7 +3,6 @@ Shared helper functions used across multiple Celery tasks.
 """
 import structlog
 from datetime import datetime
-from uuid import UUID
 from typing import Optional, Dict, Any
 
 from app.database import SessionLocal
@@ -19,7 +18,7 @@ def _send_position_closed_notification(
     exit_reason: str = "Position closed"
 ):
     """
-    Send Telegram notification for position closure.
+    Queue a Telegram notification for position closure.
     
     Args:
         execution: Execution object
@@ -28,7 +27,8 @@ def _send_position_closed_notification(
         exit_reason: Reason for exit
     """
     try:
-        from app.services.telegram_notifier import telegram_notifier
+        from app.services.notification_outbox import NotificationEvent, notification_outbox
+        from app.services.telegram_notifier import TelegramNotifier
         from app.models.user import User as UserModel
         from app.models.pipeline import Pipeline as PipelineModel
         
@@ -55,22 +55,26 @@ def _send_position_closed_notification(
             if "position_closed" not in notification_events:
                 return
             
-            # Send notification
-            telegram_notifier.send_position_closed(
-                bot_token=user.telegram_bot_token,
-                chat_id=user.telegram_chat_id,
-                symbol=execution.symbol,
-                pnl=pnl,
-                pnl_percent=pnl_percent,
-                exit_reason=exit_reason,
-                pipeline_name=pipeline.name
-            )
+            # Monitoring and reconciliation may both report the same close
+            notification_outbox.enqueue(NotificationEvent(
+                channel="telegram",
+                user_id=str(execution.user_id),
+                event="position_closed",
+                message=TelegramNotifier.position_closed_message(
+                    symbol=execution.symbol,
+                    pnl=pnl,
+                    pnl_percent=pnl_percent,
+                    exit_reason=exit_reason,
+                    pipeline_name=pipeline.name
+                ),
+                dedupe_key=f"position_closed:{execution.id}",
+            ))
             
             logger.info(
-                "telegram_notification_sent",
+                "telegram_notification_queued",
                 user_id=str(execution.user_id),
                 pipeline_id=str(execution.pipeline_id),
-                event="position_closed"
+                notification_event="position_closed"
             )
             
         finally:
@@ -91,10 +95,11 @@ def _send_monitoring_stalled_notification(
     last_error: str = None,
 ):
     """
-    Send Telegram notification when monitoring is stalled due to communication errors.
+    Queue a Telegram notification when monitoring is stalled due to communication errors.
 
     Alerts the user that their position may still be open on the broker but the
     system can no longer reach the broker API. Manual review is required.
+    Repeats for the same execution within the outbox dedupe window are dropped.
 
     Args:
         execution: Execution object
@@ -102,13 +107,11 @@ def _send_monitoring_stalled_notification(
         last_error: Last error message from broker API
     """
     try:
-        from app.services.telegram_notifier import telegram_notifier
+        from app.services.notification_outbox import NotificationEvent, notification_outbox
+        from app.services.telegram_notifier import TelegramNotifier
         from app.models.user import User as UserModel
         from app.models.pipeline import Pipeline as PipelineModel
 
-        if not telegram_notifier:
-            return
-
         db = SessionLocal()
         try:
             user = db.query(UserModel).filter(UserModel.id == execution.user_id).first()
@@ -124,22 +127,26 @@ def _send_monitoring_stalled_notification(
 
             pipeline_name = pipeline.name if pipeline else "Unknown Pipeline"
 
-            telegram_notifier.send_pipeline_error(
-                bot_token=user.telegram_bot_token,
-                chat_id=user.telegram_chat_id,
-                pipeline_name=pipeline_name,
-                error_message=(
-                    f"⚠️ Broker communication lost for {execution.symbol or 'unknown symbol'} "
-                    f"after {error_count} attempts.\n\n"
-                    f"Your position may still be OPEN on the broker.\n"
-                    f"Please check your broker account and reconcile manually.\n\n"
-                    f"Last error: {last_error or 'Unknown'}"
+            notification_outbox.enqueue(NotificationEvent(
+                channel="telegram",
+                user_id=str(execution.user_id),
+                event="monitoring_stalled",
+                message=TelegramNotifier.pipeline_error_message(
+                    pipeline_name=pipeline_name,
+                    error_message=(
+                        f"⚠️ Broker communication lost for {execution.symbol or 'unknown symbol'} "
+                        f"after {error_count} attempts.\n\n"
+                        f"Your position may still be OPEN on the broker.\n"
+                        f"Please check your broker account and reconcile manually.\n\n"
+                        f"Last error: {last_error or 'Unknown'}"
+                    ),
+                    symbol=execution.symbol,
                 ),
-                symbol=execution.symbol,
-            )
+                dedupe_key=f"monitoring_stalled:{execution.id}",
+            ))
 
             logger.info(
-                "monitoring_stalled_notification_sent",
+                "monitoring_stalled_notification_queued",
                 user_id=str(execution.user_id),
                 pipeline_id=str(execution.pipeline_id),
                 symbol=execution.symbol,
@@ -193,6 +200,23 @@ def _extract_broker_tool(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return None
 
 
+def _broker_account_key(broker_tool: Dict[str, Any]) -> str:
+    """
+    Identify the broker account a broker tool trades on.
+
+    Executions whose tools resolve to the same key share one broker account,
+    so their broker reads can be batched (monitoring) or cached (reconciliation).
+
+    Args:
+        broker_tool: Broker tool config dict (see _extract_broker_tool)
+
+    Returns:
+        Key of the form "tool_type:account_id:account_type"
+    """
+    config = broker_tool.get("config", {}) or {}
+    return f"{broker_tool.get('tool_type')}:{config.get('account_id')}:{config.get('account_type')}"
+
+
 def _serialize_logs(logs):
     """Helper to serialize execution logs."""
     return [
@@ -236,10 +260,12 @@ def _serialize_reports(reports):
 
 def save_pipeline_state(execution, state, db=None):
     """
-    Serialize and save the full PipelineState to execution.pipeline_state.
+    Serialize and save the full PipelineState to execution.pipeline_state_packed.
 
-    Uses Pydantic's .dict() for lossless round-tripping.  UUIDs and datetimes
-    are converted to strings so the result is pure JSON.
+    Uses the compact binary codec (orchestration.state_codec): msgpack with
+    candles stored as columns. Candles that were loaded but never read are
+    written back without being decoded. The legacy JSON column is cleared
+    once the execution has a packed snapshot.
 
     Args:
         execution: Execution ORM object
@@ -247,23 +273,13 @@ def save_pipeline_state(execution, state, db=None):
         db: Optional SQLAlchemy session — if provided, flag_modified is called
     """
     from sqlalchemy.orm.attributes import flag_modified
-
-    def _json_safe(value):
-        """Recursively convert non-JSON-native types."""
-        if isinstance(value, datetime):
-            return value.isoformat()
-        if isinstance(value, UUID):
-            return str(value)
-        if isinstance(value, dict):
-            return {k: _json_safe(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [_json_safe(item) for item in value]
-        return value
+    from app.orchestration.state_codec import encode_state
 
     try:
-        execution.pipeline_state = _json_safe(state.dict())
+        execution.pipeline_state_packed = encode_state(state)
+        execution.pipeline_state = None
         if db is not None:
-            flag_modified(execution, "pipeline_state")
+            flag_modified(execution, "pipeline_state_packed")
     except Exception as e:
         logger.error(
             "save_pipeline_state_failed",
@@ -273,12 +289,35 @@ def save_pipeline_state(execution, state, db=None):
         )
 
 
+def load_pipeline_state_dict(execution) -> Dict[str, Any]:
+    """
+    The saved PipelineState as a JSON-mode dict, without candles.
+
+    Cheaper than load_pipeline_state for callers that only read a few
+    fields (strategy, broker config). Returns {} if nothing was saved.
+    """
+    if execution.pipeline_state_packed:
+        from app.orchestration.state_codec import decode_state_dict
+
+        try:
+            return decode_state_dict(execution.pipeline_state_packed)
+        except Exception as e:
+            logger.warning(
+                "pipeline_state_dict_decode_failed",
+                execution_id=str(execution.id),
+                error=str(e),
+            )
+    return execution.pipeline_state or {}
+
+
 def load_pipeline_state(execution):
     """
-    Deserialize PipelineState from execution.pipeline_state.
+    Deserialize PipelineState from execution.pipeline_state_packed.
 
-    Falls back to the legacy reconstruction from execution.result
-    if pipeline_state is not yet populated (for pre-migration executions).
+    Market-data candles stay packed until an agent reads them. Falls back to
+    the legacy JSON snapshot in execution.pipeline_state, then to the legacy
+    reconstruction from execution.result if no snapshot was saved (for
+    pre-migration executions).
 
     Args:
         execution: Execution ORM object
@@ -286,6 +325,7 @@ def load_pipeline_state(execution):
     Returns:
         PipelineState instance, or None if deserialization fails entirely
     """
+    from app.orchestration.state_codec import decode_state
     from app.schemas.pipeline_state import (
         PipelineState,
         StrategyResult,
@@ -293,7 +333,18 @@ def load_pipeline_state(execution):
         TradeExecution,
     )
 
-    # --- Primary path: use the full pipeline_state snapshot ---
+    # --- Primary path: use the packed pipeline_state snapshot ---
+    if execution.pipeline_state_packed:
+        try:
+            return decode_state(execution.pipeline_state_packed)
+        except Exception as e:
+            logger.warning(
+                "pipeline_state_decode_failed_trying_legacy",
+                execution_id=str(execution.id),
+                error=str(e),
+            )
+
+    # --- Legacy JSON snapshot ---
     if execution.pipeline_state:
         try:
             return PipelineState(**execution.pipeline_state)
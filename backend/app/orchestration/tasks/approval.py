@@ -174,7 +174,7 @@ def resume_approved_execution(self, execution_id: str) -> dict:
             execution.monitor_interval_minutes = getattr(state, "monitor_interval_minutes", 5.0)
 
             # Schedule monitoring check
-            from app.orchestration.tasks.monitoring import schedule_monitoring_check
+            from app.orchestration.tasks.monitoring import _schedule_next_check
             monitor_delay = execution.monitor_interval_minutes * 60
             execution.next_check_at = datetime.utcnow() + __import__("datetime").timedelta(seconds=monitor_delay)
 
@@ -182,15 +182,12 @@ def resume_approved_execution(self, execution_id: str) -> dict:
             flag_modified(execution, "logs")
             flag_modified(execution, "reports")
             flag_modified(execution, "result")
-            flag_modified(execution, "pipeline_state")
+            flag_modified(execution, "pipeline_state_packed")
             flag_modified(execution, "cost_breakdown")
             execution.version += 1
             db.commit()
 
-            schedule_monitoring_check.apply_async(
-                args=[execution_id],
-                countdown=monitor_delay,
-            )
+            _schedule_next_check(execution_id, countdown=monitor_delay)
             logger.info("approved_execution_monitoring", execution_id=execution_id)
             return {"status": "monitoring"}
         else:
@@ -201,7 +198,7 @@ def resume_approved_execution(self, execution_id: str) -> dict:
             flag_modified(execution, "logs")
             flag_modified(execution, "reports")
             flag_modified(execution, "result")
-            flag_modified(execution, "pipeline_state")
+            flag_modified(execution, "pipeline_state_packed")
             flag_modified(execution, "cost_breakdown")
             execution.version += 1
             db.commit()
@@ -3,123 +3,228 @@ Celery Task: Check Scheduled Pipelines
 
 Periodic task that checks for pipelines due for execution based on their schedule.
 Runs every minute via Celery Beat.
+
+The due set is computed by a single statement (active-execution guard as an
+anti-join, last finished run through a LATERAL join), so a tick costs the
+same handful of round trips for ten pipelines or ten thousand:
+
+  1. one SELECT for the due pipelines
+  2. one Redis pipeline claiming an idempotency key per schedule slot
+  3. the broker publishes, over one pooled producer connection
 """
 import structlog
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Any, List, Sequence
+
+from sqlalchemy import Float, case, exists, func, or_, select, true
+from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.orchestration.celery_app import celery_app
 from app.database import SessionLocal
-from app.models.pipeline import Pipeline
+from app.models.pipeline import Pipeline, TriggerMode
 from app.models.execution import Execution, ExecutionStatus
 
 logger = structlog.get_logger()
 
+# Executions that block a new periodic run. Includes MONITORING so we don't
+# launch a new execution while a limit order from a previous run is still
+# pending on the broker.
+ACTIVE_STATUSES = (
+    ExecutionStatus.PENDING,
+    ExecutionStatus.RUNNING,
+    ExecutionStatus.MONITORING,
+)
 
-@celery_app.task(name="app.orchestration.tasks.check_scheduled_pipelines")
-def check_scheduled_pipelines():
+# Executions whose completion time starts the rate-limit interval
+FINISHED_STATUSES = (ExecutionStatus.COMPLETED, ExecutionStatus.FAILED)
+
+# Default interval between runs (pipeline.config["interval_minutes"])
+DEFAULT_INTERVAL_MINUTES = 5
+
+SLOT_KEY_PREFIX = "scheduled_pipeline_slot:"
+
+# ``now`` is naive UTC (like Execution.completed_at)
+_EPOCH = datetime(1970, 1, 1)
+
+_redis = None
+
+
+def _get_redis():
+    global _redis
+    if _redis is None:
+        import redis
+
+        _redis = redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+        )
+    return _redis
+
+
+def _interval_minutes_expr():
+    """``config->'interval_minutes'`` as a number, default when missing or not numeric."""
+    raw = Pipeline.config["interval_minutes"]
+    return case(
+        (func.jsonb_typeof(raw) == "number", raw.astext.cast(Float)),
+        else_=float(DEFAULT_INTERVAL_MINUTES),
+    )
+
+
+def due_pipelines_query(now: datetime):
     """
-    Check for pipelines that should be executed based on their schedule.
-    
-    This task runs every minute (configured in beat_schedule) and:
-    1. Finds active periodic pipelines
-    2. Checks if they should run based on their schedule
-    3. Triggers execution tasks for pipelines that should run
-    
-    Returns:
-        Dict with number of pipelines scheduled
+    Active PERIODIC pipelines that should run at ``now``.
+
+    A pipeline is due when it has no PENDING/RUNNING/MONITORING execution
+    and its last COMPLETED/FAILED execution finished at least
+    ``interval_minutes`` ago (or it never finished one).
     """
-    logger.info("checking_scheduled_pipelines")
-    
-    db = SessionLocal()
-    scheduled_count = 0
-    triggered_count = 0
-    
-    try:
-        from app.models.pipeline import TriggerMode
-        from app.orchestration.tasks.execute_pipeline import execute_pipeline
-        
-        # Find active PERIODIC pipelines
-        pipelines = db.query(Pipeline).filter(
+    interval_minutes = _interval_minutes_expr()
+
+    last_finished = (
+        select(func.max(Execution.completed_at).label("completed_at"))
+        .where(
+            Execution.pipeline_id == Pipeline.id,
+            Execution.status.in_(FINISHED_STATUSES),
+        )
+        .correlate(Pipeline)
+        .lateral("last_finished")
+    )
+
+    has_active = exists().where(
+        Execution.pipeline_id == Pipeline.id,
+        Execution.status.in_(ACTIVE_STATUSES),
+    )
+
+    return (
+        select(
+            Pipeline.id,
+            Pipeline.user_id,
+            Pipeline.name,
+            interval_minutes.label("interval_minutes"),
+        )
+        .select_from(Pipeline)
+        .join(last_finished, true())
+        .where(
             Pipeline.is_active == True,  # noqa: E712
-            Pipeline.trigger_mode == TriggerMode.PERIODIC
-        ).all()
-        
-        logger.info("periodic_pipelines_found", count=len(pipelines))
-        
-        for pipeline in pipelines:
+            Pipeline.trigger_mode == TriggerMode.PERIODIC,
+            ~has_active,
+            or_(
+                last_finished.c.completed_at.is_(None),
+                last_finished.c.completed_at
+                <= now - func.make_interval(0, 0, 0, 0, 0, 0, interval_minutes * 60),
+            ),
+        )
+    )
+
+
+def schedule_slot_key(pipeline_id: Any, interval_minutes: float, now: datetime) -> str:
+    """
+    Idempotency key for the schedule slot ``now`` falls into.
+
+    Slots are ``interval_minutes`` wide. A pipeline becomes due at least one
+    interval after its last run was triggered, so consecutive legitimate
+    runs always land in different slots, while overlapping ticks (a slow
+    tick, a duplicated beat) collide on the same key.
+    """
+    slot_seconds = max(int(interval_minutes * 60), 60)
+    slot = int((now - _EPOCH).total_seconds()) // slot_seconds
+    return f"{SLOT_KEY_PREFIX}{pipeline_id}:{slot}"
+
+
+def _claim_slots(keys: Sequence[str], ttls: Sequence[int]) -> List[bool]:
+    """
+    SET NX every slot key in one Redis round trip.
+
+    Returns one flag per key; if Redis is unavailable every slot counts as
+    claimed (the active-execution guard and execute_pipeline's preflight
+    still prevent duplicate runs).
+    """
+    if not keys:
+        return []
+    try:
+        pipe = _get_redis().pipeline(transaction=False)
+        for key, ttl in zip(keys, ttls):
+            pipe.set(key, "1", nx=True, ex=ttl)
+        return [bool(claimed) for claimed in pipe.execute()]
+    except Exception as e:
+        logger.warning("schedule_slot_claim_unavailable", error=str(e))
+        return [True] * len(keys)
+
+
+def _enqueue(due: Sequence[Any], now: datetime) -> List[str]:
+    """
+    Enqueue execute_pipeline for every due pipeline whose slot is unclaimed.
+
+    The slot key doubles as the Celery task ID. Returns the triggered
+    pipeline IDs.
+    """
+    from app.orchestration.tasks.execute_pipeline import execute_pipeline
+
+    keys = [schedule_slot_key(row.id, row.interval_minutes, now) for row in due]
+    ttls = [max(int(row.interval_minutes * 60), 60) * 2 for row in due]
+    claimed = _claim_slots(keys, ttls)
+
+    triggered: List[str] = []
+    with celery_app.producer_or_acquire() as producer:
+        for row, key, is_new in zip(due, keys, claimed):
+            if not is_new:
+                logger.debug("periodic_pipeline_slot_taken", pipeline_id=str(row.id), slot_key=key)
+                continue
             try:
-                # Check if pipeline has any running or actively monitoring executions.
-                # Include MONITORING so we don't launch a new execution while a limit
-                # order is still pending on the broker from a previous run.
-                running_exec = db.query(Execution).filter(
-                    Execution.pipeline_id == pipeline.id,
-                    Execution.status.in_([
-                        ExecutionStatus.PENDING,
-                        ExecutionStatus.RUNNING,
-                        ExecutionStatus.MONITORING,
-                    ])
-                ).first()
-                
-                if running_exec:
-                    logger.debug(
-                        "pipeline_already_running",
-                        pipeline_id=str(pipeline.id),
-                        execution_id=str(running_exec.id)
-                    )
-                    continue
-                
-                # ✅ Rate limiting: Check when last execution completed
-                # Default interval: 5 minutes (configurable per pipeline in future)
-                last_completed = db.query(Execution).filter(
-                    Execution.pipeline_id == pipeline.id,
-                    Execution.status.in_([ExecutionStatus.COMPLETED, ExecutionStatus.FAILED])
-                ).order_by(Execution.completed_at.desc()).first()
-                
-                if last_completed and last_completed.completed_at:
-                    # Get interval from pipeline config, default to 5 minutes
-                    interval_minutes = pipeline.config.get("interval_minutes", 5) if pipeline.config else 5
-                    time_since_last = datetime.utcnow() - last_completed.completed_at
-                    
-                    if time_since_last < timedelta(minutes=interval_minutes):
-                        logger.debug(
-                            "periodic_pipeline_skipped_rate_limit",
-                            pipeline_id=str(pipeline.id),
-                            interval_minutes=interval_minutes,
-                            time_since_last_seconds=time_since_last.total_seconds()
-                        )
-                        continue
-                
-                # Trigger pipeline execution
-                logger.info(
-                    "triggering_periodic_pipeline",
-                    pipeline_id=str(pipeline.id),
-                    name=pipeline.name
+                execute_pipeline.apply_async(
+                    kwargs={
+                        "pipeline_id": str(row.id),
+                        "user_id": str(row.user_id),
+                        "mode": "paper",  # Default to paper for periodic executions
+                    },
+                    task_id=key,
+                    producer=producer,
                 )
-                
-                execute_pipeline.delay(
-                    pipeline_id=str(pipeline.id),
-                    user_id=str(pipeline.user_id),
-                    mode="paper"  # Default to paper for periodic executions
-                )
-                
-                triggered_count += 1
-                scheduled_count += 1
-                    
+                triggered.append(str(row.id))
             except Exception as e:
                 logger.error(
-                    "error_checking_pipeline",
-                    pipeline_id=str(pipeline.id),
+                    "error_triggering_pipeline",
+                    pipeline_id=str(row.id),
                     error=str(e),
                     exc_info=True
                 )
-                continue
-        
+    return triggered
+
+
+@celery_app.task(name="app.orchestration.tasks.check_scheduled_pipelines")
+def check_scheduled_pipelines():
+    """
+    Check for pipelines that should be executed based on their schedule.
+
+    This task runs every minute (configured in beat_schedule) and:
+    1. Selects due PERIODIC pipelines in one query
+    2. Claims a per-slot idempotency key for each in one Redis round trip
+    3. Triggers execution tasks for the claimed pipelines
+
+    Returns:
+        Dict with number of pipelines scheduled
+    """
+    logger.info("checking_scheduled_pipelines")
+
+    db: Session = SessionLocal()
+    now = datetime.utcnow()
+
+    try:
+        due = db.execute(due_pipelines_query(now)).all()
+        logger.info("periodic_pipelines_due", count=len(due))
+
+        triggered = _enqueue(due, now) if due else []
+        for pipeline_id in triggered:
+            logger.info("triggering_periodic_pipeline", pipeline_id=pipeline_id)
+
         logger.info(
             "scheduled_pipelines_checked",
-            total_found=len(pipelines),
-            triggered=triggered_count
+            total_due=len(due),
+            triggered=len(triggered)
         )
-        return {"scheduled": scheduled_count, "triggered": triggered_count}
-        
+        return {"scheduled": len(triggered), "triggered": len(triggered)}
+
     finally:
         db.close()
@@ -0,0 +1,62 @@
+"""
+Celery Tasks: Dashboard Aggregates
+
+Contains:
+- refresh_execution_aggregates: Recompute aggregate buckets touched by a commit
+- rebuild_execution_aggregates: Full rebuild (nightly safety net / backfill)
+"""
+from typing import List, Optional
+from uuid import UUID
+
+import structlog
+
+from app.orchestration.celery_app import celery_app
+from app.database import SessionLocal
+from app.services.execution_aggregates import parse_buckets, rebuild_aggregates, refresh_buckets
+
+logger = structlog.get_logger()
+
+
+@celery_app.task(name="app.orchestration.tasks.refresh_execution_aggregates")
+def refresh_execution_aggregates(buckets: List[List[str]]):
+    """
+    Recompute dashboard aggregates for the given buckets.
+
+    Args:
+        buckets: ``[[pipeline_id, "YYYY-MM-DD"], ...]`` as recorded by the
+            execution session hook
+
+    Returns:
+        Dict with number of aggregate rows written
+    """
+    db = SessionLocal()
+    try:
+        rows = refresh_buckets(db, parse_buckets(buckets))
+        logger.debug("execution_aggregates_refreshed", buckets=len(buckets), rows=rows)
+        return {"rows": rows}
+    finally:
+        db.close()
+
+
+@celery_app.task(name="app.orchestration.tasks.rebuild_execution_aggregates")
+def rebuild_execution_aggregates(user_id: Optional[str] = None):
+    """
+    Rebuild dashboard aggregates from the executions table.
+
+    Runs nightly after old-execution cleanup (which bulk-deletes rows without
+    going through the session hooks). Run it once by hand after the
+    aggregates migration to backfill history.
+
+    Args:
+        user_id: Restrict the rebuild to one user (default: everyone)
+
+    Returns:
+        Dict with number of aggregate rows written
+    """
+    db = SessionLocal()
+    try:
+        rows = rebuild_aggregates(db, UUID(user_id) if user_id else None)
+        logger.info("execution_aggregates_rebuilt", user_id=user_id, rows=rows)
+        return {"rows": rows}
+    finally:
+        db.close()
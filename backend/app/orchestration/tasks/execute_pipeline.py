@@ -23,6 +23,7 @@ from app.agents.base import AgentError, InsufficientDataError, AgentProcessingEr
 from billiard.exceptions import SoftTimeLimitExceeded, TimeLimitExceeded
 
 from app.orchestration.tasks._helpers import _extract_broker_tool
+from app.services.llm_governor import llm_priority, priority_for_mode
 
 logger = structlog.get_logger()
 
@@ -345,7 +346,7 @@ def execute_pipeline(
 
             try:
                 # Execute pipeline with real-time DB updates using sync session
-                with prompt_context:
+                with prompt_context, llm_priority(priority_for_mode(mode)):
                     execution = executor.execute_with_sync_db_tracking(db, execution)
                 
             except TriggerNotMetException as e:
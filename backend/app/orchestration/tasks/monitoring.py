@@ -4,24 +4,38 @@ Celery Task: Position Monitoring Check
 Periodic monitoring loop for open positions (Trade Manager Agent).
 Uses optimistic locking and handles communication errors with retries.
 
-Main entry point: schedule_monitoring_check (Celery task)
+Entry points (Celery tasks):
+- schedule_monitoring_check: Check a single execution
+- dispatch_due_monitoring: Beat sweep that claims due executions and groups
+  them by broker account (when MONITORING_BATCH_ENABLED)
+- monitor_broker_account: Check every claimed execution of one broker account
+  against a shared BrokerAccountSnapshot (one positions / orders / quotes
+  call per account instead of per trade)
+
 Internal helpers (prefixed with _) handle each branch of the monitoring logic.
 """
 import structlog
+from collections import defaultdict
 from uuid import UUID
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
+from sqlalchemy import tuple_, update
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
+from app.config import settings
 from app.orchestration.celery_app import celery_app
 from app.database import SessionLocal
 from app.models.execution import Execution, ExecutionStatus
+from app.models.pipeline import Pipeline
 from app.agents import get_registry
 from app.schemas.pipeline_state import PipelineState
+from app.websocket.event_bus import publish_execution_event
 
 from app.orchestration.tasks._helpers import (
+    _broker_account_key,
+    _extract_broker_tool,
     _send_position_closed_notification,
     _send_monitoring_stalled_notification,
     _serialize_logs,
@@ -34,6 +48,8 @@ logger = structlog.get_logger()
 
 # --- Constants ---
 MAX_COMM_ERROR_RETRIES = 60  # Max communication error retries (~1 hour at 1min intervals)
+MAX_EXECUTIONS_PER_BATCH = 50  # Split very large accounts across several batch tasks
+MONITORABLE_STATUSES = (ExecutionStatus.MONITORING, ExecutionStatus.COMMUNICATION_ERROR)
 
 
 def _extend_chart_candles(chart_data: dict, symbol: str) -> None:
@@ -47,10 +63,10 @@ def _extend_chart_candles(chart_data: dict, symbol: str) -> None:
     """
     import requests
     from app.config import settings
+    from app.services.chart_annotation_builder import ChartAnnotationBuilder
 
     try:
-        existing = chart_data.get("candles", [])
-        if not existing:
+        if not chart_data.get("candles"):
             return
 
         timeframe = chart_data.get("meta", {}).get("timeframe", "5m")
@@ -64,35 +80,15 @@ def _extend_chart_candles(chart_data: dict, symbol: str) -> None:
         )
         resp.raise_for_status()
         fresh_candles = resp.json().get("candles") or []
-        if not fresh_candles:
-            return
-
-        # Find the last existing candle time to deduplicate
-        last_existing_time = existing[-1].get("time") or existing[-1].get("timestamp")
-        if not last_existing_time:
-            return
-
-        from dateutil.parser import parse as parse_dt
 
-        last_ts = parse_dt(str(last_existing_time)) if isinstance(last_existing_time, str) else last_existing_time
-
-        new_candles = []
-        for c in fresh_candles:
-            c_time = c.get("time") or c.get("timestamp")
-            if not c_time:
-                continue
-            c_ts = parse_dt(str(c_time)) if isinstance(c_time, str) else c_time
-            if c_ts > last_ts:
-                new_candles.append(c)
-
-        if new_candles:
-            chart_data["candles"] = existing + new_candles
-            chart_data.setdefault("meta", {})["candle_count"] = len(chart_data["candles"])
+        # Only candles newer than the chart's last one are appended
+        appended = ChartAnnotationBuilder.append_candles(chart_data, fresh_candles)
+        if appended:
             logger.info(
                 "chart_candles_extended",
                 symbol=symbol,
-                new_candles=len(new_candles),
-                total_candles=len(chart_data["candles"]),
+                new_candles=appended,
+                total_candles=chart_data["meta"]["candle_count"],
             )
     except Exception as e:
         # Non-critical — don't fail execution completion if candle fetch fails
@@ -177,6 +173,19 @@ def _recovery_commit(
         db2.close()
 
 
+def _schedule_next_check(execution_id: str, countdown: float) -> None:
+    """
+    Chain the next monitoring check for an execution.
+
+    In batched mode the dispatch_due_monitoring sweep picks the execution up
+    again from next_check_at, so no per-trade task is chained.
+    """
+    if settings.MONITORING_BATCH_ENABLED:
+        return
+
+    schedule_monitoring_check.apply_async(args=[execution_id], countdown=countdown)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Step helpers — each one handles a discrete phase of the monitoring check
 # ──────────────────────────────────────────────────────────────────────────────
@@ -204,8 +213,7 @@ def _load_execution(
         logger.warning("execution_not_found", execution_id=execution_id)
         return None, {"status": "not_found"}
 
-    allowed_statuses = {ExecutionStatus.MONITORING, ExecutionStatus.COMMUNICATION_ERROR}
-    if execution.status not in allowed_statuses:
+    if execution.status not in MONITORABLE_STATUSES:
         logger.info(
             "execution_not_monitorable",
             execution_id=execution_id,
@@ -407,9 +415,7 @@ def _handle_communication_error(
             context="comm_error",
         )
 
-    schedule_monitoring_check.apply_async(
-        args=[str(execution.id)], countdown=60
-    )
+    _schedule_next_check(str(execution.id), countdown=60)
 
     return {
         "status": "communication_error",
@@ -586,10 +592,7 @@ def _handle_continue_monitoring(
             context="continue",
         )
 
-    schedule_monitoring_check.apply_async(
-        args=[str(execution.id)],
-        countdown=interval * 60,
-    )
+    _schedule_next_check(str(execution.id), countdown=interval * 60)
 
     logger.info(
         "monitoring_continuing",
@@ -603,8 +606,156 @@ def _handle_continue_monitoring(
     return {"status": "monitoring", "next_check_minutes": interval}
 
 
+def _publish_monitoring_event(
+    execution: Execution,
+    updated_state: PipelineState,
+    outcome: Dict[str, Any],
+) -> None:
+    """Publish the check's P&L tick (or final result) on the execution event bus."""
+    status = outcome.get("status")
+    if status == "completed":
+        publish_execution_event(execution.user_id, execution.id, "execution_complete", {
+            "status": ExecutionStatus.COMPLETED.value,
+            "final_pnl": outcome.get("pnl"),
+            "final_pnl_percent": outcome.get("pnl_percent"),
+        })
+        return
+
+    tick: Dict[str, Any] = {"status": execution.status.value, "next_check_at": execution.next_check_at}
+    for report in updated_state.agent_reports.values():
+        if isinstance(report, dict):  # Legacy states carry raw report dicts
+            agent_type, data = report.get("agent_type"), report.get("data")
+        else:
+            agent_type, data = report.agent_type, report.data
+        if agent_type == "trade_manager_agent":
+            for key in ("unrealized_pl", "pnl_percent", "current_price", "order_status"):
+                tick[key] = (data or {}).get(key)
+            break
+    publish_execution_event(execution.user_id, execution.id, "execution_pnl", tick)
+
+
+def _run_monitoring_check(
+    db: Session,
+    execution_id: str,
+    broker=None,
+) -> Dict[str, Any]:
+    """
+    Run one monitoring check for an execution.
+
+    Shared by the per-trade task and the per-account batch task. When
+    ``broker`` is given (a BrokerAccountSnapshot in batched mode) the Trade
+    Manager reads positions, orders and quotes from it instead of building
+    its own broker connection.
+
+    Raises:
+        Exception: If the Trade Manager agent fails (caller decides on retry)
+    """
+    # 1. Load and validate execution
+    execution, early_return = _load_execution(db, execution_id)
+    if early_return:
+        return early_return
+
+    # 2. Load PipelineState + Trade Manager agent
+    state, agent, early_return = _load_state_and_agent(execution, execution_id)
+    if early_return:
+        return early_return
+
+    if broker is not None:
+        agent.use_broker(broker)
+
+    # 3. Execute monitoring logic
+    try:
+        updated_state = agent.process(state)
+    except Exception as agent_error:
+        logger.error(
+            "trade_manager_agent_process_failed",
+            execution_id=execution_id,
+            error=str(agent_error),
+            exc_info=True,
+        )
+        raise
+
+    # 4. Persist agent output (does NOT commit)
+    original_version = execution.version
+    _persist_agent_output(db, execution, updated_state)
+
+    # 5. Branch based on agent output
+    if updated_state.communication_error:
+        outcome = _handle_communication_error(
+            db, execution, execution_id, original_version, updated_state,
+        )
+    elif updated_state.should_complete:
+        outcome = _handle_monitoring_complete(
+            db, execution, execution_id, original_version, updated_state,
+        )
+    else:
+        outcome = _handle_continue_monitoring(
+            db, execution, execution_id, original_version, updated_state,
+        )
+
+    # 6. Push the tick to the user's WebSockets
+    _publish_monitoring_event(execution, updated_state, outcome)
+    return outcome
+
+
+def _claim_due_executions(db: Session, now: datetime) -> Dict[Tuple[str, str], List[str]]:
+    """
+    Claim every due execution and group it by (user, broker account).
+
+    Claiming pushes next_check_at out by MONITORING_CLAIM_SECONDS and bumps
+    the version in a single UPDATE guarded by the version each row was read
+    at, so an execution concurrently touched elsewhere is skipped this sweep
+    and an in-flight check is not dispatched twice. If a batch task dies, the
+    lease expires and the execution is picked up again.
+
+    Executions without a broker tool are grouped under an empty account key.
+
+    Returns:
+        Dict of (user_id, broker_account_key) → list of execution ID strings
+    """
+    due_rows = (
+        db.query(Execution.id, Execution.version, Execution.user_id, Pipeline.config)
+        .join(Pipeline, Pipeline.id == Execution.pipeline_id)
+        .filter(
+            Execution.status.in_(MONITORABLE_STATUSES),
+            Execution.next_check_at.isnot(None),
+            Execution.next_check_at <= now,
+        )
+        .order_by(Execution.next_check_at)
+        .all()
+    )
+    if not due_rows:
+        return {}
+
+    claimed_ids = set(
+        db.execute(
+            update(Execution)
+            .where(tuple_(Execution.id, Execution.version).in_(
+                [(row.id, row.version) for row in due_rows]
+            ))
+            .values(
+                next_check_at=now + timedelta(seconds=settings.MONITORING_CLAIM_SECONDS),
+                version=Execution.version + 1,
+            )
+            .returning(Execution.id)
+            .execution_options(synchronize_session=False)
+        ).scalars()
+    )
+    db.commit()
+
+    groups: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+    for row in due_rows:
+        if row.id not in claimed_ids:
+            continue
+        broker_tool = _extract_broker_tool(row.config or {})
+        account_key = _broker_account_key(broker_tool) if broker_tool else ""
+        groups[(str(row.user_id), account_key)].append(str(row.id))
+
+    return groups
+
+
 # ──────────────────────────────────────────────────────────────────────────────
-# Celery task — orchestrates the helpers above
+# Celery tasks — orchestrate the helpers above
 # ──────────────────────────────────────────────────────────────────────────────
 
 @celery_app.task(
@@ -641,45 +792,7 @@ def schedule_monitoring_check(self, execution_id: str):
     db = SessionLocal()
 
     try:
-        # 1. Load and validate execution
-        execution, early_return = _load_execution(db, execution_id)
-        if early_return:
-            return early_return
-
-        # 2. Load PipelineState + Trade Manager agent
-        state, agent, early_return = _load_state_and_agent(execution, execution_id)
-        if early_return:
-            return early_return
-
-        # 3. Execute monitoring logic
-        try:
-            updated_state = agent.process(state)
-        except Exception as agent_error:
-            logger.error(
-                "trade_manager_agent_process_failed",
-                execution_id=execution_id,
-                error=str(agent_error),
-                exc_info=True,
-            )
-            raise
-
-        # 4. Persist agent output (does NOT commit)
-        original_version = execution.version
-        _persist_agent_output(db, execution, updated_state)
-
-        # 5. Branch based on agent output
-        if updated_state.communication_error:
-            return _handle_communication_error(
-                db, execution, execution_id, original_version, updated_state,
-            )
-        elif updated_state.should_complete:
-            return _handle_monitoring_complete(
-                db, execution, execution_id, original_version, updated_state,
-            )
-        else:
-            return _handle_continue_monitoring(
-                db, execution, execution_id, original_version, updated_state,
-            )
+        return _run_monitoring_check(db, execution_id)
 
     except Exception as exc:
         logger.error(
@@ -694,3 +807,142 @@ def schedule_monitoring_check(self, execution_id: str):
 
     finally:
         db.close()
+
+
+@celery_app.task(name="app.orchestration.tasks.dispatch_due_monitoring")
+def dispatch_due_monitoring():
+    """
+    Monitoring sweep (Celery Beat, every MONITORING_SWEEP_SECONDS).
+
+    Claims executions whose next_check_at has passed and enqueues one
+    monitor_broker_account task per (user, broker account), so a user with
+    40 open positions on one account costs one task and a handful of broker
+    calls per interval instead of 40 tasks and 120+ calls.
+
+    Returns:
+        Dict with number of executions and batches dispatched
+    """
+    if not settings.MONITORING_BATCH_ENABLED:
+        return {"status": "disabled"}
+
+    db = SessionLocal()
+
+    try:
+        groups = _claim_due_executions(db, datetime.utcnow())
+
+        batches = 0
+        for (_, account_key), execution_ids in groups.items():
+            if not account_key:
+                # No broker to batch against — the agent completes these on its own
+                for execution_id in execution_ids:
+                    schedule_monitoring_check.apply_async(args=[execution_id])
+                continue
+
+            for start in range(0, len(execution_ids), MAX_EXECUTIONS_PER_BATCH):
+                monitor_broker_account.apply_async(
+                    args=[execution_ids[start:start + MAX_EXECUTIONS_PER_BATCH]]
+                )
+                batches += 1
+
+        dispatched = sum(len(ids) for ids in groups.values())
+        if dispatched:
+            logger.info(
+                "monitoring_sweep_dispatched",
+                executions=dispatched,
+                accounts=len(groups),
+                batches=batches,
+            )
+
+        return {"status": "completed", "executions": dispatched, "batches": batches}
+
+    except Exception as e:
+        logger.error("monitoring_sweep_failed", error=str(e), exc_info=True)
+        db.rollback()
+        return {"status": "error", "error": str(e)}
+
+    finally:
+        db.close()
+
+
+@celery_app.task(name="app.orchestration.tasks.monitor_broker_account")
+def monitor_broker_account(execution_ids: List[str]):
+    """
+    Check every claimed execution of one broker account in a single task.
+
+    Builds the broker once, wraps it in a BrokerAccountSnapshot and runs the
+    regular per-execution monitoring check against it. Each execution keeps
+    its own DB session, optimistic-lock versioning and outcome branches; an
+    execution whose check fails falls back to its own schedule_monitoring_check
+    task so it gets the usual retry/backoff.
+
+    Args:
+        execution_ids: Execution ID strings sharing one (user, broker account)
+
+    Returns:
+        Dict with per-execution results and number of broker read calls
+    """
+    from app.services.brokers.account_snapshot import BrokerAccountSnapshot
+    from app.services.brokers.factory import broker_factory
+
+    db = SessionLocal()
+    try:
+        executions = (
+            db.query(Execution.symbol, Pipeline.config)
+            .join(Pipeline, Pipeline.id == Execution.pipeline_id)
+            .filter(Execution.id.in_([UUID(execution_id) for execution_id in execution_ids]))
+            .all()
+        )
+        broker_tool = next(
+            (tool for tool in (_extract_broker_tool(row.config or {}) for row in executions) if tool),
+            None,
+        )
+        symbols = [row.symbol for row in executions if row.symbol]
+    finally:
+        db.close()
+
+    try:
+        if not broker_tool:
+            raise ValueError("No broker tool found for batched executions")
+        snapshot = BrokerAccountSnapshot(broker_factory.from_tool_config(broker_tool), symbols)
+    except Exception as e:
+        # Let each trade surface the broker problem through its own check
+        logger.error(
+            "broker_account_snapshot_failed",
+            execution_ids=execution_ids,
+            error=str(e),
+        )
+        for execution_id in execution_ids:
+            schedule_monitoring_check.apply_async(args=[execution_id])
+        return {"status": "fallback", "executions": len(execution_ids)}
+
+    results: Dict[str, Any] = {}
+    for execution_id in execution_ids:
+        db = SessionLocal()
+        try:
+            results[execution_id] = _run_monitoring_check(db, execution_id, broker=snapshot)
+        except Exception as exc:
+            logger.error(
+                "batched_monitoring_check_failed",
+                execution_id=execution_id,
+                error=str(exc),
+                exc_info=True,
+            )
+            db.rollback()
+            schedule_monitoring_check.apply_async(args=[execution_id], countdown=60)
+            results[execution_id] = {"status": "retry_scheduled", "error": str(exc)}
+        finally:
+            db.close()
+
+    logger.info(
+        "broker_account_monitoring_completed",
+        executions=len(execution_ids),
+        symbols=len(set(symbols)),
+        broker_calls=snapshot.broker_calls,
+    )
+
+    return {
+        "status": "completed",
+        "executions": len(execution_ids),
+        "broker_calls": snapshot.broker_calls,
+        "results": results,
+    }
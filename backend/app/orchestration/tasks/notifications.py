@@ -0,0 +1,21 @@
+"""
+Celery Tasks: Notifications
+
+Contains:
+- dispatch_notifications: Send queued Telegram/SMS notifications
+"""
+from app.orchestration.celery_app import celery_app
+from app.services.notification_outbox import notification_outbox
+
+
+@celery_app.task(name="app.orchestration.tasks.dispatch_notifications")
+def dispatch_notifications():
+    """
+    Drain the notification outbox: drop duplicates, coalesce bursts per
+    user and channel into digests and apply per-channel rate limits.
+
+    Returns:
+        Dict with counts of events, duplicates, messages, failures and
+        requeued events
+    """
+    return notification_outbox.dispatch()
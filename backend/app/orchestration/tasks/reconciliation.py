@@ -4,34 +4,38 @@ Celery Tasks: Trade Reconciliation
 Safety net that catches discrepancies between DB state and broker reality.
 
 Contains:
-- reconcile_user_trades: Per-user reconciliation of broker positions vs DB state
-- schedule_user_reconciliation: Master scheduler that spawns per-user tasks
+- reconcile_broker_account: Reconciliation of one (user, broker account) against one snapshot
+- reconcile_user_trades: Per-user reconciliation (all of the user's accounts)
+- schedule_user_reconciliation: Master scheduler that spawns per-account tasks
 
 Internal helpers (prefixed with _):
-- _get_broker_for_execution: Resolve broker instance from pipeline config (cached)
 - _check_symbol_on_broker: Safely call has_active_symbol with exception handling
+- _load_trade_execution / _trade_ref: trade_execution and its broker trade IDs
 - _recover_pnl_from_broker: Broker-only P&L recovery (single source of truth)
 - _reconcile_closed_position: Complete reconciliation of a single closed execution
 - _reschedule_orphaned_monitoring: Re-trigger broken monitoring chains
-- _reconcile_comm_error_executions: Reconcile COMMUNICATION_ERROR executions
+- _resolve_needs_reconciliation: Retry P&L recovery for NEEDS_RECONCILIATION executions
+- _group_by_broker_account / _reconcile_account: Account-batched reconciliation
 """
 import structlog
+from collections import defaultdict
 from uuid import UUID
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
 from app.orchestration.celery_app import celery_app
 from app.database import SessionLocal
-from app.models.execution import Execution, ExecutionStatus
+from app.models.execution import Execution, ExecutionStatus, lean_load
 from app.models.user import User
 from app.models.pipeline import Pipeline
 from app.services.brokers.base import BrokerService
 from app.services.brokers.factory import broker_factory
 
 from app.orchestration.tasks._helpers import (
+    _broker_account_key,
     _extract_broker_tool,
     _send_position_closed_notification,
     load_pipeline_state,
@@ -48,53 +52,18 @@ GRACE_PERIOD_MINUTES = 3
 # chain is considered broken and needs rescheduling.
 ORPHAN_THRESHOLD_MINUTES = 2
 
+# Executions with a (possibly) open trade that reconciliation checks
+RECONCILABLE_STATUSES = (
+    ExecutionStatus.MONITORING,
+    ExecutionStatus.COMMUNICATION_ERROR,
+    ExecutionStatus.NEEDS_RECONCILIATION,
+)
+
 
 # ---------------------------------------------------------------------------
-# Broker resolution helpers
+# Broker / trade lookup helpers
 # ---------------------------------------------------------------------------
 
-def _get_broker_for_execution(
-    execution: Execution,
-    db: Session,
-    broker_cache: Dict[str, BrokerService],
-) -> Tuple[Optional[BrokerService], Optional[str]]:
-    """
-    Resolve the broker instance for an execution from its pipeline config.
-
-    Uses a cache keyed by broker_type:account_id:account_type to avoid
-    creating duplicate broker connections for the same account.
-
-    Args:
-        execution: Execution ORM object
-        db: Active SQLAlchemy session
-        broker_cache: Mutable dict of broker_key → BrokerService
-
-    Returns:
-        (broker, broker_key) on success, (None, None) on failure
-    """
-    pipeline = db.query(Pipeline).filter(Pipeline.id == execution.pipeline_id).first()
-    broker_tool = _extract_broker_tool(pipeline.config if pipeline else {}) if pipeline else None
-    if not broker_tool:
-        return None, None
-
-    config = broker_tool.get("config", {}) or {}
-    broker_key = f"{broker_tool.get('tool_type')}:{config.get('account_id')}:{config.get('account_type')}"
-
-    if broker_key not in broker_cache:
-        try:
-            broker = broker_factory.from_tool_config(broker_tool)
-            broker_cache[broker_key] = broker
-        except Exception as e:
-            logger.error(
-                "reconciliation_broker_creation_failed",
-                execution_id=str(execution.id),
-                error=str(e),
-            )
-            return None, None
-
-    return broker_cache.get(broker_key), broker_key
-
-
 def _check_symbol_on_broker(
     broker: BrokerService,
     execution: Execution,
@@ -119,6 +88,26 @@ def _check_symbol_on_broker(
         return None
 
 
+def _load_trade_execution(execution: Execution) -> Tuple[Optional[Any], Dict[str, Any]]:
+    """
+    Load an execution's trade_execution from PipelineState (preferred) or legacy result.
+
+    Returns:
+        (pipeline_state or None, trade_execution dict)
+    """
+    pipeline_state = load_pipeline_state(execution)
+    if pipeline_state and pipeline_state.trade_execution:
+        return pipeline_state, pipeline_state.trade_execution.dict()
+    return pipeline_state, (execution.result or {}).get("trade_execution", {})
+
+
+def _trade_ref(trade_exec: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """(trade_id, order_id) exactly as passed to ``get_trade_details``."""
+    trade_id = trade_exec.get("trade_id")
+    order_id = trade_exec.get("order_id")
+    return (str(trade_id) if trade_id else None, str(order_id) if order_id else None)
+
+
 # ---------------------------------------------------------------------------
 # Broker-only P&L recovery (single source of truth)
 # ---------------------------------------------------------------------------
@@ -180,9 +169,10 @@ def _recover_pnl_from_broker(
 
     try:
         # Pass both IDs — each broker decides which one to use
+        ref_trade_id, ref_order_id = _trade_ref(existing_trade_exec)
         trade_details = broker.get_trade_details(
-            trade_id=str(trade_id) if trade_id else None,
-            order_id=str(order_id) if order_id else None,
+            trade_id=ref_trade_id,
+            order_id=ref_order_id,
         )
     except Exception as e:
         logger.warning(
@@ -313,13 +303,7 @@ def _reconcile_closed_position(
         True if reconciled or marked as NEEDS_RECONCILIATION, False on commit failure
     """
     existing_result = execution.result or {}
-
-    # Load trade_execution from PipelineState (preferred) or legacy result
-    pipeline_state = load_pipeline_state(execution)
-    if pipeline_state and pipeline_state.trade_execution:
-        existing_trade_exec = pipeline_state.trade_execution.dict()
-    else:
-        existing_trade_exec = existing_result.get("trade_execution", {})
+    pipeline_state, existing_trade_exec = _load_trade_execution(execution)
 
     # Broker-only P&L recovery
     outcome, pnl, pnl_percent, exit_reason, close_time, trade_id = _recover_pnl_from_broker(
@@ -438,7 +422,7 @@ def _reschedule_orphaned_monitoring(
         True if rescheduled, False otherwise
     """
     # Deferred import to avoid circular dependency (monitoring → reconciliation)
-    from app.orchestration.tasks.monitoring import schedule_monitoring_check
+    from app.orchestration.tasks.monitoring import _schedule_next_check
 
     orphan_threshold = datetime.utcnow() - timedelta(minutes=ORPHAN_THRESHOLD_MINUTES)
     is_orphaned = (
@@ -471,77 +455,307 @@ def _reschedule_orphaned_monitoring(
         db.rollback()
         return False
 
-    # Re-trigger the monitoring chain
-    schedule_monitoring_check.apply_async(
-        args=[str(execution.id)],
-        countdown=10,
-    )
+    # Re-trigger the monitoring chain (batched mode: the sweep picks it up
+    # from next_check_at)
+    _schedule_next_check(str(execution.id), countdown=15)
 
     return True
 
 
 # ---------------------------------------------------------------------------
-# COMMUNICATION_ERROR reconciliation
+# NEEDS_RECONCILIATION retry
 # ---------------------------------------------------------------------------
 
-def _reconcile_comm_error_executions(
+def _resolve_needs_reconciliation(
     db: Session,
-    comm_error_executions: list,
-    broker_cache: Dict[str, BrokerService],
-) -> Tuple[int, int]:
+    execution: Execution,
+    broker: BrokerService,
+) -> bool:
     """
-    Reconcile COMMUNICATION_ERROR executions.
+    Retry broker P&L recovery for a NEEDS_RECONCILIATION execution.
+
+    These had their position closed but P&L couldn't be fetched from the
+    broker at reconciliation time. If the broker answers now, promote to
+    COMPLETED; if not, leave as-is.
+
+    Returns:
+        True if the execution was promoted to COMPLETED
+    """
+    existing_result = execution.result or {}
+    pipeline_state, existing_trade_exec = _load_trade_execution(execution)
 
-    These are executions where the monitoring loop lost contact with the broker.
-    Two sub-cases:
-      1. Retries exhausted (next_check_at = None): Awaiting user intervention.
-         Check if broker position is gone → auto-reconcile if so.
-         If broker P&L unavailable → mark NEEDS_RECONCILIATION.
-      2. Still retrying (next_check_at set): Leave for monitoring.py to handle,
-         but check if the monitoring chain is broken → reschedule if so.
+    outcome, pnl, pnl_percent, exit_reason, close_time, trade_id = (
+        _recover_pnl_from_broker(
+            execution=execution,
+            broker=broker,
+            existing_trade_exec=existing_trade_exec,
+        )
+    )
+
+    # Only promote to COMPLETED if broker gave us actual P&L.
+    # "needs_reconciliation" again means broker still can't help — leave as-is.
+    if outcome not in ("executed", "cancelled"):
+        return False
+
+    execution.status = ExecutionStatus.COMPLETED
+    execution.completed_at = datetime.utcnow()
+    execution.execution_phase = "completed"
+    execution.error_message = None
+
+    existing_result["trade_outcome"] = {
+        "status": outcome,
+        "pnl": pnl,
+        "pnl_percent": pnl_percent,
+        "exit_reason": exit_reason,
+        "closed_at": close_time,
+    }
+    if pnl != 0:
+        existing_result["final_pnl"] = pnl
+
+    execution.result = existing_result | {
+        "reconciled": True,
+        "reconcile_reason": exit_reason,
+    }
+    flag_modified(execution, "result")
+
+    if pipeline_state:
+        pipeline_state.should_complete = True
+        if pipeline_state.trade_outcome:
+            pipeline_state.trade_outcome.pnl = pnl
+            pipeline_state.trade_outcome.pnl_percent = pnl_percent
+            pipeline_state.trade_outcome.exit_reason = exit_reason
+            pipeline_state.trade_outcome.status = outcome
+        save_pipeline_state(execution, pipeline_state, db=db)
+
+    execution.version += 1
+    try:
+        db.commit()
+    except Exception as commit_error:
+        logger.error(
+            "needs_reconciliation_commit_failed",
+            execution_id=str(execution.id),
+            error=str(commit_error),
+        )
+        db.rollback()
+        return False
+
+    logger.info(
+        "needs_reconciliation_resolved",
+        execution_id=str(execution.id),
+        symbol=execution.symbol,
+        outcome=outcome,
+        pnl=pnl,
+    )
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Per-account reconciliation
+# ---------------------------------------------------------------------------
+
+def _group_by_broker_account(db: Session, *filters) -> Dict[Tuple[str, str], List[str]]:
+    """
+    Find reconcilable executions and group them by (user, broker account).
+
+    Executions without a broker tool are skipped — there is nothing to
+    reconcile them against.
 
     Args:
         db: Active SQLAlchemy session
-        comm_error_executions: List of COMMUNICATION_ERROR Execution objects
-        broker_cache: Shared broker instance cache
+        *filters: Extra filters on Execution (e.g. a single user)
 
     Returns:
-        Tuple of (reconciled_count, rescheduled_count)
+        Dict of (user_id, broker_account_key) → list of execution ID strings
     """
-    reconciled = 0
-    rescheduled = 0
+    rows = (
+        db.query(Execution.id, Execution.user_id, Pipeline.config)
+        .join(Pipeline, Pipeline.id == Execution.pipeline_id)
+        .filter(Execution.status.in_(RECONCILABLE_STATUSES), *filters)
+        .all()
+    )
+
+    groups: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+    for row in rows:
+        broker_tool = _extract_broker_tool(row.config or {})
+        if not broker_tool:
+            continue
+        groups[(str(row.user_id), _broker_account_key(broker_tool))].append(str(row.id))
+    return groups
 
-    for execution in comm_error_executions:
+
+def _reconcile_account(db: Session, execution_ids: List[str]) -> Dict[str, Any]:
+    """
+    Reconcile every open execution of one broker account against one snapshot.
+
+    1. Wrap the account's broker in a BrokerAccountSnapshot: one positions
+       call and one open-orders call serve every has_active_symbol check.
+    2. Diff all MONITORING / COMMUNICATION_ERROR executions against it in
+       memory.
+    3. Register the trades that need P&L (positions gone + NEEDS_RECONCILIATION)
+       so their order/fill history is fetched in one batch call.
+    4. Apply the outcomes:
+       - position gone → fetch P&L from broker → COMPLETED, or
+         NEEDS_RECONCILIATION if the broker can't give P&L
+       - position still open but monitoring chain broken → reschedule
+         (COMMUNICATION_ERROR executions paused for the user are left alone)
+       - NEEDS_RECONCILIATION with P&L now available → COMPLETED
+
+    Args:
+        db: Active SQLAlchemy session
+        execution_ids: Execution ID strings sharing one (user, broker account)
+
+    Returns:
+        Dict of counters for this account
+    """
+    # Deferred import: account_snapshot → brokers (keeps task import light)
+    from app.services.brokers.account_snapshot import BrokerAccountSnapshot
+
+    # Payload columns are deferred: only positions that actually get
+    # reconciled lazy-load their pipeline_state.
+    executions = (
+        db.query(Execution)
+        .filter(
+            Execution.id.in_([UUID(execution_id) for execution_id in execution_ids]),
+            Execution.status.in_(RECONCILABLE_STATUSES),
+        )
+        .options(*lean_load())
+        .all()
+    )
+
+    monitoring = [e for e in executions if e.status == ExecutionStatus.MONITORING]
+    comm_errors = [e for e in executions if e.status == ExecutionStatus.COMMUNICATION_ERROR]
+    needs_recon = [e for e in executions if e.status == ExecutionStatus.NEEDS_RECONCILIATION]
+
+    stats: Dict[str, Any] = {
+        "monitoring_executions": len(monitoring),
+        "monitoring_symbols": sorted({e.symbol for e in monitoring if e.symbol}),
+        "communication_errors": len(comm_errors),
+        "needs_reconciliation": len(needs_recon),
+        "recon_resolved": 0,
+        "reconciled": 0,
+        "rescheduled": 0,
+        "broker_calls": 0,
+    }
+    if not executions:
+        return stats
+
+    pipeline = db.query(Pipeline).filter(Pipeline.id == executions[0].pipeline_id).first()
+    broker_tool = _extract_broker_tool(pipeline.config or {}) if pipeline else None
+    try:
+        if not broker_tool:
+            raise ValueError("No broker tool found for reconciled executions")
+        broker = BrokerAccountSnapshot(broker_factory.from_tool_config(broker_tool))
+    except Exception as e:
+        logger.error(
+            "reconciliation_broker_creation_failed",
+            execution_ids=execution_ids,
+            error=str(e),
+        )
+        return stats
+
+    # -----------------------------------------------------------------
+    # Diff open executions against the account snapshot
+    # -----------------------------------------------------------------
+    grace_cutoff = datetime.utcnow() - timedelta(minutes=GRACE_PERIOD_MINUTES)
+    closed: List[Execution] = []
+    still_active: List[Execution] = []
+    for execution in monitoring + comm_errors:
         if not execution.symbol:
             continue
 
-        broker, _ = _get_broker_for_execution(execution, db, broker_cache)
-        if not broker:
+        # Skip executions that entered monitoring very recently
+        monitoring_start = execution.started_at or execution.created_at
+        if (
+            execution.status == ExecutionStatus.MONITORING
+            and monitoring_start
+            and monitoring_start > grace_cutoff
+        ):
+            logger.debug(
+                "reconciliation_skipped_grace_period",
+                execution_id=str(execution.id),
+                symbol=execution.symbol,
+                age_seconds=(datetime.utcnow() - monitoring_start).total_seconds(),
+            )
             continue
 
         has_active = _check_symbol_on_broker(broker, execution)
         if has_active is None:
             # API error — can't determine state, skip
             continue
+        (still_active if has_active else closed).append(execution)
 
-        if not has_active:
-            # Position is gone — auto-reconcile regardless of retry state
-            if _reconcile_closed_position(db, execution, broker):
-                reconciled += 1
-        elif execution.next_check_at is not None:
-            # Position still active + still retrying → check if chain is broken
-            if _reschedule_orphaned_monitoring(db, execution):
-                rescheduled += 1
-        # else: next_check_at is None (paused) + position still active
-        # → leave for user to manually handle
+    # One order/fill history lookup for every trade that needs its P&L
+    broker.prefetch_trade_details(
+        _trade_ref(_load_trade_execution(execution)[1])
+        for execution in closed + needs_recon
+    )
 
-    return reconciled, rescheduled
+    # -----------------------------------------------------------------
+    # Apply outcomes
+    # -----------------------------------------------------------------
+    for execution in closed:
+        # Position/order no longer exists on broker — reconcile
+        if _reconcile_closed_position(db, execution, broker):
+            stats["reconciled"] += 1
+
+    for execution in still_active:
+        # Broker still has the position — check if the monitoring chain is
+        # broken. A COMMUNICATION_ERROR execution with next_check_at = None
+        # is paused for the user and left alone.
+        if execution.status == ExecutionStatus.COMMUNICATION_ERROR and execution.next_check_at is None:
+            continue
+        if _reschedule_orphaned_monitoring(db, execution):
+            stats["rescheduled"] += 1
+
+    for execution in needs_recon:
+        if _resolve_needs_reconciliation(db, execution, broker):
+            stats["recon_resolved"] += 1
+    stats["reconciled"] += stats["recon_resolved"]
+
+    stats["broker_calls"] = broker.broker_calls
+    return stats
 
 
 # ===========================================================================
 # Main Celery tasks
 # ===========================================================================
 
+@celery_app.task(name="app.orchestration.tasks.reconcile_broker_account")
+def reconcile_broker_account(execution_ids: List[str]):
+    """
+    Reconcile every open execution of one (user, broker account).
+
+    Broker reads per sweep are O(accounts), not O(executions): one positions
+    call, one open-orders call and one order/fill history lookup cover all
+    executions on the account (see _reconcile_account).
+
+    Args:
+        execution_ids: Execution ID strings sharing one (user, broker account)
+
+    Returns:
+        Dict with reconciliation results for this account
+    """
+    db = SessionLocal()
+
+    try:
+        stats = _reconcile_account(db, execution_ids)
+        logger.info("broker_account_reconciliation_completed", **stats)
+        return {"status": "completed", **stats}
+
+    except Exception as e:
+        logger.error(
+            "broker_account_reconciliation_failed",
+            execution_ids=execution_ids,
+            error=str(e),
+            exc_info=True,
+        )
+        db.rollback()
+        return {"status": "error", "error": str(e)}
+
+    finally:
+        db.close()
+
+
 @celery_app.task(
     name="app.orchestration.tasks.reconcile_user_trades",
     bind=True,
@@ -552,15 +766,12 @@ def reconcile_user_trades(self, user_id: str):
     Reconcile trades for a specific user.
 
     Checks if user's open positions on broker match MONITORING and
-    COMMUNICATION_ERROR executions in database.
+    COMMUNICATION_ERROR executions in database, and retries P&L recovery
+    for NEEDS_RECONCILIATION executions. Each of the user's broker accounts
+    is reconciled against one snapshot (see _reconcile_account).
 
-    For each execution:
-    1. If broker says position is gone → fetch P&L from broker → COMPLETED
-    2. If broker P&L unavailable (no trade_id, API error) → NEEDS_RECONCILIATION
-    3. If broker says position is still open but monitoring chain is broken → reschedule
-    4. If COMMUNICATION_ERROR with retries exhausted + position gone → auto-reconcile or NEEDS_RECONCILIATION
-
-    Runs independently per user for isolation and scalability.
+    The periodic sweep dispatches reconcile_broker_account directly; this
+    task reconciles a single user on demand.
 
     Args:
         user_id: UUID of user to reconcile
@@ -579,192 +790,25 @@ def reconcile_user_trades(self, user_id: str):
             logger.warning("user_not_found", user_id=user_id)
             return {"status": "user_not_found", "user_id": user_id}
 
-        # Get all MONITORING executions for this user
-        monitoring_executions = (
-            db.query(Execution)
-            .filter(
-                Execution.user_id == UUID(user_id),
-                Execution.status == ExecutionStatus.MONITORING,
-            )
-            .all()
-        )
-
-        # Get COMMUNICATION_ERROR executions (broker API issues)
-        comm_error_executions = (
-            db.query(Execution)
-            .filter(
-                Execution.user_id == UUID(user_id),
-                Execution.status == ExecutionStatus.COMMUNICATION_ERROR,
-            )
-            .all()
-        )
-
-        # Get NEEDS_RECONCILIATION executions (P&L unknown — retry broker)
-        needs_recon_executions = (
-            db.query(Execution)
-            .filter(
-                Execution.user_id == UUID(user_id),
-                Execution.status == ExecutionStatus.NEEDS_RECONCILIATION,
-            )
-            .all()
-        )
-
-        monitoring_symbols = {ex.symbol for ex in monitoring_executions}
-        grace_cutoff = datetime.utcnow() - timedelta(minutes=GRACE_PERIOD_MINUTES)
-
-        # Shared broker instance cache (avoids duplicate connections per account)
-        broker_cache: Dict[str, BrokerService] = {}
-        reconciled = 0
-        rescheduled = 0
-
-        # -----------------------------------------------------------------
-        # Phase 1: Reconcile MONITORING executions
-        # -----------------------------------------------------------------
-        for execution in monitoring_executions:
-            # Skip executions that entered monitoring very recently
-            monitoring_start = execution.started_at or execution.created_at
-            if monitoring_start and monitoring_start > grace_cutoff:
-                logger.debug(
-                    "reconciliation_skipped_grace_period",
-                    execution_id=str(execution.id),
-                    symbol=execution.symbol,
-                    age_seconds=(datetime.utcnow() - monitoring_start).total_seconds(),
-                )
-                continue
-
-            broker, _ = _get_broker_for_execution(execution, db, broker_cache)
-            if not broker:
-                continue
-
-            if not execution.symbol:
-                continue
-
-            has_active = _check_symbol_on_broker(broker, execution)
-            if has_active is None:
-                # API error — can't determine state, skip
-                continue
-
-            if not has_active:
-                # Position/order no longer exists on broker — reconcile
-                if _reconcile_closed_position(db, execution, broker):
-                    reconciled += 1
-            else:
-                # Broker still has active position — check if monitoring chain is broken
-                if _reschedule_orphaned_monitoring(db, execution):
-                    rescheduled += 1
-
-        # -----------------------------------------------------------------
-        # Phase 2: Reconcile COMMUNICATION_ERROR executions
-        # -----------------------------------------------------------------
-        comm_reconciled, comm_rescheduled = _reconcile_comm_error_executions(
-            db, comm_error_executions, broker_cache,
-        )
-        reconciled += comm_reconciled
-        rescheduled += comm_rescheduled
-
-        # -----------------------------------------------------------------
-        # Phase 3: Retry NEEDS_RECONCILIATION executions
-        # These had their position closed but P&L couldn't be fetched from
-        # the broker at reconciliation time. Retry the broker call — if it
-        # succeeds now, promote to COMPLETED; if not, leave as-is.
-        # -----------------------------------------------------------------
-        recon_resolved = 0
-        for execution in needs_recon_executions:
-            broker, _ = _get_broker_for_execution(execution, db, broker_cache)
-            if not broker:
-                continue
-
-            existing_result = execution.result or {}
-            pipeline_state = load_pipeline_state(execution)
-            if pipeline_state and pipeline_state.trade_execution:
-                existing_trade_exec = pipeline_state.trade_execution.dict()
-            else:
-                existing_trade_exec = existing_result.get("trade_execution", {})
-
-            outcome, pnl, pnl_percent, exit_reason, close_time, trade_id = (
-                _recover_pnl_from_broker(
-                    execution=execution,
-                    broker=broker,
-                    existing_trade_exec=existing_trade_exec,
-                )
-            )
+        groups = _group_by_broker_account(db, Execution.user_id == UUID(user_id))
 
-            # Only promote to COMPLETED if broker gave us actual P&L.
-            # "needs_reconciliation" again means broker still can't help — leave as-is.
-            if outcome in ("executed", "cancelled"):
-                execution.status = ExecutionStatus.COMPLETED
-                execution.completed_at = datetime.utcnow()
-                execution.execution_phase = "completed"
-                execution.error_message = None
-
-                existing_result["trade_outcome"] = {
-                    "status": outcome,
-                    "pnl": pnl,
-                    "pnl_percent": pnl_percent,
-                    "exit_reason": exit_reason,
-                    "closed_at": close_time,
-                }
-                if pnl != 0:
-                    existing_result["final_pnl"] = pnl
-
-                execution.result = existing_result | {
-                    "reconciled": True,
-                    "reconcile_reason": exit_reason,
-                }
-                flag_modified(execution, "result")
-
-                if pipeline_state:
-                    pipeline_state.should_complete = True
-                    if pipeline_state.trade_outcome:
-                        pipeline_state.trade_outcome.pnl = pnl
-                        pipeline_state.trade_outcome.pnl_percent = pnl_percent
-                        pipeline_state.trade_outcome.exit_reason = exit_reason
-                        pipeline_state.trade_outcome.status = outcome
-                    save_pipeline_state(execution, pipeline_state, db=db)
-
-                execution.version += 1
-                try:
-                    db.commit()
-                    recon_resolved += 1
-                    logger.info(
-                        "needs_reconciliation_resolved",
-                        execution_id=str(execution.id),
-                        symbol=execution.symbol,
-                        outcome=outcome,
-                        pnl=pnl,
-                    )
-                except Exception as commit_error:
-                    logger.error(
-                        "needs_reconciliation_commit_failed",
-                        execution_id=str(execution.id),
-                        error=str(commit_error),
-                    )
-                    db.rollback()
-
-        reconciled += recon_resolved
+        totals: Dict[str, Any] = {}
+        for execution_ids in groups.values():
+            for key, value in _reconcile_account(db, execution_ids).items():
+                totals[key] = totals.get(key, [] if isinstance(value, list) else 0) + value
 
         logger.info(
             "user_reconciliation_completed",
             user_id=user_id,
-            monitoring_count=len(monitoring_executions),
-            monitoring_symbols=list(monitoring_symbols),
-            communication_errors=len(comm_error_executions),
-            needs_reconciliation=len(needs_recon_executions),
-            recon_resolved=recon_resolved,
-            reconciled=reconciled,
-            rescheduled=rescheduled,
+            accounts=len(groups),
+            **totals,
         )
 
         return {
             "status": "completed",
             "user_id": user_id,
-            "monitoring_executions": len(monitoring_executions),
-            "monitoring_symbols": list(monitoring_symbols),
-            "communication_errors": len(comm_error_executions),
-            "needs_reconciliation": len(needs_recon_executions),
-            "recon_resolved": recon_resolved,
-            "reconciled": reconciled,
-            "rescheduled": rescheduled,
+            "accounts": len(groups),
+            **totals,
         }
 
     except Exception as e:
@@ -790,51 +834,43 @@ def schedule_user_reconciliation():
     """
     Master reconciliation scheduler.
 
-    Spawns individual reconciliation tasks for each user with active trades.
-    Runs every 1 minute via Celery Beat.
+    Groups every execution with an active trade (MONITORING,
+    COMMUNICATION_ERROR, NEEDS_RECONCILIATION) by (user, broker account)
+    in one query and spawns one reconcile_broker_account task per group.
+    Runs every 5 minutes via Celery Beat.
 
     This approach provides:
-    - User isolation: One user's broker issues don't affect others
-    - Scalability: Tasks distributed across workers
-    - Parallel execution: All users checked simultaneously
+    - Account isolation: One account's broker issues don't affect others
+    - Batching: A user with dozens of pipelines on one account costs one
+      task and a constant number of broker calls
+    - Parallel execution: All accounts checked simultaneously
 
     Returns:
-        Dict with number of users scheduled
+        Dict with number of accounts and executions scheduled
     """
     logger.info("master_reconciliation_started")
 
     db = SessionLocal()
 
     try:
-        # Find users with active trades (MONITORING, COMMUNICATION_ERROR, or NEEDS_RECONCILIATION)
-        users_with_active_trades = (
-            db.query(User)
-            .join(Execution)
-            .filter(
-                Execution.status.in_([
-                    ExecutionStatus.MONITORING,
-                    ExecutionStatus.COMMUNICATION_ERROR,
-                    ExecutionStatus.NEEDS_RECONCILIATION,
-                ])
-            )
-            .distinct()
-            .all()
-        )
-
-        scheduled_count = 0
+        groups = _group_by_broker_account(db)
 
-        for user in users_with_active_trades:
-            reconcile_user_trades.apply_async(args=[str(user.id)])
-            scheduled_count += 1
+        for execution_ids in groups.values():
+            reconcile_broker_account.apply_async(args=[execution_ids])
 
+        executions = sum(len(ids) for ids in groups.values())
         logger.info(
             "master_reconciliation_completed",
-            users_scheduled=scheduled_count,
+            accounts_scheduled=len(groups),
+            users_scheduled=len({user_id for user_id, _ in groups}),
+            executions=executions,
         )
 
         return {
             "status": "completed",
-            "users_scheduled": scheduled_count,
+            "accounts_scheduled": len(groups),
+            "users_scheduled": len({user_id for user_id, _ in groups}),
+            "executions": executions,
         }
 
     except Exception as e:
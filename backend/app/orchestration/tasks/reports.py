@@ -0,0 +1,199 @@
+"""
+Celery Task: Execution Reports
+
+Renders the post-execution reports (executive report, trade analysis, PDF)
+outside the pipeline worker. The task is routed to the low-priority
+``reports`` queue (see celery_app.task_routes), so LLM latency and
+HTML→PDF rendering no longer hold a pipeline worker slot after the
+execution completes.
+
+Reports are cached under the execution's state hash (see
+app.services.execution_reports): re-running the task for an unchanged
+execution does no LLM calls and no rendering.
+"""
+import asyncio
+import structlog
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.orchestration.celery_app import celery_app
+from app.database import SessionLocal
+from app.models.execution import Execution, ExecutionStatus
+from app.models.pipeline import Pipeline
+from app.services.execution_reports import (
+    build_execution_data,
+    build_executive_report,
+    cached_report,
+    is_failed_report,
+    report_state_hash,
+)
+from app.services.langfuse_service import (
+    activate_observation,
+    flush_langfuse,
+    resume_execution_trace,
+    span_context,
+)
+
+logger = structlog.get_logger()
+
+
+async def _generate_llm_reports(
+    execution_data: Dict[str, Any],
+    trace: Optional[Any],
+    need_summary: bool,
+    need_analysis: bool,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Run the executive summary and trade analysis LLM calls concurrently."""
+    from app.services.executive_report_generator import executive_report_generator
+    from app.services.trade_analysis_generator import trade_analysis_generator
+
+    metadata = {"execution_id": execution_data["id"]}
+
+    async def summary():
+        if not need_summary:
+            return None
+        with span_context(name="report:executive_summary", parent=trace, metadata=metadata) as span:
+            return await executive_report_generator.generate_executive_summary(
+                execution_data, langfuse_trace=span
+            )
+
+    async def analysis():
+        if not need_analysis:
+            return None
+        with span_context(name="report:trade_analysis", parent=trace, metadata=metadata) as span:
+            return await trade_analysis_generator.generate_trade_analysis(
+                execution_data, langfuse_trace=span
+            )
+
+    return tuple(await asyncio.gather(summary(), analysis()))
+
+
+@celery_app.task(
+    name="app.orchestration.tasks.generate_execution_reports",
+    bind=True,
+    max_retries=2,
+)
+def generate_execution_reports(self, execution_id: str):
+    """
+    Generate the executive report, trade analysis and PDF of a completed execution.
+
+    Each report is skipped when the stored one was built from the current
+    state hash. Failed LLM generations are not stored, so the API (or a
+    later run) can try again.
+
+    Args:
+        execution_id: UUID string of a COMPLETED execution
+
+    Returns:
+        Dict with the state hash and the reports generated by this run
+    """
+    from app.services.pdf_generator import pdf_generator
+
+    db = SessionLocal()
+
+    try:
+        row = (
+            db.query(Execution, Pipeline.name)
+            .join(Pipeline, Pipeline.id == Execution.pipeline_id)
+            .filter(Execution.id == UUID(execution_id))
+            .first()
+        )
+        if not row:
+            return {"status": "not_found", "execution_id": execution_id}
+
+        execution, pipeline_name = row
+        if execution.status != ExecutionStatus.COMPLETED:
+            return {"status": "skipped", "execution_id": execution_id, "reason": execution.status.value}
+
+        execution_data = build_execution_data(execution, pipeline_name)
+        state_hash = report_state_hash(execution_data)
+
+        executive_report = cached_report(execution.executive_report, state_hash)
+        trade_analysis = cached_report(execution.trade_analysis, state_hash)
+        pdf_is_current = bool(
+            execution.report_pdf_path
+            and execution.report_pdf_path.endswith(f"-{state_hash[:16]}.pdf")
+        )
+        if executive_report and trade_analysis and pdf_is_current:
+            logger.info("execution_reports_cache_hit", execution_id=execution_id, state_hash=state_hash)
+            return {"status": "cached", "execution_id": execution_id, "state_hash": state_hash}
+
+        logger.info("generating_execution_reports", execution_id=execution_id, state_hash=state_hash)
+
+        trace = resume_execution_trace(
+            trace_id=execution.langfuse_trace_id,
+            session_id=execution_id,
+            user_id=str(execution.user_id),
+            metadata={"execution_id": execution_id, "pipeline_name": pipeline_name},
+        )
+
+        generated: List[str] = []
+        with activate_observation(trace, as_trace=True):
+            summary = None
+            if executive_report is None or trade_analysis is None:
+                summary, analysis = asyncio.run(_generate_llm_reports(
+                    execution_data,
+                    trace,
+                    need_summary=executive_report is None,
+                    need_analysis=trade_analysis is None,
+                ))
+                if summary is not None and not is_failed_report(summary):
+                    executive_report = build_executive_report(execution_data, summary, state_hash)
+                    execution.executive_report = executive_report
+                    generated.append("executive_report")
+                if analysis is not None and not is_failed_report(analysis):
+                    trade_analysis = analysis | {"state_hash": state_hash}
+                    execution.trade_analysis = trade_analysis
+                    generated.append("trade_analysis")
+
+            # A PDF rendered before this summary existed holds the fallback text
+            summary_is_new = "executive_report" in generated
+            if not pdf_is_current or summary_is_new:
+                with span_context(
+                    name="report:pdf_generation",
+                    parent=trace,
+                    metadata={"execution_id": execution_id},
+                ):
+                    # Only a PDF with a real summary is pinned to the state
+                    # hash; a fallback one gets a timestamped name, so the
+                    # next run retries the summary and replaces it
+                    execution.report_pdf_path = pdf_generator.generate_execution_report(
+                        execution_id=execution_id,
+                        execution_data=execution_data,
+                        executive_summary=executive_report or summary,
+                        state_hash=state_hash if executive_report else None,
+                        reuse_existing=not summary_is_new,
+                    )
+                generated.append("pdf")
+
+        db.commit()
+        flush_langfuse()
+
+        logger.info(
+            "execution_reports_generated",
+            execution_id=execution_id,
+            state_hash=state_hash,
+            generated=generated,
+            pdf_path=execution.report_pdf_path,
+        )
+        return {
+            "status": "completed",
+            "execution_id": execution_id,
+            "state_hash": state_hash,
+            "generated": generated,
+        }
+
+    except Exception as exc:
+        logger.error(
+            "execution_reports_failed",
+            execution_id=execution_id,
+            error=str(exc),
+            exc_info=True,
+        )
+        db.rollback()
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=exc, countdown=60)
+        return {"status": "error", "execution_id": execution_id, "error": str(exc)}
+
+    finally:
+        db.close()
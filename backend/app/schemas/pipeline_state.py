@@ -8,7 +8,7 @@ make trading decisions.
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_serializer
 
 
 class TimeframeData(BaseModel):
@@ -52,6 +52,14 @@ class MarketData(BaseModel):
     market_status: Optional[str] = None  # "open", "closed", "pre_market", "after_hours"
     last_updated: datetime = Field(default_factory=datetime.utcnow)
 
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler):
+        # Loaded snapshots decode candles on first access (see
+        # orchestration.state_codec.PackedMarketData); make sure they're
+        # decoded before any dump reads the fields directly
+        self.timeframes
+        return handler(self)
+
 
 class BiasResult(BaseModel):
     """Result from Bias Agent analysis."""
@@ -85,6 +85,11 @@ class ValidateInstructionsResponse(BaseModel):
         None,
         description="Suggestions for unsupported features"
     )
+    
+    cached: bool = Field(
+        False,
+        description="Result reused from an earlier detection of the same instructions"
+    )
 
 
 class ToolInfo(BaseModel):
@@ -496,6 +496,10 @@ def seed_llm_models(db: Session = None):
         
         db.commit()
         logger.info(f"✨ Successfully seeded {len(DEFAULT_LLM_MODELS)} LLM models")
+
+        # Workers cache the model catalog; make them pick up the new pricing
+        from app.services.model_registry import model_registry
+        model_registry.invalidate()
         
         # Print summary
         print("\n" + "="*70)
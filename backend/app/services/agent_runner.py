@@ -6,9 +6,12 @@ prompt contracts and output schemas.
 """
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import structlog
 
@@ -29,14 +32,71 @@ class AgentRunnerError(RuntimeError):
     pass
 
 
+@dataclass
+class _StreamedToolCall:
+    id: str = ""
+    name: str = ""
+    arguments: str = ""
+
+
+# (call, parsed arguments, pending tool output)
+_DispatchedToolCall = Tuple[_StreamedToolCall, Dict[str, Any], "asyncio.Future[str]"]
+
+
+def _run_blocking(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine to completion from sync code (event loop or not)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside an event loop (e.g. PipelineExecutor.execute):
+    # run on a private loop in a helper thread, keeping the caller's context
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-runner") as pool:
+        return pool.submit(context.run, asyncio.run, coro).result()
+
+
 class AgentRunner:
+    """
+    Tool-calling agent loop over the async OpenAI client.
+
+    Responses are streamed; each tool call is dispatched to a worker
+    thread as soon as its arguments have been streamed completely, so
+    tools run while the model is still generating the rest of the turn.
+    Tool results are sent back in the order the model requested them.
+
+    ``arun``/``acomplete`` are the native entry points; ``run``/``complete``
+    drive them for the synchronous agents.
+    """
+
     def __init__(self, *, model: str, temperature: float = 0.2, timeout: int = 45):
         self.model = model
         self.temperature = temperature
         self.timeout = timeout
-        self.client = create_openai_client()
 
-    def run(
+    def run(self, **kwargs: Any) -> AgentRunnerResult:
+        """Synchronous ``arun``."""
+        return _run_blocking(self.arun(**kwargs))
+
+    def complete(self, prompt: str, *, temperature: Optional[float] = None) -> str:
+        """Synchronous ``acomplete``."""
+        return _run_blocking(self.acomplete(prompt, temperature=temperature))
+
+    async def acomplete(self, prompt: str, *, temperature: Optional[float] = None) -> str:
+        """Single-turn completion without tools; returns the stripped text."""
+        client = create_openai_client(async_client=True)
+        try:
+            response = await client.chat.completions.create(
+                model=resolve_chat_model(self.model),
+                messages=[{"role": "user", "content": prompt}],
+                temperature=self.temperature if temperature is None else temperature,
+                timeout=self.timeout,
+            )
+        finally:
+            await client.close()
+        return (response.choices[0].message.content or "").strip()
+
+    async def arun(
         self,
         *,
         system_prompt: str,
@@ -54,68 +114,163 @@ class AgentRunner:
         all_tool_calls: List[Dict[str, Any]] = []
         usage_totals = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         model_id = resolve_chat_model(self.model)
+        client = create_openai_client(async_client=True)
 
-        for iteration in range(max_iterations):
-            response = self.client.chat.completions.create(
-                model=model_id,
-                messages=messages,
-                tools=tools or None,
-                temperature=self.temperature if response_temperature is None else response_temperature,
-                timeout=self.timeout,
-            )
+        try:
+            for iteration in range(max_iterations):
+                content, tool_calls, dispatched = await self._stream_turn(
+                    client,
+                    model_id=model_id,
+                    messages=messages,
+                    tools=tools,
+                    tool_handlers=tool_handlers,
+                    temperature=self.temperature if response_temperature is None else response_temperature,
+                    usage_totals=usage_totals,
+                )
+                trace_llm_call(
+                    trace=trace,
+                    model=model_id,
+                    prompt=user_prompt if iteration == 0 else json.dumps(messages[-2:], default=str),
+                    response=content or "[tool-call]",
+                    tokens_used=usage_totals,
+                )
 
-            usage = getattr(response, "usage", None)
-            if usage:
-                usage_totals["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
-                usage_totals["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
-                usage_totals["total_tokens"] += getattr(usage, "total_tokens", 0) or 0
-
-            message = response.choices[0].message
-            content = (message.content or "").strip()
-            trace_llm_call(
-                trace=trace,
-                model=model_id,
-                prompt=user_prompt if iteration == 0 else json.dumps(messages[-2:], default=str),
-                response=content or "[tool-call]",
-                tokens_used=usage_totals,
-            )
+                if not tool_calls:
+                    return AgentRunnerResult(content=content, usage=usage_totals, tool_calls=all_tool_calls)
+
+                messages.append(
+                    {
+                        "role": "assistant",
+                        **({"content": content} if content else {}),
+                        "tool_calls": [
+                            {
+                                "id": call.id,
+                                "type": "function",
+                                "function": {"name": call.name, "arguments": call.arguments},
+                            }
+                            for call in tool_calls
+                        ],
+                    }
+                )
+
+                outputs = await asyncio.gather(*(task for _, _, task in dispatched))
+                for (call, arguments, _), tool_output in zip(dispatched, outputs):
+                    all_tool_calls.append(
+                        {
+                            "id": call.id,
+                            "name": call.name,
+                            "arguments": arguments,
+                            "output": tool_output,
+                        }
+                    )
+                    trace_tool_call(trace, call.name, arguments, tool_output)
+                    messages.append(
+                        {
+                            "role": "tool",
+                            "tool_call_id": call.id,
+                            "content": tool_output,
+                        }
+                    )
+        finally:
+            await client.close()
+
+        raise AgentRunnerError(f"Agent tool loop exceeded max_iterations={max_iterations}")
+
+    async def _stream_turn(
+        self,
+        client: Any,
+        *,
+        model_id: str,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        tool_handlers: Optional[Dict[str, Callable[[Dict[str, Any]], str]]],
+        temperature: float,
+        usage_totals: Dict[str, int],
+    ) -> Tuple[str, List[_StreamedToolCall], List[_DispatchedToolCall]]:
+        """
+        Stream one assistant turn, dispatching tool calls as they complete.
+
+        Returns:
+            (content, tool calls, [(call, parsed arguments, pending output)])
+        """
+        stream = await client.chat.completions.create(
+            model=model_id,
+            messages=messages,
+            tools=tools or None,
+            temperature=temperature,
+            timeout=self.timeout,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        content_parts: List[str] = []
+        calls: Dict[int, _StreamedToolCall] = {}
+        dispatched: List[_DispatchedToolCall] = []
+        dispatched_indices: Set[int] = set()
 
-            if not getattr(message, "tool_calls", None):
-                return AgentRunnerResult(content=content, usage=usage_totals, tool_calls=all_tool_calls)
+        def dispatch_before(limit: Optional[int] = None):
+            # A tool call's arguments are complete once a later one starts
+            # (or the stream ends)
+            for index in sorted(calls):
+                if (limit is None or index < limit) and index not in dispatched_indices:
+                    dispatched_indices.add(index)
+                    dispatch(calls[index])
 
+        def dispatch(call: _StreamedToolCall):
             if not tool_handlers:
                 raise AgentRunnerError("LLM requested tool calls but no tool handlers were provided")
+            try:
+                arguments = json.loads(call.arguments or "{}")
+            except json.JSONDecodeError as exc:
+                raise AgentRunnerError(f"Invalid tool arguments for {call.name}: {exc}") from exc
+            handler = tool_handlers.get(call.name)
+            if not handler:
+                raise AgentRunnerError(f"No tool handler registered for {call.name}")
 
-            assistant_message = message.model_dump(exclude_none=True)
-            messages.append(assistant_message)
+            logger.info("agent_tool_call", name=call.name, arguments=arguments)
+            task = asyncio.ensure_future(asyncio.to_thread(handler, arguments))
+            dispatched.append((call, arguments, task))
 
-            for tool_call in message.tool_calls:
-                try:
-                    arguments = json.loads(tool_call.function.arguments or "{}")
-                except json.JSONDecodeError as exc:
-                    raise AgentRunnerError(f"Invalid tool arguments for {tool_call.function.name}: {exc}") from exc
+        try:
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None)
+                if usage:
+                    usage_totals["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+                    usage_totals["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+                    usage_totals["total_tokens"] += getattr(usage, "total_tokens", 0) or 0
+                if not chunk.choices:
+                    continue
 
-                handler = tool_handlers.get(tool_call.function.name)
-                if not handler:
-                    raise AgentRunnerError(f"No tool handler registered for {tool_call.function.name}")
+                delta = chunk.choices[0].delta
+                if getattr(delta, "content", None):
+                    content_parts.append(delta.content)
 
-                logger.info("agent_tool_call", name=tool_call.function.name, arguments=arguments)
-                tool_output = handler(arguments)
-                all_tool_calls.append(
-                    {
-                        "id": tool_call.id,
-                        "name": tool_call.function.name,
-                        "arguments": arguments,
-                        "output": tool_output,
-                    }
-                )
-                trace_tool_call(trace, tool_call.function.name, arguments, tool_output)
-                messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": tool_output,
-                    }
-                )
+                for fragment in getattr(delta, "tool_calls", None) or []:
+                    call = calls.get(fragment.index)
+                    if call is None:
+                        dispatch_before(fragment.index)
+                        call = calls[fragment.index] = _StreamedToolCall()
+                    if fragment.id:
+                        call.id = fragment.id
+                    function = getattr(fragment, "function", None)
+                    if function is not None:
+                        if function.name:
+                            call.name += function.name
+                        if function.arguments:
+                            call.arguments += function.arguments
 
-        raise AgentRunnerError(f"Agent tool loop exceeded max_iterations={max_iterations}")
+            dispatch_before()
+        except BaseException:
+            # Release the connection (and its governor slot) before the
+            # already-dispatched tools finish
+            close = getattr(stream, "close", None)
+            if close is not None:
+                try:
+                    await close()
+                except Exception as exc:
+                    logger.debug("agent_stream_close_failed", error=str(exc))
+            await asyncio.gather(*(task for _, _, task in dispatched), return_exceptions=True)
+            raise
+
+        tool_calls = [calls[index] for index in sorted(calls)]
+        return "".join(content_parts).strip(), tool_calls, dispatched
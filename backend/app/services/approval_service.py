@@ -79,7 +79,7 @@ class ApprovalService:
         from app.orchestration.tasks._helpers import save_pipeline_state
         save_pipeline_state(execution, state)
 
-        flag_modified(execution, "pipeline_state")
+        flag_modified(execution, "pipeline_state_packed")
         execution.version += 1
         db_session.commit()
 
@@ -123,19 +123,28 @@ class ApprovalService:
                 )
             else:
                 try:
+                    from app.services.notification_outbox import NotificationEvent, notification_outbox
                     from app.services.sms_notifier import TwilioSmsNotifier
                     report = ApprovalService.build_pre_trade_report(state, pipeline)
                     approval_url = f"{settings.APPROVAL_BASE_URL}/approve/{token}"
-                    TwilioSmsNotifier.send_approval_request(
-                        to_phone=pipeline.approval_phone,
-                        symbol=execution.symbol or "N/A",
-                        action=report.get("action", "TRADE"),
-                        confidence=report.get("confidence"),
-                        position_size=report.get("position_size"),
-                        entry_price=report.get("entry_price"),
-                        approval_url=approval_url,
-                        timeout_minutes=timeout_minutes,
-                    )
+                    # Each approval link goes out on its own, never in a digest
+                    notification_outbox.enqueue(NotificationEvent(
+                        channel="sms",
+                        user_id=str(pipeline.user_id),
+                        event="approval_request",
+                        message=TwilioSmsNotifier.approval_request_message(
+                            symbol=execution.symbol or "N/A",
+                            action=report.get("action", "TRADE"),
+                            confidence=report.get("confidence"),
+                            position_size=report.get("position_size"),
+                            entry_price=report.get("entry_price"),
+                            approval_url=approval_url,
+                            timeout_minutes=timeout_minutes,
+                        ),
+                        recipient=pipeline.approval_phone,
+                        dedupe_key=f"approval:{token}",
+                        digest=False,
+                    ))
                 except Exception as e:
                     logger.error("sms_notification_failed", error=str(e))
 
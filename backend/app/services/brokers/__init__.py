@@ -8,6 +8,8 @@ from app.services.brokers.alpaca_service import AlpacaBrokerService
 from app.services.brokers.oanda_service import OandaBrokerService
 from app.services.brokers.tradier_service import TradierBrokerService
 from app.services.brokers.factory import BrokerFactory
+from app.services.brokers.account_snapshot import BrokerAccountSnapshot
+from app.services.brokers.quote_cache import QuoteCache, LocalQuoteFeed, quote_cache
 
 __all__ = [
     "BrokerService",
@@ -20,5 +22,9 @@ __all__ = [
     "OandaBrokerService",
     "TradierBrokerService",
     "BrokerFactory",
+    "BrokerAccountSnapshot",
+    "QuoteCache",
+    "LocalQuoteFeed",
+    "quote_cache",
 ]
 
@@ -0,0 +1,276 @@
+"""
+Broker Account Snapshot
+
+Read-through view of a single broker account, shared by every execution that
+is monitored on that account during one monitoring sweep.
+
+Positions, open orders and quotes are each fetched with ONE broker call the
+first time any execution asks for them, then served from memory. Trade
+details (order/fill history) registered up front with
+``prefetch_trade_details`` are fetched together in one batch as well. Calls that
+change broker state (cancel, close) go straight to the wrapped broker and
+invalidate the affected cached data so later executions in the same sweep
+never act on a stale view. That includes calls the snapshot doesn't know
+(order placement, broker-specific trade modifiers): anything delegated to
+the broker that isn't a read invalidates orders and positions.
+"""
+import functools
+import inspect
+from typing import Dict, Any, List, Optional, Iterable, Set, Tuple
+import structlog
+
+from app.services.brokers.base import BrokerService, Position, Order
+
+logger = structlog.get_logger()
+
+# (trade_id, order_id) as passed to BrokerService.get_trade_details
+TradeRef = Tuple[Optional[str], Optional[str]]
+
+# Delegated broker methods that don't change account state
+READ_METHOD_PREFIXES = ("get_", "is_", "has_", "list_")
+READ_METHODS = {"test_connection", "stream_quotes", "stop_streams"}
+
+
+def normalize_symbol(symbol: Optional[str]) -> str:
+    """
+    Normalize a symbol for cross-broker comparison.
+
+    Brokers disagree on separators (Oanda ``EUR_USD``, Alpaca crypto
+    ``BTC/USD`` vs. position symbol ``BTCUSD``), so separators are dropped.
+    """
+    return (symbol or "").upper().replace("/", "").replace("_", "")
+
+
+class BrokerAccountSnapshot:
+    """
+    Batched, per-sweep view of one broker account.
+
+    Implements the read side of ``BrokerService`` used by the Trade Manager's
+    monitoring loop. Any attribute not defined here is delegated to the
+    wrapped broker, so the snapshot can be passed wherever a broker is used.
+
+    Fetch errors are remembered and re-raised to every caller for the rest of
+    the sweep — callers keep distinguishing "no position" from "API failure"
+    exactly as they do against the live broker.
+    """
+
+    def __init__(self, broker: BrokerService, symbols: Iterable[str] = ()):
+        """
+        Args:
+            broker: Live broker service for the account
+            symbols: Symbols that will be monitored (quoted in one batch)
+        """
+        self.wrapped = broker
+        self._symbols: List[str] = [s for s in dict.fromkeys(symbols) if s]
+
+        self._positions: Optional[Dict[str, Position]] = None
+        self._positions_error: Optional[Exception] = None
+        self._orders: Optional[List[Order]] = None
+        self._orders_error: Optional[Exception] = None
+        self._quotes: Optional[Dict[str, Dict[str, Any]]] = None
+        self._candles: Dict[Tuple[str, int, str], List[Dict[str, Any]]] = {}
+
+        # (trade_id, order_id) -> trade details; pending refs load in one batch
+        self._trade_details: Dict[TradeRef, Dict[str, Any]] = {}
+        self._trade_details_errors: Dict[TradeRef, Exception] = {}
+        self._pending_trade_refs: Dict[TradeRef, None] = {}
+
+        # Symbols whose position changed during this sweep (closed by an
+        # earlier execution) — read live instead of from the snapshot.
+        self._stale_position_symbols: Set[str] = set()
+
+        # Number of read calls actually sent to the broker
+        self.broker_calls = 0
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes not defined on the snapshot
+        if name == "wrapped":
+            raise AttributeError(name)
+        attr = getattr(self.wrapped, name)
+        if not callable(attr) or name.startswith(READ_METHOD_PREFIXES) or name in READ_METHODS:
+            return attr
+        return self._invalidating(attr)
+
+    def _invalidating(self, method):
+        """Wrap a delegated mutation so it invalidates orders and positions."""
+
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._invalidate(self._symbol_argument(method, args, kwargs))
+
+        return call
+
+    @staticmethod
+    def _symbol_argument(method, args, kwargs) -> Optional[str]:
+        try:
+            bound = inspect.signature(method).bind_partial(*args, **kwargs)
+        except (TypeError, ValueError):
+            return kwargs.get("symbol")
+        symbol = bound.arguments.get("symbol")
+        return symbol if isinstance(symbol, str) else None
+
+    def _invalidate(self, symbol: Optional[str] = None):
+        """Forget open orders and the symbol's position (all positions if unknown)."""
+        self._orders = None
+        self._orders_error = None
+        if symbol:
+            self._stale_position_symbols.add(normalize_symbol(symbol))
+        else:
+            self._positions = None
+            self._positions_error = None
+
+    # ------------------------------------------------------------------
+    # Lazy batch loaders
+    # ------------------------------------------------------------------
+
+    def _load_positions(self) -> Dict[str, Position]:
+        if self._positions is None and self._positions_error is None:
+            self.broker_calls += 1
+            try:
+                self._positions = {
+                    normalize_symbol(position.symbol): position
+                    for position in self.wrapped.get_positions()
+                }
+            except Exception as e:
+                self._positions_error = e
+        if self._positions_error is not None:
+            raise self._positions_error
+        return self._positions
+
+    def _load_orders(self) -> List[Order]:
+        if self._orders is None and self._orders_error is None:
+            self.broker_calls += 1
+            try:
+                self._orders = self.wrapped.get_orders()
+            except Exception as e:
+                self._orders_error = e
+        if self._orders_error is not None:
+            raise self._orders_error
+        return self._orders
+
+    def _load_quotes(self) -> Dict[str, Dict[str, Any]]:
+        if self._quotes is None:
+            self.broker_calls += 1
+            quotes = self.wrapped.get_quotes(self._symbols)
+            self._quotes = {normalize_symbol(symbol): quote for symbol, quote in quotes.items()}
+        return self._quotes
+
+    def _load_trade_details(self):
+        refs, self._pending_trade_refs = list(self._pending_trade_refs), {}
+        self.broker_calls += 1
+        try:
+            self._trade_details.update(self.wrapped.get_trade_details_batch(refs))
+        except Exception as e:
+            for ref in refs:
+                self._trade_details_errors[ref] = e
+
+    # ------------------------------------------------------------------
+    # Read API (BrokerService-compatible)
+    # ------------------------------------------------------------------
+
+    def get_positions(self, account_id: Optional[str] = None) -> List[Position]:
+        """All open positions on the account (one broker call per sweep)."""
+        return list(self._load_positions().values())
+
+    def get_position(self, symbol: str, account_id: Optional[str] = None) -> Optional[Position]:
+        """Position for a symbol, served from the account snapshot."""
+        if normalize_symbol(symbol) in self._stale_position_symbols:
+            self.broker_calls += 1
+            return self.wrapped.get_position(symbol, account_id)
+        return self._load_positions().get(normalize_symbol(symbol))
+
+    def get_orders(self, account_id: Optional[str] = None) -> List[Order]:
+        """Open orders on the account (one broker call per sweep)."""
+        return list(self._load_orders())
+
+    def get_quote(self, symbol: str) -> Dict[str, Any]:
+        """Quote for a symbol; monitored symbols are quoted in one batch."""
+        key = normalize_symbol(symbol)
+        if key not in {normalize_symbol(s) for s in self._symbols}:
+            self.broker_calls += 1
+            return self.wrapped.get_quote(symbol)
+        return self._load_quotes().get(key, {"error": "No quote data"})
+
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        return {symbol: self.get_quote(symbol) for symbol in dict.fromkeys(symbols) if symbol}
+
+    def get_recent_candles(
+        self,
+        symbol: str,
+        count: int = 60,
+        granularity: str = "M1",
+    ) -> List[Dict[str, Any]]:
+        """Recent candles, fetched once per (symbol, count, granularity) per sweep."""
+        key = (normalize_symbol(symbol), count, granularity)
+        if key not in self._candles:
+            self.broker_calls += 1
+            self._candles[key] = self.wrapped.get_recent_candles(
+                symbol, count=count, granularity=granularity
+            )
+        return self._candles[key]
+
+    def prefetch_trade_details(self, refs: Iterable[TradeRef]):
+        """
+        Register trades whose details will be asked for during this sweep.
+
+        Nothing is fetched yet; the first ``get_trade_details`` call for any
+        registered trade loads all of them with one batch call.
+        """
+        for ref in refs:
+            if ref not in self._trade_details and ref not in self._trade_details_errors:
+                self._pending_trade_refs[ref] = None
+
+    def get_trade_details(
+        self,
+        trade_id: Optional[str] = None,
+        order_id: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Trade details, from the prefetched batch when the trade was registered."""
+        ref = (trade_id, order_id)
+        if ref in self._pending_trade_refs:
+            self._load_trade_details()
+        if ref in self._trade_details_errors:
+            raise self._trade_details_errors[ref]
+        if ref in self._trade_details:
+            return self._trade_details[ref]
+        self.broker_calls += 1
+        return self.wrapped.get_trade_details(
+            trade_id=trade_id, order_id=order_id, account_id=account_id
+        )
+
+    def has_active_symbol(self, symbol: str, account_id: Optional[str] = None) -> bool:
+        """
+        Check for an active position or open order using the snapshot.
+
+        Re-raises fetch errors, matching ``BrokerService.has_active_symbol``.
+        """
+        position = self.get_position(symbol, account_id)
+        if position and position.qty != 0:
+            return True
+
+        key = normalize_symbol(symbol)
+        return any(normalize_symbol(order.symbol) == key for order in self._load_orders())
+
+    # ------------------------------------------------------------------
+    # Mutations — pass through and invalidate
+    # ------------------------------------------------------------------
+
+    def cancel_order(self, order_id: str, account_id: Optional[str] = None) -> Dict[str, Any]:
+        result = self.wrapped.cancel_order(order_id, account_id)
+        self._orders = None
+        self._orders_error = None
+        return result
+
+    def close_position(
+        self,
+        symbol: str,
+        qty: Optional[float] = None,
+        account_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        result = self.wrapped.close_position(symbol, qty=qty, account_id=account_id)
+        self._invalidate(symbol)
+        return result
@@ -9,6 +9,7 @@ from datetime import datetime
 from app.services.brokers.base import (
     BrokerService, Position, Order, OrderSide, OrderType, TimeInForce, OrderStatus
 )
+from app.services.brokers.quote_cache import quote_cache
 
 
 class AlpacaBrokerService(BrokerService):
@@ -317,31 +318,47 @@ class AlpacaBrokerService(BrokerService):
     
     def get_quote(self, symbol: str) -> Dict[str, Any]:
         """Get real-time quote"""
+        return self.get_quotes([symbol]).get(symbol, {"error": "No quote data"})
+    
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes, calling Alpaca only for symbols not freshly cached"""
+        return quote_cache.get_quotes(self, symbols, self._fetch_quotes)
+
+    def _fetch_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes for several symbols in a single request"""
+        requested = [symbol for symbol in dict.fromkeys(symbols) if symbol]
+        if not requested:
+            return {}
+
         try:
             from alpaca.data.requests import StockLatestQuoteRequest
             from alpaca.data.historical import StockHistoricalDataClient
-            
-            # Create data client (separate from trading client)
+
             data_client = StockHistoricalDataClient(self.api_key, self.secret_key)
-            
-            request = StockLatestQuoteRequest(symbol_or_symbols=symbol)
-            quote = data_client.get_stock_latest_quote(request)
-            
-            quote_data = quote[symbol]
-            
-            return {
-                "symbol": symbol,
-                "bid": float(quote_data.bid_price),
-                "ask": float(quote_data.ask_price),
-                "bid_size": quote_data.bid_size,
-                "ask_size": quote_data.ask_size,
-                "last": (float(quote_data.bid_price) + float(quote_data.ask_price)) / 2,
-                "timestamp": quote_data.timestamp
-            }
+
+            request = StockLatestQuoteRequest(symbol_or_symbols=requested)
+            latest = data_client.get_stock_latest_quote(request)
+
+            quotes = {}
+            for symbol in requested:
+                quote_data = latest.get(symbol)
+                if quote_data is None:
+                    quotes[symbol] = {"error": "No quote data"}
+                    continue
+                quotes[symbol] = {
+                    "symbol": symbol,
+                    "bid": float(quote_data.bid_price),
+                    "ask": float(quote_data.ask_price),
+                    "bid_size": quote_data.bid_size,
+                    "ask_size": quote_data.ask_size,
+                    "last": (float(quote_data.bid_price) + float(quote_data.ask_price)) / 2,
+                    "timestamp": quote_data.timestamp
+                }
+            return quotes
         except Exception as e:
-            self.logger.error("Failed to get Alpaca quote", symbol=symbol, error=str(e))
-            return {"error": str(e)}
-    
+            self.logger.error("Failed to get Alpaca quotes", symbols=requested, error=str(e))
+            return {symbol: {"error": str(e)} for symbol in requested}
+
     def _convert_order(self, alpaca_order) -> Order:
         """Convert Alpaca order to standard Order model"""
         return Order(
@@ -5,7 +5,7 @@ Abstract base class defining the interface for broker integrations.
 """
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 from pydantic import BaseModel
 import structlog
@@ -306,6 +306,40 @@ class BrokerService(ABC):
         """
         pass
     
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get real-time quotes for several symbols.
+
+        Brokers whose quote endpoint accepts a symbol list should override this
+        so that batched callers (position monitoring, reconciliation) pay one
+        round trip instead of one per symbol.
+
+        Args:
+            symbols: Trading symbols
+
+        Returns:
+            Dict keyed by the symbols as passed in, each value shaped like
+            ``get_quote`` (including ``{"error": ...}`` entries on failure).
+        """
+        return {symbol: self.get_quote(symbol) for symbol in dict.fromkeys(symbols) if symbol}
+
+    def stream_quotes(self, symbols: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream real-time quotes for symbols from the broker's streaming API.
+
+        Used by the shared quote cache when streaming is enabled. Yields dicts
+        shaped like ``get_quote``; heartbeats are yielded as
+        ``{"type": "heartbeat"}`` so the consumer can stop promptly. Brokers
+        without a streaming endpoint keep the default and are polled instead.
+
+        Args:
+            symbols: Trading symbols to subscribe to
+
+        Raises:
+            NotImplementedError: The broker has no streaming support
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support quote streaming")
+
     def get_recent_candles(
         self,
         symbol: str,
@@ -380,6 +414,31 @@ class BrokerService(ABC):
             NotImplementedError: If broker subclass has not implemented this method
         """
         pass
+
+    def get_trade_details_batch(
+        self,
+        refs: Iterable[Tuple[Optional[str], Optional[str]]],
+        account_id: Optional[str] = None,
+    ) -> Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]]:
+        """
+        Get details for several trades at once.
+
+        Used by reconciliation to fetch the order/fill history of every trade
+        on an account in one sweep. The default implementation calls
+        ``get_trade_details`` per trade; brokers with a bulk history endpoint
+        override it with a single request.
+
+        Args:
+            refs: ``(trade_id, order_id)`` pairs, as passed to ``get_trade_details``
+            account_id: Account ID (optional).
+
+        Returns:
+            Dict of ``(trade_id, order_id)`` → trade-details dict
+        """
+        return {
+            ref: self.get_trade_details(trade_id=ref[0], order_id=ref[1], account_id=account_id)
+            for ref in dict.fromkeys(refs)
+        }
     
     def is_paper_trading(self) -> bool:
         """Check if this is a paper trading account."""
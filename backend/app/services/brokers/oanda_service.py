@@ -4,13 +4,21 @@ Oanda Broker Service
 Implementation using Oanda v3 REST API for forex trading.
 Based on tested oanda_service.py from project root.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
+import json
 import requests
 
 from app.services.brokers.base import (
     BrokerService, Position, Order, OrderSide, OrderType, TimeInForce, OrderStatus
 )
+from app.services.brokers.quote_cache import quote_cache
+
+# Most trades GET /trades returns per request
+TRADES_LIST_MAX_COUNT = 500
+
+# How many recent transactions are scanned for trades no longer listed
+TRANSACTION_HISTORY_WINDOW = 1000
 
 
 class OandaBrokerService(BrokerService):
@@ -159,9 +167,12 @@ class OandaBrokerService(BrokerService):
                 error_msg = result.get("error", "Unknown error")
                 raise Exception(f"Oanda API error: {error_msg}")
             
+            # One pricing request for every held instrument instead of one per position
+            pricing = self.get_quotes([pos.get("instrument", "") for pos in result["positions"]])
+
             positions = []
             for pos in result["positions"]:
-                converted = self._convert_position(pos)
+                converted = self._convert_position(pos, pricing=pricing.get(pos.get("instrument", "")))
                 if converted:
                     positions.append(converted)
             
@@ -196,7 +207,7 @@ class OandaBrokerService(BrokerService):
             self.logger.error("Failed to get Oanda position", symbol=symbol, error=str(e))
             raise
     
-    def _convert_position(self, oanda_pos: Dict) -> Optional[Position]:
+    def _convert_position(self, oanda_pos: Dict, pricing: Optional[Dict[str, Any]] = None) -> Optional[Position]:
         """Convert Oanda position to standard Position model"""
         try:
             instrument = oanda_pos.get("instrument", "")
@@ -222,8 +233,9 @@ class OandaBrokerService(BrokerService):
                 avg_price = float(oanda_pos.get("short", {}).get("averagePrice", 0))
                 unrealized_pl = float(oanda_pos.get("short", {}).get("unrealizedPL", 0))
             
-            # Get current price from pricing API
-            pricing = self.get_quote(instrument)
+            # Get current price from pricing API (pre-fetched by get_positions when batched)
+            if pricing is None:
+                pricing = self.get_quote(instrument)
             current_price = pricing.get("last", avg_price)
             
             # Calculate values
@@ -668,34 +680,94 @@ class OandaBrokerService(BrokerService):
             return {"success": False, "error": str(e)}
     
     def get_quote(self, symbol: str) -> Dict[str, Any]:
-        """Get real-time quote"""
+        """Get real-time quote (served from the shared quote cache)"""
+        return self.get_quotes([symbol]).get(symbol, {"error": "No price data"})
+
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes, calling Oanda only for instruments not freshly cached"""
+        return quote_cache.get_quotes(self, symbols, self._fetch_quotes)
+
+    def _fetch_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes for several instruments in a single pricing request"""
+        requested = [symbol for symbol in dict.fromkeys(symbols) if symbol]
+        if not requested:
+            return {}
+
         target_account = self.account_id
         if not target_account:
-            return {"error": "No account ID provided"}
-        
-        instrument = symbol.replace("/", "_") if "/" in symbol else symbol
-        
+            return {symbol: {"error": "No account ID provided"} for symbol in requested}
+
+        instruments = {symbol: symbol.replace("/", "_") for symbol in requested}
+
         try:
-            result = self._make_request("GET", f"/accounts/{target_account}/pricing", params={"instruments": instrument})
-            
+            result = self._make_request(
+                "GET",
+                f"/accounts/{target_account}/pricing",
+                params={"instruments": ",".join(sorted(set(instruments.values())))},
+            )
+
             if "error" in result or "prices" not in result:
-                return {"error": result.get("error", "No price data")}
-            
-            price_data = result["prices"][0] if result["prices"] else {}
-            
-            bid = float(price_data.get("bids", [{}])[0].get("price", 0))
-            ask = float(price_data.get("asks", [{}])[0].get("price", 0))
-            
-            return {
-                "symbol": instrument,
-                "bid": bid,
-                "ask": ask,
-                "last": (bid + ask) / 2,
-                "timestamp": price_data.get("time")
-            }
+                error = result.get("error", "No price data")
+                return {symbol: {"error": error} for symbol in requested}
+
+            by_instrument = {p.get("instrument"): p for p in result["prices"]}
+            quotes = {}
+            for symbol, instrument in instruments.items():
+                price_data = by_instrument.get(instrument)
+                if price_data is None:
+                    quotes[symbol] = {"error": "No price data"}
+                    continue
+                try:
+                    quotes[symbol] = self._convert_price(instrument, price_data)
+                except (TypeError, ValueError, IndexError) as e:
+                    quotes[symbol] = {"error": str(e)}
+            return quotes
         except Exception as e:
-            self.logger.error("Failed to get Oanda quote", symbol=symbol, error=str(e))
-            return {"error": str(e)}
+            self.logger.error("Failed to get Oanda quotes", symbols=requested, error=str(e))
+            return {symbol: {"error": str(e)} for symbol in requested}
+
+    @staticmethod
+    def _convert_price(instrument: str, price_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an Oanda pricing entry to the standard quote dict"""
+        bid = float(price_data.get("bids", [{}])[0].get("price", 0))
+        ask = float(price_data.get("asks", [{}])[0].get("price", 0))
+
+        return {
+            "symbol": instrument,
+            "bid": bid,
+            "ask": ask,
+            "last": (bid + ask) / 2,
+            "timestamp": price_data.get("time")
+        }
+
+    def stream_quotes(self, symbols: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream prices via Oanda's pricing stream endpoint.
+
+        Oanda sends a heartbeat every few seconds, so the consumer regains
+        control regularly even when the market is quiet.
+        """
+        if not self.account_id:
+            raise RuntimeError("No account ID provided")
+
+        instruments = sorted({symbol.replace("/", "_") for symbol in symbols})
+        response = self.session.get(
+            f"{self.stream_url}/accounts/{self.account_id}/pricing/stream",
+            params={"instruments": ",".join(instruments)},
+            stream=True,
+            timeout=(self._http_timeout[0], 30),
+        )
+        response.raise_for_status()
+
+        with response:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line:
+                    continue
+                message = json.loads(line)
+                if message.get("type") != "PRICE":
+                    yield {"type": "heartbeat"}
+                    continue
+                yield self._convert_price(message.get("instrument", ""), message)
     
     def get_recent_candles(
         self,
@@ -716,6 +788,16 @@ class OandaBrokerService(BrokerService):
         Returns:
             List of dicts with keys: high, low, open, close, time
         """
+        return quote_cache.get_candles(
+            self,
+            symbol,
+            count,
+            granularity,
+            lambda: self._fetch_recent_candles(symbol, count, granularity),
+        )
+
+    def _fetch_recent_candles(self, symbol: str, count: int, granularity: str) -> List[Dict[str, Any]]:
+        """Fetch recent candles from Oanda, bypassing the shared cache"""
         instrument = symbol.replace("/", "_") if "/" in symbol else symbol
 
         try:
@@ -839,41 +921,155 @@ class OandaBrokerService(BrokerService):
                 )
                 return self._get_closed_trade_details(trade_id, target_account)
             
-            trade = result["trade"]
-            state = trade.get("state", "OPEN").upper()
-            unrealized_pl = float(trade.get("unrealizedPL", 0))
-            realized_pl = float(trade.get("realizedPL", 0))
-            
-            # Parse open time
-            open_time = None
-            if trade.get("openTime"):
-                try:
-                    open_time = datetime.fromtimestamp(float(trade["openTime"]))
-                except (ValueError, TypeError):
-                    open_time = None
-            
-            return {
-                "found": True,
-                "state": "open" if state == "OPEN" else "closed",
-                "realized_pl": realized_pl,
-                "unrealized_pl": unrealized_pl,
-                "close_time": None,  # Open trades don't have close time
-                "instrument": trade.get("instrument", ""),
-                "open_price": float(trade.get("price", 0)),
-                "close_price": None,
-                "units": float(trade.get("currentUnits", trade.get("initialUnits", 0))),
-                "initial_units": float(trade.get("initialUnits", 0)),
-                "stop_loss": trade.get("stopLossOrder", {}).get("price"),
-                "take_profit": trade.get("takeProfitOrder", {}).get("price"),
-                "broker_data": trade,
-            }
+            return self._trade_details_from_trade(result["trade"])
             
         except Exception as e:
             self.logger.error(
                 "get_trade_details_failed", trade_id=trade_id, error=str(e)
             )
             return {"found": False, "error": str(e)}
-    
+
+    def get_trade_details_batch(
+        self,
+        refs: Iterable[Tuple[Optional[str], Optional[str]]],
+        account_id: Optional[str] = None,
+    ) -> Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]]:
+        """
+        Get details for many trades with one trades-list request.
+
+        ``GET /trades?ids=...&state=ALL`` returns open and closed trades
+        (with realized P&L) in a single call. Trades the list does not
+        return are looked up in ONE shared scan of recent transactions
+        instead of one scan per trade. If the list request fails, falls back
+        to per-trade lookups.
+        """
+        refs = list(dict.fromkeys(refs))
+        target_account = account_id or self.account_id
+        if not target_account:
+            return {ref: {"found": False, "error": "No account ID provided"} for ref in refs}
+
+        details: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+        trade_ids: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        for ref in refs:
+            trade_id = ref[0] or ref[1]
+            if trade_id:
+                trade_ids[ref] = str(trade_id)
+            else:
+                details[ref] = {"found": False, "error": "No trade_id or order_id provided"}
+
+        unique_ids = list(dict.fromkeys(trade_ids.values()))
+        trades: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(unique_ids), TRADES_LIST_MAX_COUNT):
+            chunk = unique_ids[start:start + TRADES_LIST_MAX_COUNT]
+            result = self._make_request(
+                "GET",
+                f"/accounts/{target_account}/trades",
+                params={"ids": ",".join(chunk), "state": "ALL", "count": len(chunk)},
+            )
+            if "error" in result:
+                self.logger.warning(
+                    "trade_batch_lookup_failed_falling_back",
+                    trades=len(unique_ids),
+                    error=result.get("error"),
+                )
+                return super().get_trade_details_batch(refs, account_id)
+            for trade in result.get("trades", []):
+                trades[str(trade.get("id"))] = trade
+
+        missing = [trade_id for trade_id in unique_ids if trade_id not in trades]
+        closed_from_history: Dict[str, Dict[str, Any]] = {}
+        if missing:
+            history = self._fetch_recent_transactions(target_account)
+            for trade_id in missing:
+                if "error" in history:
+                    closed_from_history[trade_id] = {"found": False, "error": history["error"]}
+                else:
+                    closed_from_history[trade_id] = self._closed_trade_from_transactions(
+                        trade_id, history["transactions"]
+                    )
+
+        for ref, trade_id in trade_ids.items():
+            if trade_id in trades:
+                details[ref] = self._trade_details_from_trade(trades[trade_id])
+            else:
+                details[ref] = closed_from_history[trade_id]
+        return details
+
+    def _trade_details_from_trade(self, trade: Dict[str, Any]) -> Dict[str, Any]:
+        """Standardised trade-details dict from an Oanda Trade object."""
+        state = trade.get("state", "OPEN").upper()
+        unrealized_pl = float(trade.get("unrealizedPL", 0))
+        realized_pl = float(trade.get("realizedPL", 0))
+        
+        # Parse open time
+        open_time = None
+        if trade.get("openTime"):
+            try:
+                open_time = datetime.fromtimestamp(float(trade["openTime"]))
+            except (ValueError, TypeError):
+                open_time = None
+
+        # Closed trades carry their close time and average close price
+        close_time = None
+        if trade.get("closeTime"):
+            try:
+                close_time = datetime.fromtimestamp(float(trade["closeTime"])).isoformat()
+            except (ValueError, TypeError):
+                close_time = trade.get("closeTime")
+        
+        return {
+            "found": True,
+            "state": "open" if state == "OPEN" else "closed",
+            "realized_pl": realized_pl,
+            "unrealized_pl": unrealized_pl,
+            "close_time": close_time,
+            "instrument": trade.get("instrument", ""),
+            "open_price": float(trade.get("price", 0)),
+            "close_price": (
+                float(trade["averageClosePrice"]) if trade.get("averageClosePrice") else None
+            ),
+            "units": float(trade.get("currentUnits", trade.get("initialUnits", 0))),
+            "initial_units": float(trade.get("initialUnits", 0)),
+            "stop_loss": trade.get("stopLossOrder", {}).get("price"),
+            "take_profit": trade.get("takeProfitOrder", {}).get("price"),
+            "broker_data": trade,
+        }
+
+    def _fetch_recent_transactions(self, account_id: str) -> Dict[str, Any]:
+        """
+        Fetch the last TRANSACTION_HISTORY_WINDOW transactions of an account.
+
+        Returns:
+            {"transactions": [...]} on success, {"error": "..."} otherwise
+        """
+        # Get the last transaction ID so we know the search range
+        txn_result = self._make_request(
+            "GET",
+            f"/accounts/{account_id}/transactions",
+            params={"pageSize": 1},
+        )
+
+        last_txn_id = txn_result.get("lastTransactionID")
+        if not last_txn_id:
+            return {"error": "No transactions found"}
+
+        # Search a larger window (1000 transactions instead of 200) to handle
+        # active accounts or system downtime where the close may be far back.
+        from_id = max(1, int(last_txn_id) - TRANSACTION_HISTORY_WINDOW)
+        range_result = self._make_request(
+            "GET",
+            f"/accounts/{account_id}/transactions/idrange",
+            params={
+                "from": str(from_id),
+                "to": last_txn_id,
+            },
+        )
+
+        if "error" in range_result:
+            return {"error": range_result.get("error")}
+
+        return {"transactions": range_result.get("transactions", [])}
+
     def _get_closed_trade_details(self, trade_id: str, account_id: str) -> Dict[str, Any]:
         """
         Get details for a closed trade by searching recent transactions.
@@ -890,116 +1086,16 @@ class OandaBrokerService(BrokerService):
             Dict with trade details including realized P&L
         """
         try:
-            # Get the last transaction ID so we know the search range
-            txn_result = self._make_request(
-                "GET",
-                f"/accounts/{account_id}/transactions",
-                params={"pageSize": 1},
-            )
-
-            last_txn_id = txn_result.get("lastTransactionID")
-            if not last_txn_id:
-                return {"found": False, "error": "No transactions found"}
-
-            # Search a larger window (1000 transactions instead of 200) to handle
-            # active accounts or system downtime where the close may be far back.
-            from_id = max(1, int(last_txn_id) - 1000)
-            range_result = self._make_request(
-                "GET",
-                f"/accounts/{account_id}/transactions/idrange",
-                params={
-                    "from": str(from_id),
-                    "to": last_txn_id,
-                },
-            )
-
-            if "error" in range_result:
+            history = self._fetch_recent_transactions(account_id)
+            if "error" in history:
                 self.logger.warning(
                     "transaction_fetch_failed",
                     trade_id=trade_id,
-                    error=range_result.get("error"),
-                )
-                return {"found": False, "error": range_result.get("error")}
-
-            transactions = range_result.get("transactions", [])
-
-            # Look for ORDER_FILL transactions that reference our trade_id
-            realized_pl = 0.0
-            close_price = None
-            close_time = None
-            open_price = 0.0
-            instrument = ""
-            units_closed = 0.0
-            initial_units = 0.0
-            found_close = False
-
-            for txn in transactions:
-                if txn.get("type") != "ORDER_FILL":
-                    continue
-
-                # Check if this fill OPENED our trade — extract the actual entry price
-                trade_opened = txn.get("tradeOpened", {})
-                if trade_opened and str(trade_opened.get("tradeID")) == str(trade_id):
-                    open_price = float(txn.get("price", 0))
-                    initial_units = abs(float(trade_opened.get("units", 0)))
-                    if not instrument:
-                        instrument = txn.get("instrument", "")
-
-                # Check if this fill closed our trade
-                trades_closed = txn.get("tradesClosed", [])
-                for tc in trades_closed:
-                    if str(tc.get("tradeID")) == str(trade_id):
-                        realized_pl += float(tc.get("realizedPL", 0))
-                        units_closed += abs(float(tc.get("units", 0)))
-                        close_price = float(txn.get("price", 0))
-                        instrument = txn.get("instrument", "")
-                        found_close = True
-
-                        # Parse close time
-                        if txn.get("time"):
-                            try:
-                                close_time = datetime.fromtimestamp(
-                                    float(txn["time"])
-                                ).isoformat()
-                            except (ValueError, TypeError):
-                                close_time = txn.get("time")
-
-                # Also check tradesReduced for partial closes
-                trades_reduced = txn.get("tradesReduced", [])
-                for tr in trades_reduced:
-                    if str(tr.get("tradeID")) == str(trade_id):
-                        realized_pl += float(tr.get("realizedPL", 0))
-                        found_close = True
-
-            if found_close:
-                self.logger.info(
-                    "found_closed_trade_details",
-                    trade_id=trade_id,
-                    realized_pl=realized_pl,
-                    open_price=open_price,
-                    close_price=close_price,
+                    error=history.get("error"),
                 )
-                return {
-                    "found": True,
-                    "state": "closed",
-                    "realized_pl": realized_pl,
-                    "unrealized_pl": 0.0,
-                    "close_time": close_time,
-                    "instrument": instrument,
-                    "open_price": open_price,
-                    "close_price": close_price,
-                    "units": units_closed,
-                    "initial_units": initial_units or units_closed,
-                    "broker_data": {"transactions": [t for t in transactions if any(
-                        str(tc.get("tradeID")) == str(trade_id)
-                        for tc in t.get("tradesClosed", []) + t.get("tradesReduced", [])
-                    )]},
-                }
+                return {"found": False, "error": history.get("error")}
 
-            return {
-                "found": False,
-                "error": f"Trade {trade_id} not found in recent transactions (searched last 1000)",
-            }
+            return self._closed_trade_from_transactions(trade_id, history["transactions"])
 
         except Exception as e:
             self.logger.error(
@@ -1009,6 +1105,93 @@ class OandaBrokerService(BrokerService):
             )
             return {"found": False, "error": str(e)}
 
+    def _closed_trade_from_transactions(
+        self,
+        trade_id: str,
+        transactions: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Closed-trade details for ``trade_id`` from ORDER_FILL transactions."""
+        # Look for ORDER_FILL transactions that reference our trade_id
+        realized_pl = 0.0
+        close_price = None
+        close_time = None
+        open_price = 0.0
+        instrument = ""
+        units_closed = 0.0
+        initial_units = 0.0
+        found_close = False
+
+        for txn in transactions:
+            if txn.get("type") != "ORDER_FILL":
+                continue
+
+            # Check if this fill OPENED our trade — extract the actual entry price
+            trade_opened = txn.get("tradeOpened", {})
+            if trade_opened and str(trade_opened.get("tradeID")) == str(trade_id):
+                open_price = float(txn.get("price", 0))
+                initial_units = abs(float(trade_opened.get("units", 0)))
+                if not instrument:
+                    instrument = txn.get("instrument", "")
+
+            # Check if this fill closed our trade
+            trades_closed = txn.get("tradesClosed", [])
+            for tc in trades_closed:
+                if str(tc.get("tradeID")) == str(trade_id):
+                    realized_pl += float(tc.get("realizedPL", 0))
+                    units_closed += abs(float(tc.get("units", 0)))
+                    close_price = float(txn.get("price", 0))
+                    instrument = txn.get("instrument", "")
+                    found_close = True
+
+                    # Parse close time
+                    if txn.get("time"):
+                        try:
+                            close_time = datetime.fromtimestamp(
+                                float(txn["time"])
+                            ).isoformat()
+                        except (ValueError, TypeError):
+                            close_time = txn.get("time")
+
+            # Also check tradesReduced for partial closes
+            trades_reduced = txn.get("tradesReduced", [])
+            for tr in trades_reduced:
+                if str(tr.get("tradeID")) == str(trade_id):
+                    realized_pl += float(tr.get("realizedPL", 0))
+                    found_close = True
+
+        if found_close:
+            self.logger.info(
+                "found_closed_trade_details",
+                trade_id=trade_id,
+                realized_pl=realized_pl,
+                open_price=open_price,
+                close_price=close_price,
+            )
+            return {
+                "found": True,
+                "state": "closed",
+                "realized_pl": realized_pl,
+                "unrealized_pl": 0.0,
+                "close_time": close_time,
+                "instrument": instrument,
+                "open_price": open_price,
+                "close_price": close_price,
+                "units": units_closed,
+                "initial_units": initial_units or units_closed,
+                "broker_data": {"transactions": [t for t in transactions if any(
+                    str(tc.get("tradeID")) == str(trade_id)
+                    for tc in t.get("tradesClosed", []) + t.get("tradesReduced", [])
+                )]},
+            }
+
+        return {
+            "found": False,
+            "error": (
+                f"Trade {trade_id} not found in recent transactions "
+                f"(searched last {TRANSACTION_HISTORY_WINDOW})"
+            ),
+        }
+
     def has_active_symbol(self, symbol: str, account_id: Optional[str] = None) -> bool:
         """
         Check if there is an active position or open order for a symbol.
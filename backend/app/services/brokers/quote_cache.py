@@ -0,0 +1,430 @@
+"""
+Broker Quote Cache
+
+Process-wide, short-TTL cache for broker quotes and recent candles, shared by
+position monitoring, reconciliation, the Trade Manager and the API.
+
+- Entries are keyed by broker type, environment (paper/live) and normalized
+  symbol — quotes are market data, so every user on the same broker shares
+  them.
+- Concurrent misses for the same key are coalesced (single-flight): one
+  thread calls the broker, the others wait for its answer.
+- Optionally mirrored to Redis so other worker processes reuse fresh quotes.
+- Optionally fed by the broker's streaming endpoint (``stream_quotes``): a
+  background thread per broker environment pushes every tick into the cache,
+  and REST polling resumes automatically once the stream goes quiet.
+
+Error responses (``{"error": ...}``) are handed to the callers that were
+waiting on the same flight but are never cached.
+"""
+import json
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+
+from app.services.brokers.account_snapshot import normalize_symbol
+
+logger = structlog.get_logger()
+
+# How long followers wait for the in-flight broker call before fetching themselves
+FLIGHT_WAIT_SECONDS = 25.0
+# Back-off between stream reconnect attempts
+STREAM_RECONNECT_SECONDS = 5.0
+
+
+def broker_namespace(broker: Any) -> str:
+    """Cache namespace for a broker: class name + paper/live environment."""
+    broker = getattr(broker, "wrapped", broker)
+    environment = "paper" if getattr(broker, "paper", True) else "live"
+    return f"{type(broker).__name__}:{environment}"
+
+
+class _Flight:
+    """A broker call in progress; followers wait on ``done``."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+
+
+class QuoteCache:
+    """
+    Thread-safe TTL cache with per-key single-flight.
+
+    ``ttl_seconds=0`` disables caching; concurrent callers are still
+    coalesced onto one broker call.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 2.0,
+        candle_ttl_seconds: float = 10.0,
+        redis_url: Optional[str] = None,
+        streaming_enabled: bool = False,
+        stream_stale_seconds: float = 10.0,
+        stream_idle_seconds: float = 300.0,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.candle_ttl_seconds = candle_ttl_seconds
+        self.redis_url = redis_url
+        self.streaming_enabled = streaming_enabled
+        self.stream_stale_seconds = stream_stale_seconds
+        self.stream_idle_seconds = stream_idle_seconds
+
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._streams: Dict[str, "QuoteStreamer"] = {}
+        self._redis = None
+
+        # Counters, mostly for tests and debugging
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_quotes(
+        self,
+        broker: Any,
+        symbols: Iterable[str],
+        fetch_many: Callable[[List[str]], Dict[str, Dict[str, Any]]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Quotes for ``symbols``, calling ``fetch_many`` once for all misses.
+
+        Args:
+            broker: Broker service the quotes belong to (namespace + stream source)
+            symbols: Symbols as the caller spells them
+            fetch_many: Broker REST call taking the missing symbols and
+                returning quotes keyed by those symbols
+
+        Returns:
+            Dict keyed by the symbols as passed in
+        """
+        requested = [symbol for symbol in dict.fromkeys(symbols) if symbol]
+        if not requested:
+            return {}
+
+        namespace = broker_namespace(broker)
+        if self.streaming_enabled:
+            self._subscribe(broker, namespace, requested)
+
+        keys = {symbol: ("quote", namespace, normalize_symbol(symbol)) for symbol in requested}
+        results = self._get_many(
+            keys,
+            fetch_many,
+            ttl=self.ttl_seconds,
+            cacheable=lambda quote: isinstance(quote, dict) and "error" not in quote,
+        )
+        return {symbol: results.get(symbol) or {"error": "No quote data"} for symbol in requested}
+
+    def get_candles(
+        self,
+        broker: Any,
+        symbol: str,
+        count: int,
+        granularity: str,
+        fetch: Callable[[], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Recent candles for ``symbol``; empty (failed) fetches are not cached."""
+        key = ("candles", broker_namespace(broker), normalize_symbol(symbol), count, granularity)
+        results = self._get_many(
+            {symbol: key},
+            lambda _missing: {symbol: fetch()},
+            ttl=self.candle_ttl_seconds,
+            cacheable=bool,
+        )
+        return results.get(symbol) or []
+
+    def put(self, namespace: str, symbol: str, quote: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store a quote pushed by a stream (or any other trusted source)."""
+        key = ("quote", namespace, normalize_symbol(symbol))
+        ttl = self.ttl_seconds if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, quote)
+        self._redis_set({key: quote}, ttl)
+
+    def clear(self) -> None:
+        """Drop every cached entry (in-flight calls are unaffected)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stop_streams(self) -> None:
+        """Stop every background quote stream."""
+        with self._lock:
+            streams = list(self._streams.values())
+            self._streams.clear()
+        for streamer in streams:
+            streamer.stop()
+
+    # ------------------------------------------------------------------
+    # Single-flight core
+    # ------------------------------------------------------------------
+
+    def _get_many(
+        self,
+        keys: Dict[str, Hashable],
+        fetch_many: Callable[[List[str]], Dict[str, Any]],
+        ttl: float,
+        cacheable: Callable[[Any], bool],
+    ) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        leading: Dict[str, Hashable] = {}
+        following: Dict[str, _Flight] = {}
+        now = time.monotonic()
+
+        with self._lock:
+            for symbol, key in keys.items():
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    results[symbol] = entry[1]
+                    self.hits += 1
+                elif key in self._flights:
+                    following[symbol] = self._flights[key]
+                else:
+                    self._flights[key] = _Flight()
+                    leading[symbol] = key
+                    self.misses += 1
+
+        if leading:
+            results.update(self._lead(leading, fetch_many, ttl, cacheable))
+
+        late: List[str] = []
+        for symbol, flight in following.items():
+            if flight.done.wait(FLIGHT_WAIT_SECONDS):
+                results[symbol] = flight.result
+            else:
+                late.append(symbol)
+        if late:
+            # Leader is stuck (slow broker) — don't block the caller forever
+            fetched = fetch_many(late)
+            results.update({symbol: fetched.get(symbol) for symbol in late})
+
+        return results
+
+    def _lead(
+        self,
+        leading: Dict[str, Hashable],
+        fetch_many: Callable[[List[str]], Dict[str, Any]],
+        ttl: float,
+        cacheable: Callable[[Any], bool],
+    ) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        try:
+            results.update(self._redis_get(leading))
+            missing = [symbol for symbol in leading if symbol not in results]
+            if missing:
+                fetched = fetch_many(missing)
+                fresh = {}
+                for symbol in missing:
+                    value = fetched.get(symbol)
+                    results[symbol] = value
+                    if ttl > 0 and cacheable(value):
+                        fresh[leading[symbol]] = value
+                if fresh:
+                    self._redis_set(fresh, ttl)
+        finally:
+            now = time.monotonic()
+            with self._lock:
+                for symbol, key in leading.items():
+                    value = results.get(symbol)
+                    current = self._entries.get(key)
+                    # A stream tick that landed while we were fetching is newer
+                    # than our REST answer — keep it.
+                    pushed_meanwhile = current is not None and current[0] > now
+                    if ttl > 0 and cacheable(value) and not pushed_meanwhile:
+                        self._entries[key] = (now + ttl, value)
+                    flight = self._flights.pop(key, None)
+                    if flight is not None:
+                        flight.result = value
+                        flight.done.set()
+        return results
+
+    # ------------------------------------------------------------------
+    # Optional Redis mirror
+    # ------------------------------------------------------------------
+
+    def _get_redis(self):
+        if not self.redis_url:
+            return None
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._redis
+
+    @staticmethod
+    def _redis_key(key: Hashable) -> str:
+        return "broker_cache:" + ":".join(str(part) for part in key)
+
+    def _redis_get(self, keys: Dict[str, Hashable]) -> Dict[str, Any]:
+        client = self._get_redis()
+        if client is None:
+            return {}
+        symbols = list(keys)
+        try:
+            raw = client.mget([self._redis_key(keys[symbol]) for symbol in symbols])
+        except Exception as e:
+            logger.warning("broker_quote_cache_redis_read_failed", error=str(e))
+            return {}
+        return {symbol: json.loads(value) for symbol, value in zip(symbols, raw) if value}
+
+    def _redis_set(self, values: Dict[Hashable, Any], ttl: float) -> None:
+        client = self._get_redis()
+        if client is None or ttl <= 0:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.set(self._redis_key(key), json.dumps(value, default=str), px=int(ttl * 1000))
+            pipe.execute()
+        except Exception as e:
+            logger.warning("broker_quote_cache_redis_write_failed", error=str(e))
+
+    # ------------------------------------------------------------------
+    # Optional streaming
+    # ------------------------------------------------------------------
+
+    def _subscribe(self, broker: Any, namespace: str, symbols: List[str]) -> None:
+        broker = getattr(broker, "wrapped", broker)
+        with self._lock:
+            streamer = self._streams.get(namespace)
+            if streamer is None or not streamer.is_alive():
+                if streamer is not None and streamer.unsupported:
+                    return
+                streamer = QuoteStreamer(self, broker, namespace)
+                self._streams[namespace] = streamer
+        streamer.subscribe(symbols)
+
+
+class QuoteStreamer:
+    """
+    Background thread pushing a broker's streamed quotes into a ``QuoteCache``.
+
+    The stream is (re)opened with the union of every symbol requested so far
+    and stops itself after ``stream_idle_seconds`` without a subscription.
+    Brokers that don't implement ``stream_quotes`` are marked unsupported and
+    simply keep being polled.
+    """
+
+    def __init__(self, cache: QuoteCache, broker: Any, namespace: str):
+        self.cache = cache
+        self.broker = broker
+        self.namespace = namespace
+        self.unsupported = False
+
+        # Normalized symbol -> symbol as first requested
+        self._symbols: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._resubscribe = threading.Event()
+        self._last_used = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        with self._lock:
+            self._last_used = time.monotonic()
+            added = [symbol for symbol in symbols if normalize_symbol(symbol) not in self._symbols]
+            for symbol in added:
+                self._symbols[normalize_symbol(symbol)] = symbol
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"quote-stream-{self.namespace}", daemon=True
+                )
+                self._thread.start()
+            elif added:
+                self._resubscribe.set()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _idle(self) -> bool:
+        return time.monotonic() - self._last_used > self.cache.stream_idle_seconds
+
+    def _run(self) -> None:
+        while not self._stopped.is_set() and not self._idle():
+            self._resubscribe.clear()
+            with self._lock:
+                symbols = list(self._symbols.values())
+            try:
+                for quote in self.broker.stream_quotes(symbols):
+                    symbol = quote.get("symbol") if isinstance(quote, dict) else None
+                    if symbol and "error" not in quote:
+                        self.cache.put(self.namespace, symbol, quote, ttl=self.cache.stream_stale_seconds)
+                    if self._stopped.is_set() or self._resubscribe.is_set() or self._idle():
+                        break
+                else:
+                    # Stream ended on its own — reconnect after a pause
+                    self._stopped.wait(STREAM_RECONNECT_SECONDS)
+            except NotImplementedError:
+                self.unsupported = True
+                logger.info("broker_quote_stream_unsupported", namespace=self.namespace)
+                return
+            except Exception as e:
+                logger.warning("broker_quote_stream_error", namespace=self.namespace, error=str(e))
+                self._stopped.wait(STREAM_RECONNECT_SECONDS)
+        logger.info("broker_quote_stream_stopped", namespace=self.namespace)
+
+
+class LocalQuoteFeed:
+    """
+    In-memory stand-in for a broker streaming endpoint.
+
+    Assign ``feed.stream_quotes`` as a broker's ``stream_quotes`` and call
+    ``publish`` to emit ticks; used by tests and local development.
+    """
+
+    def __init__(self, heartbeat_seconds: float = 0.05):
+        self.heartbeat_seconds = heartbeat_seconds
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._closed = threading.Event()
+
+    def publish(self, symbol: str, **fields: Any) -> None:
+        self._queue.put({"symbol": symbol, **fields})
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def stream_quotes(self, symbols: List[str]) -> Iterator[Dict[str, Any]]:
+        wanted = {normalize_symbol(symbol) for symbol in symbols}
+        while not self._closed.is_set():
+            try:
+                quote = self._queue.get(timeout=self.heartbeat_seconds)
+            except queue.Empty:
+                # Heartbeat, so consumers can notice resubscribe/stop requests
+                yield {"type": "heartbeat"}
+                continue
+            if normalize_symbol(quote.get("symbol")) in wanted:
+                yield quote
+
+
+def _build_quote_cache() -> QuoteCache:
+    from app.config import settings
+
+    return QuoteCache(
+        ttl_seconds=settings.BROKER_QUOTE_CACHE_TTL_SECONDS,
+        candle_ttl_seconds=settings.BROKER_CANDLE_CACHE_TTL_SECONDS,
+        redis_url=settings.REDIS_URL if settings.BROKER_QUOTE_CACHE_REDIS_ENABLED else None,
+        streaming_enabled=settings.BROKER_QUOTE_STREAMING_ENABLED,
+        stream_stale_seconds=settings.BROKER_QUOTE_STREAM_STALE_SECONDS,
+        stream_idle_seconds=settings.BROKER_QUOTE_STREAM_IDLE_SECONDS,
+    )
+
+
+# Global instance shared by every broker service in the process
+quote_cache = _build_quote_cache()
@@ -4,13 +4,15 @@ Tradier Broker Service
 Implementation using Tradier Brokerage REST API for US stocks and options.
 Based on tested tradier_service.py from project root.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
+import json
 import requests
 
 from app.services.brokers.base import (
     BrokerService, Position, Order, OrderSide, OrderType, TimeInForce, OrderStatus
 )
+from app.services.brokers.quote_cache import quote_cache
 
 
 class TradierBrokerService(BrokerService):
@@ -218,9 +220,12 @@ class TradierBrokerService(BrokerService):
             # positions_data is not in expected format
             return []
         
+        # One quote request for every held symbol instead of one per position
+        quotes = self.get_quotes([pos.get("symbol", "") for pos in pos_list])
+
         positions = []
         for pos in pos_list:
-            converted = self._convert_position(pos)
+            converted = self._convert_position(pos, quote=quotes.get(pos.get("symbol", "")))
             if converted:
                 positions.append(converted)
         
@@ -234,7 +239,7 @@ class TradierBrokerService(BrokerService):
                 return pos
         return None
     
-    def _convert_position(self, tradier_pos: Dict) -> Optional[Position]:
+    def _convert_position(self, tradier_pos: Dict, quote: Optional[Dict[str, Any]] = None) -> Optional[Position]:
         """Convert Tradier position to standard Position model"""
         try:
             symbol = tradier_pos.get("symbol", "")
@@ -246,8 +251,9 @@ class TradierBrokerService(BrokerService):
             side = "long" if qty > 0 else "short"
             qty = abs(qty)
             
-            # Get current quote for market value
-            quote = self.get_quote(symbol)
+            # Get current quote for market value (pre-fetched by get_positions when batched)
+            if quote is None:
+                quote = self.get_quote(symbol)
             current_price = quote.get("last", 0)
             
             # Calculate values
@@ -832,32 +838,107 @@ class TradierBrokerService(BrokerService):
             return {"success": False, "error": str(e)}
     
     def get_quote(self, symbol: str) -> Dict[str, Any]:
-        """Get real-time quote"""
+        """Get real-time quote (served from the shared quote cache)"""
+        return self.get_quotes([symbol]).get(symbol, {"error": "No quote data"})
+
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes, calling Tradier only for symbols not freshly cached"""
+        return quote_cache.get_quotes(self, symbols, self._fetch_quotes)
+
+    def _fetch_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get real-time quotes for several symbols in a single request"""
+        requested = [symbol for symbol in dict.fromkeys(symbols) if symbol]
+        if not requested:
+            return {}
+
         try:
-            result = self._make_request('GET', '/v1/markets/quotes', params={'symbols': symbol.upper()})
-            
+            result = self._make_request(
+                'GET',
+                '/v1/markets/quotes',
+                params={'symbols': ','.join(sorted({s.upper() for s in requested}))},
+            )
+
             if 'error' in result or 'quotes' not in result:
-                return {"error": result.get('error', 'No quote data')}
-            
+                error = result.get('error', 'No quote data')
+                return {symbol: {"error": error} for symbol in requested}
+
             quotes = result['quotes']
-            if isinstance(quotes, dict) and 'quote' in quotes:
-                quote_data = quotes['quote']
-                if isinstance(quote_data, list):
-                    quote_data = quote_data[0] if quote_data else {}
-            else:
-                return {"error": "Invalid quote format"}
-            
-            return {
-                "symbol": symbol.upper(),
-                "bid": float(quote_data.get("bid", 0)),
-                "ask": float(quote_data.get("ask", 0)),
-                "last": float(quote_data.get("last", 0)),
-                "volume": quote_data.get("volume", 0),
-                "timestamp": quote_data.get("trade_date")
-            }
+            quote_list = quotes.get('quote', []) if isinstance(quotes, dict) else []
+            if isinstance(quote_list, dict):
+                quote_list = [quote_list]
+
+            by_symbol = {str(q.get("symbol", "")).upper(): q for q in quote_list}
+            converted = {}
+            for symbol in requested:
+                quote_data = by_symbol.get(symbol.upper())
+                if quote_data is None:
+                    converted[symbol] = {"error": "No quote data"}
+                    continue
+                try:
+                    converted[symbol] = self._convert_quote(symbol, quote_data)
+                except (TypeError, ValueError) as e:
+                    converted[symbol] = {"error": str(e)}
+            return converted
         except Exception as e:
-            self.logger.error("Failed to get Tradier quote", symbol=symbol, error=str(e))
-            return {"error": str(e)}
+            self.logger.error("Failed to get Tradier quotes", symbols=requested, error=str(e))
+            return {symbol: {"error": str(e)} for symbol in requested}
+
+    @staticmethod
+    def _convert_quote(symbol: str, quote_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a Tradier quote payload to the standard quote dict"""
+        return {
+            "symbol": symbol.upper(),
+            "bid": float(quote_data.get("bid", 0)),
+            "ask": float(quote_data.get("ask", 0)),
+            "last": float(quote_data.get("last", 0)),
+            "volume": quote_data.get("volume", 0),
+            "timestamp": quote_data.get("trade_date")
+        }
+
+    def stream_quotes(self, symbols: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream quotes via Tradier's market events API.
+
+        Creates a streaming session, then reads line-delimited quote events
+        until the connection closes. Sandbox accounts have no streaming
+        access; the session call fails and the quote cache keeps polling.
+        """
+        session = self._make_request('POST', '/v1/markets/events/session')
+        stream = session.get('stream') or {}
+        if 'error' in session or not stream.get('sessionid'):
+            raise RuntimeError(session.get('error', 'Could not create Tradier streaming session'))
+
+        response = self.session.get(
+            stream.get('url') or f"{self.stream_url}/v1/markets/events",
+            params={
+                'sessionid': stream['sessionid'],
+                'symbols': ','.join(sorted({s.upper() for s in symbols})),
+                'filter': 'quote',
+                'linebreak': 'true',
+            },
+            stream=True,
+            timeout=(self._http_timeout[0], 60),
+        )
+        response.raise_for_status()
+
+        with response:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line:
+                    yield {"type": "heartbeat"}
+                    continue
+                event = json.loads(line)
+                if event.get("type") != "quote":
+                    yield {"type": "heartbeat"}
+                    continue
+                bid = float(event.get("bid") or 0)
+                ask = float(event.get("ask") or 0)
+                yield {
+                    "symbol": str(event.get("symbol", "")).upper(),
+                    "bid": bid,
+                    "ask": ask,
+                    "last": (bid + ask) / 2,
+                    "timestamp": event.get("biddate"),
+                }
 
     def get_trade_details(
         self,
@@ -3,15 +3,73 @@ Chart Annotation Builder - Converts tool results into visual chart annotations
 
 This service transforms ICT tool results (FVGs, liquidity, structure, etc.) into
 a structured format that can be rendered on TradingView charts.
+
+The chart is built once per execution (strategy timeframe) and persisted with
+the execution. Later events only extend it: ``append_candles`` adds candles
+newer than the last one and ``add_post_trade_annotations`` adds each trade
+event (fill, exit) once. Every change bumps ``meta.revision``, which is what
+``chart_etag`` is derived from.
+
+Candles are persisted column-wise (``{"time": [...], "open": [...], ...}``)
+instead of one dict per candle; ``expand_chart`` restores the row format the
+frontend renders.
 """
+import hashlib
 import structlog
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Union
+from datetime import datetime, timezone
 
 from app.schemas.pipeline_state import StrategyResult
 
 logger = structlog.get_logger()
 
+# Columns of the compact (column-wise) candle encoding
+CANDLE_COLUMNS = ("time", "open", "high", "low", "close", "volume")
+
+
+def compact_candles(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Encode formatted candle rows column-wise."""
+    return {column: [row.get(column) for row in rows] for column in CANDLE_COLUMNS}
+
+
+def expand_candles(candles: Union[Dict[str, List[Any]], List[Dict[str, Any]], None]) -> List[Dict[str, Any]]:
+    """Decode column-wise candles into rows (row lists pass through unchanged)."""
+    if not candles:
+        return []
+    if isinstance(candles, list):
+        return candles
+    columns = [candles.get(column) or [] for column in CANDLE_COLUMNS]
+    return [dict(zip(CANDLE_COLUMNS, values)) for values in zip(*columns)]
+
+
+def expand_chart(chart_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Copy of a persisted chart with candles in row format (for API responses)."""
+    if not chart_data or not isinstance(chart_data.get("candles"), dict):
+        return chart_data
+    return {**chart_data, "candles": expand_candles(chart_data["candles"])}
+
+
+def chart_etag(chart_data: Dict[str, Any]) -> str:
+    """Weak ETag of a chart, derived from its build time and revision."""
+    meta = chart_data.get("meta", {})
+    key = f"{meta.get('generated_at')}|{meta.get('revision', 0)}|{meta.get('candle_count')}"
+    return f'W/"chart-{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+
+def _candle_time_key(value: Any) -> Optional[datetime]:
+    """Naive-UTC timestamp for a candle time (ISO string, datetime or epoch)."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.utcfromtimestamp(value)
+    if not isinstance(value, datetime):
+        from dateutil.parser import parse as parse_dt
+
+        value = parse_dt(str(value))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 
 class ChartAnnotationBuilder:
     """Builds chart annotations from strategy tool results."""
@@ -102,8 +160,10 @@ class ChartAnnotationBuilder:
                 "generated_at": datetime.utcnow().isoformat(),
                 "candle_count": len(candles),
                 "trade_relevance": trade_relevance["summary"],
+                "revision": 1,
+                "trade_events": [],
             },
-            "candles": chart_candles,
+            "candles": compact_candles(chart_candles),
             "annotations": annotations,
             "indicators": indicators,
             "decision": decision_summary
@@ -119,7 +179,8 @@ class ChartAnnotationBuilder:
         
         return chart_data
     
-    def _format_candles(self, candles: List[Dict]) -> List[Dict]:
+    @staticmethod
+    def _format_candles(candles: List[Dict]) -> List[Dict]:
         """Format candles for TradingView."""
         formatted = []
         
@@ -134,6 +195,47 @@ class ChartAnnotationBuilder:
             })
         
         return formatted
+
+    @staticmethod
+    def append_candles(chart_data: Dict[str, Any], candles: List[Dict[str, Any]]) -> int:
+        """
+        Append only the candles newer than the chart's last candle.
+
+        Args:
+            chart_data: Persisted chart (compact or legacy row candles)
+            candles: Raw candles (e.g. fresh from the Data Plane), any order
+
+        Returns:
+            Number of candles appended
+        """
+        existing = chart_data.get("candles")
+        if not existing or not candles:
+            return 0
+
+        columns = existing if isinstance(existing, dict) else compact_candles(existing)
+        times = columns.get("time") or []
+        last_ts = _candle_time_key(times[-1]) if times else None
+        if last_ts is None:
+            return 0
+
+        new_rows = []
+        for row in ChartAnnotationBuilder._format_candles(candles):
+            ts = _candle_time_key(row["time"])
+            if ts is not None and ts > last_ts:
+                new_rows.append((ts, row))
+        if not new_rows:
+            return 0
+
+        new_rows.sort(key=lambda item: item[0])
+        for _, row in new_rows:
+            for column in CANDLE_COLUMNS:
+                columns.setdefault(column, []).append(row.get(column))
+
+        meta = chart_data.setdefault("meta", {})
+        chart_data["candles"] = columns
+        meta["candle_count"] = len(columns["time"])
+        meta["revision"] = meta.get("revision", 0) + 1
+        return len(new_rows)
     
     def _add_relevant_fvg_annotations(self, annotations: Dict, fvgs: List[Dict[str, Any]]) -> None:
         """Add only the FVGs directly tied to the trade thesis."""
@@ -455,6 +557,9 @@ class ChartAnnotationBuilder:
         """
         Add post-trade markers (fill price, exit price) to existing chart data.
 
+        Each trade event is added once (tracked in ``meta.trade_events``), so
+        calling this again with the same execution/outcome is a no-op.
+
         Args:
             chart_data: Existing chart data with annotations
             trade_execution: Trade execution data with filled_price
@@ -467,11 +572,24 @@ class ChartAnnotationBuilder:
             return chart_data
 
         annotations = chart_data["annotations"]
-        candles = chart_data.get("candles", [])
-        latest_time = candles[-1].get("time") if candles else None
+        meta = chart_data.setdefault("meta", {})
+        applied = meta.setdefault("trade_events", [])
+        times = expand_candles(chart_data.get("candles"))
+        latest_time = times[-1].get("time") if times else None
+
+        def is_new(event: str) -> bool:
+            if event in applied:
+                return False
+            applied.append(event)
+            meta["revision"] = meta.get("revision", 0) + 1
+            return True
 
         # Fill price marker
-        if trade_execution and trade_execution.get("filled_price"):
+        if (
+            trade_execution
+            and trade_execution.get("filled_price")
+            and is_new(f"fill:{trade_execution['filled_price']}")
+        ):
             filled_price = trade_execution["filled_price"]
 
             annotations["markers"].append({
@@ -503,7 +621,11 @@ class ChartAnnotationBuilder:
             })
 
         # Exit price marker
-        if trade_outcome and trade_outcome.get("exit_price"):
+        if (
+            trade_outcome
+            and trade_outcome.get("exit_price")
+            and is_new(f"exit:{trade_outcome['exit_price']}")
+        ):
             exit_price = trade_outcome["exit_price"]
             pnl = trade_outcome.get("pnl", 0)
             exit_reason = trade_outcome.get("exit_reason", "closed")
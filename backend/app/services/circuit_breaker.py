@@ -172,7 +172,9 @@ async def _close_execution_position(execution: Execution, reason: str) -> bool:
 
     Returns True if the close order was placed successfully.
     """
-    state_dict = execution.pipeline_state or {}
+    from app.orchestration.tasks._helpers import load_pipeline_state_dict
+
+    state_dict = load_pipeline_state_dict(execution)
 
     # Find broker tool config — stored in agent config or top-level broker_tool
     broker_tool = _extract_broker_tool(state_dict)
@@ -0,0 +1,379 @@
+"""
+Execution Aggregates Service
+
+Maintains the ``execution_aggregates`` table (see
+``app.models.execution_aggregate``) that the dashboard and execution stats
+read instead of loading every execution row.
+
+- Only terminal executions are aggregated; active ones change on every
+  monitoring tick and are few, so readers load them live and merge them in
+  with ``ExecutionTotals.add_execution``.
+- A session hook records which (pipeline, day) buckets a commit touched and
+  enqueues ``refresh_execution_aggregates`` for them after commit.
+- ``rebuild_aggregates`` recomputes everything (nightly safety net and
+  first-time backfill).
+
+The P&L and "real trade" rules here are the single source of truth for the
+dashboard: the same Python code aggregates stored rows and live rows.
+"""
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+import structlog
+from sqlalchemy import case, delete, event, func, inspect, select, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from app.models.execution import Execution, ExecutionStatus
+from app.models.execution_aggregate import ExecutionAggregate
+
+logger = structlog.get_logger()
+
+# Statuses whose executions are stored in the aggregate table
+TERMINAL_STATUSES = (
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELLED,
+    ExecutionStatus.SKIPPED,
+)
+# Everything else is read live from the executions table
+LIVE_STATUSES = tuple(s for s in ExecutionStatus if s not in TERMINAL_STATUSES)
+
+# Statuses shown as open positions on the dashboard
+ACTIVE_POSITION_STATUSES = (
+    ExecutionStatus.MONITORING,
+    ExecutionStatus.RUNNING,
+    ExecutionStatus.NEEDS_RECONCILIATION,
+)
+
+# Serializes bucket refreshes so concurrent delete/insert cycles never collide
+AGGREGATE_LOCK_KEY = 727_001
+
+_PENDING_BUCKETS_KEY = "execution_aggregate_buckets"
+_TRACKED_ATTRIBUTES = ("status", "cost", "result", "reports", "created_at", "started_at", "completed_at")
+
+Bucket = Tuple[UUID, date]
+
+
+def _status_value(status: Any) -> str:
+    return getattr(status, "value", status)
+
+
+_TERMINAL_VALUES = {s.value for s in TERMINAL_STATUSES}
+
+
+def extract_pnl(execution: Any) -> Optional[Dict[str, Any]]:
+    """
+    Extract P&L from an execution (or any row with ``result``/``reports``).
+
+    Checks final_pnl (completed) and the Trade Manager report (monitoring)
+    in that order. Rows that carry ``trade_manager_report`` (ORM objects and
+    lean rows) are read from that generated column, never from ``reports``.
+
+    Returns:
+        Dict with value, percent, and type or None
+    """
+    result = execution.result or {}
+
+    # Check final P&L (completed trades)
+    if result.get("final_pnl") is not None:
+        return {
+            "value": result["final_pnl"],
+            "percent": result.get("final_pnl_percent"),
+            "type": "realized",
+        }
+
+    # Check monitoring reports (live trades)
+    if hasattr(execution, "trade_manager_report"):
+        reports = {"trade_manager": execution.trade_manager_report}
+    else:
+        reports = execution.reports or {}
+    for agent_id, report in reports.items():
+        if isinstance(report, dict) and report.get("agent_type") == "trade_manager_agent":
+            data = report.get("data", {})
+            if data and data.get("unrealized_pl") is not None:
+                return {
+                    "value": data["unrealized_pl"],
+                    "percent": data.get("pnl_percent"),
+                    "type": "unrealized",
+                }
+
+    return None
+
+
+def is_real_trade(execution: Any, pnl_value: float) -> bool:
+    """
+    Whether an execution with P&L represents an actual trade attempt.
+
+    "executed" (filled) and "cancelled" (limit order attempted) outcomes
+    count; other outcomes don't. Without an outcome, any non-zero P&L counts.
+    """
+    trade_outcome = (execution.result or {}).get("trade_outcome")
+    if trade_outcome and isinstance(trade_outcome, dict):
+        return trade_outcome.get("status") in ("executed", "cancelled")
+    return pnl_value != 0
+
+
+@dataclass
+class ExecutionTotals:
+    """Additive execution totals — one aggregate row, or any sum of them."""
+
+    execution_count: int = 0
+    total_cost: float = 0.0
+    realized_pnl: float = 0.0
+    realized_count: int = 0
+    unrealized_pnl: float = 0.0
+    unrealized_count: int = 0
+    trade_count: int = 0
+    win_count: int = 0
+    loss_count: int = 0
+    win_pnl: float = 0.0
+    loss_pnl: float = 0.0
+    best_trade: float = 0.0
+    worst_trade: float = 0.0
+    duration_seconds: float = 0.0
+    duration_count: int = 0
+
+    @property
+    def pnl(self) -> float:
+        return self.realized_pnl + self.unrealized_pnl
+
+    @property
+    def pnl_count(self) -> int:
+        return self.realized_count + self.unrealized_count
+
+    def add_execution(self, execution: Any) -> "ExecutionTotals":
+        """Fold one execution (ORM object or lean row) into the totals."""
+        self.execution_count += 1
+        self.total_cost += execution.cost or 0
+
+        if (
+            _status_value(execution.status) == ExecutionStatus.COMPLETED.value
+            and execution.started_at
+            and execution.completed_at
+        ):
+            self.duration_seconds += (execution.completed_at - execution.started_at).total_seconds()
+            self.duration_count += 1
+
+        pnl = extract_pnl(execution)
+        if pnl is None:
+            return self
+
+        value = pnl["value"] or 0
+        if pnl["type"] == "realized":
+            self.realized_pnl += value
+            self.realized_count += 1
+        else:
+            self.unrealized_pnl += value
+            self.unrealized_count += 1
+
+        if pnl["value"] is not None and is_real_trade(execution, value):
+            self.trade_count += 1
+            if value > 0:
+                self.win_count += 1
+                self.win_pnl += value
+                self.best_trade = max(self.best_trade, value)
+            elif value < 0:
+                self.loss_count += 1
+                self.loss_pnl += value
+                self.worst_trade = min(self.worst_trade, value)
+        return self
+
+    def add(self, other: "ExecutionTotals") -> "ExecutionTotals":
+        """Merge another set of totals into this one."""
+        for field in fields(self):
+            name = field.name
+            if name == "best_trade":
+                self.best_trade = max(self.best_trade, other.best_trade)
+            elif name == "worst_trade":
+                self.worst_trade = min(self.worst_trade, other.worst_trade)
+            else:
+                setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+    @classmethod
+    def from_aggregate(cls, row: ExecutionAggregate) -> "ExecutionTotals":
+        return cls(**{field.name: getattr(row, field.name) or 0 for field in fields(cls)})
+
+    def to_aggregate(self, pipeline_id: UUID, user_id: UUID, day: date, status: str) -> ExecutionAggregate:
+        return ExecutionAggregate(
+            pipeline_id=pipeline_id,
+            user_id=user_id,
+            day=day,
+            status=status,
+            updated_at=datetime.utcnow(),
+            **{field.name: getattr(self, field.name) for field in fields(self)},
+        )
+
+
+def lean_execution_columns() -> tuple:
+    """
+    Columns needed to aggregate an execution, without the heavy JSONB.
+
+    ``result`` is reduced to the P&L keys, and the Trade Manager report is
+    only read for executions without a final P&L (the unrealized fallback).
+    """
+    return (
+        Execution.pipeline_id,
+        Execution.user_id,
+        Execution.status,
+        Execution.cost,
+        Execution.created_at,
+        Execution.started_at,
+        Execution.completed_at,
+        func.jsonb_build_object(
+            "final_pnl", Execution.result["final_pnl"],
+            "final_pnl_percent", Execution.result["final_pnl_percent"],
+            "trade_outcome", Execution.result["trade_outcome"],
+            type_=JSONB,
+        ).label("result"),
+        case(
+            (Execution.result["final_pnl"].astext.is_(None), Execution.trade_manager_report),
+            else_=None,
+        ).label("trade_manager_report"),
+    )
+
+
+def _group_rows(rows: Iterable[Any]) -> Dict[Tuple[UUID, date, str], Tuple[UUID, ExecutionTotals]]:
+    grouped: Dict[Tuple[UUID, date, str], Tuple[UUID, ExecutionTotals]] = {}
+    for row in rows:
+        key = (row.pipeline_id, row.created_at.date(), _status_value(row.status))
+        if key not in grouped:
+            grouped[key] = (row.user_id, ExecutionTotals())
+        grouped[key][1].add_execution(row)
+    return grouped
+
+
+def _write_groups(db: Session, grouped: Dict[Tuple[UUID, date, str], Tuple[UUID, ExecutionTotals]]) -> None:
+    db.add_all(
+        totals.to_aggregate(pipeline_id, user_id, day, status)
+        for (pipeline_id, day, status), (user_id, totals) in grouped.items()
+    )
+
+
+def refresh_buckets(db: Session, buckets: Iterable[Bucket]) -> int:
+    """
+    Recompute the aggregate rows for the given (pipeline_id, day) buckets.
+
+    Commits the session.
+
+    Returns:
+        Number of aggregate rows written
+    """
+    wanted: Set[Bucket] = {(UUID(str(pipeline_id)), day) for pipeline_id, day in buckets}
+    if not wanted:
+        return 0
+
+    db.execute(select(func.pg_advisory_xact_lock(AGGREGATE_LOCK_KEY)))
+
+    days = sorted(day for _, day in wanted)
+    rows = db.execute(
+        select(*lean_execution_columns()).where(
+            Execution.pipeline_id.in_({pipeline_id for pipeline_id, _ in wanted}),
+            Execution.status.in_(TERMINAL_STATUSES),
+            Execution.created_at >= datetime.combine(days[0], datetime.min.time()),
+            Execution.created_at < datetime.combine(days[-1] + timedelta(days=1), datetime.min.time()),
+        )
+    ).all()
+    grouped = {
+        key: value
+        for key, value in _group_rows(rows).items()
+        if (key[0], key[1]) in wanted
+    }
+
+    db.execute(
+        delete(ExecutionAggregate).where(
+            tuple_(ExecutionAggregate.pipeline_id, ExecutionAggregate.day).in_(sorted(wanted))
+        )
+    )
+    _write_groups(db, grouped)
+    db.commit()
+    return len(grouped)
+
+
+def rebuild_aggregates(db: Session, user_id: Optional[UUID] = None) -> int:
+    """
+    Rebuild the aggregate table from scratch (for one user, or everyone).
+
+    Commits the session.
+
+    Returns:
+        Number of aggregate rows written
+    """
+    db.execute(select(func.pg_advisory_xact_lock(AGGREGATE_LOCK_KEY)))
+
+    query = select(*lean_execution_columns()).where(Execution.status.in_(TERMINAL_STATUSES))
+    purge = delete(ExecutionAggregate)
+    if user_id is not None:
+        query = query.where(Execution.user_id == user_id)
+        purge = purge.where(ExecutionAggregate.user_id == user_id)
+
+    grouped = _group_rows(db.execute(query.execution_options(yield_per=1000)))
+    db.execute(purge)
+    _write_groups(db, grouped)
+    db.commit()
+    return len(grouped)
+
+
+# ----------------------------------------------------------------------
+# Session hooks — find touched buckets, refresh them after commit
+# ----------------------------------------------------------------------
+
+def _touched_buckets(session: Session) -> Set[Tuple[str, str]]:
+    touched: Set[Tuple[str, str]] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, Execution) or obj.pipeline_id is None or obj.created_at is None:
+            continue
+
+        state = inspect(obj)
+        status_history = state.attrs.status.history
+        statuses = {_status_value(s) for s in chain(status_history.added, status_history.deleted)}
+        statuses.add(_status_value(obj.status))
+        if not statuses & _TERMINAL_VALUES:
+            continue
+
+        if obj in session.dirty and not any(
+            state.attrs[name].history.has_changes() for name in _TRACKED_ATTRIBUTES
+        ):
+            continue
+
+        touched.add((str(obj.pipeline_id), obj.created_at.date().isoformat()))
+        # An execution moved to another day keeps its old bucket stale otherwise
+        for previous in state.attrs.created_at.history.deleted:
+            if previous is not None:
+                touched.add((str(obj.pipeline_id), previous.date().isoformat()))
+    return touched
+
+
+@event.listens_for(Session, "after_flush")
+def _record_touched_buckets(session: Session, flush_context) -> None:
+    touched = _touched_buckets(session)
+    if touched:
+        session.info.setdefault(_PENDING_BUCKETS_KEY, set()).update(touched)
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_bucket_refresh(session: Session) -> None:
+    buckets = session.info.pop(_PENDING_BUCKETS_KEY, None)
+    if not buckets:
+        return
+    try:
+        from app.orchestration.tasks.dashboard_aggregates import refresh_execution_aggregates
+
+        refresh_execution_aggregates.delay(sorted(buckets))
+    except Exception as e:
+        # Nightly rebuild catches anything missed here
+        logger.warning("execution_aggregate_refresh_enqueue_failed", buckets=len(buckets), error=str(e))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_touched_buckets(session: Session) -> None:
+    session.info.pop(_PENDING_BUCKETS_KEY, None)
+
+
+def parse_buckets(buckets: Iterable[Iterable[str]]) -> List[Bucket]:
+    """Decode ``[[pipeline_id, "YYYY-MM-DD"], ...]`` task arguments."""
+    return [(UUID(str(pipeline_id)), date.fromisoformat(day)) for pipeline_id, day in buckets]
@@ -0,0 +1,119 @@
+"""
+Execution Reports
+
+Shared building blocks for the post-execution reports (executive report,
+trade analysis, PDF), which are rendered off the pipeline worker by the
+``generate_execution_reports`` task on the low-priority ``reports`` queue.
+
+Every report is content-addressed by ``report_state_hash`` — a hash of the
+execution's final state. Stored reports carry the hash they were built
+from (``state_hash``) and the PDF file name embeds it, so re-requesting or
+re-rendering an unchanged execution is a cache hit, while an execution
+whose state changed afterwards (e.g. P&L fixed by reconciliation) gets
+fresh reports.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from app.services.chart_annotation_builder import expand_chart
+
+# Bump when prompts or report layout change so stored reports are rebuilt
+REPORT_CACHE_VERSION = 1
+
+
+def build_execution_data(execution: Any, pipeline_name: Optional[str]) -> Dict[str, Any]:
+    """
+    Execution data consumed by the report generators.
+
+    Args:
+        execution: Execution ORM object (sync or async session)
+        pipeline_name: Name of the execution's pipeline
+
+    Returns:
+        Dict with execution context, agent reports and result
+    """
+    return {
+        "id": str(execution.id),
+        "pipeline_name": pipeline_name or "Unknown",
+        "symbol": execution.symbol,
+        "mode": execution.mode,
+        "status": execution.status.value,
+        "started_at": execution.started_at.isoformat() if execution.started_at else None,
+        "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
+        "duration_seconds": (
+            (execution.completed_at - execution.started_at).total_seconds()
+            if execution.started_at and execution.completed_at else None
+        ),
+        "cost": execution.cost,
+        "reports": execution.reports or {},
+        "result": execution.result or {},
+        "agent_states": execution.agent_states or [],
+    }
+
+
+def report_state_hash(execution_data: Dict[str, Any]) -> str:
+    """SHA-256 of the execution's final state (canonical JSON)."""
+    payload = json.dumps(
+        {"version": REPORT_CACHE_VERSION, "execution": execution_data},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cached_report(stored: Optional[Dict[str, Any]], state_hash: str) -> Optional[Dict[str, Any]]:
+    """Return a stored report if it was built from ``state_hash``."""
+    if stored and stored.get("state_hash") == state_hash:
+        return stored
+    return None
+
+
+def build_executive_report(
+    execution_data: Dict[str, Any],
+    summary: Dict[str, Any],
+    state_hash: str,
+) -> Dict[str, Any]:
+    """
+    Full executive report: LLM summary plus execution context and artifacts.
+
+    Args:
+        execution_data: Output of build_execution_data
+        summary: Output of ExecutiveReportGenerator.generate_executive_summary
+        state_hash: report_state_hash(execution_data)
+    """
+    report = dict(summary)
+    report["execution_context"] = {
+        "id": execution_data["id"],
+        "pipeline_name": execution_data["pipeline_name"],
+        "symbol": execution_data["symbol"],
+        "mode": execution_data["mode"],
+        "started_at": execution_data["started_at"],
+        "completed_at": execution_data["completed_at"],
+        "duration_seconds": execution_data["duration_seconds"],
+        "total_cost": execution_data["cost"],
+    }
+
+    # Include all agent reports
+    report["agent_reports"] = execution_data["reports"]
+
+    # Include execution artifacts (charts, etc.)
+    result = execution_data["result"]
+    if result and isinstance(result, dict):
+        artifacts = dict(result.get("execution_artifacts") or {})
+        if artifacts.get("strategy_chart"):
+            artifacts["strategy_chart"] = expand_chart(artifacts["strategy_chart"])
+        report["execution_artifacts"] = artifacts
+        report["strategy"] = result.get("strategy")
+        report["bias"] = result.get("biases")
+        report["risk_assessment"] = result.get("risk_assessment")
+        report["trade_execution"] = result.get("trade_execution")
+
+    report["state_hash"] = state_hash
+    return report
+
+
+def is_failed_report(report: Dict[str, Any]) -> bool:
+    """Failed LLM generations are returned to the caller but never cached."""
+    return "error" in report
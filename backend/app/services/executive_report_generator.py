@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional
 import structlog
 
 from app.config import settings
+from app.services.llm_governor import LLMPriority
 from app.services.llm_provider import create_openai_client, resolve_chat_model
 
 logger = structlog.get_logger(__name__)
@@ -22,7 +23,7 @@ class ExecutiveReportGenerator:
     """
     
     def __init__(self):
-        self.client = create_openai_client(async_client=True)
+        self.client = create_openai_client(async_client=True, priority=LLMPriority.REPORT)
         self.model = resolve_chat_model(settings.OPENAI_MODEL)
     
     async def generate_executive_summary(
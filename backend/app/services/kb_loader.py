@@ -1,14 +1,32 @@
 """
 KB loader for markdown-backed concepts and skills.
+
+The KB is compiled once per process into an immutable ``KBIndex`` (parsed
+skills, per-agent concept bundles, content hash). Prompt assembly reads the
+index from memory; the loader only re-stats the KB files every
+``reload_check_seconds`` and recompiles when one was added, removed or
+modified. Because the bundles are byte-identical between recompiles, they
+form a stable prompt prefix for provider-side prompt caching.
 """
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import structlog
 
 from app.schemas.skill import SkillDetail
 
+logger = structlog.get_logger()
+
+# (relative path, mtime_ns, size) of every KB file the index was built from
+KBFingerprint = Tuple[Tuple[str, int, int], ...]
+
 
 def _coerce_frontmatter_value(raw_value: str) -> Any:
     value = raw_value.strip()
@@ -54,12 +72,23 @@ class ParsedMarkdown:
     body: str
 
 
+@dataclass(frozen=True)
+class KBIndex:
+    """Compiled, read-only view of the KB."""
+
+    content_hash: str
+    skills: Tuple[SkillDetail, ...]
+    concept_bundles: Mapping[str, str]
+    fingerprint: KBFingerprint
+
+
 class KBLoader:
-    """Loads and caches knowledge base markdown content."""
+    """Compiles knowledge base markdown into an in-memory index."""
 
     _CONCEPT_AGENT_TYPES = {"bias_agent", "strategy_agent"}
+    _SOURCE_DIRS = ("concepts", "skills")
 
-    def __init__(self, kb_root: Path | None = None):
+    def __init__(self, kb_root: Path | None = None, reload_check_seconds: float = 30.0):
         if kb_root is not None:
             resolved_root = kb_root
         else:
@@ -70,8 +99,10 @@ class KBLoader:
             ]
             resolved_root = next((candidate for candidate in candidates if candidate.exists()), candidates[0])
         self.kb_root = resolved_root
-        self._concept_bundle_cache: Dict[str, str] = {}
-        self._skill_cache: List[SkillDetail] | None = None
+        self.reload_check_seconds = reload_check_seconds
+        self._index: Optional[KBIndex] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
 
     @staticmethod
     def parse_frontmatter(content: str) -> ParsedMarkdown:
@@ -98,65 +129,138 @@ class KBLoader:
 
         return ParsedMarkdown(metadata=metadata, body=body)
 
-    def load_concepts_bundle(self, agent_type: str) -> str:
-        if agent_type not in self._CONCEPT_AGENT_TYPES:
-            return ""
-        if agent_type in self._concept_bundle_cache:
-            return self._concept_bundle_cache[agent_type]
+    @property
+    def index(self) -> KBIndex:
+        """Current KB index, recompiled if the KB files changed."""
+        index = self._index
+        now = time.monotonic()
+        if index is not None and now - self._checked_at < self.reload_check_seconds:
+            return index
 
-        concepts_dir = self.kb_root / "concepts"
-        sections: List[str] = []
-        for path in sorted(concepts_dir.glob("*.md")):
-            content = path.read_text(encoding="utf-8").strip()
-            sections.append(f"## KB Concept: {path.stem.replace('-', ' ').title()}\n\n{content}")
+        with self._lock:
+            if self._index is not None and now - self._checked_at < self.reload_check_seconds:
+                return self._index
+            fingerprint = self._fingerprint()
+            if self._index is None:
+                self._index = self._compile(fingerprint)
+            elif self._index.fingerprint != fingerprint:
+                try:
+                    index = self._compile(fingerprint)
+                except (OSError, ValueError) as e:
+                    # Keep serving the last good index; retried on the next check
+                    logger.error("kb_index_reload_failed", error=str(e))
+                else:
+                    logger.info(
+                        "kb_index_reloaded",
+                        previous_hash=self._index.content_hash[:12],
+                        content_hash=index.content_hash[:12],
+                    )
+                    self._index = index
+            self._checked_at = now
+            return self._index
 
-        bundle = ""
-        if sections:
-            bundle = "# FOUNDATIONAL ICT CONCEPTS\n\n" + "\n\n".join(sections)
+    @property
+    def content_hash(self) -> str:
+        return self.index.content_hash
 
-        self._concept_bundle_cache[agent_type] = bundle
-        return bundle
+    def preload(self) -> KBIndex:
+        """Compile the index now (e.g. at process start)."""
+        return self.index
+
+    def load_concepts_bundle(self, agent_type: str) -> str:
+        return self.index.concept_bundles.get(agent_type, "")
 
     def load_kb_skill_definitions(self) -> List[SkillDetail]:
-        if self._skill_cache is not None:
-            return self._skill_cache
-
-        skills_dir = self.kb_root / "skills"
-        skill_definitions: List[SkillDetail] = []
-        for path in sorted(skills_dir.glob("*.md")):
-            content = path.read_text(encoding="utf-8")
-            parsed = self.parse_frontmatter(content)
-            metadata = parsed.metadata
-            missing = [
-                key
-                for key in ("skill_id", "name", "category", "agent_types", "recommended_tools")
-                if not metadata.get(key)
-            ]
-            if missing:
-                raise ValueError(
-                    f"KB skill '{path.name}' missing required frontmatter fields: {', '.join(missing)}"
-                )
-
-            skill_definitions.append(
-                SkillDetail(
-                    skill_id=str(metadata["skill_id"]),
-                    name=str(metadata["name"]),
-                    slug=str(metadata.get("slug") or _slugify(str(metadata["name"]))),
-                    version=str(metadata.get("version") or "1.0.0"),
-                    description=str(metadata.get("description") or _extract_description(parsed.body)),
-                    category=str(metadata["category"]),
-                    agent_types=list(metadata["agent_types"]),
-                    tags=list(metadata.get("tags") or []),
-                    recommended_tools=list(metadata["recommended_tools"]),
-                    instruction_fragment=parsed.body,
-                    guardrails=list(metadata.get("guardrails") or []),
-                    tool_overrides=dict(metadata.get("tool_overrides") or {}),
-                    kb_source=str(path.relative_to(self.kb_root)),
-                )
-            )
+        return list(self.index.skills)
+
+    def _source_files(self) -> List[Path]:
+        return [
+            path
+            for directory in self._SOURCE_DIRS
+            for path in sorted((self.kb_root / directory).glob("*.md"))
+        ]
+
+    def _fingerprint(self) -> KBFingerprint:
+        entries = []
+        for path in self._source_files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path.relative_to(self.kb_root).as_posix(), stat.st_mtime_ns, stat.st_size))
+        return tuple(entries)
+
+    def _compile(self, fingerprint: KBFingerprint) -> KBIndex:
+        digest = hashlib.sha256()
+        contents: Dict[str, str] = {}
+        for relative_path, _, _ in fingerprint:
+            content = (self.kb_root / relative_path).read_text(encoding="utf-8")
+            contents[relative_path] = content
+            digest.update(relative_path.encode("utf-8") + b"\0" + content.encode("utf-8") + b"\0")
+
+        bundle = self._build_concepts_bundle(
+            {path: content for path, content in contents.items() if path.startswith("concepts/")}
+        )
+        skills = tuple(
+            self._build_skill(path, content)
+            for path, content in contents.items()
+            if path.startswith("skills/")
+        )
+
+        index = KBIndex(
+            content_hash=digest.hexdigest(),
+            skills=skills,
+            concept_bundles=MappingProxyType(
+                {agent_type: bundle for agent_type in sorted(self._CONCEPT_AGENT_TYPES)}
+            ),
+            fingerprint=fingerprint,
+        )
+        logger.info(
+            "kb_index_compiled",
+            content_hash=index.content_hash[:12],
+            skills=len(skills),
+            concept_files=sum(1 for path in contents if path.startswith("concepts/")),
+        )
+        return index
 
-        self._skill_cache = skill_definitions
-        return skill_definitions
+    @staticmethod
+    def _build_concepts_bundle(concepts: Dict[str, str]) -> str:
+        sections: List[str] = []
+        for relative_path, content in concepts.items():
+            stem = Path(relative_path).stem
+            sections.append(f"## KB Concept: {stem.replace('-', ' ').title()}\n\n{content.strip()}")
+
+        if not sections:
+            return ""
+        return "# FOUNDATIONAL ICT CONCEPTS\n\n" + "\n\n".join(sections)
+
+    def _build_skill(self, relative_path: str, content: str) -> SkillDetail:
+        parsed = self.parse_frontmatter(content)
+        metadata = parsed.metadata
+        missing = [
+            key
+            for key in ("skill_id", "name", "category", "agent_types", "recommended_tools")
+            if not metadata.get(key)
+        ]
+        if missing:
+            raise ValueError(
+                f"KB skill '{Path(relative_path).name}' missing required frontmatter fields: {', '.join(missing)}"
+            )
 
+        return SkillDetail(
+            skill_id=str(metadata["skill_id"]),
+            name=str(metadata["name"]),
+            slug=str(metadata.get("slug") or _slugify(str(metadata["name"]))),
+            version=str(metadata.get("version") or "1.0.0"),
+            description=str(metadata.get("description") or _extract_description(parsed.body)),
+            category=str(metadata["category"]),
+            agent_types=list(metadata["agent_types"]),
+            tags=list(metadata.get("tags") or []),
+            recommended_tools=list(metadata["recommended_tools"]),
+            instruction_fragment=parsed.body,
+            guardrails=list(metadata.get("guardrails") or []),
+            tool_overrides=dict(metadata.get("tool_overrides") or {}),
+            kb_source=relative_path,
+        )
 
 kb_loader = KBLoader()
@@ -4,9 +4,15 @@ Langfuse Integration Service.
 Provides safe tracing helpers for pipeline, agent, tool, and report execution.
 The implementation is defensive because Langfuse may be unavailable locally and
 the deployed SDK surface can vary across versions.
+
+Traces and spans are opened inline (they parent later observations), but the
+leaf records — generations, tool calls, scores — are handed to the background
+trace exporter (app/services/trace_export.py), so recording them costs the
+caller an enqueue.
 """
 from __future__ import annotations
 
+import contextvars
 from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import Optional, Dict, Any, Iterator
@@ -15,6 +21,7 @@ from uuid import uuid4
 import structlog
 
 from app.config import settings
+from app.services.trace_export import TraceEvent, trace_exporter
 
 logger = structlog.get_logger(__name__)
 
@@ -95,6 +102,20 @@ def _trace_id(raw: Any) -> Optional[str]:
     return None
 
 
+def _export(kind: str, record: Dict[str, Any], emit: Optional[Any] = None) -> None:
+    """Queue a leaf trace record; ``emit`` runs later in a copy of this context."""
+    if emit is None and not trace_exporter.file_sink_enabled:
+        return
+    trace_exporter.submit(
+        TraceEvent(
+            kind=kind,
+            record=record,
+            emit=emit,
+            context=contextvars.copy_context() if emit is not None else None,
+        )
+    )
+
+
 def _call_with_fallbacks(callables: list) -> Any:
     last_error: Optional[Exception] = None
     for candidate in callables:
@@ -165,6 +186,34 @@ class LangfuseObservation:
         output: Any = None,
         usage: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a generation under this observation (exported in the background)."""
+        _export(
+            "generation",
+            {
+                "name": name,
+                "model": model,
+                "trace_id": self.trace_id,
+                "parent": self.name,
+                "input": input,
+                "output": output,
+                "usage": usage or {},
+                "metadata": _clean_metadata(metadata),
+            },
+            lambda: self._emit_generation(
+                name=name, model=model, input=input, output=output, usage=usage, metadata=metadata
+            ),
+        )
+
+    def _emit_generation(
+        self,
+        *,
+        name: str,
+        model: str,
+        input: Any = None,
+        output: Any = None,
+        usage: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> Any:
         payload = {
             "name": name,
@@ -505,47 +554,60 @@ def trace_llm_call(
     langfuse.openai wrapper. This function serves as a manual fallback
     for non-OpenAI calls or additional metadata.
     """
-    if not trace:
-        return
-
-    client = get_langfuse_client()
-    if not client:
-        return
+    client = get_langfuse_client() if trace else None
+    prompt_text = prompt[:2000] if prompt else None
+    response_text = response[:2000] if response else None
 
-    if isinstance(trace, LangfuseObservation):
-        trace.generation(
-            name="llm_call",
-            model=model,
-            input=prompt[:2000] if prompt else None,
-            output=response[:2000] if response else None,
-            usage=tokens_used or {},
-            metadata={"cost": cost, "agent": trace.name},
-        )
-    elif hasattr(client, "create_event"):
-        safe_langfuse_operation(
-            "llm_generation",
-            lambda: client.create_event(
+    def emit():
+        if isinstance(trace, LangfuseObservation):
+            trace._emit_generation(
                 name="llm_call",
-                metadata={
-                    "model": model,
-                    "cost": cost,
-                    "tokens": tokens_used or {},
-                    "trace_id": getattr(trace, "trace_id", None),
-                },
-                input=prompt[:2000] if prompt else None,
-                output=response[:2000] if response else None,
-            ),
-        )
+                model=model,
+                input=prompt_text,
+                output=response_text,
+                usage=tokens_used or {},
+                metadata={"cost": cost, "agent": trace.name},
+            )
+        elif hasattr(client, "create_event"):
+            safe_langfuse_operation(
+                "llm_generation",
+                lambda: client.create_event(
+                    name="llm_call",
+                    metadata={
+                        "model": model,
+                        "cost": cost,
+                        "tokens": tokens_used or {},
+                        "trace_id": getattr(trace, "trace_id", None),
+                    },
+                    input=prompt_text,
+                    output=response_text,
+                ),
+            )
 
-    if cost and getattr(trace, "trace_id", None) and hasattr(client, "create_score"):
-        safe_langfuse_operation(
-            "llm_cost_score",
-            lambda: client.create_score(
-                trace_id=trace.trace_id,
-                name="cost",
-                value=cost,
-            ),
-        )
+        if cost and getattr(trace, "trace_id", None) and hasattr(client, "create_score"):
+            safe_langfuse_operation(
+                "llm_cost_score",
+                lambda: client.create_score(
+                    trace_id=trace.trace_id,
+                    name="cost",
+                    value=cost,
+                ),
+            )
+
+    _export(
+        "generation",
+        {
+            "name": "llm_call",
+            "model": model,
+            "trace_id": getattr(trace, "trace_id", None),
+            "parent": getattr(trace, "name", None),
+            "input": prompt_text,
+            "output": response_text,
+            "usage": tokens_used or {},
+            "cost": cost,
+        },
+        emit if client else None,
+    )
 
 
 def trace_tool_call(
@@ -557,43 +619,52 @@ def trace_tool_call(
     """
     Record a tool call as a Langfuse event.
     """
-    if not trace:
-        return
-
-    client = get_langfuse_client()
-    if not client:
-        return
-
-    if isinstance(trace, LangfuseObservation):
-        with span_context(
-            name=f"tool:{tool_name}",
-            parent=trace,
-            metadata={"tool_name": tool_name},
-            input=arguments,
-        ) as tool_span:
-            if tool_span:
-                tool_span.generation(
+    client = get_langfuse_client() if trace else None
+    output_text = str(output)[:2000] if output else None
+
+    def emit():
+        if isinstance(trace, LangfuseObservation):
+            with span_context(
+                name=f"tool:{tool_name}",
+                parent=trace,
+                metadata={"tool_name": tool_name},
+                input=arguments,
+            ) as tool_span:
+                if tool_span:
+                    tool_span._emit_generation(
+                        name=f"tool_{tool_name}",
+                        model="tool",
+                        input=arguments,
+                        output=output_text,
+                        metadata={"tool_name": tool_name},
+                    )
+            return
+
+        if hasattr(client, "create_event"):
+            safe_langfuse_operation(
+                "tool_span",
+                lambda: client.create_event(
                     name=f"tool_{tool_name}",
-                    model="tool",
+                    metadata={
+                        "tool_name": tool_name,
+                        "trace_id": getattr(trace, "trace_id", None),
+                    },
                     input=arguments,
-                    output=str(output)[:2000] if output else None,
-                    metadata={"tool_name": tool_name},
-                )
-        return
+                    output=output_text,
+                ),
+            )
 
-    if hasattr(client, "create_event"):
-        safe_langfuse_operation(
-            "tool_span",
-            lambda: client.create_event(
-                name=f"tool_{tool_name}",
-                metadata={
-                    "tool_name": tool_name,
-                    "trace_id": getattr(trace, "trace_id", None),
-                },
-                input=arguments,
-                output=str(output)[:2000] if output else None,
-            ),
-        )
+    _export(
+        "tool",
+        {
+            "name": f"tool_{tool_name}",
+            "trace_id": getattr(trace, "trace_id", None),
+            "parent": getattr(trace, "name", None),
+            "input": arguments,
+            "output": output_text,
+        },
+        emit if client else None,
+    )
 
 
 def safe_langfuse_operation(operation_name: str, func, *args, **kwargs) -> Optional[Any]:
@@ -635,8 +706,11 @@ def safe_langfuse_operation(operation_name: str, func, *args, **kwargs) -> Optio
         return None
 
 
-def flush_langfuse():
-    """Flush any pending Langfuse data."""
-    client = get_langfuse_client()
-    if client:
-        safe_langfuse_operation("flush", client.flush)
+def flush_langfuse(timeout: Optional[float] = None) -> bool:
+    """
+    Export queued trace events and flush the Langfuse client.
+
+    Runs on the trace exporter thread; callers only wait when they pass a
+    ``timeout`` (e.g. before a process exits).
+    """
+    return trace_exporter.flush(timeout=timeout)
@@ -0,0 +1,630 @@
+"""
+LLM request governor.
+
+Every chat completion made through ``create_openai_client`` passes through
+one process-wide ``LLMGovernor``:
+
+  - Budgets: cluster-wide requests- and tokens-per-minute per model, kept
+    as fixed one-minute windows in Redis (``llm:budget:*``). Tokens are
+    reserved from an estimate before the call and corrected with the
+    reported usage afterwards. Without Redis the same budgets are kept
+    per process.
+  - Priorities: a priority may only fill its share of a model's budget
+    (``PRIORITY_BUDGET_SHARE``), so reports and backtests leave headroom
+    for live trading calls instead of competing with them.
+  - Cooldown: a provider 429 sets ``llm:cooldown:{model}`` for the
+    Retry-After period and every process waits it out, instead of each
+    one retrying into the rate limit.
+  - A call that gets no budget within ``LLM_GOVERNOR_MAX_WAIT_SECONDS``
+    fails with ``LLMBudgetExhausted`` rather than going out unreserved.
+  - Coalescing: identical requests in flight in the same process share
+    one provider call (not streams, which can only be consumed once).
+  - Concurrency: at most ``LLM_MAX_CONCURRENT_REQUESTS`` calls in flight
+    per process. A streamed call holds its slot until the stream is
+    drained or closed, and is settled from its final usage chunk.
+
+The priority of a call is the client's explicit priority, or else the
+ambient one set with ``llm_priority(...)`` (the pipeline task sets it from
+the execution mode).
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+
+class LLMPriority(str, Enum):
+    LIVE = "live"
+    DEFAULT = "default"
+    REPORT = "report"
+    BACKTEST = "backtest"
+
+
+# Share of each model budget a priority may consume
+PRIORITY_BUDGET_SHARE: Dict[LLMPriority, float] = {
+    LLMPriority.LIVE: 1.0,
+    LLMPriority.DEFAULT: 0.85,
+    LLMPriority.REPORT: 0.6,
+    LLMPriority.BACKTEST: 0.5,
+}
+
+# Reserved for the completion when a request sets no max_tokens
+DEFAULT_COMPLETION_TOKENS = 1024
+
+# Cooldown after a 429 without a usable Retry-After header
+DEFAULT_COOLDOWN_SECONDS = 5.0
+
+BUDGET_KEY_PREFIX = "llm:budget:"
+COOLDOWN_KEY_PREFIX = "llm:cooldown:"
+
+# Request parameters that don't change the completion
+_NON_SEMANTIC_PARAMS = ("timeout", "extra_headers", "extra_query")
+
+_current_priority: ContextVar[LLMPriority] = ContextVar("llm_priority", default=LLMPriority.DEFAULT)
+
+
+def current_llm_priority() -> LLMPriority:
+    return _current_priority.get()
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority | str) -> Iterator[None]:
+    """Set the priority of LLM calls made inside the block."""
+    token = _current_priority.set(LLMPriority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def priority_for_mode(mode: Optional[str]) -> LLMPriority:
+    """LLM priority of a pipeline execution mode."""
+    if mode == "live":
+        return LLMPriority.LIVE
+    if mode == "backtest":
+        return LLMPriority.BACKTEST
+    return LLMPriority.DEFAULT
+
+
+def estimate_tokens(request: Dict[str, Any]) -> int:
+    """Rough prompt + completion token estimate (~4 characters per token)."""
+    prompt_chars = len(json.dumps(request.get("messages") or [], default=str))
+    prompt_chars += len(json.dumps(request.get("tools") or [], default=str))
+    completion = request.get("max_tokens") or request.get("max_completion_tokens") or DEFAULT_COMPLETION_TOKENS
+    return prompt_chars // 4 + int(completion)
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Identity of a completion request, for coalescing."""
+    semantic = {k: v for k, v in request.items() if k not in _NON_SEMANTIC_PARAMS}
+    payload = json.dumps(semantic, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def model_limits(model: str) -> Tuple[int, int]:
+    """(requests per minute, tokens per minute) for ``model``."""
+    override = settings.LLM_MODEL_LIMITS.get(model) or settings.LLM_MODEL_LIMITS.get(model.split("/")[-1]) or {}
+    return (
+        int(override.get("rpm", settings.LLM_MODEL_RPM_LIMIT)),
+        int(override.get("tpm", settings.LLM_MODEL_TPM_LIMIT)),
+    )
+
+
+def _retry_after_seconds(error: Exception) -> float:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(float(headers.get("retry-after")), 1.0)
+    except (TypeError, ValueError):
+        return DEFAULT_COOLDOWN_SECONDS
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    try:
+        from openai import RateLimitError
+    except ImportError:  # pragma: no cover - openai is a hard dependency
+        return False
+    return isinstance(error, RateLimitError)
+
+
+# KEYS: requests counter, tokens counter, cooldown
+# ARGV: rpm limit, tpm limit, tokens, window ttl
+# Returns 1 (granted), 0 (window full) or -<cooldown ms left>
+_ACQUIRE_SCRIPT = """
+local cooldown = redis.call('PTTL', KEYS[3])
+if cooldown > 0 then
+    return -cooldown
+end
+local requests = tonumber(redis.call('GET', KEYS[1]) or '0')
+local tokens = tonumber(redis.call('GET', KEYS[2]) or '0')
+local want = tonumber(ARGV[3])
+if requests > 0 and (requests + 1 > tonumber(ARGV[1]) or tokens + want > tonumber(ARGV[2])) then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('INCRBY', KEYS[2], want)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return 1
+"""
+
+
+class LLMBudgetExhausted(RuntimeError):
+    """No budget for the model within ``LLM_GOVERNOR_MAX_WAIT_SECONDS``."""
+
+
+class _LocalBudget:
+    """Per-process fixed-window counters (used while Redis is unavailable)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._windows: Dict[str, Tuple[int, int, int]] = {}  # model -> (window, requests, tokens)
+        self._cooldowns: Dict[str, float] = {}  # model -> monotonic deadline
+
+    def try_acquire(self, model: str, window: int, rpm: int, tpm: int, tokens: int) -> float:
+        with self._lock:
+            cooldown = self._cooldowns.get(model, 0.0) - time.monotonic()
+            if cooldown > 0:
+                return cooldown
+            current, requests, used = self._windows.get(model, (window, 0, 0))
+            if current != window:
+                requests, used = 0, 0
+            if requests > 0 and (requests + 1 > rpm or used + tokens > tpm):
+                return 0.0
+            self._windows[model] = (window, requests + 1, used + tokens)
+            return -1.0
+
+    def adjust(self, model: str, window: int, delta: int):
+        with self._lock:
+            current, requests, used = self._windows.get(model, (window, 0, 0))
+            if current == window:
+                self._windows[model] = (window, requests, max(used + delta, 0))
+
+    def cooldown(self, model: str, seconds: float):
+        with self._lock:
+            self._cooldowns[model] = time.monotonic() + seconds
+
+
+class LLMGovernor:
+    """Budgets, prioritizes and coalesces LLM completion calls."""
+
+    def __init__(self, redis_factory: Optional[Callable[[], Any]] = None):
+        self._redis_factory = redis_factory or self._default_redis
+        self._redis = None
+        self._redis_failed_at: Optional[float] = None
+        self._script = None
+        self._local = _LocalBudget()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._async_inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._semaphore = threading.BoundedSemaphore(max(settings.LLM_MAX_CONCURRENT_REQUESTS, 1))
+        self._async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _default_redis():
+        import redis
+
+        return redis.from_url(settings.REDIS_URL, socket_connect_timeout=1, socket_timeout=1)
+
+    def _get_redis(self):
+        # After a failure, stay on local budgets for a while instead of
+        # paying a connect timeout on every call
+        if self._redis is None and (
+            self._redis_failed_at is None or time.monotonic() - self._redis_failed_at > 30
+        ):
+            try:
+                self._redis = self._redis_factory()
+                self._script = self._redis.register_script(_ACQUIRE_SCRIPT) if self._redis else None
+            except Exception as e:
+                self._redis_unavailable(e)
+        return self._redis
+
+    def _redis_unavailable(self, error: Exception):
+        logger.warning("llm_governor_redis_unavailable", error=str(error))
+        self._redis = None
+        self._script = None
+        self._redis_failed_at = time.monotonic()
+
+    # ── Budget ───────────────────────────────────────────────────────────
+
+    def try_acquire(self, model: str, priority: LLMPriority, tokens: int) -> Tuple[float, int]:
+        """
+        Reserve one request and ``tokens`` from the model's current window.
+
+        Returns:
+            (seconds to wait before retrying, 0 if granted; window granted in)
+        """
+        now = time.time()
+        window = int(now // 60)
+        rpm, tpm = model_limits(model)
+        share = PRIORITY_BUDGET_SHARE[priority]
+        rpm_limit = max(int(rpm * share), 1)
+        tpm_limit = max(int(tpm * share), 1)
+        window_left = 60 - (now % 60)
+
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                result = int(self._script(
+                    keys=[
+                        f"{BUDGET_KEY_PREFIX}{model}:{window}:requests",
+                        f"{BUDGET_KEY_PREFIX}{model}:{window}:tokens",
+                        f"{COOLDOWN_KEY_PREFIX}{model}",
+                    ],
+                    args=[rpm_limit, tpm_limit, tokens, 120],
+                ))
+                if result == 1:
+                    return 0.0, window
+                if result < 0:
+                    return -result / 1000.0, window
+                return window_left, window
+            except Exception as e:
+                self._redis_unavailable(e)
+
+        result = self._local.try_acquire(model, window, rpm_limit, tpm_limit, tokens)
+        if result < 0:
+            return 0.0, window
+        return (result or window_left), window
+
+    def settle(self, model: str, window: int, estimated: int, response: Any):
+        """Replace the token estimate with the reported usage."""
+        usage = getattr(response, "usage", None)
+        actual = getattr(usage, "total_tokens", None) if usage else None
+        if actual:
+            self._adjust_tokens(model, window, int(actual) - estimated)
+
+    def refund(self, model: str, window: int, estimated: int):
+        """Release the tokens reserved for a call that failed."""
+        self._adjust_tokens(model, window, -estimated)
+
+    def _adjust_tokens(self, model: str, window: int, delta: int):
+        if delta == 0:
+            return
+        redis = self._redis
+        if redis is not None:
+            try:
+                key = f"{BUDGET_KEY_PREFIX}{model}:{window}:tokens"
+                pipe = redis.pipeline(transaction=False)
+                pipe.incrby(key, delta)
+                pipe.expire(key, 120)
+                pipe.execute()
+                return
+            except Exception as e:
+                self._redis_unavailable(e)
+        self._local.adjust(model, window, delta)
+
+    def cooldown(self, model: str, seconds: float):
+        """Make every process wait ``seconds`` before calling ``model`` again."""
+        logger.warning("llm_rate_limited", model=model, cooldown_seconds=seconds)
+        self._local.cooldown(model, seconds)
+        redis = self._redis
+        if redis is not None:
+            try:
+                redis.set(f"{COOLDOWN_KEY_PREFIX}{model}", "1", px=int(seconds * 1000))
+            except Exception as e:
+                self._redis_unavailable(e)
+
+    def _check_wait(self, model: str, priority: LLMPriority, wait: float, waited: float) -> bool:
+        """
+        True once budget was granted; raises when the wait limit is used up.
+
+        A call never goes out without a reservation: that would bypass an
+        active 429 cooldown, and its settle/refund would correct a counter
+        that never held its tokens.
+        """
+        if wait <= 0:
+            if waited > 0:
+                logger.info("llm_governor_waited", model=model, priority=priority.value, waited=round(waited, 2))
+            return True
+        if waited >= settings.LLM_GOVERNOR_MAX_WAIT_SECONDS:
+            logger.warning("llm_governor_wait_exceeded", model=model, priority=priority.value, waited=round(waited, 1))
+            raise LLMBudgetExhausted(
+                f"No {priority.value} budget for {model} after waiting {waited:.0f}s"
+            )
+        return False
+
+    def _wait_for_budget(self, model: str, priority: LLMPriority, tokens: int) -> int:
+        started = time.monotonic()
+        while True:
+            wait, window = self.try_acquire(model, priority, tokens)
+            waited = time.monotonic() - started
+            if self._check_wait(model, priority, wait, waited):
+                return window
+            time.sleep(min(wait, settings.LLM_GOVERNOR_MAX_WAIT_SECONDS - waited, 5.0))
+
+    async def _await_budget(self, model: str, priority: LLMPriority, tokens: int) -> int:
+        started = time.monotonic()
+        while True:
+            wait, window = await asyncio.to_thread(self.try_acquire, model, priority, tokens)
+            waited = time.monotonic() - started
+            if self._check_wait(model, priority, wait, waited):
+                return window
+            await asyncio.sleep(min(wait, settings.LLM_GOVERNOR_MAX_WAIT_SECONDS - waited, 5.0))
+
+    # ── Calls ────────────────────────────────────────────────────────────
+
+    def call(self, create: Callable[..., Any], request: Dict[str, Any], priority: LLMPriority) -> Any:
+        """Run a sync completion call under the governor."""
+        if request.get("stream"):
+            return self._call(create, request, priority)
+
+        key = request_key(request)
+        with self._lock:
+            leader = self._inflight.get(key)
+            if leader is None:
+                future: Future = Future()
+                self._inflight[key] = future
+        if leader is not None:
+            logger.debug("llm_request_coalesced", model=request.get("model"))
+            return leader.result()
+
+        try:
+            result = self._call(create, request, priority)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _call(self, create: Callable[..., Any], request: Dict[str, Any], priority: LLMPriority) -> Any:
+        model = str(request.get("model"))
+        tokens = estimate_tokens(request)
+        window = self._wait_for_budget(model, priority, tokens)
+        self._semaphore.acquire()
+        try:
+            response = create(**request)
+        except BaseException as e:
+            self._semaphore.release()
+            if isinstance(e, Exception):
+                self._failed(model, window, tokens, e)
+            raise
+        if request.get("stream"):
+            return _GovernedStream(
+                response, lambda usage: self._stream_done(self._semaphore, model, window, tokens, usage)
+            )
+        self._semaphore.release()
+        self.settle(model, window, tokens, response)
+        return response
+
+    def _failed(self, model: str, window: int, tokens: int, error: Exception):
+        self.refund(model, window, tokens)
+        if _is_rate_limit_error(error):
+            self.cooldown(model, _retry_after_seconds(error))
+
+    def _stream_done(self, semaphore: Any, model: str, window: int, tokens: int, usage_chunk: Any):
+        semaphore.release()
+        # Streams without a usage chunk keep the estimate
+        if usage_chunk is not None:
+            self.settle(model, window, tokens, usage_chunk)
+
+    async def acall(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        request: Dict[str, Any],
+        priority: LLMPriority,
+    ) -> Any:
+        """Run an async completion call under the governor."""
+        if request.get("stream"):
+            return await self._acall(create, request, priority)
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), request_key(request))
+        leader = self._async_inflight.get(key)
+        if leader is not None:
+            logger.debug("llm_request_coalesced", model=request.get("model"))
+            return await asyncio.shield(leader)
+
+        future = loop.create_future()
+        self._async_inflight[key] = future
+        try:
+            result = await self._acall(create, request, priority)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieved here so an uncoalesced failure isn't reported as unhandled
+            future.exception()
+            raise
+        finally:
+            self._async_inflight.pop(key, None)
+
+    async def _acall(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        request: Dict[str, Any],
+        priority: LLMPriority,
+    ) -> Any:
+        model = str(request.get("model"))
+        tokens = estimate_tokens(request)
+        window = await self._await_budget(model, priority, tokens)
+        semaphore = self._async_semaphore()
+        await semaphore.acquire()
+        try:
+            response = await create(**request)
+        except BaseException as e:
+            semaphore.release()
+            if isinstance(e, Exception):
+                self._failed(model, window, tokens, e)
+            raise
+        if request.get("stream"):
+            return _GovernedAsyncStream(
+                response, lambda usage: self._stream_done(semaphore, model, window, tokens, usage)
+            )
+        semaphore.release()
+        self.settle(model, window, tokens, response)
+        return response
+
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(settings.LLM_MAX_CONCURRENT_REQUESTS, 1))
+            self._async_semaphores[loop] = semaphore
+        return semaphore
+
+
+class _GovernedStreamBase:
+    """
+    Stream that reports back to the governor once it is drained or closed.
+
+    ``on_done`` gets the last chunk carrying ``usage`` (None if the provider
+    sent none) and is called exactly once, also when the consumer stops
+    early or the stream is garbage collected unclosed.
+    """
+
+    def __init__(self, stream: Any, on_done: Callable[[Any], None]):
+        self._stream = stream
+        self._on_done: Optional[Callable[[Any], None]] = on_done
+        self._usage_chunk = None
+
+    def _observe(self, chunk: Any) -> Any:
+        if getattr(chunk, "usage", None):
+            self._usage_chunk = chunk
+        return chunk
+
+    def _finish(self):
+        on_done, self._on_done = self._on_done, None
+        if on_done is not None:
+            on_done(self._usage_chunk)
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._stream, name)
+
+
+class _GovernedStream(_GovernedStreamBase):
+    def __init__(self, stream: Any, on_done: Callable[[Any], None]):
+        super().__init__(stream, on_done)
+        self._iterator = iter(stream)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            return self._observe(next(self._iterator))
+        except BaseException:
+            self._finish()
+            raise
+
+    def close(self):
+        try:
+            close = getattr(self._stream, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._finish()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _GovernedAsyncStream(_GovernedStreamBase):
+    def __init__(self, stream: Any, on_done: Callable[[Any], None]):
+        super().__init__(stream, on_done)
+        self._iterator = stream.__aiter__()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return self._observe(await self._iterator.__anext__())
+        except BaseException:
+            self._finish()
+            raise
+
+    async def close(self):
+        try:
+            close = getattr(self._stream, "close", None) or getattr(self._stream, "aclose", None)
+            if close is not None:
+                await close()
+        finally:
+            self._finish()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+class _GovernedCompletions:
+    def __init__(self, completions: Any, client: "GovernedClient"):
+        self._completions = completions
+        self._client = client
+
+    def create(self, **request: Any) -> Any:
+        priority = self._client.priority or current_llm_priority()
+        if self._client.is_async:
+            return self._client.governor.acall(self._completions.create, request, priority)
+        return self._client.governor.call(self._completions.create, request, priority)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._completions, name)
+
+
+class _GovernedChat:
+    def __init__(self, chat: Any, client: "GovernedClient"):
+        self._chat = chat
+        self.completions = _GovernedCompletions(chat.completions, client)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._chat, name)
+
+
+class GovernedClient:
+    """OpenAI client whose chat completions go through the governor."""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        is_async: bool,
+        priority: Optional[LLMPriority] = None,
+        governor: Optional[LLMGovernor] = None,
+    ):
+        self._client = client
+        self.is_async = is_async
+        self.priority = priority
+        self.governor = governor or llm_governor
+        self.chat = _GovernedChat(client.chat, self)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+llm_governor = LLMGovernor()
@@ -1,5 +1,8 @@
 """
 Shared helpers for OpenAI-compatible LLM providers.
+
+Clients from ``create_openai_client`` route chat completions through the
+LLM request governor (see app/services/llm_governor.py).
 """
 from __future__ import annotations
 
@@ -7,6 +10,7 @@ from typing import Any, Dict, Optional
 from openai import AsyncOpenAI, OpenAI
 
 from app.config import settings
+from app.services.llm_governor import GovernedClient, LLMPriority
 
 
 def get_llm_provider() -> str:
@@ -37,7 +41,21 @@ def get_llm_default_headers() -> Dict[str, str]:
     return headers
 
 
-def create_openai_client(*, async_client: bool = False, **overrides: Any) -> OpenAI | AsyncOpenAI:
+def create_openai_client(
+    *,
+    async_client: bool = False,
+    priority: Optional[LLMPriority] = None,
+    **overrides: Any,
+) -> OpenAI | AsyncOpenAI:
+    """
+    OpenAI-compatible client for the configured provider.
+
+    Args:
+        async_client: Return an AsyncOpenAI client
+        priority: Governor priority for this client's calls (default: the
+            ambient ``llm_priority``)
+        **overrides: OpenAI client kwargs (api_key, base_url, ...)
+    """
     kwargs: Dict[str, Any] = {"api_key": get_llm_api_key()}
     base_url = get_llm_base_url()
     headers = get_llm_default_headers()
@@ -48,9 +66,10 @@ def create_openai_client(*, async_client: bool = False, **overrides: Any) -> Ope
         kwargs["default_headers"] = headers
 
     kwargs.update(overrides)
-    if async_client:
-        return AsyncOpenAI(**kwargs)
-    return OpenAI(**kwargs)
+    client = AsyncOpenAI(**kwargs) if async_client else OpenAI(**kwargs)
+    if not settings.LLM_GOVERNOR_ENABLED:
+        return client
+    return GovernedClient(client, is_async=async_client, priority=priority)
 
 
 def resolve_chat_model(model_id: str) -> str:
@@ -2,17 +2,49 @@
 Model Registry Service - Manages LLM models and pricing
 
 Provides a centralized service for looking up model information and calculating costs.
+
+The active models are read from the database once per worker and kept as a
+detached snapshot (``MODEL_REGISTRY_CACHE_TTL_SECONDS``), so pipeline setup
+and cost calculation don't query ``llm_models`` on every run. Call
+``model_registry.invalidate()`` after changing models or pricing; every
+worker reloads within ``WORKER_CACHE_VERSION_CHECK_SECONDS``.
 """
 import structlog
 import os
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Tuple
 from sqlalchemy.orm import Session
 from app.models.llm_model import LLMModel
 from app.config import settings
+from app.services.worker_cache import WorkerCache
 
 logger = structlog.get_logger()
 
 
+@dataclass(frozen=True)
+class _ModelCatalog:
+    """Active models, ordered by display name."""
+    models: Tuple[LLMModel, ...]
+    by_id: Dict[str, LLMModel]
+
+
+def _detached_copy(model: LLMModel) -> LLMModel:
+    """Transient copy of a row, safe to share after its session is closed."""
+    return LLMModel(**{
+        attr.key: getattr(model, attr.key)
+        for attr in LLMModel.__mapper__.column_attrs
+    })
+
+
+def _load_catalog(db: Session) -> _ModelCatalog:
+    rows = db.query(LLMModel).filter(
+        LLMModel.is_active == True
+    ).order_by(LLMModel.display_name).all()
+    models = tuple(_detached_copy(row) for row in rows)
+    logger.info("model_catalog_loaded", model_count=len(models))
+    return _ModelCatalog(models=models, by_id={m.model_id: m for m in models})
+
+
 class ModelRegistry:
     """
     Service for managing LLM model registry and pricing.
@@ -21,9 +53,18 @@ class ModelRegistry:
     without hardcoding values in agent code.
     """
     
-    # In-memory cache for model data (refreshed periodically)
-    _model_cache: Dict[str, LLMModel] = {}
-    _default_model_id: Optional[str] = None
+    # Worker-level cache of the active model catalog
+    _cache = WorkerCache(
+        namespace="model_registry",
+        ttl_seconds=settings.MODEL_REGISTRY_CACHE_TTL_SECONDS,
+        max_entries=1,
+        redis_url=settings.REDIS_URL,
+        version_check_seconds=settings.WORKER_CACHE_VERSION_CHECK_SECONDS,
+    )
+
+    @classmethod
+    def _catalog(cls, db: Session) -> _ModelCatalog:
+        return cls._cache.get_or_load("catalog", lambda: _load_catalog(db))
     
     @classmethod
     def get_model(cls, model_id: str, db: Session) -> Optional[LLMModel]:
@@ -32,26 +73,14 @@ class ModelRegistry:
         
         Args:
             model_id: Model identifier (e.g., "gpt-4")
-            db: Database session
+            db: Database session (only used when the catalog isn't cached)
             
         Returns:
             LLMModel object or None if not found
         """
-        # Check cache first
-        if model_id in cls._model_cache:
-            return cls._model_cache[model_id]
-        
-        # Query database
-        model = db.query(LLMModel).filter(
-            LLMModel.model_id == model_id,
-            LLMModel.is_active == True
-        ).first()
-        
-        if model:
-            cls._model_cache[model_id] = model
-        else:
+        model = cls._catalog(db).by_id.get(model_id)
+        if not model:
             logger.warning("model_not_found", model_id=model_id)
-        
         return model
     
     @classmethod
@@ -60,23 +89,17 @@ class ModelRegistry:
         Get the default model.
         
         Args:
-            db: Database session
+            db: Database session (only used when the catalog isn't cached)
             
         Returns:
             Default LLMModel object
         """
-        model = db.query(LLMModel).filter(
-            LLMModel.is_default == True,
-            LLMModel.is_active == True
-        ).first()
-        
-        if not model:
-            # Fallback: get any active model
-            model = db.query(LLMModel).filter(
-                LLMModel.is_active == True
-            ).first()
-        
-        return model
+        models = cls._catalog(db).models
+        for model in models:
+            if model.is_default:
+                return model
+        # Fallback: get any active model
+        return models[0] if models else None
     
     @classmethod
     def list_available_models(cls, db: Session) -> List[LLMModel]:
@@ -88,7 +111,7 @@ class ModelRegistry:
         - production: Shows only production-ready models (no local/dev models)
         
         Args:
-            db: Database session
+            db: Database session (only used when the catalog isn't cached)
             
         Returns:
             List of active LLMModel objects appropriate for current environment
@@ -96,24 +119,15 @@ class ModelRegistry:
         # Get current environment (default to production for safety)
         current_env = os.getenv("ENVIRONMENT", "production").lower()
         
-        query = db.query(LLMModel).filter(LLMModel.is_active == True)
-        
-        # Filter by environment
-        if current_env == "development":
-            # In development, show all models (environment = 'all' OR 'development')
-            query = query.filter(
-                (LLMModel.environment == "all") | (LLMModel.environment == "development")
-            )
-        else:
-            # In production, only show production-ready models (environment = 'all' OR 'production')
-            query = query.filter(
-                (LLMModel.environment == "all") | (LLMModel.environment == "production")
-            )
-
+        # In development, show all models (environment = 'all' OR 'development');
+        # in production, only production-ready ones (environment = 'all' OR 'production')
+        environments = {"all", "development" if current_env == "development" else "production"}
         active_provider = (settings.LLM_PROVIDER or "openai").lower()
-        query = query.filter(LLMModel.provider == active_provider)
 
-        models = query.order_by(LLMModel.display_name).all()
+        models = [
+            m for m in cls._catalog(db).models
+            if m.environment in environments and m.provider == active_provider
+        ]
         
         logger.debug(
             "models_listed",
@@ -193,11 +207,15 @@ class ModelRegistry:
     
     @classmethod
     def clear_cache(cls):
-        """Clear the in-memory model cache."""
-        cls._model_cache = {}
-        cls._default_model_id = None
+        """Clear this worker's cached model catalog."""
+        cls._cache.clear()
         logger.info("model_cache_cleared")
 
+    @classmethod
+    def invalidate(cls):
+        """Reload the model catalog in every worker (after model/pricing changes)."""
+        cls._cache.invalidate()
+
 
 # Singleton instance
 model_registry = ModelRegistry()
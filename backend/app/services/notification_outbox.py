@@ -0,0 +1,347 @@
+"""
+Notification Outbox
+
+Execution and monitoring paths used to call Telegram and Twilio inline, one
+blocking request per event. They now ``enqueue`` a ``NotificationEvent`` —
+a Redis RPUSH — and the ``dispatch_notifications`` Celery beat task sends
+what has accumulated every ``NOTIFICATION_DISPATCH_INTERVAL_SECONDS``:
+
+  - Duplicates (same ``dedupe_key``) within ``NOTIFICATION_DEDUPE_WINDOW_SECONDS``
+    are dropped, e.g. a stalled-monitoring alert raised on every check.
+  - Events for the same user and channel that arrived in one interval are
+    coalesced into a single digest message. Events with ``digest=False``
+    (approval requests) are always sent on their own.
+  - Each channel has a cluster-wide budget of messages per minute
+    (``NOTIFICATION_RATE_LIMITS``); messages over budget go back to the
+    outbox for the next run.
+
+Telegram recipients are resolved from the user's settings at send time, so
+bot tokens never sit in Redis. If Redis is unreachable, events are kept in
+process and dispatched from a background timer instead.
+"""
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+OUTBOX_KEY = "notifications:outbox"
+# Telegram rejects messages over 4096 characters
+MAX_MESSAGE_CHARS = {"telegram": 4000, "sms": 1500}
+DIGEST_SEPARATOR = "\n\n— — —\n\n"
+
+
+@dataclass
+class NotificationEvent:
+    channel: str  # "telegram" or "sms"
+    user_id: str
+    event: str  # e.g. "position_closed", "trade_executed"
+    message: str
+    recipient: Optional[str] = None  # SMS phone number; Telegram uses the user's settings
+    dedupe_key: Optional[str] = None
+    digest: bool = True
+    created_at: float = field(default_factory=time.time)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "NotificationEvent":
+        return cls(**json.loads(raw))
+
+    @property
+    def group_key(self) -> Tuple[str, str, Optional[str]]:
+        return (self.channel, self.user_id, self.recipient)
+
+
+def _send_telegram(event: NotificationEvent, message: str) -> Dict[str, Any]:
+    from app.database import SessionLocal
+    from app.models.user import User as UserModel
+    from app.services.telegram_notifier import telegram_notifier
+
+    db = SessionLocal()
+    try:
+        user = db.query(UserModel).filter(UserModel.id == event.user_id).first()
+        if not user or not user.telegram_enabled or not user.telegram_bot_token or not user.telegram_chat_id:
+            return {"status": "skipped", "reason": "telegram_not_configured"}
+        bot_token, chat_id = user.telegram_bot_token, user.telegram_chat_id
+    finally:
+        db.close()
+    return telegram_notifier.send_message(bot_token, chat_id, message)
+
+
+def _send_sms(event: NotificationEvent, message: str) -> Dict[str, Any]:
+    from app.services.sms_notifier import TwilioSmsNotifier
+
+    return TwilioSmsNotifier.send_sms(event.recipient, message)
+
+
+DEFAULT_SENDERS: Dict[str, Callable[[NotificationEvent, str], Dict[str, Any]]] = {
+    "telegram": _send_telegram,
+    "sms": _send_sms,
+}
+
+
+def digest_message(events: List[NotificationEvent]) -> str:
+    """One message for a burst of events to the same user and channel."""
+    if len(events) == 1:
+        return events[0].message
+    header = f"📬 *{len(events)} updates*" if events[0].channel == "telegram" else f"{len(events)} updates:"
+    message = header + DIGEST_SEPARATOR + DIGEST_SEPARATOR.join(e.message for e in events)
+    limit = MAX_MESSAGE_CHARS.get(events[0].channel)
+    if limit and len(message) > limit:
+        message = message[: limit - 20].rstrip() + "\n\n… (truncated)"
+    return message
+
+
+class NotificationOutbox:
+    """Queue of outgoing notifications plus the dispatcher that drains it."""
+
+    def __init__(
+        self,
+        redis_factory: Optional[Callable[[], Any]] = None,
+        senders: Optional[Dict[str, Callable[[NotificationEvent, str], Dict[str, Any]]]] = None,
+        dispatch_interval: Optional[float] = None,
+        dedupe_window: Optional[float] = None,
+        rate_limits: Optional[Dict[str, int]] = None,
+        batch_size: int = 500,
+    ):
+        self._redis_factory = redis_factory or self._default_redis
+        self.senders = senders or DEFAULT_SENDERS
+        self.dispatch_interval = (
+            settings.NOTIFICATION_DISPATCH_INTERVAL_SECONDS if dispatch_interval is None else dispatch_interval
+        )
+        self.dedupe_window = (
+            settings.NOTIFICATION_DEDUPE_WINDOW_SECONDS if dedupe_window is None else dedupe_window
+        )
+        self.rate_limits = settings.NOTIFICATION_RATE_LIMITS if rate_limits is None else rate_limits
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._redis = None
+        self._redis_failed_at = 0.0
+        # Fallback state when Redis is unreachable
+        self._local: List[NotificationEvent] = []
+        self._local_dedupe: Dict[str, float] = {}
+        self._local_sent: Dict[Tuple[str, int], int] = {}
+        self._local_timer: Optional[threading.Timer] = None
+
+    @staticmethod
+    def _default_redis():
+        import redis
+
+        return redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+
+    def _get_redis(self):
+        if self._redis_failed_at and time.monotonic() - self._redis_failed_at < 30:
+            return None
+        if self._redis is None:
+            try:
+                self._redis = self._redis_factory()
+            except Exception as e:
+                self._redis_unavailable(e)
+                return None
+        return self._redis
+
+    def _redis_unavailable(self, error: Exception):
+        self._redis = None
+        self._redis_failed_at = time.monotonic()
+        logger.warning("notification_outbox_redis_unavailable", error=str(error))
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, event: NotificationEvent) -> None:
+        """Queue a notification; never waits on the notification provider."""
+        client = self._get_redis()
+        if client is not None:
+            try:
+                client.rpush(OUTBOX_KEY, event.to_json())
+                logger.info("notification_queued", channel=event.channel, notification_event=event.event, user_id=event.user_id)
+                return
+            except Exception as e:
+                self._redis_unavailable(e)
+        with self._lock:
+            self._local.append(event)
+            self._schedule_local_dispatch()
+        logger.info("notification_queued_locally", channel=event.channel, notification_event=event.event, user_id=event.user_id)
+
+    def _schedule_local_dispatch(self):
+        # Caller holds self._lock
+        if self._local_timer is None:
+            self._local_timer = threading.Timer(self.dispatch_interval, self._dispatch_local)
+            self._local_timer.daemon = True
+            self._local_timer.start()
+
+    def _dispatch_local(self):
+        with self._lock:
+            self._local_timer = None
+        try:
+            self.dispatch(use_redis=False)
+        except Exception as e:
+            logger.error("notification_local_dispatch_failed", error=str(e))
+
+    # ------------------------------------------------------------------
+    # Dispatcher side
+    # ------------------------------------------------------------------
+
+    def dispatch(self, use_redis: bool = True) -> Dict[str, int]:
+        """
+        Send everything queued so far: dedupe, digest per user/channel, rate-limit.
+
+        Returns:
+            Counts of events taken, duplicates dropped, messages sent,
+            send failures and events requeued by the rate limit
+        """
+        client = self._get_redis() if use_redis else None
+        events = self._take(client)
+        stats = {"events": len(events), "duplicates": 0, "messages": 0, "failed": 0, "requeued": 0}
+        if not events:
+            return stats
+
+        fresh = []
+        for event in events:
+            if self._first_seen(client, event):
+                fresh.append(event)
+            else:
+                stats["duplicates"] += 1
+
+        requeue: List[NotificationEvent] = []
+        for channel_events in self._messages(fresh):
+            channel = channel_events[0].channel
+            if not self._acquire(client, channel):
+                requeue.extend(channel_events)
+                continue
+            sender = self.senders.get(channel)
+            if sender is None:
+                logger.error("notification_channel_unknown", channel=channel)
+                stats["failed"] += 1
+                continue
+            try:
+                result = sender(channel_events[0], digest_message(channel_events))
+            except Exception as e:
+                result = {"status": "error", "message": str(e)}
+            if result.get("status") == "error":
+                stats["failed"] += 1
+                logger.error(
+                    "notification_send_failed",
+                    channel=channel,
+                    user_id=channel_events[0].user_id,
+                    events=len(channel_events),
+                    error=result.get("message") or result.get("error"),
+                )
+            else:
+                stats["messages"] += 1
+
+        if requeue:
+            stats["requeued"] = len(requeue)
+            # Already passed the duplicate check; don't drop them next run
+            for event in requeue:
+                event.dedupe_key = None
+            self._requeue(client, requeue)
+        logger.info("notifications_dispatched", **stats)
+        return stats
+
+    def _take(self, client) -> List[NotificationEvent]:
+        raw: List[str] = []
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=True)
+                pipe.lrange(OUTBOX_KEY, 0, self.batch_size - 1)
+                pipe.ltrim(OUTBOX_KEY, self.batch_size, -1)
+                raw = pipe.execute()[0]
+            except Exception as e:
+                self._redis_unavailable(e)
+        events = []
+        for item in raw:
+            try:
+                events.append(NotificationEvent.from_json(item))
+            except Exception as e:
+                logger.error("notification_event_invalid", error=str(e))
+        with self._lock:
+            events.extend(self._local)
+            self._local = []
+        return events
+
+    def _requeue(self, client, events: List[NotificationEvent]):
+        if client is not None:
+            try:
+                # Back to the head, so they go out first next time
+                client.lpush(OUTBOX_KEY, *[e.to_json() for e in reversed(events)])
+                return
+            except Exception as e:
+                self._redis_unavailable(e)
+        with self._lock:
+            self._local[:0] = events
+            self._schedule_local_dispatch()
+
+    def _first_seen(self, client, event: NotificationEvent) -> bool:
+        if not event.dedupe_key or self.dedupe_window <= 0:
+            return True
+        key = f"notifications:dedupe:{event.channel}:{event.user_id}:{event.dedupe_key}"
+        if client is not None:
+            try:
+                return bool(client.set(key, "1", nx=True, ex=max(int(self.dedupe_window), 1)))
+            except Exception as e:
+                self._redis_unavailable(e)
+        now = time.time()
+        with self._lock:
+            expires_at = self._local_dedupe.get(key)
+            if expires_at is not None and expires_at > now:
+                return False
+            self._local_dedupe = {k: v for k, v in self._local_dedupe.items() if v > now}
+            self._local_dedupe[key] = now + self.dedupe_window
+        return True
+
+    @staticmethod
+    def _messages(events: List[NotificationEvent]) -> List[List[NotificationEvent]]:
+        """Group events into outgoing messages, oldest first."""
+        messages: List[List[NotificationEvent]] = []
+        digests: Dict[Tuple[str, str, Optional[str]], List[NotificationEvent]] = {}
+        for event in sorted(events, key=lambda e: e.created_at):
+            if not event.digest:
+                messages.append([event])
+                continue
+            group = digests.get(event.group_key)
+            if group is None:
+                group = digests[event.group_key] = []
+                messages.append(group)
+            group.append(event)
+        return messages
+
+    def _acquire(self, client, channel: str) -> bool:
+        limit = self.rate_limits.get(channel)
+        if not limit:
+            return True
+        window = int(time.time() // 60)
+        if client is not None:
+            try:
+                key = f"notifications:rate:{channel}:{window}"
+                pipe = client.pipeline(transaction=True)
+                pipe.incr(key)
+                pipe.expire(key, 120)
+                count = pipe.execute()[0]
+                return int(count) <= limit
+            except Exception as e:
+                self._redis_unavailable(e)
+        with self._lock:
+            count = self._local_sent.get((channel, window), 0) + 1
+            self._local_sent = {k: v for k, v in self._local_sent.items() if k[1] >= window}
+            self._local_sent[(channel, window)] = count
+        return count <= limit
+
+
+# Global instance shared by every producer in the process
+notification_outbox = NotificationOutbox()
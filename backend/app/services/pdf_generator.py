@@ -45,7 +45,9 @@ class PDFReportGenerator:
         execution_id: str,
         execution_data: Dict[str, Any],
         executive_summary: Optional[Dict[str, Any]] = None,
-        executive_report: Optional[Dict[str, Any]] = None
+        executive_report: Optional[Dict[str, Any]] = None,
+        state_hash: Optional[str] = None,
+        reuse_existing: bool = True
     ) -> str:
         """
         Generate PDF report for a pipeline execution.
@@ -54,11 +56,26 @@ class PDFReportGenerator:
             execution_id: Execution UUID
             execution_data: Complete execution data
             executive_summary: Optional AI-generated summary
+            state_hash: Optional hash of the execution's final state. When
+                given, the file is named after it and an existing file is
+                reused instead of rendering again.
+            reuse_existing: Set to False to re-render an existing file for
+                ``state_hash`` (e.g. it was rendered without the summary)
             
         Returns:
             Relative path to generated PDF file
         """
         try:
+            symbol = execution_data.get('symbol', 'unknown')
+            if state_hash:
+                filename = f"execution-report-{symbol}-{state_hash[:16]}.pdf"
+                if reuse_existing and (self.pdf_dir / filename).exists():
+                    logger.info("pdf_report_cache_hit", execution_id=execution_id, filename=filename)
+                    return f"reports/{filename}"
+            else:
+                timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+                filename = f"execution-report-{symbol}-{timestamp}.pdf"
+
             logger.info("generating_pdf_report", execution_id=execution_id)
             
             # Prepare template context
@@ -67,10 +84,6 @@ class PDFReportGenerator:
             # Render HTML from template
             html_content = self._render_template(context)
             
-            # Generate PDF filename
-            symbol = execution_data.get('symbol', 'unknown')
-            timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-            filename = f"execution-report-{symbol}-{timestamp}.pdf"
             filepath = self.pdf_dir / filename
             
             # Convert HTML to PDF
@@ -325,8 +338,11 @@ class PDFReportGenerator:
             }
         ''')
         
-        # Generate PDF
-        HTML(string=html_content).write_pdf(output_path, stylesheets=[css])
+        # Generate PDF (renamed into place so a crashed render never leaves a
+        # partial file behind under a content-addressed name)
+        tmp_path = output_path.with_suffix('.pdf.tmp')
+        HTML(string=html_content).write_pdf(tmp_path, stylesheets=[css])
+        os.replace(tmp_path, output_path)
     
     def _generate_fallback_html(self, context: Dict[str, Any]) -> str:
         """Generate simple HTML fallback if template is missing."""
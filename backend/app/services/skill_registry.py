@@ -3,7 +3,7 @@ First-party skill registry and runtime resolver.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from app.schemas.skill import AgentSkillAttachment, SkillDetail, SkillSummary
 from app.services.kb_loader import kb_loader
@@ -89,21 +89,37 @@ _HARDCODED_SKILLS: Dict[str, SkillDetail] = {
 }
 
 
-def _build_skill_registry() -> Dict[str, SkillDetail]:
+def _build_skill_registry(kb_skills: Iterable[SkillDetail]) -> Dict[str, SkillDetail]:
     registry = dict(_HARDCODED_SKILLS)
-    for kb_skill in kb_loader.load_kb_skill_definitions():
+    for kb_skill in kb_skills:
         registry.setdefault(kb_skill.skill_id, kb_skill)
     return registry
 
 
-SKILL_REGISTRY: Dict[str, SkillDetail] = _build_skill_registry()
+# (KB content hash, registry) — rebuilt only when the KB index changes
+_registry_cache: Tuple[str, Dict[str, SkillDetail]] | None = None
+
+
+def get_skill_registry() -> Dict[str, SkillDetail]:
+    """Skill ID -> skill, hardcoded skills first, then KB skills."""
+    global _registry_cache
+    index = kb_loader.index
+    cached = _registry_cache
+    if cached is None or cached[0] != index.content_hash:
+        cached = (index.content_hash, _build_skill_registry(index.skills))
+        _registry_cache = cached
+    return cached[1]
+
+
+# Compile the KB at import so worker processes start with a warm index
+get_skill_registry()
 
 
 class SkillRegistryService:
     """Provides catalog access and runtime resolution for agent skills."""
 
     def list_skills(self, agent_type: Optional[str] = None) -> List[SkillSummary]:
-        skills = list(SKILL_REGISTRY.values())
+        skills = list(get_skill_registry().values())
         if agent_type:
             skills = [skill for skill in skills if agent_type in skill.agent_types]
         return [
@@ -112,7 +128,7 @@ class SkillRegistryService:
         ]
 
     def get_skill(self, skill_id: str) -> Optional[SkillDetail]:
-        return SKILL_REGISTRY.get(skill_id)
+        return get_skill_registry().get(skill_id)
 
     def validate_attachments(
         self,
@@ -41,19 +41,48 @@ class TwilioSmsNotifier:
         Returns:
             Dict with message SID and status
         """
-        if not settings.TWILIO_ACCOUNT_SID or not settings.TWILIO_AUTH_TOKEN:
-            logger.warning("twilio_not_configured", msg="Skipping SMS — Twilio credentials not set")
-            return {"status": "skipped", "reason": "twilio_not_configured"}
+        body = TwilioSmsNotifier.approval_request_message(
+            symbol, action, confidence, position_size, entry_price, approval_url, timeout_minutes
+        )
+        return TwilioSmsNotifier.send_sms(to_phone, body, symbol=symbol)
 
+    @staticmethod
+    def approval_request_message(
+        symbol: str,
+        action: str,
+        confidence: Optional[float],
+        position_size: Optional[float],
+        entry_price: Optional[float],
+        approval_url: str,
+        timeout_minutes: int,
+    ) -> str:
+        """SMS body for send_approval_request."""
         conf_str = f" ({confidence * 100:.0f}% conf)" if confidence else ""
         size_str = f", {position_size:.0f} units" if position_size else ""
         price_str = f" @ ${entry_price:.2f}" if entry_price else ""
 
-        body = (
+        return (
             f"Trade approval: {action} {symbol}{price_str}{conf_str}{size_str}. "
             f"Approve/reject within {timeout_minutes}m: {approval_url}"
         )
 
+    @staticmethod
+    def send_sms(to_phone: str, body: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Send an SMS via Twilio.
+
+        Args:
+            to_phone: Recipient phone number (E.164 format)
+            body: Message text
+            symbol: Trading symbol, for logging
+
+        Returns:
+            Dict with message SID and status
+        """
+        if not settings.TWILIO_ACCOUNT_SID or not settings.TWILIO_AUTH_TOKEN:
+            logger.warning("twilio_not_configured", msg="Skipping SMS — Twilio credentials not set")
+            return {"status": "skipped", "reason": "twilio_not_configured"}
+
         try:
             from twilio.rest import Client
             client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
@@ -110,10 +110,26 @@ class TelegramNotifier:
         Returns:
             Dict with status
         """
+        message = TelegramNotifier.trade_alert_message(
+            symbol, action, entry_price, stop_loss, take_profit, position_size, pipeline_name
+        )
+        return TelegramNotifier.send_message(bot_token, chat_id, message)
+
+    @staticmethod
+    def trade_alert_message(
+        symbol: str,
+        action: str,
+        entry_price: float,
+        stop_loss: float,
+        take_profit: float,
+        position_size: float,
+        pipeline_name: Optional[str] = None
+    ) -> str:
+        """Message text for send_trade_alert."""
         emoji = "🟢" if action.upper() == "BUY" else "🔴"
         pipeline_info = f"\n📋 Pipeline: `{pipeline_name}`" if pipeline_name else ""
         
-        message = f"""{emoji} *Trade Executed*{pipeline_info}
+        return f"""{emoji} *Trade Executed*{pipeline_info}
 
 📊 Symbol: `{symbol}`
 🎯 Action: *{action.upper()}*
@@ -123,8 +139,6 @@ class TelegramNotifier:
 📦 Size: {position_size} units
 
 Good luck! 🚀"""
-        
-        return TelegramNotifier.send_message(bot_token, chat_id, message)
     
     @staticmethod
     def send_position_closed(
@@ -151,19 +165,31 @@ Good luck! 🚀"""
         Returns:
             Dict with status
         """
+        message = TelegramNotifier.position_closed_message(
+            symbol, pnl, pnl_percent, exit_reason, pipeline_name
+        )
+        return TelegramNotifier.send_message(bot_token, chat_id, message)
+
+    @staticmethod
+    def position_closed_message(
+        symbol: str,
+        pnl: float,
+        pnl_percent: float,
+        exit_reason: str,
+        pipeline_name: Optional[str] = None
+    ) -> str:
+        """Message text for send_position_closed."""
         emoji = "🎉" if pnl >= 0 else "😔"
         result_emoji = "✅" if pnl >= 0 else "❌"
         pipeline_info = f"\n📋 Pipeline: `{pipeline_name}`" if pipeline_name else ""
         
-        message = f"""{emoji} *Position Closed*{pipeline_info}
+        return f"""{emoji} *Position Closed*{pipeline_info}
 
 📊 Symbol: `{symbol}`
 {result_emoji} P&L: ${pnl:.2f} ({pnl_percent:+.2f}%)
 🏁 Reason: {exit_reason}
 
 {"Well done! 🎯" if pnl >= 0 else "Better luck next time! 💪"}"""
-        
-        return TelegramNotifier.send_message(bot_token, chat_id, message)
     
     @staticmethod
     def send_risk_rejection(
@@ -218,16 +244,24 @@ Your capital is protected! 🛡️"""
         Returns:
             Dict with status
         """
+        message = TelegramNotifier.pipeline_error_message(pipeline_name, error_message, symbol)
+        return TelegramNotifier.send_message(bot_token, chat_id, message)
+
+    @staticmethod
+    def pipeline_error_message(
+        pipeline_name: str,
+        error_message: str,
+        symbol: Optional[str] = None
+    ) -> str:
+        """Message text for send_pipeline_error."""
         symbol_info = f"\n📊 Symbol: `{symbol}`" if symbol else ""
         
-        message = f"""❌ *Pipeline Failed*
+        return f"""❌ *Pipeline Failed*
 
 📋 Pipeline: `{pipeline_name}`{symbol_info}
 ⚠️ Error: {error_message}
 
 Please check your pipeline configuration."""
-        
-        return TelegramNotifier.send_message(bot_token, chat_id, message)
     
     @staticmethod
     def send_test_message(
@@ -3,7 +3,15 @@ Tool Detection Service - LLM-powered analysis of user instructions
 
 This service analyzes user strategy instructions and automatically determines
 which tools are required to execute the strategy.
+
+Results are cached per worker (and shared through Redis) keyed by a hash of
+the detection prompt — instructions, agent type and attached skills — plus
+the model and tool registry, so re-validating unchanged instructions skips
+the LLM calls. Errors are never cached.
 """
+import asyncio
+import copy
+import hashlib
 import structlog
 from typing import Dict, Any, List, Optional
 import json
@@ -15,9 +23,25 @@ from app.tools.strategy_tools_registry import (
 )
 from app.services.skill_registry import skill_registry
 from app.services.llm_provider import create_openai_client, resolve_chat_model
+from app.services.worker_cache import WorkerCache
+from app.config import settings
 
 logger = structlog.get_logger()
 
+# Changes to tool definitions or pricing invalidate cached detections
+_TOOL_REGISTRY_DIGEST = hashlib.sha256(
+    json.dumps(STRATEGY_TOOL_REGISTRY, sort_keys=True, default=str).encode("utf-8")
+).hexdigest()[:16]
+
+_detection_cache = WorkerCache(
+    namespace="tool_detection",
+    ttl_seconds=settings.TOOL_DETECTION_CACHE_TTL_SECONDS,
+    max_entries=settings.TOOL_DETECTION_CACHE_MAX_ENTRIES,
+    redis_url=settings.REDIS_URL,
+    shared=True,
+    version_check_seconds=settings.WORKER_CACHE_VERSION_CHECK_SECONDS,
+)
+
 
 class ToolDetectionService:
     """
@@ -87,10 +111,27 @@ class ToolDetectionService:
                 "total_cost": 0.0
             }
         
+        # Build the analysis prompt
+        prompt = self._build_detection_prompt(instructions, agent_type, attached_skills or [])
+        cache_key = self._cache_key(prompt, agent_type)
+        cached = await asyncio.to_thread(_detection_cache.get, cache_key)
+        if cached is not None:
+            logger.info("tool_detection_cache_hit", agent_type=agent_type)
+            # Callers adjust the result in place; never hand out the cached dict
+            return {**copy.deepcopy(cached), "llm_cost": 0.0, "cached": True}
+
+        result = await self._detect(instructions, agent_type, prompt)
+        if result.get("status") in ("success", "partial"):
+            await asyncio.to_thread(_detection_cache.set, cache_key, copy.deepcopy(result))
+        return result
+
+    def _cache_key(self, prompt: str, agent_type: str) -> str:
+        payload = "\x1f".join([self.model, agent_type, _TOOL_REGISTRY_DIGEST, prompt])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _detect(self, instructions: str, agent_type: str, prompt: str) -> Dict[str, Any]:
+        """Run the LLM detection for an already built prompt."""
         try:
-            # Build the analysis prompt
-            prompt = self._build_detection_prompt(instructions, agent_type, attached_skills or [])
-            
             # Call LLM with function calling
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -0,0 +1,222 @@
+"""
+Background export of trace events.
+
+LLM generations, tool calls and scores are recorded from agent hot paths.
+Instead of calling the tracing backend inline, callers submit a
+``TraceEvent`` to the process-wide ``trace_exporter``, which only enqueues:
+
+  - The queue is bounded (``TRACE_EXPORT_QUEUE_SIZE``). Past half full,
+    low-priority events (tool calls) are sampled at
+    ``TRACE_EXPORT_SAMPLE_RATE_UNDER_PRESSURE``; when full, events are
+    dropped and counted. ``submit`` never blocks.
+  - A daemon thread drains the queue in batches of up to
+    ``TRACE_EXPORT_BATCH_SIZE`` every ``TRACE_EXPORT_FLUSH_INTERVAL_SECONDS``
+    and hands them to the sinks: Langfuse (the event's ``emit`` callable,
+    run in a copy of the submitter's context so spans keep their parents)
+    and, if ``TRACE_EXPORT_FILE_PATH`` is set, a JSON-lines file for
+    offline runs.
+  - ``flush`` asks the thread to drain and flush the Langfuse client;
+    callers only wait for it when they pass a timeout.
+
+The thread is started on first use and restarted after a fork, so Celery
+prefork children each get their own. Queued events are drained at exit,
+and in Celery children (which skip atexit) on ``worker_process_shutdown``.
+"""
+from __future__ import annotations
+
+import atexit
+import contextvars
+import json
+import os
+import queue
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Sampled first when the queue is under pressure
+LOW_PRIORITY_KINDS = {"tool"}
+
+
+@dataclass
+class TraceEvent:
+    kind: str
+    # JSON-safe summary, written by the file sink
+    record: Dict[str, Any]
+    # Langfuse call, run on the exporter thread
+    emit: Optional[Callable[[], Any]] = None
+    context: Optional[contextvars.Context] = None
+    created_at: float = field(default_factory=time.time)
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class TraceExporter:
+    """Bounded, non-blocking trace event queue with a batching exporter thread."""
+
+    def __init__(
+        self,
+        *,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        sample_rate: Optional[float] = None,
+        file_path: Optional[str] = None,
+    ):
+        self.queue_size = queue_size or settings.TRACE_EXPORT_QUEUE_SIZE
+        self.batch_size = batch_size or settings.TRACE_EXPORT_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.TRACE_EXPORT_FLUSH_INTERVAL_SECONDS
+        self.sample_rate = (
+            settings.TRACE_EXPORT_SAMPLE_RATE_UNDER_PRESSURE if sample_rate is None else sample_rate
+        )
+        self.file_path = file_path if file_path is not None else settings.TRACE_EXPORT_FILE_PATH
+        self.stats = {"submitted": 0, "exported": 0, "sampled_out": 0, "dropped": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def file_sink_enabled(self) -> bool:
+        return bool(self.file_path)
+
+    def _ensure_started(self):
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+                return
+            if self._pid != os.getpid():
+                # Forked: the parent's queue and thread don't exist here
+                self._queue = queue.Queue(maxsize=self.queue_size)
+                self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+            self._thread.start()
+
+    def submit(self, event: TraceEvent) -> bool:
+        """Enqueue an event; returns False if it was sampled out or dropped."""
+        self._ensure_started()
+        if event.kind in LOW_PRIORITY_KINDS and self._queue.qsize() >= self.queue_size // 2:
+            if random.random() >= self.sample_rate:
+                self.stats["sampled_out"] += 1
+                return False
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.stats["dropped"] += 1
+            dropped = self.stats["dropped"]
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning("trace_export_queue_full", dropped=dropped, queue_size=self.queue_size)
+            return False
+        self.stats["submitted"] += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Ask the exporter to drain the queue and flush the tracing client.
+
+        Args:
+            timeout: Seconds to wait for the flush; None returns immediately
+
+        Returns:
+            True if the flush completed within ``timeout``
+        """
+        self._ensure_started()
+        request = _FlushRequest()
+        try:
+            if timeout:
+                self._queue.put(request, timeout=timeout)
+            else:
+                self._queue.put_nowait(request)
+        except queue.Full:
+            return False
+        if not timeout:
+            return False
+        return request.done.wait(timeout)
+
+    def _run(self):
+        queue_ = self._queue
+        while True:
+            batch: List[TraceEvent] = []
+            flushes: List[_FlushRequest] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = queue_.get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    break
+                if isinstance(item, _FlushRequest):
+                    flushes.append(item)
+                    break
+                batch.append(item)
+
+            if batch:
+                self._export(batch)
+            if flushes:
+                self._flush_client()
+                for request in flushes:
+                    request.done.set()
+
+    def _export(self, batch: List[TraceEvent]):
+        if self.file_path:
+            self._write_file(batch)
+        for event in batch:
+            if event.emit is None:
+                continue
+            try:
+                if event.context is not None:
+                    event.context.run(event.emit)
+                else:
+                    event.emit()
+                self.stats["exported"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                logger.warning("trace_export_failed", kind=event.kind, error=str(e))
+
+    def _write_file(self, batch: List[TraceEvent]):
+        lines = []
+        for event in batch:
+            record = {
+                "ts": datetime.utcfromtimestamp(event.created_at).isoformat() + "Z",
+                "kind": event.kind,
+                **event.record,
+            }
+            lines.append(json.dumps(record, default=str))
+        try:
+            directory = os.path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.file_path, "a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+        except OSError as e:
+            self.stats["failed"] += len(batch)
+            logger.warning("trace_export_file_failed", path=self.file_path, error=str(e))
+
+    @staticmethod
+    def _flush_client():
+        from app.services.langfuse_service import get_langfuse_client, safe_langfuse_operation
+
+        client = get_langfuse_client()
+        if client is not None and hasattr(client, "flush"):
+            safe_langfuse_operation("flush", client.flush)
+
+    def close(self, timeout: float = 5.0):
+        """Drain what is queued (bounded by ``timeout``), e.g. at exit."""
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            return
+        self.flush(timeout=timeout)
+
+
+trace_exporter = TraceExporter()
+atexit.register(trace_exporter.close)
@@ -0,0 +1,206 @@
+"""
+Worker Cache
+
+Process-wide TTL/LRU cache for data that is expensive to produce and rarely
+changes between pipeline runs (model registry rows, tool detection results).
+
+- Entries live in the worker process and expire after ``ttl_seconds``; the
+  least recently used ones are evicted past ``max_entries``.
+- With a Redis URL, every cache has a generation counter in Redis.
+  ``invalidate()`` bumps it, and other processes notice within
+  ``version_check_seconds`` and drop their entries — e.g. after model
+  pricing is updated.
+- ``shared=True`` also mirrors JSON-serializable values to Redis, so a
+  result computed by one worker is reused by the others.
+
+Redis errors never fail a lookup; the cache just stays process-local.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+_MISSING = object()
+
+
+class WorkerCache:
+    """Thread-safe TTL + LRU cache with cluster-wide invalidation."""
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float,
+        max_entries: int = 256,
+        redis_url: Optional[str] = None,
+        shared: bool = False,
+        version_check_seconds: float = 15.0,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.redis_url = redis_url
+        self.shared = shared and bool(redis_url)
+        self.version_check_seconds = version_check_seconds
+
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generation = 0
+        self._generation_checked_at = 0.0
+        self._redis = None
+        self._redis_failed_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for ``key``, or ``default``."""
+        self._check_generation()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+        if self.shared:
+            value = self._redis_get(key)
+            if value is not _MISSING:
+                self._store(key, value)
+                return value
+        return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._store(key, value)
+        if self.shared:
+            self._redis_set(key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Cached value for ``key``, calling ``loader`` on a miss.
+
+        Concurrent misses in the same process wait for one load. Exceptions
+        from ``loader`` propagate and nothing is cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._load_lock:
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                value = loader()
+                self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop this process's entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def invalidate(self) -> None:
+        """Drop cached values in every process sharing this cache."""
+        self.clear()
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            generation = int(client.incr(self._generation_key()))
+        except Exception as e:
+            self._redis_unavailable("worker_cache_invalidate_failed", e)
+            return
+        with self._lock:
+            self._generation = generation
+            self._generation_checked_at = time.monotonic()
+        logger.info("worker_cache_invalidated", namespace=self.namespace, generation=generation)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Redis generation + optional value mirror
+    # ------------------------------------------------------------------
+
+    def _check_generation(self) -> None:
+        if not self.redis_url:
+            return
+        now = time.monotonic()
+        if now - self._generation_checked_at < self.version_check_seconds:
+            return
+        self._generation_checked_at = now
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            generation = int(client.get(self._generation_key()) or 0)
+        except Exception as e:
+            self._redis_unavailable("worker_cache_generation_check_failed", e)
+            return
+        with self._lock:
+            if generation != self._generation:
+                self._generation = generation
+                self._entries.clear()
+
+    def _generation_key(self) -> str:
+        return f"worker_cache:{self.namespace}:generation"
+
+    def _value_key(self, key: Hashable) -> str:
+        return f"worker_cache:{self.namespace}:{self._generation}:{key}"
+
+    def _get_redis(self):
+        if not self.redis_url:
+            return None
+        # Don't retry a dead Redis on every lookup
+        if self._redis_failed_at and time.monotonic() - self._redis_failed_at < self.version_check_seconds:
+            return None
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._redis
+
+    def _redis_unavailable(self, event: str, error: Exception) -> None:
+        self._redis_failed_at = time.monotonic()
+        logger.warning(event, namespace=self.namespace, error=str(error))
+
+    def _redis_get(self, key: Hashable) -> Any:
+        client = self._get_redis()
+        if client is None:
+            return _MISSING
+        try:
+            raw = client.get(self._value_key(key))
+        except Exception as e:
+            self._redis_unavailable("worker_cache_redis_read_failed", e)
+            return _MISSING
+        return _MISSING if raw is None else json.loads(raw)
+
+    def _redis_set(self, key: Hashable, value: Any) -> None:
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            client.set(
+                self._value_key(key),
+                json.dumps(value, default=str),
+                px=int(self.ttl_seconds * 1000),
+            )
+        except Exception as e:
+            self._redis_unavailable("worker_cache_redis_write_failed", e)
@@ -9,6 +9,8 @@ In ICT trading:
 import structlog
 from typing import List, Dict, Any, Optional
 
+from app.utils.market_structure import liquidity_grabs, ohlc_arrays, swing_points
+
 logger = structlog.get_logger()
 
 
@@ -70,16 +72,21 @@ class LiquidityAnalyzer:
             return self._empty_result()
         
         candles_to_analyze = candles[-self.lookback_periods:]
+        high, low, close = ohlc_arrays(candles_to_analyze, ("high", "low", "close"))
         
         # 1. Detect swing highs and swing lows
-        swing_highs = self._detect_swing_highs(candles_to_analyze)
-        swing_lows = self._detect_swing_lows(candles_to_analyze)
+        swing_high_idx, swing_low_idx = swing_points(high, low, self.swing_strength)
+        swing_highs = self._swing_list(candles_to_analyze, swing_high_idx, "high")
+        swing_lows = self._swing_list(candles_to_analyze, swing_low_idx, "low")
         
         # 2. Detect liquidity grabs
-        liquidity_grabs = self._detect_liquidity_grabs(
+        grabs = self._detect_liquidity_grabs(
             candles_to_analyze,
-            swing_highs,
-            swing_lows
+            high,
+            low,
+            close,
+            swing_high_idx,
+            swing_low_idx
         )
         
         # 3. Identify active (unfilled) liquidity pools
@@ -87,19 +94,19 @@ class LiquidityAnalyzer:
         active_pools = self._get_active_pools(
             swing_highs,
             swing_lows,
-            liquidity_grabs,
+            grabs,
             current_price
         )
         
-        latest_grab = liquidity_grabs[-1] if liquidity_grabs else None
+        latest_grab = grabs[-1] if grabs else None
         
         result = {
             "swing_highs": swing_highs,
             "swing_lows": swing_lows,
-            "liquidity_grabs": liquidity_grabs,
+            "liquidity_grabs": grabs,
             "latest_grab": latest_grab,
             "active_liquidity_pools": active_pools,
-            "total_grabs": len(liquidity_grabs),
+            "total_grabs": len(grabs),
             "timeframe": self.timeframe
         }
         
@@ -108,135 +115,58 @@ class LiquidityAnalyzer:
             timeframe=self.timeframe,
             swing_highs=len(swing_highs),
             swing_lows=len(swing_lows),
-            grabs=len(liquidity_grabs)
+            grabs=len(grabs)
         )
         
         return result
     
-    def _detect_swing_highs(self, candles: List[Dict]) -> List[Dict]:
-        """
-        Detect swing highs: A candle high that is higher than N candles before and after.
+    def _swing_list(self, candles: List[Dict], indices, price_key: str) -> List[Dict]:
         """
-        swing_highs = []
-        n = self.swing_strength
-        
-        for i in range(n, len(candles) - n):
-            current_high = candles[i]["high"]
-            
-            # Check if this high is higher than all surrounding candles
-            is_swing = True
-            for j in range(i - n, i + n + 1):
-                if j == i:
-                    continue
-                if candles[j]["high"] >= current_high:
-                    is_swing = False
-                    break
-            
-            if is_swing:
-                swing_highs.append({
-                    "price": current_high,
-                    "timestamp": candles[i].get("timestamp", ""),
-                    "index": i
-                })
-        
-        return swing_highs
-    
-    def _detect_swing_lows(self, candles: List[Dict]) -> List[Dict]:
+        Swing points as {price, timestamp, index} dicts. A swing high is a candle
+        high above the N candles before and after (swing lows mirror it).
         """
-        Detect swing lows: A candle low that is lower than N candles before and after.
-        """
-        swing_lows = []
-        n = self.swing_strength
-        
-        for i in range(n, len(candles) - n):
-            current_low = candles[i]["low"]
-            
-            # Check if this low is lower than all surrounding candles
-            is_swing = True
-            for j in range(i - n, i + n + 1):
-                if j == i:
-                    continue
-                if candles[j]["low"] <= current_low:
-                    is_swing = False
-                    break
-            
-            if is_swing:
-                swing_lows.append({
-                    "price": current_low,
-                    "timestamp": candles[i].get("timestamp", ""),
-                    "index": i
-                })
-        
-        return swing_lows
+        return [
+            {
+                "price": candles[i][price_key],
+                "timestamp": candles[i].get("timestamp", ""),
+                "index": i
+            }
+            for i in indices.tolist()
+        ]
     
     def _detect_liquidity_grabs(
         self,
         candles: List[Dict],
-        swing_highs: List[Dict],
-        swing_lows: List[Dict]
+        high,
+        low,
+        close,
+        swing_high_idx,
+        swing_low_idx
     ) -> List[Dict]:
         """
         Detect liquidity grabs: when price quickly spikes through a swing level and reverses.
-        """
-        grabs = []
-        
-        # Check for buy-side liquidity grabs (spike above swing high)
-        for swing_high in swing_highs:
-            swing_index = swing_high["index"]
-            swing_price = swing_high["price"]
-            
-            # Look for candles after the swing that spike above it
-            for i in range(swing_index + 1, len(candles)):
-                candle = candles[i]
-                
-                # Did this candle spike above the swing high?
-                if candle["high"] > swing_price:
-                    distance_pips = (candle["high"] - swing_price) * 100
-                    
-                    if distance_pips >= self.grab_threshold_pips:
-                        # Check if price reversed (closed below the level)
-                        reversed = candle["close"] < swing_price
-                        
-                        grabs.append({
-                            "type": "buy_side",
-                            "level": swing_price,
-                            "grabbed_at": candle.get("timestamp", ""),
-                            "grab_candle_index": i,
-                            "distance_pips": round(distance_pips, 2),
-                            "reversed": reversed
-                        })
-                        
-                        break  # Only count first grab of this level
-        
-        # Check for sell-side liquidity grabs (spike below swing low)
-        for swing_low in swing_lows:
-            swing_index = swing_low["index"]
-            swing_price = swing_low["price"]
-            
-            for i in range(swing_index + 1, len(candles)):
-                candle = candles[i]
-                
-                if candle["low"] < swing_price:
-                    distance_pips = (swing_price - candle["low"]) * 100
-                    
-                    if distance_pips >= self.grab_threshold_pips:
-                        reversed = candle["close"] > swing_price
-                        
-                        grabs.append({
-                            "type": "sell_side",
-                            "level": swing_price,
-                            "grabbed_at": candle.get("timestamp", ""),
-                            "grab_candle_index": i,
-                            "distance_pips": round(distance_pips, 2),
-                            "reversed": reversed
-                        })
-                        
-                        break
         
-        # Sort by index
-        grabs.sort(key=lambda x: x["grab_candle_index"])
-        
-        return grabs
+        Only the first spike of at least ``grab_threshold_pips`` through each level counts.
+        """
+        return [
+            {
+                "type": grab["type"],
+                "level": grab["level"],
+                "grabbed_at": candles[grab["candle_index"]].get("timestamp", ""),
+                "grab_candle_index": grab["candle_index"],
+                "distance_pips": round(grab["distance"], 2),
+                "reversed": grab["reversed"]
+            }
+            for grab in liquidity_grabs(
+                high,
+                low,
+                close,
+                swing_high_idx,
+                swing_low_idx,
+                min_distance=self.grab_threshold_pips,
+                pip_multiplier=100
+            )
+        ]
     
     def _get_active_pools(
         self,
@@ -9,6 +9,8 @@ In ICT trading:
 import structlog
 from typing import List, Dict, Any, Optional
 
+from app.utils.market_structure import ohlc_arrays, structure_events, swing_points
+
 logger = structlog.get_logger()
 
 
@@ -68,10 +70,12 @@ class MarketStructureAnalyzer:
             return self._empty_result()
         
         candles_to_analyze = candles[-self.lookback_periods:]
+        high, low, close = ohlc_arrays(candles_to_analyze, ("high", "low", "close"))
         
         # 1. Detect swing points
-        swing_highs = self._detect_swing_highs(candles_to_analyze)
-        swing_lows = self._detect_swing_lows(candles_to_analyze)
+        swing_high_idx, swing_low_idx = swing_points(high, low, self.swing_strength)
+        swing_highs = self._swing_list(candles_to_analyze, swing_high_idx, "high")
+        swing_lows = self._swing_list(candles_to_analyze, swing_low_idx, "low")
         
         # 2. Analyze swing patterns (HH, HL, LH, LL)
         swing_patterns = self._analyze_swing_patterns(swing_highs, swing_lows)
@@ -79,8 +83,11 @@ class MarketStructureAnalyzer:
         # 3. Detect structure breaks (BOS, CHoCH)
         structure_events = self._detect_structure_breaks(
             candles_to_analyze,
-            swing_highs,
-            swing_lows,
+            high,
+            low,
+            close,
+            swing_high_idx,
+            swing_low_idx,
             swing_patterns
         )
         
@@ -113,51 +120,16 @@ class MarketStructureAnalyzer:
         
         return result
     
-    def _detect_swing_highs(self, candles: List[Dict]) -> List[Dict]:
-        """Detect swing highs."""
-        swing_highs = []
-        n = self.swing_strength
-        
-        for i in range(n, len(candles) - n):
-            current_high = candles[i]["high"]
-            
-            is_swing = all(
-                candles[j]["high"] < current_high
-                for j in range(i - n, i + n + 1)
-                if j != i
-            )
-            
-            if is_swing:
-                swing_highs.append({
-                    "price": current_high,
-                    "timestamp": candles[i].get("timestamp", ""),
-                    "index": i
-                })
-        
-        return swing_highs
-    
-    def _detect_swing_lows(self, candles: List[Dict]) -> List[Dict]:
-        """Detect swing lows."""
-        swing_lows = []
-        n = self.swing_strength
-        
-        for i in range(n, len(candles) - n):
-            current_low = candles[i]["low"]
-            
-            is_swing = all(
-                candles[j]["low"] > current_low
-                for j in range(i - n, i + n + 1)
-                if j != i
-            )
-            
-            if is_swing:
-                swing_lows.append({
-                    "price": current_low,
-                    "timestamp": candles[i].get("timestamp", ""),
-                    "index": i
-                })
-        
-        return swing_lows
+    def _swing_list(self, candles: List[Dict], indices, price_key: str) -> List[Dict]:
+        """Swing points as {price, timestamp, index} dicts."""
+        return [
+            {
+                "price": candles[i][price_key],
+                "timestamp": candles[i].get("timestamp", ""),
+                "index": i
+            }
+            for i in indices.tolist()
+        ]
     
     def _analyze_swing_patterns(
         self,
@@ -197,8 +169,11 @@ class MarketStructureAnalyzer:
     def _detect_structure_breaks(
         self,
         candles: List[Dict],
-        swing_highs: List[Dict],
-        swing_lows: List[Dict],
+        high,
+        low,
+        close,
+        swing_high_idx,
+        swing_low_idx,
         swing_patterns: Dict[str, int]
     ) -> List[Dict]:
         """
@@ -212,8 +187,6 @@ class MarketStructureAnalyzer:
         - Bullish CHoCH: Price breaks above swing high while in downtrend
         - Bearish CHoCH: Price breaks below swing low while in uptrend
         """
-        events = []
-        
         # Simple trend detection based on swing patterns
         bullish_bias = (
             swing_patterns["higher_highs"] + swing_patterns["higher_lows"]
@@ -221,64 +194,16 @@ class MarketStructureAnalyzer:
             swing_patterns["lower_highs"] + swing_patterns["lower_lows"]
         )
         
-        current_trend = "bullish" if bullish_bias else "bearish"
-        
-        # Check for breaks of swing highs
-        for swing_high in swing_highs:
-            swing_index = swing_high["index"]
-            swing_price = swing_high["price"]
-            
-            for i in range(swing_index + 1, len(candles)):
-                candle = candles[i]
-                
-                # Price broke above swing high
-                if candle["close"] > swing_price:
-                    # BOS if in uptrend, CHoCH if in downtrend
-                    event_type = "BOS" if current_trend == "bullish" else "CHoCH"
-                    
-                    events.append({
-                        "type": event_type,
-                        "direction": "bullish",
-                        "level": swing_price,
-                        "timestamp": candle.get("timestamp", ""),
-                        "candle_index": i
-                    })
-                    
-                    # Update trend if CHoCH
-                    if event_type == "CHoCH":
-                        current_trend = "bullish"
-                    
-                    break
-        
-        # Check for breaks of swing lows
-        for swing_low in swing_lows:
-            swing_index = swing_low["index"]
-            swing_price = swing_low["price"]
-            
-            for i in range(swing_index + 1, len(candles)):
-                candle = candles[i]
-                
-                # Price broke below swing low
-                if candle["close"] < swing_price:
-                    event_type = "BOS" if current_trend == "bearish" else "CHoCH"
-                    
-                    events.append({
-                        "type": event_type,
-                        "direction": "bearish",
-                        "level": swing_price,
-                        "timestamp": candle.get("timestamp", ""),
-                        "candle_index": i
-                    })
-                    
-                    if event_type == "CHoCH":
-                        current_trend = "bearish"
-                    
-                    break
-        
-        # Sort by candle index
-        events.sort(key=lambda x: x["candle_index"])
-        
-        return events
+        return [
+            {
+                "type": event["type"],
+                "direction": event["direction"],
+                "level": event["level"],
+                "timestamp": candles[event["candle_index"]].get("timestamp", ""),
+                "candle_index": event["candle_index"]
+            }
+            for event in structure_events(close, swing_high_idx, swing_low_idx, high, low, bullish_bias)
+        ]
     
     def _determine_trend(
         self,
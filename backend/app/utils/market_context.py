@@ -9,6 +9,7 @@ commented-out TODO blocks for VIX spike, SPY crash, and news detection.
 """
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Optional
 
@@ -37,6 +38,34 @@ class MarketSnapshot:
     error: Optional[str] = None           # Set if data fetch failed
 
 
+async def _get_quotes(symbols: list[str], client: httpx.AsyncClient) -> dict:
+    """
+    Fetch quotes from the Data Plane's live quote table in one request.
+
+    The live endpoint serves the streamed in-memory quotes and keeps the
+    requested symbols streamed, so repeated snapshots cost no provider
+    calls. Symbols it doesn't know yet fall back to the on-demand
+    ``/quote/{symbol}`` endpoint.
+    """
+    quotes: dict = {}
+    try:
+        resp = await client.get(
+            f"{_DATA_PLANE_URL}/api/v1/data/quotes/live",
+            params={"tickers": ",".join(symbols)},
+            timeout=5.0,
+        )
+        if resp.is_success:
+            quotes = resp.json().get("quotes") or {}
+    except Exception as exc:
+        logger.debug("market_context_live_quotes_failed", symbols=symbols, error=str(exc))
+
+    missing = [s for s in symbols if not isinstance(quotes.get(s), dict)]
+    if missing:
+        fetched = await asyncio.gather(*(_get_quote(s, client) for s in missing))
+        quotes.update({s: q for s, q in zip(missing, fetched) if q is not None})
+    return quotes
+
+
 async def _get_quote(symbol: str, client: httpx.AsyncClient) -> Optional[dict]:
     """Fetch a single quote from the Data Plane."""
     try:
@@ -61,12 +90,8 @@ async def get_market_snapshot() -> MarketSnapshot:
     """
     try:
         async with httpx.AsyncClient(timeout=5.0) as client:
-            import asyncio
-            vix_data, spy_data = await asyncio.gather(
-                _get_quote("VIX", client),
-                _get_quote("SPY", client),
-                return_exceptions=True,
-            )
+            quotes = await _get_quotes(["VIX", "SPY"], client)
+        vix_data, spy_data = quotes.get("VIX"), quotes.get("SPY")
 
         snap = MarketSnapshot()
 
@@ -5,6 +5,11 @@ Provides real-time updates for pipeline executions via WebSocket connections.
 """
 
 from app.websocket.manager import ConnectionManager, get_connection_manager
-
-__all__ = ["ConnectionManager", "get_connection_manager"]
-
+from app.websocket.event_bus import ExecutionEventRelay, publish_execution_event
+
+__all__ = [
+    "ConnectionManager",
+    "get_connection_manager",
+    "ExecutionEventRelay",
+    "publish_execution_event",
+]
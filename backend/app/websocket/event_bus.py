@@ -0,0 +1,179 @@
+"""
+Execution Event Bus
+
+Carries execution events from Celery workers to every API replica over
+Redis pub/sub, so WebSocket clients get pushed deltas instead of polling.
+
+- Workers call ``publish_execution_event`` (sync, best-effort: a Redis
+  outage never fails an execution, it only stops the push updates).
+- Each API process runs one ``ExecutionEventRelay`` that subscribes to the
+  channels of users with an open socket on *this* replica and hands the
+  messages to the local ``ConnectionManager``.
+
+Channel per user: ``execution_events:{user_id}``. Message envelope::
+
+    {"type": "execution_update" | "execution_log" | "execution_pnl" | "execution_complete",
+     "execution_id": "...", "data": {...}, "ts": "2026-04-28T14:30:00"}
+"""
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+from uuid import UUID
+
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+CHANNEL_PREFIX = "execution_events:"
+PUBLISH_RETRY_SECONDS = 30.0  # Back off publishing after a Redis failure
+RELAY_RECONNECT_SECONDS = 5.0
+
+_publisher = None
+_publisher_retry_at = 0.0
+
+
+def channel_for_user(user_id: Any) -> str:
+    return f"{CHANNEL_PREFIX}{user_id}"
+
+
+def _get_publisher():
+    global _publisher
+    if _publisher is None:
+        import redis
+
+        _publisher = redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return _publisher
+
+
+def publish_execution_event(
+    user_id: Any,
+    execution_id: Any,
+    event_type: str,
+    data: Dict[str, Any],
+) -> None:
+    """
+    Publish one execution event for the user's WebSocket clients.
+
+    Best-effort and synchronous (called from Celery workers). After a Redis
+    error, publishing is skipped for ``PUBLISH_RETRY_SECONDS`` so a Redis
+    outage doesn't add a connect timeout to every execution step.
+
+    Args:
+        user_id: Owner of the execution
+        execution_id: Execution the event is about
+        event_type: execution_update, execution_log, execution_pnl or execution_complete
+        data: JSON-serializable payload
+    """
+    global _publisher_retry_at
+    if not settings.EXECUTION_EVENTS_ENABLED or time.monotonic() < _publisher_retry_at:
+        return
+
+    message = json.dumps(
+        {
+            "type": event_type,
+            "execution_id": str(execution_id),
+            "data": data,
+            "ts": datetime.utcnow().isoformat(),
+        },
+        default=str,
+    )
+    try:
+        _get_publisher().publish(channel_for_user(user_id), message)
+    except Exception as e:
+        _publisher_retry_at = time.monotonic() + PUBLISH_RETRY_SECONDS
+        logger.warning("execution_event_publish_failed", event_type=event_type, error=str(e))
+
+
+class ExecutionEventRelay:
+    """
+    Subscribes this API replica to the channels of its connected users and
+    forwards every message to the ``ConnectionManager``.
+
+    The manager calls ``watch_user``/``unwatch_user`` as a user's first
+    socket opens and last socket closes. Subscriptions are restored after a
+    Redis reconnect.
+    """
+
+    def __init__(self, manager, redis_url: Optional[str] = None):
+        self.manager = manager
+        self.redis_url = redis_url or settings.REDIS_URL
+        self._users: Set[str] = set()
+        self._pubsub = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("execution_event_relay_started")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("execution_event_relay_stopped")
+
+    async def watch_user(self, user_id: str) -> None:
+        self._users.add(user_id)
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.subscribe(channel_for_user(user_id))
+            except Exception as e:
+                # _run re-subscribes everyone in _users after reconnecting
+                logger.warning("execution_event_subscribe_failed", user_id=user_id, error=str(e))
+
+    async def unwatch_user(self, user_id: str) -> None:
+        self._users.discard(user_id)
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(channel_for_user(user_id))
+            except Exception as e:
+                logger.warning("execution_event_unsubscribe_failed", user_id=user_id, error=str(e))
+
+    async def _run(self) -> None:
+        import redis.asyncio as aioredis
+
+        while True:
+            client = aioredis.from_url(self.redis_url, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                # Listening needs at least one subscription; the control
+                # channel is never published to
+                await pubsub.subscribe(f"{CHANNEL_PREFIX}_relay", *[channel_for_user(u) for u in self._users])
+                self._pubsub = pubsub
+                async for raw in pubsub.listen():
+                    if raw.get("type") != "message":
+                        continue
+                    await self._dispatch(raw["channel"], raw["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("execution_event_relay_disconnected", error=str(e))
+            finally:
+                self._pubsub = None
+                try:
+                    await pubsub.close()
+                    await client.close()
+                except Exception:
+                    pass
+            await asyncio.sleep(RELAY_RECONNECT_SECONDS)
+
+    async def _dispatch(self, channel: str, data: str) -> None:
+        try:
+            message = json.loads(data)
+            user_id = UUID(channel[len(CHANNEL_PREFIX):])
+        except (ValueError, TypeError) as e:
+            logger.warning("execution_event_malformed", channel=channel, error=str(e))
+            return
+        self.manager.dispatch_event(user_id, message)
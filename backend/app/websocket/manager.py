@@ -2,15 +2,85 @@
 WebSocket Connection Manager
 
 Manages WebSocket connections for real-time pipeline execution updates.
+
+Every socket gets an ``_Outbox`` drained by its own task, so one slow
+client never stalls delivery to the others:
+
+- Status and P&L messages are coalesced per execution — a client that
+  falls behind receives only the latest value.
+- Everything else queues up to ``WEBSOCKET_OUTBOX_MAX_MESSAGES``; beyond
+  that the oldest messages are dropped and the client is sent a ``resync``
+  message telling it to refetch over REST.
+- A client that doesn't accept a message within
+  ``WEBSOCKET_SEND_TIMEOUT_SECONDS`` is disconnected.
+
+Events published by Celery workers reach the manager through the
+``ExecutionEventRelay`` (see ``app.websocket.event_bus``).
 """
+import asyncio
 import structlog
-from typing import Dict, List, Set
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Dict, Hashable, List, Optional, Set
 from uuid import UUID
 from fastapi import WebSocket
-import json
+
+from app.config import settings
 
 logger = structlog.get_logger()
 
+# Message types where only the latest value per execution matters
+COALESCED_TYPES = {"execution_update", "execution_pnl"}
+
+
+class _Outbox:
+    """Per-socket send queue with coalescing and a size bound."""
+
+    def __init__(self, websocket: WebSocket, on_failure, max_messages: int, send_timeout: float):
+        self.websocket = websocket
+        self.max_messages = max_messages
+        self.send_timeout = send_timeout
+        self.dropped = 0
+        self._on_failure = on_failure
+        self._pending: "OrderedDict[Hashable, dict]" = OrderedDict()
+        self._sequence = count()
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._drain())
+
+    def push(self, message: dict, coalesce_key: Optional[Hashable] = None) -> None:
+        if coalesce_key is not None and coalesce_key in self._pending:
+            # Keep the queue position, replace with the newest value
+            self._pending[coalesce_key] = message
+            return
+        self._pending[coalesce_key if coalesce_key is not None else next(self._sequence)] = message
+        while len(self._pending) > self.max_messages:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+        self._ready.set()
+
+    def close(self) -> None:
+        self._task.cancel()
+
+    async def _drain(self) -> None:
+        while True:
+            await self._ready.wait()
+            if self.dropped:
+                message = {"type": "resync", "dropped": self.dropped}
+                self.dropped = 0
+            elif self._pending:
+                _, message = self._pending.popitem(last=False)
+            else:
+                self._ready.clear()
+                continue
+            try:
+                await asyncio.wait_for(self.websocket.send_json(message), timeout=self.send_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("websocket_send_failed", error=str(e) or type(e).__name__)
+                self._on_failure(self.websocket)
+                return
+
 
 class ConnectionManager:
     """
@@ -21,14 +91,24 @@ class ConnectionManager:
     - Pipeline-specific subscriptions
     - Broadcast to multiple clients
     - Connection lifecycle management
+    - Per-connection backpressure (see module docstring)
     """
     
-    def __init__(self):
+    def __init__(self, max_outbox_messages: Optional[int] = None, send_timeout: Optional[float] = None):
         # user_id -> List[WebSocket]
         self.active_connections: Dict[str, List[WebSocket]] = {}
         
         # execution_id -> Set[user_id] (who's watching this execution)
         self.execution_watchers: Dict[str, Set[str]] = {}
+
+        # WebSocket -> outbox / owning user_id
+        self._outboxes: Dict[WebSocket, _Outbox] = {}
+        self._owners: Dict[WebSocket, str] = {}
+        self.max_outbox_messages = max_outbox_messages or settings.WEBSOCKET_OUTBOX_MAX_MESSAGES
+        self.send_timeout = send_timeout or settings.WEBSOCKET_SEND_TIMEOUT_SECONDS
+
+        # Set at startup when the Redis event relay runs in this process
+        self.relay = None
         
         logger.info("connection_manager_initialized")
     
@@ -43,10 +123,21 @@ class ConnectionManager:
         await websocket.accept()
         
         user_id_str = str(user_id)
-        if user_id_str not in self.active_connections:
+        first_connection = user_id_str not in self.active_connections
+        if first_connection:
             self.active_connections[user_id_str] = []
         
         self.active_connections[user_id_str].append(websocket)
+        self._owners[websocket] = user_id_str
+        self._outboxes[websocket] = _Outbox(
+            websocket,
+            on_failure=self._drop_connection,
+            max_messages=self.max_outbox_messages,
+            send_timeout=self.send_timeout,
+        )
+
+        if first_connection and self.relay is not None:
+            await self.relay.watch_user(user_id_str)
         
         logger.info("websocket_connected", user_id=user_id_str, total_connections=len(self.active_connections[user_id_str]))
     
@@ -59,21 +150,80 @@ class ConnectionManager:
             user_id: User ID
         """
         user_id_str = str(user_id)
+
+        outbox = self._outboxes.pop(websocket, None)
+        if outbox is not None:
+            outbox.close()
+        self._owners.pop(websocket, None)
         
-        if user_id_str in self.active_connections:
+        if websocket in self.active_connections.get(user_id_str, []):
             self.active_connections[user_id_str].remove(websocket)
             
             if not self.active_connections[user_id_str]:
                 del self.active_connections[user_id_str]
-        
-        # Remove from execution watchers
-        for execution_id, watchers in list(self.execution_watchers.items()):
-            if user_id_str in watchers:
-                watchers.remove(user_id_str)
-                if not watchers:
-                    del self.execution_watchers[execution_id]
+                if self.relay is not None:
+                    asyncio.ensure_future(self.relay.unwatch_user(user_id_str))
+
+                # Last socket gone: remove from execution watchers
+                for execution_id, watchers in list(self.execution_watchers.items()):
+                    if user_id_str in watchers:
+                        watchers.remove(user_id_str)
+                        if not watchers:
+                            del self.execution_watchers[execution_id]
         
         logger.info("websocket_disconnected", user_id=user_id_str)
+
+    def _drop_connection(self, websocket: WebSocket) -> None:
+        """Outbox callback: the client stopped accepting messages."""
+        user_id_str = self._owners.get(websocket)
+        if user_id_str is None:
+            return
+        self.disconnect(websocket, UUID(user_id_str))
+        asyncio.ensure_future(self._close_quietly(websocket))
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket) -> None:
+        try:
+            await websocket.close(code=1013, reason="Client too slow")
+        except Exception:
+            pass
+
+    def send(self, websocket: WebSocket, message: dict, coalesce_key: Optional[Hashable] = None) -> None:
+        """
+        Queue a message for one socket (never blocks on the client).
+
+        Args:
+            websocket: Target connection
+            message: Message data
+            coalesce_key: Replace any still-queued message with the same key
+        """
+        outbox = self._outboxes.get(websocket)
+        if outbox is not None:
+            outbox.push(message, coalesce_key)
+
+    def _send_to_user(self, message: dict, user_id_str: str, coalesce_key: Optional[Hashable] = None) -> None:
+        for connection in list(self.active_connections.get(user_id_str, [])):
+            self.send(connection, message, coalesce_key)
+
+    def dispatch_event(self, user_id: UUID, message: Dict[str, Any]) -> None:
+        """
+        Deliver an event from the Redis event bus to this replica's sockets.
+
+        Logs only go to users watching the execution; status, P&L and
+        completion events go to all of the user's sockets so list views can
+        update without subscribing to every execution.
+
+        Args:
+            user_id: Owner of the execution
+            message: Envelope published by ``publish_execution_event``
+        """
+        user_id_str = str(user_id)
+        event_type = message.get("type")
+        execution_id = message.get("execution_id")
+        if event_type == "execution_log" and user_id_str not in self.execution_watchers.get(execution_id, ()):
+            return
+        coalesce_key = (event_type, execution_id) if event_type in COALESCED_TYPES else None
+        self._send_to_user(message, user_id_str, coalesce_key)
     
     async def send_personal_message(self, message: dict, user_id: UUID):
         """
@@ -83,22 +233,7 @@ class ConnectionManager:
             message: Message data
             user_id: User ID
         """
-        user_id_str = str(user_id)
-        
-        if user_id_str not in self.active_connections:
-            return
-        
-        disconnected = []
-        for connection in self.active_connections[user_id_str]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error("failed_to_send_message", user_id=user_id_str, error=str(e))
-                disconnected.append(connection)
-        
-        # Clean up disconnected connections
-        for connection in disconnected:
-            self.disconnect(connection, user_id)
+        self._send_to_user(message, str(user_id))
     
     async def broadcast_to_user(self, message: dict, user_id: UUID):
         """
@@ -167,7 +302,7 @@ class ConnectionManager:
         }
         
         for user_id_str in self.execution_watchers[execution_id_str]:
-            await self.send_personal_message(message, UUID(user_id_str))
+            self._send_to_user(message, user_id_str, ("execution_update", execution_id_str))
     
     async def send_execution_log(self, execution_id: UUID, log_entry: dict):
         """
@@ -189,7 +324,7 @@ class ConnectionManager:
         }
         
         for user_id_str in self.execution_watchers[execution_id_str]:
-            await self.send_personal_message(message, UUID(user_id_str))
+            self._send_to_user(message, user_id_str)
     
     async def send_execution_complete(self, execution_id: UUID, result: dict):
         """
@@ -211,7 +346,7 @@ class ConnectionManager:
         }
         
         for user_id_str in self.execution_watchers[execution_id_str]:
-            await self.send_personal_message(message, UUID(user_id_str))
+            self._send_to_user(message, user_id_str)
 
 
 # Singleton instance
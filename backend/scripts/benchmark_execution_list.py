@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Execution List Benchmark
+
+Measures the executions list query with full rows vs. the lean projection
+(payload columns deferred, summaries read from the generated columns).
+
+Seeds a throwaway user with N executions carrying realistic payload sizes,
+runs both queries for a page of 50 and for the whole history, and rolls
+everything back. Needs a migrated database (``DATABASE_URL``).
+
+Usage:
+    python scripts/benchmark_execution_list.py [--executions 10000] [--payload-kb 200]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import desc, insert, select
+
+from app.database import SessionLocal
+from app.models.execution import Execution, ExecutionStatus, lean_load
+from app.models.pipeline import Pipeline
+from app.models.user import User
+
+PAGE_SIZE = 50
+CHUNK_SIZE = 500
+
+
+def _payload_rows(user_id, pipeline_id, count: int, payload_kb: int) -> list:
+    """Execution rows whose logs/agent states/pipeline state total ~payload_kb."""
+    filler = "x" * 1024
+    now = datetime.utcnow()
+    rows = []
+    for i in range(count):
+        created_at = now - timedelta(minutes=5 * i)
+        pnl = round(random.uniform(-200, 200), 2)
+        rows.append({
+            "id": uuid.uuid4(),
+            "pipeline_id": pipeline_id,
+            "user_id": user_id,
+            "status": ExecutionStatus.COMPLETED,
+            "mode": "paper",
+            "symbol": "AAPL",
+            "cost": 0.12,
+            "result": {
+                "final_pnl": pnl,
+                "strategy": {"action": "BUY", "confidence": 0.7},
+                "trade_outcome": {"status": "executed", "pnl": pnl},
+            },
+            "logs": [{"message": filler} for _ in range(payload_kb // 2)],
+            "agent_states": [
+                {"agent_id": f"agent-{n}", "status": "completed", "output": filler * (payload_kb // 8)}
+                for n in range(4)
+            ],
+            "reports": {
+                "node-trade_manager_agent": {
+                    "agent_type": "trade_manager_agent",
+                    "data": {"unrealized_pl": pnl, "order_status": "filled"},
+                },
+                "node-strategy_agent": {"agent_type": "strategy_agent", "summary": filler * 8},
+            },
+            "pipeline_state": {"blob": filler * (payload_kb // 4)},
+            "started_at": created_at,
+            "completed_at": created_at + timedelta(minutes=3),
+            "created_at": created_at,
+        })
+    return rows
+
+
+def _time(db, query, repeat: int) -> float:
+    """Median wall time (ms) to execute ``query`` and materialize every row."""
+    samples = []
+    for _ in range(repeat):
+        db.expunge_all()
+        start = time.perf_counter()
+        db.execute(query).all()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--executions", type=int, default=10_000)
+    parser.add_argument("--payload-kb", type=int, default=200, help="Approximate payload size per execution")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user = User(email=f"bench-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        pipeline = Pipeline(user_id=user.id, name="benchmark", config={})
+        db.add(pipeline)
+        db.flush()
+
+        print(f"Seeding {args.executions} executions (~{args.payload_kb} KB payload each)...")
+        for offset in range(0, args.executions, CHUNK_SIZE):
+            chunk = min(CHUNK_SIZE, args.executions - offset)
+            db.execute(insert(Execution), _payload_rows(user.id, pipeline.id, chunk, args.payload_kb))
+
+        base = select(Execution).where(Execution.user_id == user.id).order_by(desc(Execution.created_at))
+        cases = [
+            ("page of 50, full rows", base.limit(PAGE_SIZE)),
+            ("page of 50, lean", base.options(*lean_load()).limit(PAGE_SIZE)),
+            ("all rows, full", base),
+            ("all rows, lean", base.options(*lean_load())),
+        ]
+        for label, query in cases:
+            print(f"{label:<24} {_time(db, query, args.repeat):>10.1f} ms")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
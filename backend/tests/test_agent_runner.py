@@ -0,0 +1,101 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import agent_runner
+from app.services.agent_runner import AgentRunner, AgentRunnerError
+
+
+def _chunk(content=None, tool_calls=None, usage=None):
+    choices = [] if usage else [SimpleNamespace(delta=SimpleNamespace(content=content, tool_calls=tool_calls))]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def _tool_fragment(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+class FakeStreamingClient:
+    """Replays one scripted stream per turn, recording what it was sent."""
+
+    def __init__(self, turns, events):
+        self.turns = list(turns)
+        self.events = events
+        self.requests = []
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **request):
+        self.requests.append(request)
+        chunks = self.turns.pop(0)
+
+        async def stream():
+            for chunk in chunks:
+                await asyncio.sleep(0.01)
+                self.events.append("chunk")
+                yield chunk
+
+        return stream()
+
+    async def close(self):
+        self.closed = True
+
+
+def _client(monkeypatch, turns):
+    events = []
+    client = FakeStreamingClient(turns, events)
+    monkeypatch.setattr(agent_runner, "create_openai_client", lambda **kwargs: client)
+    return client, events
+
+
+async def test_tool_calls_are_dispatched_while_the_turn_is_still_streaming(monkeypatch):
+    client, events = _client(monkeypatch, [
+        [
+            _chunk(tool_calls=[_tool_fragment(0, id="call-1", name="rsi", arguments='{"timeframe"')]),
+            _chunk(tool_calls=[_tool_fragment(0, arguments=': "1h"}')]),
+            _chunk(tool_calls=[_tool_fragment(1, id="call-2", name="macd", arguments="{}")]),
+            _chunk(),
+            _chunk(),
+            _chunk(usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15)),
+        ],
+        [
+            _chunk(content="Bias: "),
+            _chunk(content="BULLISH"),
+            _chunk(usage=SimpleNamespace(prompt_tokens=20, completion_tokens=2, total_tokens=22)),
+        ],
+    ])
+
+    def rsi(arguments):
+        events.append("rsi")
+        return f"RSI {arguments['timeframe']}: 61"
+
+    def macd(arguments):
+        events.append("macd")
+        return "MACD bullish"
+
+    result = await AgentRunner(model="gpt-4o").arun(
+        system_prompt="system",
+        user_prompt="bias?",
+        tools=[{"type": "function", "function": {"name": "rsi"}}],
+        tool_handlers={"rsi": rsi, "macd": macd},
+    )
+
+    assert result.content == "Bias: BULLISH"
+    assert result.usage == {"prompt_tokens": 30, "completion_tokens": 7, "total_tokens": 37}
+    assert [call["output"] for call in result.tool_calls] == ["RSI 1h: 61", "MACD bullish"]
+    # rsi ran as soon as the second tool call started, before the turn ended
+    assert events.index("rsi") < 6
+    assert client.closed
+
+    follow_up = client.requests[1]["messages"]
+    assert follow_up[2]["tool_calls"][0]["function"] == {"name": "rsi", "arguments": '{"timeframe": "1h"}'}
+    assert [m["tool_call_id"] for m in follow_up[3:]] == ["call-1", "call-2"]
+    assert client.requests[0]["stream"] is True
+
+
+def test_sync_run_reports_missing_tool_handlers(monkeypatch):
+    _client(monkeypatch, [[_chunk(tool_calls=[_tool_fragment(0, id="call-1", name="rsi", arguments="{}")])]])
+
+    with pytest.raises(AgentRunnerError, match="No tool handler registered for rsi"):
+        AgentRunner(model="gpt-4o").run(system_prompt="s", user_prompt="u", tool_handlers={"macd": str})
@@ -0,0 +1,198 @@
+import pytest
+
+from app.services.brokers.account_snapshot import BrokerAccountSnapshot
+from app.services.brokers.base import Order, OrderSide, OrderStatus, OrderType, Position
+
+
+def _position(symbol: str, qty: float = 10.0) -> Position:
+    return Position(
+        symbol=symbol,
+        qty=qty,
+        side="long",
+        avg_entry_price=100.0,
+        current_price=101.0,
+        market_value=qty * 101.0,
+        cost_basis=qty * 100.0,
+        unrealized_pl=qty * 1.0,
+        unrealized_pl_percent=1.0,
+    )
+
+
+class FakeBroker:
+    paper = True
+    account_id = "ACC1"
+
+    def __init__(self, positions=None, orders=None, positions_error=None):
+        self.positions = positions or []
+        self.orders = orders or []
+        self.positions_error = positions_error
+        self.calls = []
+
+    def get_positions(self, account_id=None):
+        self.calls.append("get_positions")
+        if self.positions_error:
+            raise self.positions_error
+        return list(self.positions)
+
+    def get_position(self, symbol, account_id=None):
+        self.calls.append("get_position")
+        return next((p for p in self.positions if p.symbol == symbol), None)
+
+    def get_orders(self, account_id=None):
+        self.calls.append("get_orders")
+        return list(self.orders)
+
+    def get_quote(self, symbol):
+        self.calls.append("get_quote")
+        return {"symbol": symbol, "last": 1.0}
+
+    def get_quotes(self, symbols):
+        self.calls.append("get_quotes")
+        return {symbol: {"symbol": symbol, "last": 2.0} for symbol in symbols}
+
+    def close_position(self, symbol, qty=None, account_id=None):
+        self.calls.append("close_position")
+        self.positions = [p for p in self.positions if p.symbol != symbol]
+        return {"success": True}
+
+    def place_order(self, symbol, qty, side, order_type=OrderType.MARKET, account_id=None, **kwargs):
+        self.calls.append("place_order")
+        self.positions.append(_position(symbol, qty))
+        return Order(order_id="o-new", symbol=symbol, qty=qty, side=side, type=order_type, status=OrderStatus.OPEN)
+
+    def close_trade_by_id(self, trade_id, account_id=None):
+        self.calls.append("close_trade_by_id")
+        self.positions = []
+        return {"success": True}
+
+    def get_trade_details(self, trade_id=None, order_id=None, account_id=None):
+        self.calls.append("get_trade_details")
+        return {"found": True, "state": "closed"}
+
+    def get_trade_details_batch(self, refs, account_id=None):
+        self.calls.append("get_trade_details_batch")
+        return {ref: {"found": True, "state": "closed", "realized_pl": 1.0} for ref in refs}
+
+
+@pytest.mark.no_tool_mocks
+def test_snapshot_fetches_positions_orders_and_quotes_once_per_account():
+    broker = FakeBroker(
+        positions=[_position("AAPL"), _position("MSFT")],
+        orders=[
+            Order(
+                order_id="o-1",
+                symbol="TSLA",
+                qty=5,
+                side=OrderSide.BUY,
+                type=OrderType.LIMIT,
+                status=OrderStatus.OPEN,
+            )
+        ],
+    )
+    snapshot = BrokerAccountSnapshot(broker, ["AAPL", "MSFT", "TSLA", "NVDA"])
+
+    for symbol in ["AAPL", "MSFT", "TSLA", "NVDA"]:
+        snapshot.get_position(symbol)
+        snapshot.get_quote(symbol)
+        snapshot.has_active_symbol(symbol)
+
+    assert broker.calls == ["get_positions", "get_quotes", "get_orders"]
+    assert snapshot.has_active_symbol("TSLA") is True
+    assert snapshot.has_active_symbol("NVDA") is False
+    assert snapshot.broker_calls == 3
+
+
+@pytest.mark.no_tool_mocks
+def test_snapshot_normalizes_symbol_separators():
+    broker = FakeBroker(positions=[_position("EUR_USD")])
+    snapshot = BrokerAccountSnapshot(broker, ["EUR/USD"])
+
+    assert snapshot.get_position("EUR/USD").symbol == "EUR_USD"
+    assert snapshot.get_quote("EUR_USD")["last"] == 2.0
+
+
+@pytest.mark.no_tool_mocks
+def test_snapshot_reraises_fetch_errors_to_every_caller():
+    broker = FakeBroker(positions_error=RuntimeError("broker down"))
+    snapshot = BrokerAccountSnapshot(broker, ["AAPL", "MSFT"])
+
+    for symbol in ["AAPL", "MSFT"]:
+        with pytest.raises(RuntimeError, match="broker down"):
+            snapshot.get_position(symbol)
+
+    assert broker.calls == ["get_positions"]
+
+
+@pytest.mark.no_tool_mocks
+def test_snapshot_reads_closed_symbol_live_and_delegates_other_calls():
+    broker = FakeBroker(positions=[_position("AAPL"), _position("MSFT")])
+    snapshot = BrokerAccountSnapshot(broker, ["AAPL", "MSFT"])
+
+    assert snapshot.get_position("AAPL") is not None
+    snapshot.close_position("AAPL")
+
+    assert snapshot.get_position("AAPL") is None
+    assert snapshot.get_position("MSFT") is not None
+    assert snapshot.get_trade_details(order_id="o-1")["found"] is True
+    assert broker.calls == [
+        "get_positions",
+        "close_position",
+        "get_position",
+        "get_trade_details",
+    ]
+
+
+@pytest.mark.no_tool_mocks
+def test_snapshot_fetches_prefetched_trade_details_in_one_batch():
+    broker = FakeBroker()
+    snapshot = BrokerAccountSnapshot(broker)
+    refs = [("t-1", None), ("t-2", "o-2"), (None, "o-3")]
+
+    snapshot.prefetch_trade_details(refs)
+    for trade_id, order_id in refs:
+        assert snapshot.get_trade_details(trade_id=trade_id, order_id=order_id)["realized_pl"] == 1.0
+    # Unregistered trades are still looked up live
+    snapshot.get_trade_details(trade_id="t-9")
+
+    assert broker.calls == ["get_trade_details_batch", "get_trade_details"]
+    assert snapshot.broker_calls == 2
+
+
+@pytest.mark.no_tool_mocks
+def test_trade_manager_reads_positions_from_shared_broker(monkeypatch):
+    from app.agents.trade_manager_agent import PositionCheckResult, TradeManagerAgent
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("monitoring must not build its own broker when one is shared")
+
+    monkeypatch.setattr("app.services.brokers.factory.broker_factory.from_tool_config", _fail)
+
+    agent = TradeManagerAgent(agent_id="tm-1", config={})
+    snapshot = BrokerAccountSnapshot(FakeBroker(positions=[_position("AAPL")]), ["AAPL"])
+    agent.use_broker(snapshot)
+
+    result, data = agent._get_position("AAPL", {"tool_type": "tradier_broker", "config": {}})
+
+    assert result == PositionCheckResult.FOUND
+    assert data["qty"] == 10.0
+
+
+@pytest.mark.no_tool_mocks
+def test_delegated_mutations_invalidate_orders_and_positions():
+    broker = FakeBroker(positions=[_position("MSFT")])
+    snapshot = BrokerAccountSnapshot(broker, ["AAPL", "MSFT"])
+
+    assert snapshot.get_position("AAPL") is None
+    assert snapshot.has_active_symbol("AAPL") is False
+    snapshot.place_order("AAPL", 5, OrderSide.BUY)
+
+    # The placed symbol is read live; open orders are fetched again
+    assert snapshot.get_position("AAPL").qty == 5
+    snapshot.get_orders()
+    assert broker.calls == ["get_positions", "get_orders", "place_order", "get_position", "get_orders"]
+
+    # No symbol to go by: the whole positions snapshot is refreshed
+    snapshot.close_trade_by_id("t-1")
+    assert snapshot.get_position("MSFT") is None
+    assert broker.calls[-2:] == ["close_trade_by_id", "get_positions"]
+    assert snapshot.paper is True
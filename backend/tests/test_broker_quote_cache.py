@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+
+from app.services.brokers.quote_cache import LocalQuoteFeed, QuoteCache
+
+
+class FakeBroker:
+    paper = True
+
+    def __init__(self, feed=None):
+        self.fetches = []
+        self.lock = threading.Lock()
+        if feed is not None:
+            self.stream_quotes = feed.stream_quotes
+
+    def fetch_quotes(self, symbols):
+        with self.lock:
+            self.fetches.append(list(symbols))
+        time.sleep(0.05)
+        return {symbol: {"symbol": symbol.upper(), "last": 100.0} for symbol in symbols}
+
+
+@pytest.mark.no_tool_mocks
+def test_concurrent_callers_share_one_broker_request():
+    cache = QuoteCache(ttl_seconds=5)
+    broker = FakeBroker()
+    results = []
+
+    def _read():
+        results.append(cache.get_quotes(broker, ["AAPL"], broker.fetch_quotes))
+
+    threads = [threading.Thread(target=_read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert broker.fetches == [["AAPL"]]
+    assert all(result["AAPL"]["last"] == 100.0 for result in results)
+
+
+@pytest.mark.no_tool_mocks
+def test_batch_fetches_only_missing_symbols_and_skips_errors():
+    cache = QuoteCache(ttl_seconds=5)
+    broker = FakeBroker()
+    cache.get_quotes(broker, ["AAPL"], broker.fetch_quotes)
+
+    def _fetch_with_error(symbols):
+        broker.fetches.append(list(symbols))
+        return {symbol: {"error": "No quote data"} for symbol in symbols}
+
+    quotes = cache.get_quotes(broker, ["aapl", "MSFT"], _fetch_with_error)
+    assert quotes["aapl"]["last"] == 100.0
+    assert "error" in quotes["MSFT"]
+
+    cache.get_quotes(broker, ["MSFT"], _fetch_with_error)
+    assert broker.fetches == [["AAPL"], ["MSFT"], ["MSFT"]]
+
+
+@pytest.mark.no_tool_mocks
+def test_zero_ttl_disables_caching():
+    cache = QuoteCache(ttl_seconds=0)
+    broker = FakeBroker()
+
+    cache.get_quotes(broker, ["AAPL"], broker.fetch_quotes)
+    cache.get_quotes(broker, ["AAPL"], broker.fetch_quotes)
+
+    assert len(broker.fetches) == 2
+
+
+@pytest.mark.no_tool_mocks
+def test_streamed_quotes_are_served_without_polling():
+    feed = LocalQuoteFeed(heartbeat_seconds=0.01)
+    cache = QuoteCache(ttl_seconds=0.01, streaming_enabled=True, stream_stale_seconds=5)
+    broker = FakeBroker(feed=feed)
+
+    try:
+        cache.get_quotes(broker, ["EUR_USD"], broker.fetch_quotes)
+        feed.publish("EUR_USD", bid=1.1, ask=1.2, last=1.15)
+
+        deadline = time.monotonic() + 2
+        quote = None
+        while time.monotonic() < deadline:
+            quote = cache.get_quotes(broker, ["EUR/USD"], broker.fetch_quotes)["EUR/USD"]
+            if quote.get("last") == 1.15:
+                break
+            time.sleep(0.02)
+
+        fetches_after_stream = len(broker.fetches)
+        assert quote["last"] == 1.15
+        assert cache.get_quotes(broker, ["EUR_USD"], broker.fetch_quotes)["EUR_USD"]["last"] == 1.15
+        assert len(broker.fetches) == fetches_after_stream
+    finally:
+        feed.close()
+        cache.stop_streams()
+
+
+@pytest.mark.no_tool_mocks
+def test_tradier_quotes_are_shared_across_service_instances(monkeypatch):
+    from app.services.brokers import tradier_service
+    from app.services.brokers.tradier_service import TradierBrokerService
+
+    monkeypatch.setattr(tradier_service, "quote_cache", QuoteCache(ttl_seconds=5))
+    requests_made = []
+
+    def _fake_request(self, method, endpoint, params=None, data=None):
+        requests_made.append(params["symbols"])
+        return {"quotes": {"quote": {"symbol": "AAPL", "bid": 1, "ask": 2, "last": 1.5}}}
+
+    monkeypatch.setattr(TradierBrokerService, "_make_request", _fake_request)
+
+    first = TradierBrokerService(api_key="token-a", account_id="A1", paper=True)
+    second = TradierBrokerService(api_key="token-b", account_id="B1", paper=True)
+
+    assert first.get_quote("AAPL")["last"] == 1.5
+    assert second.get_quotes(["AAPL"])["AAPL"]["last"] == 1.5
+    assert requests_made == ["AAPL"]
@@ -1,7 +1,12 @@
 from datetime import datetime, timedelta
 
 from app.schemas.pipeline_state import StrategyResult
-from app.services.chart_annotation_builder import ChartAnnotationBuilder
+from app.services.chart_annotation_builder import (
+    CANDLE_COLUMNS,
+    ChartAnnotationBuilder,
+    chart_etag,
+    expand_chart,
+)
 
 
 def _candles(base_price: float = 255.0, count: int = 30):
@@ -153,3 +158,58 @@ class TestChartAnnotationBuilder:
         assert "macd" in chart_data["indicators"]
         assert "rsi" not in chart_data["indicators"]
         assert chart_data["meta"]["trade_relevance"]["indicator_count"] == 1
+
+    def test_persists_candles_column_wise_and_appends_only_newer_ones(self):
+        builder = ChartAnnotationBuilder(symbol="AAPL", timeframe="5m")
+        strategy = StrategyResult(
+            action="BUY",
+            confidence=0.7,
+            entry_price=256.0,
+            stop_loss=255.0,
+            take_profit=258.0,
+            reasoning="Trend continuation.",
+        )
+        chart = builder.build_chart_data(candles=_candles(count=10), tool_results={}, strategy_result=strategy)
+
+        assert set(chart["candles"]) == set(CANDLE_COLUMNS)
+        assert len(chart["candles"]["time"]) == 10
+        rows = expand_chart(chart)["candles"]
+        assert rows[0] == {"time": "2026-04-08T14:00:00", "open": 254.8, "high": 255.3,
+                           "low": 254.6, "close": 255.0, "volume": 100000}
+        etag = chart_etag(chart)
+
+        # Overlapping fetch: 8 known candles + 4 new ones, newest first
+        fresh = list(reversed(_candles(count=14)[2:]))
+        assert ChartAnnotationBuilder.append_candles(chart, fresh) == 4
+        assert chart["meta"]["candle_count"] == 14
+        assert chart["candles"]["time"][-1] == "2026-04-08T15:05:00"
+        assert chart_etag(chart) != etag
+
+        etag = chart_etag(chart)
+        assert ChartAnnotationBuilder.append_candles(chart, fresh) == 0
+        assert chart_etag(chart) == etag
+
+    def test_post_trade_annotations_are_added_once(self):
+        builder = ChartAnnotationBuilder(symbol="AAPL", timeframe="5m")
+        strategy = StrategyResult(
+            action="BUY",
+            confidence=0.7,
+            entry_price=256.0,
+            stop_loss=255.0,
+            take_profit=258.0,
+            reasoning="Trend continuation.",
+        )
+        chart = builder.build_chart_data(candles=_candles(count=10), tool_results={}, strategy_result=strategy)
+        trade_execution = {"filled_price": 256.05, "action": "BUY"}
+        trade_outcome = {"exit_price": 258.0, "pnl": 1.95, "exit_reason": "take_profit"}
+
+        ChartAnnotationBuilder.add_post_trade_annotations(chart, trade_execution, None)
+        markers = len(chart["annotations"]["markers"])
+        lines = len(chart["annotations"]["lines"])
+        ChartAnnotationBuilder.add_post_trade_annotations(chart, trade_execution, trade_outcome)
+        ChartAnnotationBuilder.add_post_trade_annotations(chart, trade_execution, trade_outcome)
+
+        assert len(chart["annotations"]["markers"]) == markers + 1
+        assert len(chart["annotations"]["lines"]) == lines
+        assert chart["meta"]["trade_events"] == ["fill:256.05", "exit:258.0"]
+        assert chart["meta"]["revision"] == 3
@@ -0,0 +1,54 @@
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.orchestration.tasks import check_scheduled_pipelines as scheduler
+
+
+def test_due_set_is_one_statement_with_lateral_last_run():
+    sql = str(scheduler.due_pipelines_query(datetime(2026, 4, 16, 14, 0)).compile(
+        dialect=postgresql.dialect()
+    ))
+
+    assert sql.count("SELECT") == 3  # outer query, LATERAL last run, NOT EXISTS guard
+    assert "JOIN LATERAL" in sql
+    assert "NOT (EXISTS" in sql
+
+
+def test_slot_key_collides_within_interval_and_advances_after_it():
+    pipeline_id = uuid4()
+    start = datetime(2026, 4, 16, 14, 0)
+
+    first = scheduler.schedule_slot_key(pipeline_id, 5, start)
+    assert scheduler.schedule_slot_key(pipeline_id, 5, start + timedelta(minutes=4)) == first
+    assert scheduler.schedule_slot_key(pipeline_id, 5, start + timedelta(minutes=5)) != first
+    # Sub-minute intervals still get one-minute slots
+    assert scheduler.schedule_slot_key(pipeline_id, 0.1, start) == scheduler.schedule_slot_key(
+        pipeline_id, 0.1, start + timedelta(seconds=59)
+    )
+
+
+def test_enqueue_skips_slots_claimed_by_an_overlapping_tick(monkeypatch):
+    from app.orchestration.tasks.execute_pipeline import execute_pipeline
+
+    due = [
+        SimpleNamespace(id=uuid4(), user_id=uuid4(), interval_minutes=5.0),
+        SimpleNamespace(id=uuid4(), user_id=uuid4(), interval_minutes=15.0),
+    ]
+    sent = []
+
+    monkeypatch.setattr(scheduler, "_claim_slots", lambda keys, ttls: [False, True])
+    monkeypatch.setattr(scheduler.celery_app, "producer_or_acquire", lambda: nullcontext("producer"))
+    monkeypatch.setattr(execute_pipeline, "apply_async", lambda **kwargs: sent.append(kwargs))
+
+    now = datetime(2026, 4, 16, 14, 0)
+    triggered = scheduler._enqueue(due, now)
+
+    assert triggered == [str(due[1].id)]
+    assert len(sent) == 1
+    assert sent[0]["kwargs"]["pipeline_id"] == str(due[1].id)
+    assert sent[0]["task_id"] == scheduler.schedule_slot_key(due[1].id, 15.0, now)
+    assert sent[0]["producer"] == "producer"
@@ -0,0 +1,131 @@
+import re
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.models.execution import PAYLOAD_COLUMNS, Execution, ExecutionStatus, lean_load
+from app.services.execution_aggregates import (
+    ExecutionTotals,
+    _touched_buckets,
+    extract_pnl,
+    lean_execution_columns,
+)
+
+
+def _execution(status=ExecutionStatus.COMPLETED, final_pnl=None, outcome=None, unrealized=None, cost=0.5):
+    result = {}
+    if final_pnl is not None:
+        result["final_pnl"] = final_pnl
+    if outcome is not None:
+        result["trade_outcome"] = {"status": outcome}
+    reports = {}
+    if unrealized is not None:
+        reports["tm"] = {"agent_type": "trade_manager_agent", "data": {"unrealized_pl": unrealized}}
+    started = datetime(2026, 4, 1, 12, 0)
+    return SimpleNamespace(
+        status=status,
+        cost=cost,
+        started_at=started,
+        completed_at=started + timedelta(minutes=10),
+        result=result,
+        reports=reports,
+    )
+
+
+@pytest.mark.no_tool_mocks
+def test_totals_follow_dashboard_pnl_and_trade_rules():
+    totals = ExecutionTotals()
+    for execution in [
+        _execution(final_pnl=120.0, outcome="executed"),
+        _execution(final_pnl=-40.0),
+        _execution(final_pnl=0.0, outcome="cancelled"),  # real trade, zero P&L
+        _execution(final_pnl=0.0),  # no outcome, zero P&L: not a trade
+        _execution(final_pnl=75.0, outcome="rejected"),  # not a trade
+        _execution(status=ExecutionStatus.MONITORING, unrealized=12.5),
+        _execution(status=ExecutionStatus.FAILED),
+    ]:
+        totals.add_execution(execution)
+
+    assert totals.execution_count == 7
+    assert totals.total_cost == pytest.approx(3.5)
+    assert totals.realized_count == 5
+    assert totals.realized_pnl == pytest.approx(155.0)
+    assert totals.unrealized_count == 1
+    assert totals.unrealized_pnl == pytest.approx(12.5)
+    assert (totals.trade_count, totals.win_count, totals.loss_count) == (4, 2, 1)
+    assert totals.best_trade == 120.0
+    assert totals.worst_trade == -40.0
+    assert totals.duration_count == 5
+    assert totals.duration_seconds == pytest.approx(5 * 600)
+
+
+@pytest.mark.no_tool_mocks
+def test_merging_totals_keeps_extremes():
+    first = ExecutionTotals().add_execution(_execution(final_pnl=50.0))
+    second = ExecutionTotals().add_execution(_execution(final_pnl=-80.0))
+
+    merged = ExecutionTotals().add(first).add(second)
+
+    assert merged.execution_count == 2
+    assert merged.pnl == pytest.approx(-30.0)
+    assert merged.best_trade == 50.0
+    assert merged.worst_trade == -80.0
+
+
+@pytest.mark.no_tool_mocks
+def test_only_terminal_transitions_touch_aggregate_buckets():
+    pipeline_id = uuid4()
+    execution = Execution(
+        id=uuid4(),
+        pipeline_id=pipeline_id,
+        user_id=uuid4(),
+        status=ExecutionStatus.MONITORING,
+        cost=0.0,
+        created_at=datetime(2026, 4, 1, 23, 30),
+    )
+    make_transient_to_detached(execution)
+    session = Session()
+    session.add(execution)
+
+    execution.next_check_at = datetime(2026, 4, 1, 23, 45)
+    assert _touched_buckets(session) == set()
+
+    execution.status = ExecutionStatus.COMPLETED
+    assert _touched_buckets(session) == {(str(pipeline_id), "2026-04-01")}
+
+
+@pytest.mark.no_tool_mocks
+def test_lean_columns_skip_heavy_jsonb():
+    sql = str(select(*lean_execution_columns()).compile(dialect=postgresql.dialect()))
+
+    assert "jsonb_build_object" in sql
+    assert "executions.trade_manager_report" in sql
+    for heavy in PAYLOAD_COLUMNS:
+        assert f"executions.{heavy}" not in sql
+
+
+@pytest.mark.no_tool_mocks
+def test_lean_load_reads_generated_summaries_instead_of_payload():
+    query = select(Execution).options(*lean_load("pipeline_state"))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    for column in ("trade_manager_report", "agent_count", "agents_completed", "result", "pipeline_state"):
+        assert f"executions.{column}" in sql
+    for heavy in ("logs", "agent_states", "reports", "cost_breakdown", "executive_report", "trade_analysis"):
+        assert not re.search(rf"\bexecutions\.{heavy}\b", sql)
+
+
+@pytest.mark.no_tool_mocks
+def test_extract_pnl_prefers_generated_trade_manager_report():
+    row = SimpleNamespace(
+        result={},
+        trade_manager_report={"agent_type": "trade_manager_agent", "data": {"unrealized_pl": 7.5, "pnl_percent": 1.2}},
+    )
+
+    assert extract_pnl(row) == {"value": 7.5, "percent": 1.2, "type": "unrealized"}
+    assert extract_pnl(SimpleNamespace(result={}, trade_manager_report=None)) is None
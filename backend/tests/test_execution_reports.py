@@ -0,0 +1,55 @@
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.models.execution import ExecutionStatus
+from app.services import execution_reports
+
+
+def _execution(**overrides):
+    values = dict(
+        id=uuid4(),
+        symbol="AAPL",
+        mode="paper",
+        status=ExecutionStatus.COMPLETED,
+        started_at=datetime(2026, 4, 16, 14, 0),
+        completed_at=datetime(2026, 4, 16, 14, 2),
+        cost=0.12,
+        reports={"strategy": {"summary": "long"}},
+        result={"trade_outcome": {"pnl": 10.0}, "strategy": {"action": "BUY"}},
+        agent_states=[],
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_state_hash_is_stable_and_tracks_final_state():
+    execution = _execution()
+    data = execution_reports.build_execution_data(execution, "Momentum")
+    state_hash = execution_reports.report_state_hash(data)
+
+    # Same state, different dict ordering -> same hash
+    reordered = dict(reversed(list(data.items())))
+    assert execution_reports.report_state_hash(reordered) == state_hash
+
+    # P&L changed after the fact (e.g. reconciliation) -> new hash
+    changed = execution_reports.build_execution_data(
+        _execution(id=execution.id, result={"trade_outcome": {"pnl": -4.0}}), "Momentum"
+    )
+    assert execution_reports.report_state_hash(changed) != state_hash
+
+
+def test_stored_reports_are_served_only_for_their_state_hash():
+    data = execution_reports.build_execution_data(_execution(), "Momentum")
+    state_hash = execution_reports.report_state_hash(data)
+    report = execution_reports.build_executive_report(
+        data, {"executive_summary": "Bought AAPL"}, state_hash
+    )
+
+    assert report["execution_context"]["pipeline_name"] == "Momentum"
+    assert report["strategy"] == {"action": "BUY"}
+    assert execution_reports.cached_report(report, state_hash) is report
+    assert execution_reports.cached_report(report, "0" * 64) is None
+    # Legacy reports stored without a hash are rebuilt once
+    assert execution_reports.cached_report({"executive_summary": "old"}, state_hash) is None
+    assert execution_reports.is_failed_report({"executive_summary": "x", "error": "timeout"})
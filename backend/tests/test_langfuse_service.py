@@ -116,6 +116,9 @@ def test_tool_and_llm_calls_attach_under_agent_span(monkeypatch):
                 output="42",
             )
 
+    # Generations and tool calls are exported in the background
+    assert langfuse_service.flush_langfuse(timeout=5)
+
     raw_agent_span = agent_span.raw
     assert raw_agent_span.generations[0]["name"] == "llm_call"
     assert raw_agent_span.spans[0].name == "tool:rsi_calculator"
@@ -0,0 +1,157 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from app.config import settings
+from app.services.llm_governor import (
+    GovernedClient,
+    LLMBudgetExhausted,
+    LLMGovernor,
+    LLMPriority,
+    llm_priority,
+)
+
+
+def _governor(monkeypatch, rpm=10, tpm=1_000_000):
+    monkeypatch.setattr(settings, "LLM_MODEL_RPM_LIMIT", rpm, raising=False)
+    monkeypatch.setattr(settings, "LLM_MODEL_TPM_LIMIT", tpm, raising=False)
+    monkeypatch.setattr(settings, "LLM_MODEL_LIMITS", {}, raising=False)
+    # No Redis: budgets are kept per process
+    return LLMGovernor(redis_factory=lambda: None)
+
+
+def _response(content="ok", total_tokens=10):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(total_tokens=total_tokens),
+    )
+
+
+def test_low_priorities_leave_budget_headroom_for_live_calls(monkeypatch):
+    governor = _governor(monkeypatch, rpm=10)
+
+    granted = [governor.try_acquire("gpt-4o", LLMPriority.BACKTEST, 100)[0] for _ in range(6)]
+
+    assert granted[:5] == [0.0] * 5
+    assert granted[5] > 0  # backtests may only use half of the window
+    assert governor.try_acquire("gpt-4o", LLMPriority.LIVE, 100)[0] == 0.0
+
+
+async def test_identical_in_flight_requests_share_one_call(monkeypatch):
+    governor = _governor(monkeypatch)
+    calls = []
+
+    async def create(**request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return _response()
+
+    client = GovernedClient(
+        SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create))),
+        is_async=True,
+        governor=governor,
+    )
+    request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "bias?"}]}
+
+    first, second, other = await asyncio.gather(
+        client.chat.completions.create(**request, timeout=30),
+        client.chat.completions.create(**request, timeout=45),
+        client.chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": "setup?"}]),
+    )
+
+    assert len(calls) == 2
+    assert first is second
+    assert other is not first
+
+
+def test_rate_limit_sets_cooldown_for_the_model(monkeypatch):
+    governor = _governor(monkeypatch)
+    rate_limited = RateLimitError(
+        "rate limited",
+        response=httpx.Response(
+            429,
+            headers={"retry-after": "7"},
+            request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"),
+        ),
+        body=None,
+    )
+
+    def create(**request):
+        raise rate_limited
+
+    with llm_priority(LLMPriority.LIVE):
+        client = GovernedClient(
+            SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create))),
+            is_async=False,
+            governor=governor,
+        )
+        with pytest.raises(RateLimitError):
+            client.chat.completions.create(model="gpt-4o", messages=[])
+
+    wait, _ = governor.try_acquire("gpt-4o", LLMPriority.LIVE, 10)
+    assert 6 < wait <= 7
+    assert governor.try_acquire("gpt-4o-mini", LLMPriority.LIVE, 10)[0] == 0.0
+
+
+def test_call_without_budget_fails_instead_of_going_out_unreserved(monkeypatch):
+    governor = _governor(monkeypatch)
+    monkeypatch.setattr(settings, "LLM_GOVERNOR_MAX_WAIT_SECONDS", 0.0)
+    governor.cooldown("gpt-4o", 30)
+    calls = []
+
+    client = GovernedClient(
+        SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **r: calls.append(r)))),
+        is_async=False,
+        governor=governor,
+    )
+    with pytest.raises(LLMBudgetExhausted):
+        client.chat.completions.create(model="gpt-4o", messages=[])
+
+    assert calls == []
+    # Nothing was reserved, so nothing was refunded either
+    assert governor._local._windows.get("gpt-4o") is None
+
+
+async def test_streamed_calls_hold_their_slot_and_settle_from_the_usage_chunk(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_MAX_CONCURRENT_REQUESTS", 1)
+    governor = _governor(monkeypatch)
+    in_flight = []
+
+    async def create(**request):
+        in_flight.append(request)
+        max_in_flight.append(len(in_flight))
+
+        async def stream():
+            try:
+                for content in ("Bias: ", "BULLISH"):
+                    await asyncio.sleep(0.01)
+                    yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))], usage=None)
+                yield SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=42))
+            finally:
+                in_flight.remove(request)
+
+        return stream()
+
+    max_in_flight = []
+    client = GovernedClient(
+        SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create))),
+        is_async=True,
+        governor=governor,
+    )
+
+    async def turn(prompt):
+        stream = await client.chat.completions.create(
+            model="gpt-4o", messages=[{"role": "user", "content": prompt}], stream=True
+        )
+        return "".join([chunk.choices[0].delta.content async for chunk in stream if chunk.choices])
+
+    results = await asyncio.gather(turn("a"), turn("b"), turn("c"))
+
+    assert results == ["Bias: BULLISH"] * 3
+    # Each stream kept the only slot until it was drained
+    assert max(max_in_flight) == 1
+    # Estimates were replaced by the reported usage
+    assert governor._local._windows["gpt-4o"][2] == 3 * 42
@@ -0,0 +1,42 @@
+import httpx
+
+from app.utils import market_context
+
+
+def _client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def test_quotes_come_from_one_live_request():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={
+            "quotes": {
+                "VIX": {"current_price": 18.5},
+                "SPY": {"current_price": 500.0, "previous_close": 510.0},
+            },
+            "missing": [],
+        })
+
+    async with _client(handler) as client:
+        quotes = await market_context._get_quotes(["VIX", "SPY"], client)
+
+    assert calls == ["/api/v1/data/quotes/live"]
+    assert quotes["VIX"]["current_price"] == 18.5
+    assert quotes["SPY"]["previous_close"] == 510.0
+
+
+async def test_missing_live_quotes_fall_back_to_single_quote_endpoint():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/quotes/live"):
+            return httpx.Response(200, json={"quotes": {"SPY": {"current_price": 500.0}}, "missing": ["VIX"]})
+        if request.url.path.endswith("/quote/VIX"):
+            return httpx.Response(200, json={"current_price": 31.0})
+        return httpx.Response(404)
+
+    async with _client(handler) as client:
+        quotes = await market_context._get_quotes(["VIX", "SPY"], client)
+
+    assert quotes == {"SPY": {"current_price": 500.0}, "VIX": {"current_price": 31.0}}
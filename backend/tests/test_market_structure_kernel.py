@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.utils.market_structure import (
+    BEARISH,
+    BULLISH,
+    fair_value_gaps,
+    first_beyond,
+    liquidity_grabs,
+    order_blocks,
+    structure_events,
+    swing_points,
+)
+
+
+def test_swing_points_strict_and_non_strict():
+    high = np.array([1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 3.0, 3.0, 2.0, 1.0])
+    low = high - 0.5
+
+    strict_highs, strict_lows = swing_points(high, low, 2, strict=True)
+    loose_highs, loose_lows = swing_points(high, low, 2, strict=False)
+
+    assert strict_highs.tolist() == [2]
+    assert strict_lows.tolist() == [4]
+    # Equal highs at 6 and 7 both qualify without strict comparison
+    assert loose_highs.tolist() == [2, 6, 7]
+    assert loose_lows.tolist() == [4]
+
+
+def test_swing_points_needs_a_full_window():
+    high = np.array([1.0, 2.0, 1.0])
+    assert swing_points(high, high, 2)[0].size == 0
+
+
+def test_first_beyond_scans_past_the_first_window():
+    close = np.full(200, 10.0)
+    close[150] = 12.0
+    close[180] = 8.0
+
+    idx, size = first_beyond(close, np.array([0, 0, 190]), np.array([11.0, 9.0, 11.0]),
+                             BULLISH)
+    assert idx.tolist() == [150, 1, -1]
+    assert size[0] == pytest.approx(1.0)
+
+    idx, _ = first_beyond(close, np.array([0]), np.array([9.0]), BEARISH)
+    assert idx.tolist() == [180]
+
+
+def test_structure_events_bos_then_choch():
+    close = np.array([1.0, 2.0, 3.0, 2.5, 2.0, 3.5, 3.0, 1.5, 1.0])
+    high = close + 0.1
+    low = close - 0.1
+
+    events = structure_events(close, np.array([2]), np.array([4]), high, low, bullish_bias=True)
+
+    assert [(e["type"], e["direction"], e["candle_index"]) for e in events] == [
+        ("BOS", "bullish", 5),
+        ("CHoCH", "bearish", 7),
+    ]
+
+
+def test_liquidity_grabs_respect_min_distance_and_reversal():
+    high = np.array([1.0, 2.0, 1.0, 2.005, 2.5, 1.0])
+    low = high - 0.5
+    close = np.array([1.0, 1.8, 1.0, 1.9, 1.9, 1.0])
+
+    grabs = liquidity_grabs(high, low, close, np.array([1]), np.array([], dtype=int),
+                            min_distance=1.0, pip_multiplier=100)
+
+    # Bar 3 pokes 0.5 "pips" above the level; bar 4 is the first real grab
+    assert len(grabs) == 1
+    assert grabs[0]["type"] == "buy_side"
+    assert grabs[0]["candle_index"] == 4
+    assert grabs[0]["distance"] == pytest.approx(50.0)
+    assert grabs[0]["reversed"] is True
+
+
+def test_fair_value_gap_fill_and_order_block_retest():
+    open_ = np.array([100.0, 101.0, 104.0, 104.0, 103.0])
+    close = np.array([100.5, 104.0, 104.5, 103.5, 102.0])
+    high = np.array([101.0, 104.2, 105.0, 104.2, 103.2])
+    low = np.array([99.8, 100.9, 102.0, 103.0, 101.5])
+
+    gaps = fair_value_gaps(open_, high, low, close, min_gap=0.5, pip_multiplier=1)
+    assert len(gaps) == 1
+    assert gaps[0]["direction"] == "bullish"
+    assert (gaps[0]["bottom"], gaps[0]["top"]) == (101.0, 102.0)
+    assert gaps[0]["fill_percentage"] == pytest.approx(50.0)
+
+    open_ = np.array([101.0, 100.5, 101.5, 103.5, 102.0, 100.8])
+    close = np.array([100.5, 101.8, 103.5, 103.8, 101.0, 100.7])
+    high = np.array([101.2, 102.0, 103.8, 104.0, 102.2, 101.0])
+    low = np.array([100.2, 100.4, 101.4, 103.2, 100.9, 100.6])
+
+    blocks = order_blocks(open_, high, low, close, min_move=2.0, pip_multiplier=1)
+    assert [(b["direction"], b["index"], b["is_retested"]) for b in blocks] == [("bullish", 0, True)]
+
+
+def test_signal_generator_copy_is_identical():
+    backend_copy = Path(__file__).resolve().parents[1] / "app" / "utils" / "market_structure.py"
+    generator_copy = (
+        Path(__file__).resolve().parents[2] / "signal-generator" / "app" / "utils" / "market_structure.py"
+    )
+    if not generator_copy.exists():
+        pytest.skip("signal-generator sources not available")
+    assert backend_copy.read_text() == generator_copy.read_text()
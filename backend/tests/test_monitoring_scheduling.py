@@ -0,0 +1,80 @@
+import importlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.config import settings
+from app.models.execution import ExecutionStatus
+from app.orchestration.tasks import monitoring
+
+
+def _record_direct_checks(monkeypatch, batch_enabled):
+    monkeypatch.setattr(settings, "MONITORING_BATCH_ENABLED", batch_enabled)
+    enqueued = []
+    monkeypatch.setattr(
+        monitoring.schedule_monitoring_check,
+        "apply_async",
+        lambda args=None, countdown=None, **kwargs: enqueued.append((args, countdown)),
+    )
+    return enqueued
+
+
+class FakeAsyncSession:
+    def __init__(self, execution):
+        self.execution = execution
+        self.commits = 0
+
+    async def execute(self, statement):
+        return SimpleNamespace(scalar_one_or_none=lambda: self.execution)
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.no_tool_mocks
+@pytest.mark.parametrize("batch_enabled, expected_checks", [(True, 0), (False, 1)])
+async def test_resume_monitoring_leaves_batched_checks_to_the_sweep(monkeypatch, batch_enabled, expected_checks):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    executions_api = importlib.import_module("app.api.v1.executions")
+    enqueued = _record_direct_checks(monkeypatch, batch_enabled)
+    user = SimpleNamespace(id=uuid4())
+    execution = SimpleNamespace(
+        id=uuid4(),
+        user_id=user.id,
+        symbol="AAPL",
+        status=ExecutionStatus.NEEDS_RECONCILIATION,
+        execution_phase="completed",
+        error_message="position missing",
+        next_check_at=None,
+        result={},
+        pipeline_state=None,
+        pipeline_state_packed=None,
+    )
+
+    response = await executions_api.resume_monitoring_endpoint(
+        execution.id, current_user=user, db=FakeAsyncSession(execution)
+    )
+
+    assert response["status"] == "MONITORING"
+    assert execution.next_check_at > datetime.utcnow()
+    assert len(enqueued) == expected_checks
+
+
+@pytest.mark.no_tool_mocks
+def test_orphaned_chain_is_rescheduled_through_the_sweep_in_batch_mode(monkeypatch):
+    from app.orchestration.tasks.reconciliation import _reschedule_orphaned_monitoring
+
+    enqueued = _record_direct_checks(monkeypatch, batch_enabled=True)
+    execution = SimpleNamespace(
+        id=uuid4(),
+        symbol="AAPL",
+        version=3,
+        next_check_at=datetime.utcnow() - timedelta(minutes=10),
+    )
+    db = SimpleNamespace(commit=lambda: None, rollback=lambda: None)
+
+    assert _reschedule_orphaned_monitoring(db, execution) is True
+    assert execution.next_check_at > datetime.utcnow()
+    assert enqueued == []
@@ -0,0 +1,66 @@
+from app.services.notification_outbox import NotificationEvent, NotificationOutbox
+
+
+def _outbox(sent, rate_limits=None):
+    def sender(event, message):
+        sent.append((event.channel, event.user_id, message))
+        return {"status": "success"}
+
+    return NotificationOutbox(
+        redis_factory=lambda: None,
+        senders={"telegram": sender, "sms": sender},
+        dispatch_interval=3600,
+        dedupe_window=600,
+        rate_limits=rate_limits or {},
+    )
+
+
+def _event(message, user_id="user-1", **kwargs):
+    return NotificationEvent(channel="telegram", user_id=user_id, event="position_closed", message=message, **kwargs)
+
+
+def test_bursts_are_digested_per_user_and_duplicates_dropped():
+    sent = []
+    outbox = _outbox(sent)
+    outbox.enqueue(_event("AAPL closed", dedupe_key="position_closed:1"))
+    outbox.enqueue(_event("AAPL closed", dedupe_key="position_closed:1"))
+    outbox.enqueue(_event("MSFT closed", dedupe_key="position_closed:2"))
+    outbox.enqueue(_event("TSLA closed", user_id="user-2"))
+
+    stats = outbox.dispatch()
+
+    assert stats == {"events": 4, "duplicates": 1, "messages": 2, "failed": 0, "requeued": 0}
+    assert sent[0][1] == "user-1"
+    assert sent[0][2].startswith("📬 *2 updates*")
+    assert "AAPL closed" in sent[0][2] and "MSFT closed" in sent[0][2]
+    assert sent[1] == ("telegram", "user-2", "TSLA closed")
+
+    # Still inside the dedupe window
+    outbox.enqueue(_event("AAPL closed", dedupe_key="position_closed:1"))
+    assert outbox.dispatch()["duplicates"] == 1
+    assert len(sent) == 2
+
+
+def test_approval_requests_are_sent_alone_and_rate_limited_events_requeued():
+    sent = []
+    outbox = _outbox(sent, rate_limits={"sms": 1})
+    for token in ("a", "b"):
+        outbox.enqueue(NotificationEvent(
+            channel="sms",
+            user_id="user-1",
+            event="approval_request",
+            message=f"Approve {token}",
+            recipient="+15550100",
+            dedupe_key=f"approval:{token}",
+            digest=False,
+        ))
+
+    stats = outbox.dispatch()
+
+    assert stats["messages"] == 1 and stats["requeued"] == 1
+    assert sent == [("sms", "user-1", "Approve a")]
+    # The requeued event isn't mistaken for a duplicate on the next run
+    assert outbox._local[0].message == "Approve b"
+    outbox.rate_limits = {}
+    assert outbox.dispatch()["messages"] == 1
+    assert sent[-1] == ("sms", "user-1", "Approve b")
@@ -0,0 +1,44 @@
+import pytest
+
+from app.services.brokers.oanda_service import OandaBrokerService
+
+
+@pytest.mark.no_tool_mocks
+def test_trade_details_batch_uses_one_trades_request_and_one_history_scan(monkeypatch):
+    broker = OandaBrokerService(api_key="token", account_id="ACC1", paper=True)
+    requests_made = []
+
+    def fake_request(method, endpoint, params=None, data=None):
+        requests_made.append(endpoint)
+        if endpoint == "/accounts/ACC1/trades":
+            assert params["ids"] == "1,2,3"
+            assert params["state"] == "ALL"
+            return {"trades": [
+                {"id": "1", "state": "CLOSED", "realizedPL": "12.5", "price": "1.1",
+                 "initialUnits": "1000", "currentUnits": "0", "averageClosePrice": "1.2"},
+                {"id": "2", "state": "OPEN", "unrealizedPL": "-3", "price": "1.3",
+                 "initialUnits": "500", "currentUnits": "500"},
+            ]}
+        if endpoint == "/accounts/ACC1/transactions":
+            return {"lastTransactionID": "50"}
+        if endpoint == "/accounts/ACC1/transactions/idrange":
+            return {"transactions": [
+                {"type": "ORDER_FILL", "price": "1.5", "instrument": "EUR_USD",
+                 "tradesClosed": [{"tradeID": "3", "realizedPL": "4", "units": "-100"}]},
+            ]}
+        raise AssertionError(f"unexpected request {endpoint}")
+
+    monkeypatch.setattr(broker, "_make_request", fake_request)
+
+    details = broker.get_trade_details_batch([("1", None), ("2", "o-2"), ("3", None)])
+
+    assert requests_made == [
+        "/accounts/ACC1/trades",
+        "/accounts/ACC1/transactions",
+        "/accounts/ACC1/transactions/idrange",
+    ]
+    assert details[("1", None)]["state"] == "closed"
+    assert details[("1", None)]["realized_pl"] == 12.5
+    assert details[("1", None)]["close_price"] == 1.2
+    assert details[("2", "o-2")]["state"] == "open"
+    assert details[("3", None)]["realized_pl"] == 4.0
@@ -0,0 +1,85 @@
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.orchestration.state_codec import PackedMarketData, decode_state, encode_state
+from app.orchestration.tasks._helpers import load_pipeline_state, load_pipeline_state_dict, save_pipeline_state
+from app.schemas.pipeline_state import MarketData, PipelineState, StrategyResult, TimeframeData
+
+
+def _state(candle_count=200):
+    start = datetime(2026, 3, 2, 14, 30)
+    candles = [
+        TimeframeData(
+            timeframe="5m",
+            open=100 + i,
+            high=101 + i,
+            low=99 + i,
+            close=100.5 + i,
+            volume=1_000 + i,
+            timestamp=start + timedelta(minutes=5 * i),
+            rsi=55.5 if i % 2 else None,
+        )
+        for i in range(candle_count)
+    ]
+    candles[0].timestamp = candles[0].timestamp.replace(tzinfo=timezone.utc)
+    state = PipelineState(
+        pipeline_id=uuid4(),
+        execution_id=uuid4(),
+        user_id=uuid4(),
+        symbol="AAPL",
+        market_data=MarketData(symbol="AAPL", current_price=101.25, timeframes={"5m": candles, "1h": candles[:24]}),
+        strategy=StrategyResult(action="BUY", entry_price=101.0, confidence=0.7, reasoning="breakout"),
+    )
+    state.add_log("bias_agent", "bullish")
+    return state
+
+
+def _execution():
+    return SimpleNamespace(id=uuid4(), pipeline_state=None, pipeline_state_packed=None)
+
+
+def test_snapshot_round_trips_and_is_smaller_than_json():
+    state = _state()
+    execution = _execution()
+
+    save_pipeline_state(execution, state)
+    loaded = load_pipeline_state(execution)
+
+    assert loaded.model_dump(mode="json") == state.model_dump(mode="json")
+    assert loaded.get_latest_candle("5m") == state.get_latest_candle("5m")
+    assert loaded.market_data.timeframes["5m"][0].timestamp.tzinfo is not None
+    assert len(execution.pipeline_state_packed) * 3 < len(json.dumps(state.model_dump(mode="json")))
+
+
+def test_candles_stay_packed_until_read():
+    packed = encode_state(_state())
+
+    state = decode_state(packed)
+    assert isinstance(state.market_data, PackedMarketData)
+    assert state.market_data.current_price == 101.25
+    assert not state.market_data.candles_decoded
+
+    state.strategy.confidence = 0.9
+    repacked = decode_state(encode_state(state))
+    assert not state.market_data.candles_decoded
+    assert repacked.strategy.confidence == 0.9
+
+    # Nested dumps still see the candles
+    assert len(repacked.model_dump()["market_data"]["timeframes"]["1h"]) == 24
+
+
+def test_legacy_json_snapshots_still_load():
+    state = _state(candle_count=3)
+    execution = _execution()
+    execution.pipeline_state = state.model_dump(mode="json")
+
+    assert load_pipeline_state(execution).model_dump(mode="json") == state.model_dump(mode="json")
+    assert load_pipeline_state_dict(execution)["strategy"]["action"] == "BUY"
+
+    save_pipeline_state(execution, state)
+    assert execution.pipeline_state is None
+    summary = load_pipeline_state_dict(execution)
+    assert summary["strategy"]["action"] == "BUY"
+    assert "timeframes" not in summary["market_data"]
@@ -118,6 +118,44 @@ def test_kb_loader_loads_concepts_for_supported_agents():
     assert risk_bundle == ""
 
 
+def test_kb_loader_compiles_index_once_and_reloads_on_change(tmp_path: Path):
+    skills_dir = tmp_path / "skills"
+    concepts_dir = tmp_path / "concepts"
+    skills_dir.mkdir()
+    concepts_dir.mkdir()
+    skill_path = skills_dir / "skill-a.md"
+    skill_template = """---
+skill_id: kb_skill_alpha
+name: {name}
+category: ict
+agent_types: [strategy_agent]
+recommended_tools: [market_structure]
+---
+
+Alpha body.
+"""
+    skill_path.write_text(skill_template.format(name="Alpha Skill"), encoding="utf-8")
+    (concepts_dir / "liquidity.md").write_text("Liquidity rests above highs.", encoding="utf-8")
+
+    loader = KBLoader(kb_root=tmp_path, reload_check_seconds=0)
+    index = loader.index
+    assert loader.index is index
+    assert loader.load_concepts_bundle("strategy_agent") is index.concept_bundles["strategy_agent"]
+    assert "KB Concept: Liquidity" in index.concept_bundles["strategy_agent"]
+
+    skill_path.write_text(skill_template.format(name="Alpha Skill Renamed"), encoding="utf-8")
+    reloaded = loader.index
+
+    assert reloaded is not index
+    assert reloaded.content_hash != index.content_hash
+    assert [skill.name for skill in loader.load_kb_skill_definitions()] == ["Alpha Skill Renamed"]
+    assert reloaded.concept_bundles == index.concept_bundles
+
+    # A broken edit keeps the last good index
+    skill_path.write_text("---\nname: Missing fields\n---\n", encoding="utf-8")
+    assert loader.index is reloaded
+
+
 def test_pipeline_validator_rejects_unknown_skill_attachment():
     pipeline_config = {
         "nodes": [
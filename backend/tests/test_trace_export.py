@@ -0,0 +1,43 @@
+import json
+import threading
+
+from app.services.trace_export import TraceEvent, TraceExporter
+
+
+def test_events_reach_sinks_in_the_background(tmp_path):
+    path = tmp_path / "traces" / "events.jsonl"
+    exporter = TraceExporter(queue_size=100, batch_size=10, flush_interval=0.05, file_path=str(path))
+    emitted = []
+    caller = threading.current_thread()
+
+    assert exporter.submit(TraceEvent("generation", {"name": "llm_call"}, emit=lambda: emitted.append(
+        threading.current_thread() is caller
+    )))
+    assert exporter.submit(TraceEvent("tool", {"name": "tool_rsi"}))
+    assert exporter.flush(timeout=5)
+
+    assert emitted == [False]
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(r["kind"], r["name"]) for r in records] == [("generation", "llm_call"), ("tool", "tool_rsi")]
+
+
+def test_full_queue_drops_and_samples_instead_of_blocking():
+    exporter = TraceExporter(queue_size=4, batch_size=10, flush_interval=0.05, sample_rate=0.0, file_path="")
+    release = threading.Event()
+
+    # Hold the exporter thread inside the first batch so the queue fills up
+    exporter.submit(TraceEvent("generation", {}, emit=lambda: release.wait(5)))
+    exporter.flush()
+    for _ in range(50):
+        if exporter._queue.qsize() == 0:
+            break
+        release.wait(0.01)
+
+    accepted = [exporter.submit(TraceEvent("generation", {}, emit=lambda: None)) for _ in range(6)]
+    tool_accepted = exporter.submit(TraceEvent("tool", {}, emit=lambda: None))
+    release.set()
+
+    assert accepted == [True] * 4 + [False] * 2
+    assert tool_accepted is False
+    assert exporter.stats["dropped"] == 2
+    assert exporter.stats["sampled_out"] == 1
@@ -0,0 +1,148 @@
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+
+from app.websocket import event_bus
+from app.websocket.event_bus import ExecutionEventRelay, channel_for_user, publish_execution_event
+from app.websocket.manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Socket whose client only reads while ``reading`` is set."""
+
+    def __init__(self):
+        self.sent = []
+        self.reading = asyncio.Event()
+        self.reading.set()
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        await self.reading.wait()
+        self.sent.append(message)
+
+    async def close(self, code=1000, reason=None):
+        self.closed = True
+
+
+async def _settle():
+    await asyncio.sleep(0.01)
+
+
+def _close_all(manager):
+    for user_id, sockets in list(manager.active_connections.items()):
+        for ws in list(sockets):
+            manager.disconnect(ws, user_id)
+
+
+def _pnl(execution_id, value):
+    return {"type": "execution_pnl", "execution_id": execution_id, "data": {"unrealized_pl": value}}
+
+
+@pytest.mark.no_tool_mocks
+@pytest.mark.asyncio
+async def test_slow_client_gets_latest_pnl_and_fast_client_is_not_blocked():
+    manager = ConnectionManager(max_outbox_messages=50, send_timeout=5)
+    user_id = uuid4()
+    slow, fast = FakeWebSocket(), FakeWebSocket()
+    slow.reading.clear()
+    await manager.connect(slow, user_id)
+    await manager.connect(fast, user_id)
+
+    # First tick is taken by the slow socket's sender (stuck in send_json);
+    # the rest pile up and coalesce
+    for value in range(10):
+        manager.dispatch_event(user_id, _pnl("exec-1", float(value)))
+        await _settle()
+
+    assert [m["data"]["unrealized_pl"] for m in fast.sent] == [float(v) for v in range(10)]
+
+    slow.reading.set()
+    await _settle()
+    assert [m["data"]["unrealized_pl"] for m in slow.sent] == [0.0, 9.0]
+    _close_all(manager)
+
+
+@pytest.mark.no_tool_mocks
+@pytest.mark.asyncio
+async def test_overflow_drops_oldest_and_asks_client_to_resync():
+    manager = ConnectionManager(max_outbox_messages=3, send_timeout=5)
+    user_id = uuid4()
+    ws = FakeWebSocket()
+    ws.reading.clear()
+    await manager.connect(ws, user_id)
+
+    for n in range(6):
+        manager.send(ws, {"type": "note", "n": n})
+        await _settle()
+
+    ws.reading.set()
+    await _settle()
+    assert ws.sent == [
+        {"type": "note", "n": 0},
+        {"type": "resync", "dropped": 2},
+        {"type": "note", "n": 3},
+        {"type": "note", "n": 4},
+        {"type": "note", "n": 5},
+    ]
+    _close_all(manager)
+
+
+@pytest.mark.no_tool_mocks
+@pytest.mark.asyncio
+async def test_logs_only_reach_watchers_but_status_reaches_every_socket():
+    manager = ConnectionManager()
+    user_id = uuid4()
+    ws = FakeWebSocket()
+    await manager.connect(ws, user_id)
+
+    log = {"type": "execution_log", "execution_id": "exec-1", "data": {"entries": []}}
+    manager.dispatch_event(user_id, log)
+    manager.dispatch_event(user_id, {"type": "execution_update", "execution_id": "exec-1", "data": {}})
+    await _settle()
+    assert [m["type"] for m in ws.sent] == ["execution_update"]
+
+    await manager.subscribe_to_execution("exec-1", user_id)
+    manager.dispatch_event(user_id, log)
+    await _settle()
+    assert [m["type"] for m in ws.sent] == ["execution_update", "execution_log"]
+    _close_all(manager)
+
+
+@pytest.mark.no_tool_mocks
+@pytest.mark.asyncio
+async def test_relay_routes_channel_messages_to_the_owner():
+    manager = ConnectionManager()
+    relay = ExecutionEventRelay(manager, redis_url="redis://unused")
+    user_id = uuid4()
+    ws = FakeWebSocket()
+    await manager.connect(ws, user_id)
+
+    await relay._dispatch(channel_for_user(user_id), json.dumps(_pnl("exec-1", 4.0)))
+    await relay._dispatch("execution_events:not-a-uuid", "{}")
+    await _settle()
+
+    assert ws.sent == [_pnl("exec-1", 4.0)]
+    _close_all(manager)
+
+
+@pytest.mark.no_tool_mocks
+def test_publish_backs_off_after_redis_failure(monkeypatch):
+    attempts = []
+
+    class BrokenRedis:
+        def publish(self, channel, message):
+            attempts.append(channel)
+            raise ConnectionError("redis down")
+
+    monkeypatch.setattr(event_bus, "_publisher", BrokenRedis())
+    monkeypatch.setattr(event_bus, "_publisher_retry_at", 0.0)
+
+    for _ in range(3):
+        publish_execution_event(uuid4(), uuid4(), "execution_update", {"status": "RUNNING"})
+
+    assert len(attempts) == 1
@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+from app.models.llm_model import LLMModel
+from app.services import tool_detection_service
+from app.services.model_registry import ModelRegistry
+from app.services.tool_detection_service import ToolDetectionService
+from app.services.worker_cache import WorkerCache
+
+
+class FakeSession:
+    """Counts llm_models queries; returns the given rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    def query(self, model):
+        self.queries += 1
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def all(self):
+        return list(self.rows)
+
+
+def _model(model_id, **overrides):
+    values = dict(
+        model_id=model_id,
+        provider="openai",
+        display_name=model_id.upper(),
+        max_tokens=128000,
+        cost_per_1k_input_tokens=0.0025,
+        cost_per_1k_output_tokens=0.01,
+        cost_per_1m_cached_tokens=1.25,
+        typical_agent_cost=0.02,
+        is_active=True,
+        is_default=False,
+        environment="all",
+    )
+    values.update(overrides)
+    return LLMModel(**values)
+
+
+def test_model_lookups_share_one_catalog_query_until_invalidated(monkeypatch):
+    monkeypatch.setattr(ModelRegistry, "_cache", WorkerCache("model_registry_test", ttl_seconds=300))
+    db = FakeSession([_model("gpt-4o", is_default=True), _model("gpt-4o-mini")])
+
+    assert ModelRegistry.get_model("gpt-4o", db).typical_agent_cost == 0.02
+    assert ModelRegistry.get_default_model(db).model_id == "gpt-4o"
+    assert ModelRegistry.get_model_choices_for_schema(db) == ["gpt-4o", "gpt-4o-mini"]
+    assert ModelRegistry.calculate_agent_cost("gpt-4o-mini", db, estimated_input_tokens=1000) == 0.0025
+    assert db.queries == 1
+
+    db.rows = [_model("gpt-4o", typical_agent_cost=0.05)]
+    ModelRegistry.invalidate()
+
+    assert ModelRegistry.get_model("gpt-4o", db).typical_agent_cost == 0.05
+    assert ModelRegistry.get_model("gpt-4o-mini", db) is None
+    assert db.queries == 2
+
+
+def test_cache_evicts_least_recently_used_and_expired_entries():
+    cache = WorkerCache("lru_test", ttl_seconds=300, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    expired = WorkerCache("ttl_test", ttl_seconds=-1)
+    expired.set("a", 1)
+    assert expired.get("a", "missing") == "missing"
+
+
+async def test_unchanged_instructions_skip_the_detection_llm_calls(monkeypatch):
+    monkeypatch.setattr(tool_detection_service, "_detection_cache", WorkerCache("tool_detection_test", ttl_seconds=300))
+    calls = []
+
+    async def create(**request):
+        calls.append(request)
+        if "tools" in request:
+            tool_call = SimpleNamespace(
+                id="call-1",
+                function=SimpleNamespace(name="fvg_detector", arguments='{"timeframe": "1h"}'),
+            )
+            message = SimpleNamespace(tool_calls=[tool_call], content=None)
+            usage = SimpleNamespace(prompt_tokens=100, completion_tokens=20)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="tool_calls")], usage=usage)
+        message = SimpleNamespace(content='{"unsupported": [], "summary": "FVG entries", "confidence": 0.9}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    service = ToolDetectionService(openai_api_key="test", model="gpt-4o")
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    instructions = "Buy when a bullish FVG forms on the 1h chart"
+
+    first = await service.detect_tools(instructions, agent_type="strategy_agent")
+    first["tools"] = []  # callers filter the result in place
+    second = await service.detect_tools(instructions, agent_type="strategy_agent")
+    other_agent = await service.detect_tools(instructions, agent_type="bias_agent")
+
+    assert second["cached"] is True
+    assert [tool["tool"] for tool in second["tools"]] == ["fvg_detector"]
+    assert second["llm_cost"] == 0.0
+    assert "cached" not in other_agent
+    assert len(calls) == 4
@@ -1,8 +1,10 @@
 """Data Plane API endpoints"""
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 import json
+import time
 import structlog
 
 logger = structlog.get_logger()
@@ -19,39 +21,15 @@ def _get_stock_provider():
     - "finnhub": Uses Finnhub API (legacy default)
     
     Falls back to whichever API key is available if the configured provider
-    is not available.
+    is not available. Instances are shared process-wide (provider_registry),
+    so connections and rate-limit state are reused across requests.
     """
-    from app.providers.tiingo import TiingoProvider
-    from app.providers.finnhub import FinnhubProvider
-    from app.config import settings
-    
-    stock_provider = getattr(settings, "STOCK_PROVIDER", "finnhub").lower()
-    
-    if stock_provider == "tiingo":
-        if settings.TIINGO_API_KEY:
-            logger.debug("using_tiingo_provider")
-            return TiingoProvider(api_key=settings.TIINGO_API_KEY)
-        elif settings.FINNHUB_API_KEY:
-            logger.warning("tiingo_configured_but_no_key_falling_back_to_finnhub")
-            return FinnhubProvider(api_key=settings.FINNHUB_API_KEY)
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail="No stock data provider API key configured (TIINGO_API_KEY or FINNHUB_API_KEY)"
-            )
-    else:
-        # Default: Finnhub
-        if settings.FINNHUB_API_KEY:
-            logger.debug("using_finnhub_provider")
-            return FinnhubProvider(api_key=settings.FINNHUB_API_KEY)
-        elif settings.TIINGO_API_KEY:
-            logger.warning("finnhub_configured_but_no_key_falling_back_to_tiingo")
-            return TiingoProvider(api_key=settings.TIINGO_API_KEY)
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail="No stock data provider API key configured (FINNHUB_API_KEY or TIINGO_API_KEY)"
-            )
+    from app.providers.registry import provider_registry
+    
+    try:
+        return provider_registry.stock_provider()
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/quote/{ticker}")
@@ -64,8 +42,6 @@ async def get_quote(ticker: str):
     """
     from app.database import get_redis
     from app.services.data_fetcher import DataFetcher
-    from app.providers.oanda import OANDAProvider
-    from app.config import settings
     from app.telemetry import get_meter
     
     redis = await get_redis()
@@ -79,18 +55,8 @@ async def get_quote(ticker: str):
     # Cache miss - fetch on-demand
     logger.info("quote_cache_miss_fetching_on_demand", ticker=ticker)
     
-    # Determine provider based on ticker (forex pairs have underscore)
-    if "_" in ticker:
-        # Forex pair (e.g., EUR_USD)
-        if not settings.OANDA_API_KEY:
-            raise HTTPException(status_code=500, detail="OANDA API key not configured")
-        provider = OANDAProvider(
-            api_key=settings.OANDA_API_KEY,
-            account_type=settings.OANDA_ACCOUNT_TYPE
-        )
-    else:
-        # Stock ticker - uses configured stock provider (Tiingo or Finnhub)
-        provider = _get_stock_provider()
+    # OANDA for forex pairs (underscore), Tiingo/Finnhub for stocks
+    provider = _get_provider_for_ticker(ticker)
     
     meter = get_meter()
     fetcher = DataFetcher(provider, redis, meter)
@@ -104,6 +70,95 @@ async def get_quote(ticker: str):
     raise HTTPException(status_code=404, detail=f"Quote not found for {ticker}")
 
 
+def _parse_tickers(tickers: str) -> List[str]:
+    return list(dict.fromkeys(t.strip() for t in tickers.split(",") if t.strip()))
+
+
+@router.get("/quotes/live")
+async def get_live_quotes(
+    tickers: str = Query(..., description="Comma-separated list of tickers")
+):
+    """
+    Latest streamed quotes from this process's in-memory quote table.
+    
+    Requested tickers join the streamed universe (see
+    services/quote_stream.py), so repeated callers are served from memory
+    without provider calls. Tickers not streamed yet fall back to the
+    Redis quote cache; tickers in neither are listed in ``missing``.
+    
+    Example: /data/quotes/live?tickers=SPY,VIX,EUR_USD
+    """
+    from app.database import get_redis
+    from app.services.quote_stream import quote_stream
+    from app.services.redis_batch import mget_json
+    
+    ticker_list = _parse_tickers(tickers)
+    redis = await get_redis()
+    await quote_stream.register_interest(redis, ticker_list)
+    
+    quotes = quote_stream.table.get(ticker_list)
+    unknown = [t for t in ticker_list if t not in quotes]
+    if unknown:
+        cached = await mget_json(redis, [f"quote:{t}" for t in unknown])
+        quotes.update({t: cached[f"quote:{t}"] for t in unknown if cached.get(f"quote:{t}")})
+    
+    return {
+        "quotes": quotes,
+        "missing": [t for t in ticker_list if t not in quotes],
+    }
+
+
+@router.get("/quotes/stream")
+async def stream_quotes(
+    request: Request,
+    tickers: str = Query(..., description="Comma-separated list of tickers"),
+):
+    """
+    Server-Sent Events stream of quote updates.
+    
+    Sends a ``snapshot`` event with the currently known quotes, then a
+    ``quotes`` event (``{ticker: quote}``) whenever a streamed price
+    changes. Updates for a slow client are coalesced to the latest quote
+    per ticker. A comment line is sent every 15s as a keepalive.
+    
+    Example: curl -N /api/v1/data/quotes/stream?tickers=AAPL,EUR_USD
+    """
+    from app.database import get_redis
+    from app.services.quote_stream import quote_stream
+    
+    ticker_list = _parse_tickers(tickers)
+    if not ticker_list:
+        raise HTTPException(status_code=400, detail="No tickers requested")
+    
+    redis = await get_redis()
+    await quote_stream.register_interest(redis, ticker_list)
+    subscription = quote_stream.table.subscribe(ticker_list)
+    
+    async def _events():
+        try:
+            snapshot = quote_stream.table.get(ticker_list)
+            yield f"event: snapshot\ndata: {json.dumps(snapshot)}\n\n"
+            interest_renewed = time.monotonic()
+            while not await request.is_disconnected():
+                updates = await subscription.next(timeout=15.0)
+                if updates:
+                    yield f"event: quotes\ndata: {json.dumps(updates)}\n\n"
+                else:
+                    yield ": keepalive\n\n"
+                # Keep the tickers in the streamed universe while connected
+                if time.monotonic() - interest_renewed >= 60:
+                    await quote_stream.register_interest(redis, ticker_list)
+                    interest_renewed = time.monotonic()
+        finally:
+            quote_stream.table.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/candles/{ticker}")
 async def get_candles(
     ticker: str,
@@ -120,8 +175,6 @@ async def get_candles(
     Automatically routes based on ticker format (underscore = forex).
     """
     from app.services.data_fetcher import DataFetcher
-    from app.providers.oanda import OANDAProvider
-    from app.config import settings
     from app.database import get_redis
     from app.telemetry import get_meter
     
@@ -135,19 +188,8 @@ async def get_candles(
         else:
             candles = await fetcher.fetch_candles_at_timestamp(ticker, timeframe, limit, backtest_ts)
     else:
-        # Determine provider based on ticker (forex pairs have underscore)
-        if "_" in ticker:
-            # Forex pair (e.g., EUR_USD)
-            if not settings.OANDA_API_KEY:
-                raise HTTPException(status_code=500, detail="OANDA API key not configured")
-            provider = OANDAProvider(
-                api_key=settings.OANDA_API_KEY,
-                account_type=settings.OANDA_ACCOUNT_TYPE
-            )
-            logger.debug("using_oanda_provider", ticker=ticker)
-        else:
-            # Stock ticker - uses configured stock provider (Tiingo or Finnhub)
-            provider = _get_stock_provider()
+        # OANDA for forex pairs (underscore), Tiingo/Finnhub for stocks
+        provider = _get_provider_for_ticker(ticker)
 
         fetcher = DataFetcher(provider, redis, meter)
         candles = await fetcher.fetch_candles(ticker, timeframe, limit)
@@ -192,8 +234,6 @@ async def get_indicators(
         Dictionary with indicator results for each requested indicator
     """
     from app.services.data_fetcher import DataFetcher
-    from app.providers.oanda import OANDAProvider
-    from app.config import settings
     from app.database import get_redis
     from app.telemetry import get_meter
     
@@ -206,19 +246,8 @@ async def get_indicators(
         indicators=indicator_list
     )
     
-    # Determine provider based on ticker (forex pairs have underscore)
-    if "_" in ticker:
-        # Forex pair (e.g., EUR_USD)
-        if not settings.OANDA_API_KEY:
-            raise HTTPException(status_code=500, detail="OANDA API key not configured")
-        provider = OANDAProvider(
-            api_key=settings.OANDA_API_KEY,
-            account_type=settings.OANDA_ACCOUNT_TYPE
-        )
-        logger.debug("using_oanda_provider", ticker=ticker)
-    else:
-        # Stock ticker - uses configured stock provider (Tiingo or Finnhub)
-        provider = _get_stock_provider()
+    # OANDA for forex pairs (underscore), Tiingo/Finnhub for stocks
+    provider = _get_provider_for_ticker(ticker)
     
     redis = await get_redis()
     meter = get_meter()
@@ -265,6 +294,19 @@ async def get_indicators(
         )
 
 
+def _get_provider_for_ticker(ticker: str):
+    """OANDA for forex pairs (underscore), the configured stock provider otherwise."""
+    from app.providers.base import ProviderType
+    from app.providers.registry import provider_registry
+    
+    if "_" in ticker:
+        provider = provider_registry.get(ProviderType.OANDA)
+        if provider is None:
+            raise HTTPException(status_code=500, detail="OANDA API key not configured")
+        return provider
+    return _get_stock_provider()
+
+
 @router.get("/batch")
 async def get_batch_data(
     tickers: str = Query(..., description="Comma-separated list of tickers"),
@@ -273,42 +315,53 @@ async def get_batch_data(
     """
     Batch endpoint for fetching multiple tickers at once.
     
+    Cached values for all tickers are read with one MGET per data type;
+    only the misses go to the provider (grouped forex / stocks).
+    
     Example: /data/batch?tickers=AAPL,GOOGL,MSFT&data_types=quote
     """
     from app.database import get_redis
     from app.services.data_fetcher import DataFetcher
-    from app.config import settings
+    from app.services.redis_batch import mget_json
     from app.telemetry import get_meter
     
-    ticker_list = [t.strip() for t in tickers.split(",")]
+    ticker_list = list(dict.fromkeys(t.strip() for t in tickers.split(",") if t.strip()))
     types = [t.strip() for t in data_types.split(",")]
     
     logger.info("batch_request", tickers=ticker_list, types=types)
     
     redis = await get_redis()
     meter = get_meter()
-    fetcher = DataFetcher(settings.FINNHUB_API_KEY, redis, meter)
     
-    results = {}
+    results = {ticker: {} for ticker in ticker_list}
     
-    for ticker in ticker_list:
-        results[ticker] = {}
+    # Group tickers by provider type (forex pairs have underscore)
+    forex = [t for t in ticker_list if "_" in t]
+    stocks = [t for t in ticker_list if "_" not in t]
+    
+    if "quote" in types:
+        keys = {ticker: f"quote:{ticker}" for ticker in ticker_list}
+        cached = await mget_json(redis, list(keys.values()))
+        misses = [t for t in ticker_list if cached.get(keys[t]) is None]
         
-        if "quote" in types:
-            # Try cache first
-            cached = await redis.get(f"quote:{ticker}")
-            if cached:
-                results[ticker]["quote"] = json.loads(cached)
-            else:
-                # Fetch on-demand
-                await fetcher.fetch_quotes_batch([ticker], ttl=60)
-                cached = await redis.get(f"quote:{ticker}")
-                if cached:
-                    results[ticker]["quote"] = json.loads(cached)
+        # Fetch misses on-demand (fetch_quotes_batch returns what it cached)
+        for group in ([t for t in misses if t in forex], [t for t in misses if t in stocks]):
+            if group:
+                fetcher = DataFetcher(_get_provider_for_ticker(group[0]), redis, meter)
+                fetched = await fetcher.fetch_quotes_batch(group, ttl=60)
+                cached.update({keys[t]: quote for t, quote in fetched.items()})
         
-        if "candles" in types:
-            candles = await fetcher.fetch_candles(ticker, "5m", 100)
-            results[ticker]["candles"] = candles
+        for ticker in ticker_list:
+            if cached.get(keys[ticker]) is not None:
+                results[ticker]["quote"] = cached[keys[ticker]]
+    
+    if "candles" in types:
+        for group in (forex, stocks):
+            if group:
+                fetcher = DataFetcher(_get_provider_for_ticker(group[0]), redis, meter)
+                candles = await fetcher.fetch_candles_many(group, "5m", 100)
+                for ticker in group:
+                    results[ticker]["candles"] = candles.get(ticker, [])
     
     return results
 
@@ -324,8 +377,10 @@ async def get_universe():
     
     redis = await get_redis()
     
-    hot_tickers = await redis.smembers("tickers:hot")
-    warm_tickers = await redis.smembers("tickers:warm")
+    pipe = redis.pipeline(transaction=False)
+    pipe.smembers("tickers:hot")
+    pipe.smembers("tickers:warm")
+    hot_tickers, warm_tickers = await pipe.execute()
     
     return {
         "hot": sorted(list(hot_tickers)) if hot_tickers else [],
@@ -334,6 +389,24 @@ async def get_universe():
     }
 
 
+@router.get("/watermarks")
+async def get_watermarks():
+    """
+    Get the close time of the newest fully-ingested bar per timeframe.
+    
+    Advanced by the prefetch task once the bar's candles are written,
+    aggregated and cached. Consumers poll this (or subscribe to the
+    ``candles:closed`` Redis channel) to run only when a bar has closed.
+    """
+    from app.database import get_redis
+    from app.services.bar_watermark import WATERMARK_KEY
+    
+    redis = await get_redis()
+    watermarks = await redis.hgetall(WATERMARK_KEY)
+    
+    return {"watermarks": watermarks or {}}
+
+
 @router.get("/health")
 async def health():
     """Health check endpoint"""
@@ -364,9 +437,12 @@ async def metrics_universe(response: Response):
     redis = await get_redis()
     
     try:
-        hot = await redis.get("metrics:universe:hot") or "0"
-        warm = await redis.get("metrics:universe:warm") or "0"
-        total = await redis.get("metrics:universe:total") or "0"
+        hot, warm, total = (
+            value or "0"
+            for value in await redis.mget(
+                "metrics:universe:hot", "metrics:universe:warm", "metrics:universe:total"
+            )
+        )
         
         # Prometheus format
         metrics_text = f"""# HELP universe_size Total number of tickers in universe
@@ -67,12 +67,28 @@ async def startup_event():
     except Exception as e:
         logger.warning("hypertable_init_failed_on_startup", error=str(e))
 
+    # Build the shared providers (and their pooled HTTP clients) up front
+    from app.providers import provider_registry
+    providers = provider_registry.configured()
+    logger.info("providers_ready", providers=[p.provider_type.value for p in providers])
+
+    # Live quote table + batched poller (see services/quote_stream.py)
+    if settings.QUOTE_STREAM_ENABLED:
+        from app.services.quote_stream import quote_stream
+        await quote_stream.start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown tasks"""
     logger.info("data_plane_shutting_down")
 
+    from app.services.quote_stream import quote_stream
+    await quote_stream.stop()
+
+    from app.providers import provider_registry
+    await provider_registry.aclose()
+
 
 @app.get("/")
 async def root():
@@ -12,6 +12,7 @@ from .base import BaseProvider, ProviderType
 from .finnhub import FinnhubProvider
 from .oanda import OANDAProvider
 from .tiingo import TiingoProvider
+from .registry import ProviderRegistry, provider_registry
 
 __all__ = [
     "BaseProvider",
@@ -19,6 +20,8 @@ __all__ = [
     "FinnhubProvider",
     "OANDAProvider",
     "TiingoProvider",
+    "ProviderRegistry",
+    "provider_registry",
     "get_provider"
 ]
 
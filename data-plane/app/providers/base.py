@@ -7,11 +7,20 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List, Dict, Optional
 from datetime import datetime
+import asyncio
+import importlib.util
 import time
+import httpx
 import structlog
 
 logger = structlog.get_logger()
 
+# HTTP/2 needs the optional ``h2`` package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Concurrent single-symbol requests in the default ``get_quotes``
+QUOTE_BATCH_CONCURRENCY = 8
+
 
 class ProviderType(str, Enum):
     """Supported provider types."""
@@ -53,6 +62,48 @@ class BaseProvider(ABC):
         self.rate_limit_remaining = None
         self.rate_limit_total = None
         self.rate_limit_reset_time = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _client_headers(self) -> Dict[str, str]:
+        """Default headers for the pooled HTTP client. Override per provider."""
+        return {}
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the provider's persistent HTTP client.
+        
+        One keep-alive pool (HTTP/2 when available) is shared by every call
+        on this provider instead of a TCP+TLS handshake per request. The
+        client is bound to the event loop it was created on, so it is
+        recreated if a caller runs on a different loop (e.g. a Celery
+        task after its loop was replaced).
+        """
+        loop = asyncio.get_running_loop()
+        client = self._http_client
+        if client is None or client.is_closed or self._http_client_loop is not loop:
+            # A client owned by another loop can't be awaited here; it is
+            # dropped and its connections are released when collected
+            self._http_client = httpx.AsyncClient(
+                headers=self._client_headers(),
+                timeout=15.0,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                ),
+            )
+            self._http_client_loop = loop
+        return self._http_client
+    
+    async def close(self):
+        """Close the persistent HTTP client."""
+        client, self._http_client = self._http_client, None
+        loop, self._http_client_loop = self._http_client_loop, None
+        if client is None or client.is_closed:
+            return
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
     
     def _track_rate_limit(self, remaining: Optional[int], total: Optional[int], reset_time: Optional[int] = None):
         """
@@ -148,6 +199,44 @@ class BaseProvider(ABC):
         """
         pass
     
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get real-time quotes for many symbols.
+        
+        Default implementation calls ``get_quote`` concurrently (bounded).
+        Providers with a multi-symbol endpoint override this to fetch the
+        whole batch in one request.
+        
+        Args:
+            symbols: Ticker symbols (provider's default asset class)
+        
+        Returns:
+            symbol -> quote (same format as ``get_quote``); symbols that
+            failed are omitted
+        """
+        semaphore = asyncio.Semaphore(QUOTE_BATCH_CONCURRENCY)
+        
+        async def _one(symbol: str):
+            async with semaphore:
+                try:
+                    return symbol, await self.get_quote(symbol)
+                except Exception as e:
+                    logger.warning(
+                        "provider_quote_failed",
+                        provider=self.provider_type.value,
+                        symbol=symbol,
+                        error=str(e)
+                    )
+                    return symbol, None
+        
+        results = await asyncio.gather(*(_one(s) for s in dict.fromkeys(symbols)))
+        return {symbol: quote for symbol, quote in results if quote is not None}
+    
+    @property
+    def supports_batch_quotes(self) -> bool:
+        """True if ``get_quotes`` is one multi-symbol request, not a request per symbol."""
+        return type(self).get_quotes is not BaseProvider.get_quotes
+    
     @abstractmethod
     async def get_candles(
         self, 
@@ -95,46 +95,46 @@ class FinnhubProvider(BaseProvider):
         
         start_time = time.time()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=10.0)
-                duration = time.time() - start_time
-                
-                # Track rate limit from response headers
-                rate_limit_limit = response.headers.get("X-Ratelimit-Limit")
-                rate_limit_remaining = response.headers.get("X-Ratelimit-Remaining")
-                rate_limit_reset = response.headers.get("X-Ratelimit-Reset")
-                
-                if rate_limit_limit and rate_limit_remaining:
-                    self._track_rate_limit(
-                        remaining=int(rate_limit_remaining),
-                        total=int(rate_limit_limit),
-                        reset_time=int(rate_limit_reset) if rate_limit_reset else None
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
+            client = await self._get_client()
+            response = await client.get(url, params=params, timeout=10.0)
+            duration = time.time() - start_time
+            
+            # Track rate limit from response headers
+            rate_limit_limit = response.headers.get("X-Ratelimit-Limit")
+            rate_limit_remaining = response.headers.get("X-Ratelimit-Remaining")
+            rate_limit_reset = response.headers.get("X-Ratelimit-Reset")
+            
+            if rate_limit_limit and rate_limit_remaining:
+                self._track_rate_limit(
+                    remaining=int(rate_limit_remaining),
+                    total=int(rate_limit_limit),
+                    reset_time=int(rate_limit_reset) if rate_limit_reset else None
+                )
+            
+            response.raise_for_status()
+            data = response.json()
 
-                # Track successful API call with bandwidth
-                self._track_api_call("quote", duration, "success", len(response.content))
+            # Track successful API call with bandwidth
+            self._track_api_call("quote", duration, "success", len(response.content))
 
-                if "error" in data:
-                    raise ValueError(f"Finnhub error: {data['error']}")
-                
-                current_price = data.get("c", 0.0)
-                
-                return {
-                    "symbol": symbol,
-                    "current_price": current_price,
-                    "bid": current_price,  # Finnhub doesn't provide bid/ask for free tier
-                    "ask": current_price,
-                    "spread": 0.0,
-                    "high": data.get("h", 0.0),
-                    "low": data.get("l", 0.0),
-                    "open": data.get("o", 0.0),
-                    "previous_close": data.get("pc", 0.0),
-                    "volume": 0,  # Not included in quote endpoint
-                    "timestamp": datetime.fromtimestamp(data.get("t", 0))
-                }
+            if "error" in data:
+                raise ValueError(f"Finnhub error: {data['error']}")
+            
+            current_price = data.get("c", 0.0)
+            
+            return {
+                "symbol": symbol,
+                "current_price": current_price,
+                "bid": current_price,  # Finnhub doesn't provide bid/ask for free tier
+                "ask": current_price,
+                "spread": 0.0,
+                "high": data.get("h", 0.0),
+                "low": data.get("l", 0.0),
+                "open": data.get("o", 0.0),
+                "previous_close": data.get("pc", 0.0),
+                "volume": 0,  # Not included in quote endpoint
+                "timestamp": datetime.fromtimestamp(data.get("t", 0))
+            }
         
         except httpx.HTTPStatusError as e:
             duration = time.time() - start_time
@@ -201,55 +201,55 @@ class FinnhubProvider(BaseProvider):
         
         start_time = time.time()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=15.0)
-                duration = time.time() - start_time
-                
-                # Track rate limit
-                rate_limit_limit = response.headers.get("X-Ratelimit-Limit")
-                rate_limit_remaining = response.headers.get("X-Ratelimit-Remaining")
-                rate_limit_reset = response.headers.get("X-Ratelimit-Reset")
-                
-                if rate_limit_limit and rate_limit_remaining:
-                    self._track_rate_limit(
-                        remaining=int(rate_limit_remaining),
-                        total=int(rate_limit_limit),
-                        reset_time=int(rate_limit_reset) if rate_limit_reset else None
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
+            client = await self._get_client()
+            response = await client.get(url, params=params, timeout=15.0)
+            duration = time.time() - start_time
+            
+            # Track rate limit
+            rate_limit_limit = response.headers.get("X-Ratelimit-Limit")
+            rate_limit_remaining = response.headers.get("X-Ratelimit-Remaining")
+            rate_limit_reset = response.headers.get("X-Ratelimit-Reset")
+            
+            if rate_limit_limit and rate_limit_remaining:
+                self._track_rate_limit(
+                    remaining=int(rate_limit_remaining),
+                    total=int(rate_limit_limit),
+                    reset_time=int(rate_limit_reset) if rate_limit_reset else None
+                )
+            
+            response.raise_for_status()
+            data = response.json()
 
-                # Track successful API call with bandwidth
-                self._track_api_call("candles", duration, "success", len(response.content))
+            # Track successful API call with bandwidth
+            self._track_api_call("candles", duration, "success", len(response.content))
 
-                if data.get("s") == "no_data":
-                    logger.warning("finnhub_no_candle_data", symbol=symbol, timeframe=timeframe)
-                    return []
-                
-                if "error" in data:
-                    raise ValueError(f"Finnhub error: {data['error']}")
-                
-                # Convert Finnhub format to standard format
-                candles = []
-                for i in range(len(data.get("t", []))):
-                    candles.append({
-                        "time": datetime.fromtimestamp(data["t"][i]).isoformat(),
-                        "open": data["o"][i],
-                        "high": data["h"][i],
-                        "low": data["l"][i],
-                        "close": data["c"][i],
-                        "volume": data["v"][i]
-                    })
-                
-                logger.info(
-                    "finnhub_candles_fetched",
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    count=len(candles)
-                )
-                
-                return candles
+            if data.get("s") == "no_data":
+                logger.warning("finnhub_no_candle_data", symbol=symbol, timeframe=timeframe)
+                return []
+            
+            if "error" in data:
+                raise ValueError(f"Finnhub error: {data['error']}")
+            
+            # Convert Finnhub format to standard format
+            candles = []
+            for i in range(len(data.get("t", []))):
+                candles.append({
+                    "time": datetime.fromtimestamp(data["t"][i]).isoformat(),
+                    "open": data["o"][i],
+                    "high": data["h"][i],
+                    "low": data["l"][i],
+                    "close": data["c"][i],
+                    "volume": data["v"][i]
+                })
+            
+            logger.info(
+                "finnhub_candles_fetched",
+                symbol=symbol,
+                timeframe=timeframe,
+                count=len(candles)
+            )
+            
+            return candles
         
         except httpx.HTTPStatusError as e:
             duration = time.time() - start_time
@@ -104,44 +104,25 @@ class OANDAProvider(BaseProvider):
         
         start_time = time.time()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers=self.headers,
-                    timeout=10.0
-                )
-                duration = time.time() - start_time
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Track successful API call (OANDA has no rate limits)
-                self._track_api_call("quote", duration, "success", len(response.content))
-                
-                if not data.get("prices"):
-                    raise ValueError(f"No price data for {symbol}")
-                
-                price_data = data["prices"][0]
-                
-                # Extract bid/ask
-                bid = float(price_data["bids"][0]["price"]) if price_data.get("bids") else 0.0
-                ask = float(price_data["asks"][0]["price"]) if price_data.get("asks") else 0.0
-                current_price = (bid + ask) / 2 if bid and ask else 0.0
-                
-                return {
-                    "symbol": symbol,
-                    "current_price": current_price,
-                    "bid": bid,
-                    "ask": ask,
-                    "spread": ask - bid if bid and ask else 0.0,
-                    "high": current_price,  # OANDA quotes don't include daily high/low
-                    "low": current_price,
-                    "open": current_price,
-                    "previous_close": current_price,
-                    "volume": 0,  # Forex doesn't have traditional volume
-                    "timestamp": datetime.fromisoformat(price_data["time"].replace("Z", "+00:00"))
-                }
+            client = await self._get_client()
+            response = await client.get(
+                url,
+                params=params,
+                headers=self.headers,
+                timeout=10.0
+            )
+            duration = time.time() - start_time
+            
+            response.raise_for_status()
+            data = response.json()
+            
+            # Track successful API call (OANDA has no rate limits)
+            self._track_api_call("quote", duration, "success", len(response.content))
+            
+            if not data.get("prices"):
+                raise ValueError(f"No price data for {symbol}")
+            
+            return self._parse_price(symbol, data["prices"][0])
         
         except httpx.HTTPStatusError as e:
             duration = time.time() - start_time
@@ -164,6 +145,65 @@ class OANDAProvider(BaseProvider):
             )
             raise
     
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get real-time quotes for many forex pairs in one pricing request
+        (``instruments=EUR_USD,GBP_USD,...``).
+        
+        Instruments missing from the response are omitted.
+        """
+        by_instrument = {self.normalize_symbol(s, AssetClass.FOREX): s for s in symbols}
+        if not by_instrument:
+            return {}
+        
+        url = f"{self.base_url}/v3/accounts/{await self._get_account_id()}/pricing"
+        start_time = time.time()
+        try:
+            client = await self._get_client()
+            response = await client.get(
+                url,
+                params={"instruments": ",".join(by_instrument)},
+                headers=self.headers,
+                timeout=10.0
+            )
+            duration = time.time() - start_time
+            response.raise_for_status()
+            data = response.json()
+            self._track_api_call("quote", duration, "success", len(response.content))
+        except Exception as e:
+            self._track_api_call("quote", time.time() - start_time, "error")
+            logger.error("oanda_quotes_batch_error", instruments=len(by_instrument), error=str(e))
+            return {}
+        
+        quotes: Dict[str, Dict] = {}
+        for price_data in data.get("prices", []):
+            symbol = by_instrument.get(price_data.get("instrument"))
+            if symbol is not None:
+                quotes[symbol] = self._parse_price(symbol, price_data)
+        return quotes
+    
+    @staticmethod
+    def _parse_price(symbol: str, price_data: Dict) -> Dict:
+        """Convert one pricing entry to the BaseProvider quote format."""
+        # Extract bid/ask
+        bid = float(price_data["bids"][0]["price"]) if price_data.get("bids") else 0.0
+        ask = float(price_data["asks"][0]["price"]) if price_data.get("asks") else 0.0
+        current_price = (bid + ask) / 2 if bid and ask else 0.0
+        
+        return {
+            "symbol": symbol,
+            "current_price": current_price,
+            "bid": bid,
+            "ask": ask,
+            "spread": ask - bid if bid and ask else 0.0,
+            "high": current_price,  # OANDA quotes don't include daily high/low
+            "low": current_price,
+            "open": current_price,
+            "previous_close": current_price,
+            "volume": 0,  # Forex doesn't have traditional volume
+            "timestamp": datetime.fromisoformat(price_data["time"].replace("Z", "+00:00"))
+        }
+    
     async def get_candles(
         self,
         symbol: str,
@@ -197,44 +237,44 @@ class OANDAProvider(BaseProvider):
         
         start_time = time.time()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers=self.headers,
-                    timeout=15.0
-                )
-                duration = time.time() - start_time
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Track successful API call
-                self._track_api_call("candles", duration, "success", len(response.content))
-                
-                candles = []
-                for candle in data.get("candles", []):
-                    if not candle.get("complete"):
-                        continue  # Skip incomplete candles
-                    
-                    mid = candle["mid"]
-                    candles.append({
-                        "time": candle["time"],
-                        "open": float(mid["o"]),
-                        "high": float(mid["h"]),
-                        "low": float(mid["l"]),
-                        "close": float(mid["c"]),
-                        "volume": candle.get("volume", 0)
-                    })
-                
-                logger.info(
-                    "oanda_candles_fetched",
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    count=len(candles)
-                )
+            client = await self._get_client()
+            response = await client.get(
+                url,
+                params=params,
+                headers=self.headers,
+                timeout=15.0
+            )
+            duration = time.time() - start_time
+            
+            response.raise_for_status()
+            data = response.json()
+            
+            # Track successful API call
+            self._track_api_call("candles", duration, "success", len(response.content))
+            
+            candles = []
+            for candle in data.get("candles", []):
+                if not candle.get("complete"):
+                    continue  # Skip incomplete candles
                 
-                return candles
+                mid = candle["mid"]
+                candles.append({
+                    "time": candle["time"],
+                    "open": float(mid["o"]),
+                    "high": float(mid["h"]),
+                    "low": float(mid["l"]),
+                    "close": float(mid["c"]),
+                    "volume": candle.get("volume", 0)
+                })
+            
+            logger.info(
+                "oanda_candles_fetched",
+                symbol=symbol,
+                timeframe=timeframe,
+                count=len(candles)
+            )
+            
+            return candles
         
         except httpx.HTTPStatusError as e:
             duration = time.time() - start_time
@@ -358,22 +398,22 @@ class OANDAProvider(BaseProvider):
         url = f"{self.base_url}/v3/accounts"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers=self.headers,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                if not data.get("accounts"):
-                    raise ValueError("No OANDA accounts found")
-                
-                self._account_id = data["accounts"][0]["id"]
-                logger.info("oanda_account_id_fetched", account_id=self._account_id)
-                
-                return self._account_id
+            client = await self._get_client()
+            response = await client.get(
+                url,
+                headers=self.headers,
+                timeout=10.0
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if not data.get("accounts"):
+                raise ValueError("No OANDA accounts found")
+            
+            self._account_id = data["accounts"][0]["id"]
+            logger.info("oanda_account_id_fetched", account_id=self._account_id)
+            
+            return self._account_id
         
         except Exception as e:
             logger.error("oanda_account_id_fetch_error", error=str(e))
@@ -0,0 +1,129 @@
+"""
+Process-wide provider registry
+
+API handlers and Celery tasks used to construct a new provider (and with
+it a new HTTP client) for every request or ticker group, so every call
+paid a fresh TCP+TLS handshake and rate-limit state tracked on the
+provider was thrown away immediately. The registry keeps one configured
+instance per provider type for the life of the process; each instance
+owns a pooled keep-alive client (see ``BaseProvider._get_client``).
+
+Example:
+    from app.providers.registry import provider_registry
+
+    provider = provider_registry.for_ticker("EUR_USD")  # OANDA
+    quote = await provider.get_quote("EUR_USD")
+
+    await provider_registry.aclose()  # on shutdown
+"""
+from typing import Dict, List, Optional
+
+import structlog
+
+from app.config import settings
+from .base import BaseProvider, ProviderType
+from .finnhub import FinnhubProvider
+from .oanda import OANDAProvider
+from .tiingo import TiingoProvider
+
+logger = structlog.get_logger()
+
+
+class ProviderRegistry:
+    """Lazily built, shared provider instances keyed by provider type."""
+
+    def __init__(self):
+        self._providers: Dict[ProviderType, BaseProvider] = {}
+
+    def _build(self, provider_type: ProviderType) -> Optional[BaseProvider]:
+        if provider_type == ProviderType.TIINGO and settings.TIINGO_API_KEY:
+            return TiingoProvider(api_key=settings.TIINGO_API_KEY)
+        if provider_type == ProviderType.FINNHUB and settings.FINNHUB_API_KEY:
+            return FinnhubProvider(api_key=settings.FINNHUB_API_KEY)
+        if provider_type == ProviderType.OANDA and settings.OANDA_API_KEY:
+            return OANDAProvider(
+                api_key=settings.OANDA_API_KEY,
+                account_type=settings.OANDA_ACCOUNT_TYPE,
+            )
+        return None
+
+    def get(self, provider_type: ProviderType) -> Optional[BaseProvider]:
+        """
+        Shared instance for a provider type.
+
+        Returns:
+            The provider, or None when its API key is not configured
+        """
+        provider = self._providers.get(provider_type)
+        if provider is None:
+            provider = self._build(provider_type)
+            if provider is not None:
+                self._providers[provider_type] = provider
+        return provider
+
+    def stock_provider(self) -> BaseProvider:
+        """
+        The configured stock provider (STOCK_PROVIDER: tiingo or finnhub).
+
+        Falls back to whichever stock provider has an API key.
+
+        Raises:
+            RuntimeError: If neither TIINGO_API_KEY nor FINNHUB_API_KEY is set
+        """
+        preferred = (
+            ProviderType.TIINGO
+            if settings.STOCK_PROVIDER.lower() == "tiingo"
+            else ProviderType.FINNHUB
+        )
+        fallback = ProviderType.FINNHUB if preferred == ProviderType.TIINGO else ProviderType.TIINGO
+
+        provider = self.get(preferred)
+        if provider is not None:
+            return provider
+
+        provider = self.get(fallback)
+        if provider is not None:
+            logger.warning(
+                "stock_provider_key_missing_falling_back",
+                configured=preferred.value,
+                using=fallback.value,
+            )
+            return provider
+
+        raise RuntimeError(
+            "No stock data provider API key configured "
+            "(TIINGO_API_KEY or FINNHUB_API_KEY)"
+        )
+
+    def for_ticker(self, ticker: str) -> BaseProvider:
+        """
+        OANDA for forex pairs (underscore), the stock provider otherwise.
+
+        Forex tickers fall back to the stock provider when OANDA isn't
+        configured.
+        """
+        if "_" in ticker:
+            provider = self.get(ProviderType.OANDA)
+            if provider is not None:
+                return provider
+        return self.stock_provider()
+
+    def configured(self) -> List[BaseProvider]:
+        """Instantiate every provider with an API key configured."""
+        return [p for p in (self.get(t) for t in ProviderType) if p is not None]
+
+    async def aclose(self):
+        """Close every provider's HTTP client and forget the instances."""
+        providers, self._providers = list(self._providers.values()), {}
+        for provider in providers:
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.warning(
+                    "provider_close_failed",
+                    provider=provider.provider_type.value,
+                    error=str(e),
+                )
+
+
+provider_registry = ProviderRegistry()
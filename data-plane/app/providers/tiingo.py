@@ -24,7 +24,7 @@ Authentication: Header "Authorization: Token <api_key>"
 Documentation: https://www.tiingo.com/documentation/general/overview
 """
 import httpx
-from typing import List, Dict, Optional
+from typing import List, Dict
 from datetime import datetime, timedelta
 import structlog
 import time
@@ -73,6 +73,8 @@ class TiingoProvider(BaseProvider):
     """
     
     BASE_URL = "https://api.tiingo.com"
+    # Tickers per multi-symbol IEX quote request
+    IEX_BATCH_SIZE = 100
     
     def __init__(self, api_key: str, **kwargs):
         """
@@ -86,28 +88,11 @@ class TiingoProvider(BaseProvider):
             "Authorization": f"Token {self.api_key}",
             "Content-Type": "application/json",
         }
-        self._http_client: Optional[httpx.AsyncClient] = None
 
         logger.info("tiingo_provider_initialized")
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create a persistent HTTP client with connection pooling."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(
-                headers=self.headers,
-                timeout=15.0,
-                limits=httpx.Limits(
-                    max_connections=20,
-                    max_keepalive_connections=10,
-                ),
-            )
-        return self._http_client
-
-    async def close(self):
-        """Close the persistent HTTP client."""
-        if self._http_client and not self._http_client.is_closed:
-            await self._http_client.close()
-            self._http_client = None
+    def _client_headers(self) -> Dict[str, str]:
+        return self.headers
     
     @property
     def provider_type(self) -> ProviderType:
@@ -171,34 +156,7 @@ class TiingoProvider(BaseProvider):
 
             # Tiingo returns a list, take the first item
             quote = data[0] if isinstance(data, list) else data
-
-            current_price = quote.get("tngoLast") or quote.get("last", 0.0)
-
-            # Parse timestamp
-            timestamp_str = quote.get("lastSaleTimestamp", "")
-            try:
-                timestamp = datetime.fromisoformat(
-                    timestamp_str.replace("Z", "+00:00")
-                ) if timestamp_str else datetime.utcnow()
-            except (ValueError, AttributeError):
-                timestamp = datetime.utcnow()
-
-            return {
-                "symbol": symbol,
-                "current_price": current_price,
-                "bid": quote.get("bidPrice", current_price),
-                "ask": quote.get("askPrice", current_price),
-                "spread": round(
-                    (quote.get("askPrice", 0) or 0) - (quote.get("bidPrice", 0) or 0),
-                    4
-                ),
-                "high": quote.get("high", 0.0) or 0.0,
-                "low": quote.get("low", 0.0) or 0.0,
-                "open": quote.get("open", 0.0) or 0.0,
-                "previous_close": quote.get("prevClose", 0.0) or 0.0,
-                "volume": quote.get("volume", 0) or 0,
-                "timestamp": timestamp,
-            }
+            return self._parse_iex_quote(symbol, quote)
 
         except httpx.HTTPStatusError as e:
             duration = time.time() - start_time
@@ -221,6 +179,77 @@ class TiingoProvider(BaseProvider):
             )
             raise
     
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get real-time quotes for many stocks with one IEX request per
+        ``IEX_BATCH_SIZE`` tickers (``/iex?tickers=aapl,msft,...``).
+        
+        Tickers missing from the response are omitted.
+        """
+        by_ticker = {self.normalize_symbol(s, AssetClass.STOCKS): s for s in symbols}
+        tickers = list(by_ticker)
+        quotes: Dict[str, Dict] = {}
+        
+        client = await self._get_client()
+        for i in range(0, len(tickers), self.IEX_BATCH_SIZE):
+            chunk = tickers[i:i + self.IEX_BATCH_SIZE]
+            start_time = time.time()
+            try:
+                response = await client.get(
+                    f"{self.BASE_URL}/iex",
+                    params={"tickers": ",".join(chunk)},
+                    timeout=15.0
+                )
+                duration = time.time() - start_time
+                response.raise_for_status()
+                data = response.json() or []
+                self._track_api_call("quote", duration, "success", len(response.content))
+            except Exception as e:
+                self._track_api_call("quote", time.time() - start_time, "error")
+                logger.error("tiingo_quotes_batch_error", tickers=len(chunk), error=str(e))
+                continue
+            
+            for quote in data:
+                symbol = by_ticker.get(str(quote.get("ticker", "")).upper())
+                if symbol is not None:
+                    quotes[symbol] = self._parse_iex_quote(symbol, quote)
+        
+        missing = len(by_ticker) - len(quotes)
+        if missing:
+            logger.warning("tiingo_quotes_batch_missing", missing=missing, requested=len(by_ticker))
+        return quotes
+    
+    @staticmethod
+    def _parse_iex_quote(symbol: str, quote: Dict) -> Dict:
+        """Convert one IEX quote object to the BaseProvider quote format."""
+        current_price = quote.get("tngoLast") or quote.get("last", 0.0)
+
+        # Parse timestamp
+        timestamp_str = quote.get("lastSaleTimestamp", "")
+        try:
+            timestamp = datetime.fromisoformat(
+                timestamp_str.replace("Z", "+00:00")
+            ) if timestamp_str else datetime.utcnow()
+        except (ValueError, AttributeError):
+            timestamp = datetime.utcnow()
+
+        return {
+            "symbol": symbol,
+            "current_price": current_price,
+            "bid": quote.get("bidPrice", current_price),
+            "ask": quote.get("askPrice", current_price),
+            "spread": round(
+                (quote.get("askPrice", 0) or 0) - (quote.get("bidPrice", 0) or 0),
+                4
+            ),
+            "high": quote.get("high", 0.0) or 0.0,
+            "low": quote.get("low", 0.0) or 0.0,
+            "open": quote.get("open", 0.0) or 0.0,
+            "previous_close": quote.get("prevClose", 0.0) or 0.0,
+            "volume": quote.get("volume", 0) or 0,
+            "timestamp": timestamp,
+        }
+    
     async def get_candles(
         self,
         symbol: str,
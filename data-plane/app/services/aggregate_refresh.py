@@ -0,0 +1,213 @@
+"""Aggregate refresh planner - refresh only the buckets that new rows touched
+
+The prefetch task used to refresh every continuous aggregate over its full
+refresh window every minute, whether or not anything landed in it. The
+planner instead records the time range of the 1m rows each cycle actually
+inserted (per ticker) and turns it into bucket-aligned refresh windows:
+
+  - Intraday views (5m, 15m, 1h) refresh the buckets covering the newly
+    inserted rows, every cycle that inserted something.
+  - Higher timeframes (4h, D) accumulate the inserted range across cycles
+    and refresh when the newest data crosses into a new bucket (the
+    previous bucket closed), or when the forming bucket has not been
+    refreshed for ``AGGREGATE_FORMING_REFRESH_SECONDS``.
+
+A failed intraday refresh is not retried here; the Timescale refresh
+policies (see timescale_writer) still cover it within their window.
+
+The accumulated state lives in Redis (``aggregates:refresh_state``) since
+consecutive prefetch runs can land on different worker processes.
+
+Buckets are aligned to UTC epoch boundaries, like ``time_bucket``.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+import structlog
+
+from app.config import settings
+from app.services.bar_watermark import TIMEFRAME_SECONDS
+
+logger = structlog.get_logger()
+
+REFRESH_STATE_KEY = "aggregates:refresh_state"
+
+# Timeframes refreshed on bucket close instead of on every insert
+BOUNDARY_TIMEFRAMES = ("4h", "D")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MINUTE = timedelta(minutes=1)
+
+
+def bucket_floor(dt: datetime, seconds: int) -> datetime:
+    """Start of the bucket containing ``dt``."""
+    elapsed = int((dt - _EPOCH).total_seconds())
+    return _EPOCH + timedelta(seconds=elapsed - elapsed % seconds)
+
+
+def bucket_ceil(dt: datetime, seconds: int) -> datetime:
+    """End of the bucket containing ``dt`` (``dt`` itself when on a boundary)."""
+    floor = bucket_floor(dt, seconds)
+    return floor if floor == dt else floor + timedelta(seconds=seconds)
+
+
+@dataclass
+class RefreshWindow:
+    """One ``refresh_continuous_aggregate`` call."""
+    timeframe: str
+    view: str
+    start: datetime
+    end: datetime
+    # Newest data bucket covered (boundary timeframes only)
+    data_bucket: Optional[datetime] = None
+
+
+class AggregateRefreshPlanner:
+    """
+    Turn the rows inserted in one prefetch cycle into refresh windows.
+
+    Example:
+        planner = AggregateRefreshPlanner(CONTINUOUS_AGGREGATES)
+        for ticker in tickers:
+            await write_candles(candles, ticker, "1m", planner=planner)
+
+        windows = await planner.plan(redis)
+        refreshed = await refresh_aggregate_windows(windows)
+        await planner.commit(redis, refreshed)
+    """
+
+    def __init__(
+        self,
+        aggregates: Dict[str, Dict],
+        forming_refresh_seconds: Optional[int] = None
+    ):
+        self.aggregates = aggregates
+        self.forming_refresh_seconds = (
+            settings.AGGREGATE_FORMING_REFRESH_SECONDS
+            if forming_refresh_seconds is None else forming_refresh_seconds
+        )
+        # ticker -> (first inserted bar start, last inserted bar end)
+        self.ingested: Dict[str, Tuple[datetime, datetime]] = {}
+
+    def record(self, ticker: str, first_bar: datetime, last_bar: datetime):
+        """Record the start times of the first and last 1m bars inserted for a ticker."""
+        end = last_bar + _ONE_MINUTE
+        if ticker in self.ingested:
+            start, prev_end = self.ingested[ticker]
+            first_bar, end = min(start, first_bar), max(prev_end, end)
+        self.ingested[ticker] = (first_bar, end)
+
+    def ingested_range(self) -> Optional[Tuple[datetime, datetime]]:
+        """Union of the inserted ranges across tickers."""
+        if not self.ingested:
+            return None
+        return (
+            min(start for start, _ in self.ingested.values()),
+            max(end for _, end in self.ingested.values()),
+        )
+
+    async def plan(self, redis: aioredis.Redis, now: Optional[datetime] = None) -> List[RefreshWindow]:
+        """
+        Refresh windows for this cycle.
+
+        Boundary timeframes that don't need a refresh yet carry their
+        inserted range over to the next cycle.
+        """
+        now = now or datetime.now(timezone.utc)
+        ingested = self.ingested_range()
+        state = await redis.hgetall(REFRESH_STATE_KEY) or {}
+        carried: Dict[str, str] = {}
+        windows: List[RefreshWindow] = []
+
+        for tf, cfg in self.aggregates.items():
+            seconds = TIMEFRAME_SECONDS[tf]
+
+            if tf not in BOUNDARY_TIMEFRAMES:
+                if ingested:
+                    windows.append(RefreshWindow(
+                        tf, cfg["view"],
+                        bucket_floor(ingested[0], seconds),
+                        bucket_ceil(ingested[1], seconds),
+                    ))
+                continue
+
+            pending = _parse_range(state.get(f"{tf}:pending"))
+            if ingested:
+                pending = ingested if pending is None else (
+                    min(pending[0], ingested[0]), max(pending[1], ingested[1])
+                )
+            if pending is None:
+                continue
+            if ingested:
+                # Kept until a refresh covering it succeeds (see commit)
+                carried[f"{tf}:pending"] = _format_range(pending)
+
+            data_bucket = bucket_floor(pending[1] - _ONE_MINUTE, seconds)
+            last_bucket = _parse_time(state.get(f"{tf}:bucket"))
+            last_at = float(state.get(f"{tf}:at") or 0)
+            crossed = last_bucket is None or data_bucket > last_bucket
+            stale = (
+                self.forming_refresh_seconds > 0
+                and now.timestamp() - last_at >= self.forming_refresh_seconds
+            )
+
+            if crossed or stale:
+                windows.append(RefreshWindow(
+                    tf, cfg["view"],
+                    bucket_floor(pending[0], seconds),
+                    bucket_ceil(pending[1], seconds),
+                    data_bucket=data_bucket,
+                ))
+
+        if carried:
+            await redis.hset(REFRESH_STATE_KEY, mapping=carried)
+
+        logger.debug(
+            "aggregate_refresh_planned",
+            tickers=len(self.ingested),
+            windows=[f"{w.timeframe}:{w.start.isoformat()}/{w.end.isoformat()}" for w in windows],
+        )
+        return windows
+
+    async def commit(
+        self,
+        redis: aioredis.Redis,
+        refreshed: Iterable[RefreshWindow],
+        now: Optional[datetime] = None
+    ):
+        """Record successful boundary-timeframe refreshes and clear their pending range."""
+        now = now or datetime.now(timezone.utc)
+        updates: Dict[str, str] = {}
+        cleared: List[str] = []
+        for window in refreshed:
+            if window.data_bucket is None:
+                continue
+            updates[f"{window.timeframe}:bucket"] = window.data_bucket.isoformat()
+            updates[f"{window.timeframe}:at"] = str(now.timestamp())
+            cleared.append(f"{window.timeframe}:pending")
+
+        if updates:
+            await redis.hset(REFRESH_STATE_KEY, mapping=updates)
+            await redis.hdel(REFRESH_STATE_KEY, *cleared)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_range(value: Optional[str]) -> Optional[Tuple[datetime, datetime]]:
+    if not value or "/" not in value:
+        return None
+    start, end = (_parse_time(part) for part in value.split("/", 1))
+    return (start, end) if start and end else None
+
+
+def _format_range(value: Tuple[datetime, datetime]) -> str:
+    return f"{value[0].isoformat()}/{value[1].isoformat()}"
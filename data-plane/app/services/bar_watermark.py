@@ -0,0 +1,92 @@
+"""Bar watermark - high-water mark of closed, ingested candles per timeframe
+
+After each prefetch cycle has written 1m candles, refreshed the continuous
+aggregates and cached the derived timeframes, the prefetch task advances a
+per-timeframe watermark: the close time of the newest bar that is fully
+covered by ingested 1m data. Consumers (signal generator) read it through
+``GET /api/v1/data/watermarks`` or subscribe to ``candles:closed`` and
+evaluate a timeframe only when its watermark moves.
+
+Bars are aligned to UTC epoch boundaries, like the continuous aggregate
+buckets (the daily bar closes at 00:00 UTC).
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+import redis.asyncio as aioredis
+import structlog
+
+logger = structlog.get_logger()
+
+WATERMARK_KEY = "candles:watermark"
+WATERMARK_CHANNEL = "candles:closed"
+
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "4h": 14400,
+    "D": 86400,
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _parse_time(value: str) -> Optional[datetime]:
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    # Providers return naive UTC timestamps in places
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def latest_closed_minute(candles_1m: Iterable[Dict]) -> Optional[datetime]:
+    """
+    End of the newest *closed* 1m bar in a provider response.
+
+    The newest bar in the response may still be forming, so data is
+    considered complete up to its start time.
+    """
+    starts = [dt for dt in (_parse_time(c.get("time", "")) for c in candles_1m) if dt]
+    return max(starts) if starts else None
+
+
+def closed_bars(closed_through: datetime) -> Dict[str, str]:
+    """Close time of the newest fully-ingested bar for every timeframe."""
+    elapsed = int((closed_through - _EPOCH).total_seconds())
+    return {
+        tf: (_EPOCH + timedelta(seconds=elapsed - elapsed % seconds)).isoformat()
+        for tf, seconds in TIMEFRAME_SECONDS.items()
+    }
+
+
+async def advance_watermarks(redis: aioredis.Redis, closed_through: datetime) -> Dict[str, str]:
+    """
+    Move the stored watermarks forward to ``closed_through`` and publish
+    the timeframes whose bar closed.
+
+    Watermarks never move backwards (a lagging ticker or a retried task
+    can report older data).
+
+    Returns:
+        Timeframes that advanced, mapped to their new bar close time
+    """
+    current = await redis.hgetall(WATERMARK_KEY) or {}
+    advanced = {
+        tf: close
+        for tf, close in closed_bars(closed_through).items()
+        if close > current.get(tf, "")
+    }
+    if not advanced:
+        return {}
+
+    pipe = redis.pipeline()
+    pipe.hset(WATERMARK_KEY, mapping=advanced)
+    pipe.publish(WATERMARK_CHANNEL, json.dumps(advanced))
+    await pipe.execute()
+
+    logger.info("bar_watermarks_advanced", timeframes=advanced)
+    return advanced
@@ -10,6 +10,7 @@ from sqlalchemy import select, and_, text
 
 from app.providers.base import BaseProvider
 from app.services.indicator_calculator import IndicatorCalculator
+from app.services.redis_batch import RedisWriteBatch, mget_json
 from app.services.timescale_writer import TIMEFRAME_TO_VIEW
 from app.database import TimescaleSessionLocal
 from app.models.ohlcv import OHLCV
@@ -232,46 +233,64 @@ class DataFetcher:
 
         return [self._row_to_aggregated_candle(row, timeframe) for row in rows]
 
-    async def fetch_quotes_batch(self, tickers: List[str], ttl: int = 60):
-        """Fetch quotes for multiple tickers and cache"""
+    @staticmethod
+    def _quote_payload(ticker: str, quote: Dict) -> Dict:
+        """Standardized quote cache payload with backward compatibility keys."""
+        return {
+            "ticker": ticker,
+            "current_price": quote.get("current_price"),
+            "c": quote.get("current_price"),  # Backward compatibility
+            "bid": quote.get("bid"),
+            "b": quote.get("bid"),  # Backward compatibility
+            "ask": quote.get("ask"),
+            "a": quote.get("ask"),  # Backward compatibility
+            "spread": quote.get("spread"),
+            "high": quote.get("high"),
+            "h": quote.get("high"),  # Backward compatibility
+            "low": quote.get("low"),
+            "l": quote.get("low"),  # Backward compatibility
+            "open": quote.get("open"),
+            "o": quote.get("open"),  # Backward compatibility
+            "previous_close": quote.get("previous_close"),
+            "pc": quote.get("previous_close"),  # Backward compatibility
+            "volume": quote.get("volume", 0),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    async def fetch_quotes_batch(self, tickers: List[str], ttl: int = 60) -> Dict[str, Dict]:
+        """
+        Fetch quotes for multiple tickers and cache.
+
+        Quotes come from one ``provider.get_quotes`` call (a single
+        multi-symbol request where the provider supports it). Cache writes
+        are buffered and flushed in one pipelined round trip.
+
+        Returns:
+            ticker -> cached quote payload, for the tickers that succeeded
+        """
         if not tickers:
-            return
+            return {}
 
         logger.info("fetching_quotes_batch", count=len(tickers), ttl=ttl)
 
-        for ticker in tickers:
-            try:
-                # Provider API call (async) - returns standardized format per BaseProvider interface
-                quote = await self.provider.get_quote(ticker)
-
-                # Cache in standardized format with backward compatibility keys
-                quote_data = {
-                    "ticker": ticker,
-                    "current_price": quote.get("current_price"),
-                    "c": quote.get("current_price"),  # Backward compatibility
-                    "bid": quote.get("bid"),
-                    "b": quote.get("bid"),  # Backward compatibility
-                    "ask": quote.get("ask"),
-                    "a": quote.get("ask"),  # Backward compatibility
-                    "spread": quote.get("spread"),
-                    "high": quote.get("high"),
-                    "h": quote.get("high"),  # Backward compatibility
-                    "low": quote.get("low"),
-                    "l": quote.get("low"),  # Backward compatibility
-                    "open": quote.get("open"),
-                    "o": quote.get("open"),  # Backward compatibility
-                    "previous_close": quote.get("previous_close"),
-                    "pc": quote.get("previous_close"),  # Backward compatibility
-                    "volume": quote.get("volume", 0),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-
-                # Cache in Redis
-                await self.redis.setex(
-                    f"quote:{ticker}",
-                    ttl,
-                    json.dumps(quote_data)
-                )
+        try:
+            quotes = await self.provider.get_quotes(tickers)
+        except Exception as e:
+            logger.error("quote_batch_fetch_failed", count=len(tickers), error=str(e))
+            quotes = {}
+
+        payloads: Dict[str, Dict] = {}
+        async with RedisWriteBatch(self.redis) as batch:
+            for ticker in tickers:
+                quote = quotes.get(ticker)
+                if quote is None:
+                    self._increment_counter(self.quotes_fetch_failures_counter, 1, {"ticker": ticker})
+                    logger.error("quote_fetch_failed", ticker=ticker, error="no quote returned")
+                    continue
+
+                quote_data = self._quote_payload(ticker, quote)
+                batch.setex_json(f"quote:{ticker}", ttl, quote_data)
+                payloads[ticker] = quote_data
 
                 # Metrics
                 self._increment_counter(self.quotes_fetched_counter, 1, {"ticker": ticker})
@@ -284,9 +303,7 @@ class DataFetcher:
                     ttl=ttl
                 )
 
-            except Exception as e:
-                self._increment_counter(self.quotes_fetch_failures_counter, 1, {"ticker": ticker})
-                logger.error("quote_fetch_failed", ticker=ticker, error=str(e))
+        return payloads
 
     async def fetch_candles(
         self,
@@ -353,6 +370,81 @@ class DataFetcher:
             )
             return []
 
+    async def fetch_candles_many(
+        self,
+        tickers: List[str],
+        timeframe: str,
+        limit: int = 100
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch candles for many tickers: one MGET for the cached ones, the
+        provider for the rest (cached back in one pipelined flush).
+
+        Errors are isolated like in ``fetch_candles``: a failed cache read
+        sends every ticker to the provider, a provider error only empties
+        that ticker, and a failed cache write still returns the candles.
+
+        Returns:
+            ticker -> candles (empty list when unavailable)
+        """
+        from app.telemetry import candle_cache_hits_total, candle_cache_misses_total
+
+        keys = {ticker: f"candles:{timeframe}:{ticker}" for ticker in tickers}
+        try:
+            cached = await mget_json(self.redis, list(keys.values()))
+        except Exception as e:
+            logger.warning("candles_cache_read_failed", timeframe=timeframe, error=str(e))
+            cached = {}
+
+        results: Dict[str, List[Dict]] = {}
+        misses = []
+        for ticker, key in keys.items():
+            candles = cached.get(key)
+            if candles and isinstance(candles, list):
+                results[ticker] = candles[-limit:] if len(candles) > limit else candles
+            else:
+                misses.append(ticker)
+
+        if results:
+            candle_cache_hits_total.labels(timeframe=timeframe).inc(len(results))
+        if misses:
+            candle_cache_misses_total.labels(timeframe=timeframe).inc(len(misses))
+
+        ttl = self._get_candle_ttl(timeframe)
+        batch = RedisWriteBatch(self.redis)
+        for ticker in misses:
+            try:
+                candles = await self.provider.get_candles(ticker, timeframe, limit)
+            except Exception as e:
+                logger.error(
+                    "candles_fetch_failed",
+                    ticker=ticker,
+                    timeframe=timeframe,
+                    error=str(e),
+                )
+                candles = None
+            if candles:
+                batch.setex_json(keys[ticker], ttl, candles)
+                self._increment_counter(
+                    self.candles_fetched_counter,
+                    len(candles),
+                    {"ticker": ticker, "timeframe": timeframe},
+                )
+            results[ticker] = candles or []
+
+        try:
+            await batch.flush()
+        except Exception as e:
+            logger.warning("candles_cache_write_failed", timeframe=timeframe, error=str(e))
+
+        logger.debug(
+            "candles_batch_fetched",
+            timeframe=timeframe,
+            cached=len(tickers) - len(misses),
+            fetched=len(misses),
+        )
+        return results
+
     async def fetch_candles_in_range(
         self,
         ticker: str,
@@ -588,6 +680,8 @@ class DataFetcher:
         ticker: str,
         timeframe: str,
         indicator_configs: List[Tuple[str, Dict]],
+        candles: Optional[List[Dict]] = None,
+        write_batch: Optional[RedisWriteBatch] = None,
     ) -> Dict:
         """
         Fetch candles once and calculate ALL requested indicators in one pass.
@@ -596,11 +690,17 @@ class DataFetcher:
         for the same ticker+timeframe. Each indicator result is cached
         individually for compatibility with fetch_indicators() cache reads.
 
+        Cached indicators are read with one MGET; new results are written
+        through ``write_batch`` (flushed by the caller) or, without one, in
+        a single pipelined flush at the end.
+
         Args:
             ticker: Stock/forex symbol
             timeframe: Candle timeframe (1m, 5m, 1h, D, ...)
             indicator_configs: List of (indicator_name, params) tuples,
                 e.g. [("sma", {"timeperiod": 20}), ("rsi", {"timeperiod": 14})]
+            candles: Candles already read by the caller (skips the cache read)
+            write_batch: Shared write batch to buffer cache writes into
 
         Returns:
             Combined dict with all indicator values.
@@ -609,7 +709,8 @@ class DataFetcher:
             return {}
 
         # Fetch candles once (hits Redis cache from prefetch_candles_task)
-        candles = await self.fetch_candles(ticker, timeframe, limit=200)
+        if candles is None:
+            candles = await self.fetch_candles(ticker, timeframe, limit=200)
         if not candles:
             logger.warning(
                 "no_candles_for_batch_indicators",
@@ -620,19 +721,19 @@ class DataFetcher:
 
         combined_indicators: Dict = {}
         loop = asyncio.get_event_loop()
+        batch = write_batch or RedisWriteBatch(self.redis)
 
-        for indicator_name, params in indicator_configs:
-            # Build per-indicator cache key (matches fetch_indicators format)
-            indicators_str = indicator_name  # single indicator
-            params_str = json.dumps(params or {}, sort_keys=True)
-            cache_key = (
-                f"indicators:{ticker}:{timeframe}:{indicators_str}:{params_str}"
-            )
+        # Build per-indicator cache keys (match fetch_indicators format)
+        cache_keys = [
+            f"indicators:{ticker}:{timeframe}:{indicator_name}:{json.dumps(params or {}, sort_keys=True)}"
+            for indicator_name, params in indicator_configs
+        ]
+        cached_values = await mget_json(self.redis, cache_keys)
 
+        for (indicator_name, params), cache_key in zip(indicator_configs, cache_keys):
             # Check if already cached
-            cached = await self.redis.get(cache_key)
-            if cached:
-                cached_data = json.loads(cached)
+            cached_data = cached_values.get(cache_key)
+            if cached_data:
                 combined_indicators.update(cached_data.get("indicators", {}))
                 continue
 
@@ -666,7 +767,10 @@ class DataFetcher:
                 "timestamp": datetime.utcnow().isoformat(),
                 "indicators": indicator_values,
             }
-            await self.redis.setex(cache_key, 300, json.dumps(result))
+            batch.setex_json(cache_key, 300, result)
+
+        if write_batch is None:
+            await batch.flush()
 
         logger.info(
             "batch_indicators_calculated",
@@ -0,0 +1,340 @@
+"""Live quote stream - in-memory last-quote table fed by one batched poller
+
+Consumers used to poll ``/quote/{ticker}``, and every cache miss went to
+the provider. The stream instead keeps quotes for the streamed universe
+moving on its own:
+
+  - One poller across all API processes (elected through the
+    ``quotes:live:poller`` lease) fetches the streamed tickers every
+    ``QUOTE_STREAM_INTERVAL_SECONDS`` with one multi-symbol provider call
+    per provider, writes the usual ``quote:{ticker}`` cache keys, and
+    publishes the batch on the ``quotes:live`` channel. Providers without
+    a multi-symbol endpoint (Finnhub) would cost one request per ticker,
+    so their tickers are only polled every
+    ``QUOTE_STREAM_UNBATCHED_INTERVAL_SECONDS``.
+  - Every API process subscribes to ``quotes:live`` and keeps the latest
+    quote per ticker in memory (``LastQuoteTable``), which serves
+    ``GET /quotes/live`` and the ``GET /quotes/stream`` SSE endpoint.
+
+The streamed universe is the hot tier (``tickers:hot``) plus tickers
+requested through the live endpoints within ``QUOTE_STREAM_INTEREST_SECONDS``
+(``quotes:live:interest``, a sorted set scored by last request time).
+
+While a poller holds the lease, the Celery hot-tier quote task skips its
+own fetch.
+
+Other services can subscribe to ``quotes:live`` directly; each message is
+a JSON object ``{ticker: quote}`` in the ``quote:{ticker}`` cache format.
+"""
+import asyncio
+import json
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Set
+
+import redis.asyncio as aioredis
+import structlog
+
+from app.config import settings
+
+logger = structlog.get_logger()
+
+QUOTE_CHANNEL = "quotes:live"
+LEADER_KEY = "quotes:live:poller"
+INTEREST_KEY = "quotes:live:interest"
+
+# Same TTL as the hot-tier Celery fetch, so /quote and /batch keep hitting
+QUOTE_TTL = 60
+
+# A quote counts as updated when one of these changes
+PRICE_FIELDS = ("current_price", "bid", "ask")
+
+# Tickers fetched between lease renewals from providers without a
+# multi-symbol endpoint (one request per ticker)
+UNBATCHED_CHUNK_SIZE = 10
+
+
+class QuoteSubscription:
+    """
+    Updates for one consumer, coalesced per ticker.
+
+    A slow consumer only ever sees the latest quote for each ticker, so
+    memory stays bounded by the number of tickers it follows.
+    """
+
+    def __init__(self, tickers: Optional[Set[str]] = None):
+        # None = every ticker
+        self.tickers = tickers
+        self._pending: Dict[str, Dict] = {}
+        self._event = asyncio.Event()
+
+    def _offer(self, quotes: Dict[str, Dict]):
+        if self.tickers is not None:
+            quotes = {t: q for t, q in quotes.items() if t in self.tickers}
+        if quotes:
+            self._pending.update(quotes)
+            self._event.set()
+
+    async def next(self, timeout: float) -> Dict[str, Dict]:
+        """
+        Wait for updates.
+
+        Returns:
+            ticker -> quote changed since the previous call ({} on timeout)
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return {}
+        self._event.clear()
+        pending, self._pending = self._pending, {}
+        return pending
+
+
+class LastQuoteTable:
+    """Latest quote per ticker, with change notification to subscribers."""
+
+    def __init__(self):
+        self._quotes: Dict[str, Dict] = {}
+        self._subscriptions: Set[QuoteSubscription] = set()
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def get(self, tickers: Iterable[str]) -> Dict[str, Dict]:
+        """Known quotes for ``tickers`` (unknown tickers are omitted)."""
+        return {t: self._quotes[t] for t in tickers if t in self._quotes}
+
+    def apply(self, quotes: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Store quotes and notify subscribers of the ones whose price moved.
+
+        Returns:
+            ticker -> quote for the changed tickers
+        """
+        changed: Dict[str, Dict] = {}
+        for ticker, quote in quotes.items():
+            previous = self._quotes.get(ticker)
+            self._quotes[ticker] = quote
+            if previous is None or any(previous.get(f) != quote.get(f) for f in PRICE_FIELDS):
+                changed[ticker] = quote
+
+        if changed:
+            for subscription in self._subscriptions:
+                subscription._offer(changed)
+        return changed
+
+    def subscribe(self, tickers: Optional[Iterable[str]] = None) -> QuoteSubscription:
+        subscription = QuoteSubscription(set(tickers) if tickers is not None else None)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: QuoteSubscription):
+        self._subscriptions.discard(subscription)
+
+
+class QuoteStreamService:
+    """
+    Runs the quote listener (every process) and poller (lease holder).
+
+    Example:
+        await quote_stream.start()
+        quotes = quote_stream.table.get(["AAPL", "EUR_USD"])
+        await quote_stream.stop()
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[float] = None,
+        interest_seconds: Optional[int] = None,
+        unbatched_interval_seconds: Optional[float] = None
+    ):
+        self.interval_seconds = (
+            settings.QUOTE_STREAM_INTERVAL_SECONDS if interval_seconds is None else interval_seconds
+        )
+        self.unbatched_interval_seconds = max(
+            self.interval_seconds,
+            settings.QUOTE_STREAM_UNBATCHED_INTERVAL_SECONDS
+            if unbatched_interval_seconds is None else unbatched_interval_seconds
+        )
+        # Provider type -> monotonic time its tickers are next due
+        self._next_poll: Dict[str, float] = {}
+        self.interest_seconds = (
+            settings.QUOTE_STREAM_INTEREST_SECONDS if interest_seconds is None else interest_seconds
+        )
+        self.table = LastQuoteTable()
+        self.instance_id = uuid.uuid4().hex
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    @property
+    def lease_seconds(self) -> int:
+        # Survives a couple of slow polls; a dead poller is replaced quickly
+        return max(int(self.interval_seconds * 3), 10)
+
+    async def start(self):
+        if self.running:
+            return
+        self._tasks = [
+            asyncio.create_task(self._listen_loop(), name="quote-stream-listen"),
+            asyncio.create_task(self._poll_loop(), name="quote-stream-poll"),
+        ]
+        logger.info("quote_stream_started", interval=self.interval_seconds)
+
+    async def stop(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Hand the lease over right away instead of waiting for it to expire
+        try:
+            from app.database import get_redis
+            redis = await get_redis()
+            if await redis.get(LEADER_KEY) == self.instance_id:
+                await redis.delete(LEADER_KEY)
+        except Exception as e:
+            logger.debug("quote_stream_lease_release_failed", error=str(e))
+
+        logger.info("quote_stream_stopped")
+
+    async def register_interest(self, redis: aioredis.Redis, tickers: Iterable[str]):
+        """Keep ``tickers`` in the streamed universe for the interest window."""
+        now = time.time()
+        mapping = {ticker: now for ticker in tickers}
+        if mapping:
+            await redis.zadd(INTEREST_KEY, mapping)
+
+    async def streamed_tickers(self, redis: aioredis.Redis) -> List[str]:
+        """Hot tier plus recently requested tickers."""
+        cutoff = time.time() - self.interest_seconds
+        pipe = redis.pipeline(transaction=False)
+        pipe.smembers("tickers:hot")
+        pipe.zremrangebyscore(INTEREST_KEY, "-inf", cutoff)
+        pipe.zrange(INTEREST_KEY, 0, -1)
+        hot, _, interested = await pipe.execute()
+        return sorted(set(hot or ()) | set(interested or ()))
+
+    async def poll_once(self, redis: aioredis.Redis) -> Dict[str, Dict]:
+        """
+        Fetch, cache and publish quotes for the streamed universe.
+
+        Must be called while holding the poller lease. The lease is renewed
+        before every provider call, so a slow cycle (unbatched providers
+        fetch one ticker at a time) doesn't outlive it; if it was lost
+        meanwhile, polling stops and only the quotes fetched so far are
+        published.
+
+        Returns:
+            ticker -> quote for every ticker fetched this cycle
+        """
+        from app.providers import provider_registry
+        from app.services.data_fetcher import DataFetcher
+        from app.telemetry import get_meter
+
+        tickers = await self.streamed_tickers(redis)
+        if not tickers:
+            return {}
+
+        quotes: Dict[str, Dict] = {}
+        meter = get_meter()
+        forex = [t for t in tickers if "_" in t]
+        stocks = [t for t in tickers if "_" not in t]
+        lease_lost = False
+        for group in (forex, stocks):
+            if not group or lease_lost:
+                continue
+            try:
+                provider = provider_registry.for_ticker(group[0])
+            except RuntimeError as e:
+                logger.warning("quote_stream_provider_unavailable", error=str(e))
+                continue
+            if not self._due(provider):
+                continue
+            fetcher = DataFetcher(provider, redis, meter)
+            size = len(group) if provider.supports_batch_quotes else UNBATCHED_CHUNK_SIZE
+            for i in range(0, len(group), size):
+                if not await self._renew_lease(redis):
+                    logger.warning("quote_stream_lease_lost", instance=self.instance_id)
+                    lease_lost = True
+                    break
+                quotes.update(await fetcher.fetch_quotes_batch(group[i:i + size], ttl=QUOTE_TTL))
+
+        if quotes:
+            self.table.apply(quotes)
+            await redis.publish(QUOTE_CHANNEL, json.dumps(quotes))
+        return quotes
+
+    def _due(self, provider) -> bool:
+        """Rate-limit polls of providers that fetch quotes one ticker at a time."""
+        if provider.supports_batch_quotes:
+            return True
+        key = provider.provider_type.value
+        now = time.monotonic()
+        if now < self._next_poll.get(key, 0.0):
+            return False
+        self._next_poll[key] = now + self.unbatched_interval_seconds
+        return True
+
+    async def _acquire_lease(self, redis: aioredis.Redis) -> bool:
+        if await redis.set(LEADER_KEY, self.instance_id, nx=True, ex=self.lease_seconds):
+            logger.info("quote_stream_poller_elected", instance=self.instance_id)
+            return True
+        return await self._renew_lease(redis)
+
+    async def _renew_lease(self, redis: aioredis.Redis) -> bool:
+        """Extend the lease if this instance still holds it."""
+        if await redis.get(LEADER_KEY) != self.instance_id:
+            return False
+        # False when the key expired between the two calls
+        return bool(await redis.expire(LEADER_KEY, self.lease_seconds))
+
+    async def _poll_loop(self):
+        from app.database import get_redis
+
+        while True:
+            started = time.monotonic()
+            try:
+                redis = await get_redis()
+                if await self._acquire_lease(redis):
+                    quotes = await self.poll_once(redis)
+                    logger.debug("quote_stream_polled", tickers=len(quotes))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("quote_stream_poll_failed", error=str(e))
+            await asyncio.sleep(max(0.0, self.interval_seconds - (time.monotonic() - started)))
+
+    async def _listen_loop(self):
+        from app.database import get_redis
+
+        while True:
+            pubsub = None
+            try:
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(QUOTE_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self.table.apply(json.loads(message["data"]))
+                    except (TypeError, ValueError):
+                        logger.warning("quote_stream_message_invalid")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("quote_stream_listen_failed", error=str(e))
+                await asyncio.sleep(1.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.reset()
+                    except Exception:
+                        pass
+
+
+quote_stream = QuoteStreamService()
@@ -0,0 +1,107 @@
+"""Redis batch access - multi-key reads and pipelined, TTL'd writes
+
+Cache traffic in the data plane is many small JSON values keyed per ticker
+(``quote:{ticker}``, ``candles:{tf}:{ticker}``, ``indicators:...``).
+Issuing one GET/SETEX per key costs one network round trip each, which
+dominates batch endpoints and prefetch tasks once the universe has
+hundreds of tickers. This module coalesces them:
+
+  - ``mget_json`` reads any number of keys with chunked MGETs
+  - ``RedisWriteBatch`` buffers SETEX writes and flushes them in
+    non-transactional pipelines (one round trip per chunk)
+
+Example:
+    cached = await mget_json(redis, [f"quote:{t}" for t in tickers])
+
+    async with RedisWriteBatch(redis) as batch:
+        for ticker, quote in quotes.items():
+            batch.setex_json(f"quote:{ticker}", 60, quote)
+    # flushed on exit
+"""
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import redis.asyncio as aioredis
+import structlog
+
+logger = structlog.get_logger()
+
+# Keys per MGET / commands per pipeline round trip
+DEFAULT_CHUNK_SIZE = 500
+
+
+async def mget_json(
+    redis: aioredis.Redis,
+    keys: Sequence[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Optional[Any]]:
+    """
+    Read and JSON-decode many keys.
+
+    Returns:
+        key -> decoded value, or None when missing or not valid JSON
+    """
+    values: Dict[str, Optional[Any]] = {}
+    keys = list(dict.fromkeys(keys))
+    for i in range(0, len(keys), chunk_size):
+        chunk = keys[i:i + chunk_size]
+        raw_values = await redis.mget(chunk)
+        for key, raw in zip(chunk, raw_values):
+            if raw is None:
+                values[key] = None
+                continue
+            try:
+                values[key] = json.loads(raw)
+            except (TypeError, ValueError):
+                logger.warning("redis_cached_value_invalid", key=key)
+                values[key] = None
+    return values
+
+
+class RedisWriteBatch:
+    """
+    Buffered SETEX writes flushed through pipelines.
+
+    Values are serialized when buffered, so later mutation of the caller's
+    objects doesn't change what gets written. A later write to the same key
+    replaces the buffered one.
+    """
+
+    def __init__(self, redis: aioredis.Redis, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.redis = redis
+        self.chunk_size = chunk_size
+        self._pending: Dict[str, Tuple[int, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def setex_json(self, key: str, ttl: int, value: Any):
+        """Buffer ``SETEX key ttl json(value)``."""
+        self._pending[key] = (int(ttl), json.dumps(value))
+
+    async def flush(self) -> int:
+        """
+        Write all buffered values.
+
+        Returns:
+            Number of keys written
+        """
+        if not self._pending:
+            return 0
+
+        items: List[Tuple[str, Tuple[int, str]]] = list(self._pending.items())
+        self._pending.clear()
+        for i in range(0, len(items), self.chunk_size):
+            pipe = self.redis.pipeline(transaction=False)
+            for key, (ttl, payload) in items[i:i + self.chunk_size]:
+                pipe.setex(key, ttl, payload)
+            await pipe.execute()
+
+        logger.debug("redis_batch_flushed", keys=len(items))
+        return len(items)
+
+    async def __aenter__(self) -> "RedisWriteBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.flush()
@@ -0,0 +1,226 @@
+"""Storage policies for the ``ohlcv`` hypertable and its continuous aggregates
+
+Keeps disk footprint bounded as years of 1m candles accumulate:
+
+  1. Native compression for ``ohlcv`` chunks older than
+     ``OHLCV_COMPRESS_AFTER_DAYS`` (segmented by ticker/timeframe, so a
+     ticker's history decompresses as one contiguous segment)
+  2. Compression for aggregate chunks older than
+     ``OHLCV_AGGREGATE_COMPRESS_AFTER_DAYS``
+  3. Retention tiers per timeframe (``RETENTION_DAYS``, 0 = keep forever):
+     - aggregates use Timescale retention policies (drop whole chunks)
+     - raw 1m / D rows share the ``ohlcv`` chunks, so a daily job drops
+       expired chunks and carries over the rows still in their tier
+       (``enforce_raw_retention``)
+
+Policies are re-applied on every startup so configuration changes take
+effect without manual SQL. Compression and retention of an aggregate are
+never allowed inside its refresh window, which would otherwise
+re-materialize (or fail to refresh) the dropped buckets.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.config import settings
+from app.database import timescale_engine
+
+logger = structlog.get_logger()
+
+# Timeframe -> days to keep (0 = keep forever)
+RETENTION_DAYS: Dict[str, int] = {
+    "1m": settings.OHLCV_RETENTION_1M_DAYS,
+    "5m": settings.OHLCV_RETENTION_5M_DAYS,
+    "15m": settings.OHLCV_RETENTION_15M_DAYS,
+    "1h": settings.OHLCV_RETENTION_1H_DAYS,
+    "4h": settings.OHLCV_RETENTION_4H_DAYS,
+    "D": settings.OHLCV_RETENTION_D_DAYS,
+}
+
+# Timeframes stored as raw rows in ``ohlcv`` (the rest are aggregates)
+RAW_TIMEFRAMES = ("1m", "D")
+
+_INTERVAL_UNITS = {"minute": 60, "hour": 3600, "day": 86400}
+
+
+def interval_days(interval: str) -> float:
+    """Convert a simple interval literal ('2 hours', '7 days') to days."""
+    match = re.fullmatch(r"\s*(\d+)\s+(minute|hour|day)s?\s*", interval)
+    if not match:
+        raise ValueError(f"Unsupported interval: {interval!r}")
+    return int(match.group(1)) * _INTERVAL_UNITS[match.group(2)] / 86400
+
+
+def _outside_refresh_window(days: int, refresh_start: str) -> int:
+    """Push a policy age past the aggregate's refresh window."""
+    return max(days, int(interval_days(refresh_start)) + 1)
+
+
+async def apply_storage_policies(conn: AsyncConnection, aggregates: Dict[str, Dict]):
+    """
+    Apply compression and retention policies (idempotent).
+
+    Each step runs in a savepoint and is best-effort: a failure (e.g. an
+    older Timescale without compressed continuous aggregates) is logged
+    and the rest still apply.
+
+    Args:
+        conn: Open TimescaleDB connection (inside a transaction)
+        aggregates: ``CONTINUOUS_AGGREGATES`` from timescale_writer
+    """
+    # ---- Raw hypertable compression ----
+    try:
+        async with conn.begin_nested():
+            await conn.execute(text("""
+                ALTER TABLE ohlcv SET (
+                    timescaledb.compress,
+                    timescaledb.compress_segmentby = 'ticker,timeframe'
+                )
+            """))
+            # Re-create so a changed compress-after age takes effect
+            await conn.execute(text("SELECT remove_compression_policy('ohlcv', if_exists => TRUE)"))
+            await conn.execute(text(f"""
+                SELECT add_compression_policy(
+                    'ohlcv', INTERVAL '{settings.OHLCV_COMPRESS_AFTER_DAYS} days'
+                )
+            """))
+    except Exception as e:
+        logger.warning("ohlcv_compression_setup_skipped", error=str(e))
+
+    # ---- Aggregate compression + retention ----
+    for tf, cfg in aggregates.items():
+        view = cfg["view"]
+        try:
+            async with conn.begin_nested():
+                compress_after = _outside_refresh_window(
+                    settings.OHLCV_AGGREGATE_COMPRESS_AFTER_DAYS, cfg["refresh_start"]
+                )
+                await conn.execute(text(
+                    f"ALTER MATERIALIZED VIEW {view} SET (timescaledb.compress = true)"
+                ))
+                await conn.execute(text(
+                    f"SELECT remove_compression_policy('{view}', if_exists => TRUE)"
+                ))
+                await conn.execute(text(f"""
+                    SELECT add_compression_policy(
+                        '{view}', compress_after => INTERVAL '{compress_after} days'
+                    )
+                """))
+        except Exception as e:
+            logger.warning("aggregate_compression_setup_skipped", view=view, error=str(e))
+
+        try:
+            async with conn.begin_nested():
+                await conn.execute(text(
+                    f"SELECT remove_retention_policy('{view}', if_exists => TRUE)"
+                ))
+                keep_days = RETENTION_DAYS.get(tf, 0)
+                if keep_days > 0:
+                    drop_after = _outside_refresh_window(keep_days, cfg["refresh_start"])
+                    await conn.execute(text(f"""
+                        SELECT add_retention_policy(
+                            '{view}', drop_after => INTERVAL '{drop_after} days'
+                        )
+                    """))
+        except Exception as e:
+            logger.warning("aggregate_retention_setup_skipped", view=view, error=str(e))
+
+    logger.info(
+        "ohlcv_storage_policies_applied",
+        compress_after_days=settings.OHLCV_COMPRESS_AFTER_DAYS,
+        retention_days=RETENTION_DAYS,
+    )
+
+
+async def enforce_raw_retention(max_refresh_days: float) -> Dict[str, int]:
+    """
+    Drop raw ``ohlcv`` chunks past their timeframes' retention tiers.
+
+    Row-level deletes would hit chunks that are long compressed (older than
+    ``OHLCV_COMPRESS_AFTER_DAYS``) and force Timescale to decompress and
+    recompress them, so retention works on whole chunks instead. Raw 1m
+    and seeded D candles share chunks, though: before a chunk is dropped,
+    its rows of timeframes still inside their tier (D is kept forever by
+    default) are copied aside and written back in the same transaction.
+    They land in a small new chunk that only holds those timeframes, so it
+    isn't touched again until their own tier expires.
+
+    Retention is chunk-granular: a chunk goes once its whole time range is
+    past the cutoff, so rows may outlive their tier by up to one chunk
+    interval.
+
+    Args:
+        max_refresh_days: Largest aggregate refresh window; 1m rows inside
+            it are always kept so aggregates can still refresh
+
+    Returns:
+        Chunks dropped and rows carried over into new chunks
+    """
+    keep_days: Dict[str, int] = {}
+    for tf in RAW_TIMEFRAMES:
+        days = RETENTION_DAYS.get(tf, 0)
+        if days <= 0:
+            continue
+        if tf == "1m":
+            days = max(days, int(max_refresh_days) + 1)
+        keep_days[tf] = days
+
+    stats = {"chunks_dropped": 0, "rows_preserved": 0}
+    if not keep_days:
+        return stats
+
+    now = datetime.now(timezone.utc)
+    cutoffs = {tf: now - timedelta(days=days) for tf, days in keep_days.items()}
+    async with timescale_engine.connect() as conn:
+        result = await conn.execute(text("""
+            SELECT range_start, range_end
+            FROM timescaledb_information.chunks
+            WHERE hypertable_name = 'ohlcv'
+              AND range_end <= :latest_cutoff
+            ORDER BY range_start
+        """), {"latest_cutoff": max(cutoffs.values())})
+        chunks = result.all()
+
+    for range_start, range_end in chunks:
+        # Timeframes whose tier covers none of this chunk
+        expired = [tf for tf, cutoff in cutoffs.items() if range_end <= cutoff]
+        bounds = {"start": range_start, "end": range_end, "expired": expired}
+        async with timescale_engine.begin() as conn:
+            # Compressed chunks answer this from segment metadata (segmentby timeframe)
+            has_expired_rows = (await conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM ohlcv
+                    WHERE timeframe = ANY(:expired)
+                      AND timestamp >= :start AND timestamp < :end
+                )
+            """), bounds)).scalar_one()
+            if not has_expired_rows:
+                continue
+
+            await conn.execute(text("""
+                CREATE TEMP TABLE ohlcv_retained ON COMMIT DROP AS
+                SELECT * FROM ohlcv
+                WHERE timeframe <> ALL(:expired)
+                  AND timestamp >= :start AND timestamp < :end
+            """), bounds)
+            await conn.execute(text("""
+                SELECT drop_chunks('ohlcv', older_than => :end, newer_than => :start)
+            """), bounds)
+            result = await conn.execute(text("INSERT INTO ohlcv SELECT * FROM ohlcv_retained"))
+
+        stats["chunks_dropped"] += 1
+        stats["rows_preserved"] += result.rowcount or 0
+        logger.info(
+            "ohlcv_chunk_dropped",
+            range_start=str(range_start),
+            range_end=str(range_end),
+            expired=expired,
+            rows_preserved=result.rowcount or 0,
+        )
+
+    logger.info("ohlcv_raw_retention_enforced", **stats)
+    return stats
@@ -6,14 +6,19 @@ Architecture:
   3. Celery reads from continuous aggregates → caches in Redis
   4. EOD candles from Tiingo are also persisted to `ohlcv` with timeframe='D'
   5. All aggregation happens inside the database — zero Python compute
+  6. Compression and per-timeframe retention are managed by storage_policy
 """
 import structlog
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from sqlalchemy import text
 
 from app.database import timescale_engine, TimescaleSessionLocal
+from app.services.storage_policy import apply_storage_policies
+
+if TYPE_CHECKING:
+    from app.services.aggregate_refresh import AggregateRefreshPlanner, RefreshWindow
 
 logger = structlog.get_logger()
 
@@ -98,23 +103,7 @@ async def init_hypertable():
 
         logger.info("ohlcv_hypertable_initialized")
 
-        # ---- 2. Compression (best-effort) ----
-        try:
-            await conn.execute(text("""
-                ALTER TABLE ohlcv SET (
-                    timescaledb.compress,
-                    timescaledb.compress_segmentby = 'ticker,timeframe'
-                )
-            """))
-            await conn.execute(text("""
-                SELECT add_compression_policy(
-                    'ohlcv', INTERVAL '7 days', if_not_exists => TRUE
-                )
-            """))
-        except Exception as e:
-            logger.warning("ohlcv_compression_setup_skipped", error=str(e))
-
-        # ---- 3. Continuous aggregates ----
+        # ---- 2. Continuous aggregates ----
         for tf, cfg in CONTINUOUS_AGGREGATES.items():
             view = cfg["view"]
             bucket = cfg["bucket"]
@@ -147,6 +136,12 @@ async def init_hypertable():
                     """))
                     logger.info("continuous_aggregate_created", view=view, bucket=bucket)
 
+                # Supports the ticker-scoped newest-first reads
+                await conn.execute(text(f"""
+                    CREATE INDEX IF NOT EXISTS ix_{view}_ticker_bucket
+                    ON {view} (ticker, bucket DESC)
+                """))
+
                 # Add refresh policy (idempotent via if_not_exists)
                 await conn.execute(text(f"""
                     SELECT add_continuous_aggregate_policy(
@@ -165,6 +160,9 @@ async def init_hypertable():
                     error=str(e),
                 )
 
+        # ---- 3. Compression + retention (best-effort) ----
+        await apply_storage_policies(conn, CONTINUOUS_AGGREGATES)
+
         logger.info("ohlcv_hypertable_ready")
 
 
@@ -172,16 +170,20 @@ async def write_candles(
     candles: List[Dict],
     ticker: str,
     timeframe: str = "1m",
+    planner: Optional["AggregateRefreshPlanner"] = None,
 ) -> int:
     """
     Bulk upsert OHLCV candles into TimescaleDB.
 
     Uses INSERT ... ON CONFLICT DO NOTHING to avoid overwriting existing rows.
+    The whole batch is one statement over unnested arrays, which also
+    reports the time range of the rows that were actually new.
 
     Args:
         candles: List of candle dicts (keys: time, open, high, low, close, volume)
         ticker: Symbol (e.g. "AAPL")
         timeframe: Timeframe string (default "1m")
+        planner: Aggregate refresh planner to record the inserted range in
 
     Returns:
         Number of rows inserted.
@@ -189,62 +191,79 @@ async def write_candles(
     if not candles:
         return 0
 
+    columns = {"timestamp": [], "open": [], "high": [], "low": [], "close": [], "volume": []}
+    for c in candles:
+        ts = c.get("time", "")
+        if not ts:
+            continue
+        try:
+            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        except (ValueError, TypeError):
+            continue
+        columns["timestamp"].append(dt)
+        columns["open"].append(float(c.get("open", 0)))
+        columns["high"].append(float(c.get("high", 0)))
+        columns["low"].append(float(c.get("low", 0)))
+        columns["close"].append(float(c.get("close", 0)))
+        columns["volume"].append(int(c.get("volume", 0)))
+
+    if not columns["timestamp"]:
+        return 0
+
     async with TimescaleSessionLocal() as session:
         async with session.begin():
-            stmt = text("""
-                INSERT INTO ohlcv
-                    (ticker, timeframe, timestamp, open, high, low, close, volume)
-                VALUES
-                    (:ticker, :timeframe, :timestamp, :open, :high, :low, :close, :volume)
-                ON CONFLICT (ticker, timeframe, timestamp) DO NOTHING
-            """)
-
-            rows = []
-            for c in candles:
-                ts = c.get("time", "")
-                if not ts:
-                    continue
-                try:
-                    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                except (ValueError, TypeError):
-                    continue
-                rows.append({
-                    "ticker": ticker,
-                    "timeframe": timeframe,
-                    "timestamp": dt,
-                    "open": float(c.get("open", 0)),
-                    "high": float(c.get("high", 0)),
-                    "low": float(c.get("low", 0)),
-                    "close": float(c.get("close", 0)),
-                    "volume": int(c.get("volume", 0)),
-                })
-
-            if rows:
-                await session.execute(stmt, rows)
-
-            # Track TimescaleDB write metrics
-            if rows:
-                try:
-                    from app.telemetry import timescale_candles_written_total
-                    timescale_candles_written_total.labels(timeframe=timeframe).inc(len(rows))
-                except Exception:
-                    pass  # Telemetry not initialized (e.g., during tests)
-
-            logger.debug(
-                "candles_written_to_timescale",
-                ticker=ticker,
-                timeframe=timeframe,
-                count=len(rows),
+            result = await session.execute(
+                text("""
+                    WITH inserted AS (
+                        INSERT INTO ohlcv
+                            (ticker, timeframe, timestamp, open, high, low, close, volume)
+                        SELECT CAST(:ticker AS VARCHAR), CAST(:timeframe AS VARCHAR), t.*
+                        FROM unnest(
+                            CAST(:timestamp AS TIMESTAMPTZ[]),
+                            CAST(:open AS DOUBLE PRECISION[]),
+                            CAST(:high AS DOUBLE PRECISION[]),
+                            CAST(:low AS DOUBLE PRECISION[]),
+                            CAST(:close AS DOUBLE PRECISION[]),
+                            CAST(:volume AS BIGINT[])
+                        ) AS t(timestamp, open, high, low, close, volume)
+                        ON CONFLICT (ticker, timeframe, timestamp) DO NOTHING
+                        RETURNING timestamp
+                    )
+                    SELECT count(*) AS inserted, min(timestamp) AS first, max(timestamp) AS last
+                    FROM inserted
+                """),
+                {"ticker": ticker, "timeframe": timeframe, **columns},
             )
-            return len(rows)
+            row = result.one()
+
+    inserted = int(row.inserted or 0)
+    if inserted and planner is not None:
+        planner.record(ticker, row.first, row.last)
+
+    # Track TimescaleDB write metrics
+    if inserted:
+        try:
+            from app.telemetry import timescale_candles_written_total
+            timescale_candles_written_total.labels(timeframe=timeframe).inc(inserted)
+        except Exception:
+            pass  # Telemetry not initialized (e.g., during tests)
+
+    logger.debug(
+        "candles_written_to_timescale",
+        ticker=ticker,
+        timeframe=timeframe,
+        received=len(columns["timestamp"]),
+        count=inserted,
+    )
+    return inserted
 
 
 async def refresh_aggregates():
     """
     Manually refresh all continuous aggregates for the recent time window.
 
-    Called by the prefetch Celery task after writing new 1m candles to
-    ensure the aggregated views are up-to-date before reading.
+    Full-window refresh for maintenance and backfills; the prefetch task
+    refreshes only the planned windows (``refresh_aggregate_windows``).
     """
     import time as _time
     start = _time.time()
@@ -252,7 +271,8 @@ async def refresh_aggregates():
     for tf, cfg in CONTINUOUS_AGGREGATES.items():
         view = cfg["view"]
         try:
-            async with timescale_engine.begin() as conn:
+            async with timescale_engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
                 await conn.execute(text(f"""
                     CALL refresh_continuous_aggregate(
                         '{view}',
@@ -277,6 +297,55 @@ async def refresh_aggregates():
     logger.debug("continuous_aggregates_refreshed", duration_seconds=round(duration, 2))
 
 
+async def refresh_aggregate_windows(windows: List["RefreshWindow"]) -> List["RefreshWindow"]:
+    """
+    Refresh continuous aggregates over the given bucket-aligned windows.
+
+    ``refresh_continuous_aggregate`` can't run inside a transaction block,
+    so each call runs on an autocommit connection.
+
+    Returns:
+        The windows that refreshed successfully.
+    """
+    import time as _time
+    start = _time.time()
+    refreshed = []
+
+    for window in windows:
+        try:
+            async with timescale_engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await conn.execute(text(f"""
+                    CALL refresh_continuous_aggregate(
+                        '{window.view}',
+                        '{window.start.isoformat()}'::timestamptz,
+                        '{window.end.isoformat()}'::timestamptz
+                    )
+                """))
+            refreshed.append(window)
+        except Exception as e:
+            logger.warning(
+                "continuous_aggregate_refresh_failed",
+                view=window.view,
+                error=str(e),
+            )
+
+    duration = _time.time() - start
+    try:
+        from app.telemetry import timescale_aggregate_refresh_seconds
+        timescale_aggregate_refresh_seconds.observe(duration)
+    except Exception:
+        pass
+
+    logger.debug(
+        "continuous_aggregates_refreshed",
+        views=[w.view for w in refreshed],
+        skipped=len(CONTINUOUS_AGGREGATES) - len(windows),
+        duration_seconds=round(duration, 2),
+    )
+    return refreshed
+
+
 async def read_aggregated_candles(
     ticker: str,
     timeframe: str,
@@ -306,6 +375,9 @@ async def read_aggregated_candles(
         if timeframe == "D":
             # Merge continuous aggregate (forming days from 1m) with seeded EOD history.
             # Prefer aggregate rows when dates overlap (more up-to-date intraday data).
+            # Both sides are newest-first index scans capped at :limit, and the
+            # overlap check is a per-row anti-join probe on (ticker, bucket), so
+            # the cost stays flat as history grows.
             result = await session.execute(
                 text(f"""
                     WITH daily_agg AS (
@@ -313,14 +385,23 @@ async def read_aggregated_candles(
                                open, high, low, close, volume
                         FROM {view}
                         WHERE ticker = :ticker
+                        ORDER BY bucket DESC
+                        LIMIT :limit
                     ),
                     daily_seeded AS (
-                        SELECT timestamp::date AS day,
-                               open, high, low, close, volume
-                        FROM ohlcv
-                        WHERE ticker = :ticker
-                          AND timeframe = 'D'
-                          AND timestamp::date NOT IN (SELECT day FROM daily_agg)
+                        SELECT o.timestamp::date AS day,
+                               o.open, o.high, o.low, o.close, o.volume
+                        FROM ohlcv o
+                        WHERE o.ticker = :ticker
+                          AND o.timeframe = 'D'
+                          AND NOT EXISTS (
+                              SELECT 1 FROM {view} a
+                              WHERE a.ticker = :ticker
+                                AND a.bucket >= o.timestamp::date
+                                AND a.bucket < o.timestamp::date + 1
+                          )
+                        ORDER BY o.timestamp DESC
+                        LIMIT :limit
                     )
                     SELECT day, open, high, low, close, volume
                     FROM (
@@ -53,12 +53,14 @@ class UniverseManager:
             if warm_tickers:
                 pipe.sadd("tickers:warm", *warm_tickers)
             
-            await pipe.execute()
-            
             # Store sizes in Redis for metrics
-            await self.redis.set("metrics:universe:hot", len(hot_tickers))
-            await self.redis.set("metrics:universe:warm", len(warm_tickers))
-            await self.redis.set("metrics:universe:total", len(hot_tickers) + len(warm_tickers))
+            pipe.mset({
+                "metrics:universe:hot": len(hot_tickers),
+                "metrics:universe:warm": len(warm_tickers),
+                "metrics:universe:total": len(hot_tickers) + len(warm_tickers),
+            })
+            
+            await pipe.execute()
             
             # Increment counter (if metrics enabled)
             if self.refresh_counter:
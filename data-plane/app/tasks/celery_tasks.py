@@ -1,6 +1,6 @@
 """Celery tasks for Data Plane"""
 from celery import Celery
-from celery.signals import worker_process_init, worker_ready
+from celery.signals import worker_process_init, worker_process_shutdown, worker_ready
 import structlog
 import asyncio
 import time as _time
@@ -76,22 +76,11 @@ def run_async(coro):
 def _get_stock_provider_instance():
     """Get configured stock data provider instance.
 
-    Returns a BaseProvider based on the STOCK_PROVIDER setting
-    (either 'tiingo' or 'finnhub').
+    Returns the shared BaseProvider for the STOCK_PROVIDER setting
+    (either 'tiingo' or 'finnhub'), see app.providers.registry.
     """
-    from app.config import settings
-    from app.providers import TiingoProvider, FinnhubProvider
-
-    provider_name = getattr(settings, "STOCK_PROVIDER", "finnhub").lower()
-    if provider_name == "tiingo" and settings.TIINGO_API_KEY:
-        return TiingoProvider(api_key=settings.TIINGO_API_KEY)
-    elif settings.FINNHUB_API_KEY:
-        return FinnhubProvider(api_key=settings.FINNHUB_API_KEY)
-    else:
-        raise RuntimeError(
-            "No stock provider API key configured. "
-            "Set TIINGO_API_KEY or FINNHUB_API_KEY."
-        )
+    from app.providers import provider_registry
+    return provider_registry.stock_provider()
 
 
 def _get_provider_for_ticker(ticker: str):
@@ -99,15 +88,18 @@ def _get_provider_for_ticker(ticker: str):
 
     Forex pairs (containing '_') use OANDA; stocks use Tiingo/Finnhub.
     """
-    if "_" in ticker:
-        from app.config import settings
-        from app.providers import OANDAProvider
-        if settings.OANDA_API_KEY:
-            return OANDAProvider(
-                api_key=settings.OANDA_API_KEY,
-                account_type=getattr(settings, "OANDA_ACCOUNT_TYPE", "practice"),
-            )
-    return _get_stock_provider_instance()
+    from app.providers import provider_registry
+    return provider_registry.for_ticker(ticker)
+
+
+@worker_process_shutdown.connect
+def close_worker_providers(**kwargs):
+    """Close pooled provider HTTP clients when a worker process exits"""
+    from app.providers import provider_registry
+    try:
+        run_async(provider_registry.aclose())
+    except Exception as e:
+        logger.warning("provider_registry_close_failed", error=str(e))
 
 
 # ---------------------------------------------------------------------------
@@ -158,8 +150,14 @@ def fetch_hot_tickers_task():
         from app.telemetry import get_meter
 
         async def _fetch():
+            from app.services.quote_stream import LEADER_KEY
+
             redis = await get_redis()
 
+            # The API's live quote poller already refreshes the hot tier
+            if await redis.exists(LEADER_KEY):
+                return {"tickers_fetched": 0, "skipped": "quote_stream_active"}
+
             # Get hot tickers from Redis
             tickers = await redis.smembers("tickers:hot")
             ticker_list = list(tickers) if tickers else []
@@ -249,8 +247,9 @@ def prefetch_candles_task():
     1. Fetch 500 1m candles from Tiingo (single API call)
     2. Write 1m candles to TimescaleDB hypertable
     3. Cache 1m candles in Redis
-    4. Refresh TimescaleDB continuous aggregates (incremental, DB-side)
+    4. Refresh the aggregate buckets the new rows touched (see aggregate_refresh)
     5. Read pre-aggregated 5m/15m/1h/4h/D from continuous aggregates → Redis
+    6. Advance the per-timeframe bar watermarks (see bar_watermark)
     """
     logger.info("task_prefetch_candles_starting")
     task_start = _time.time()
@@ -259,13 +258,15 @@ def prefetch_candles_task():
         from app.services.data_fetcher import DataFetcher
         from app.services.timescale_writer import (
             write_candles,
-            refresh_aggregates,
+            refresh_aggregate_windows,
             read_aggregated_candles,
             CONTINUOUS_AGGREGATES,
         )
+        from app.services.aggregate_refresh import AggregateRefreshPlanner
+        from app.services.bar_watermark import advance_watermarks, latest_closed_minute
+        from app.services.redis_batch import RedisWriteBatch
         from app.database import get_redis
         from app.telemetry import get_meter
-        import json
 
         DERIVED_TIMEFRAMES = list(CONTINUOUS_AGGREGATES.keys())  # 5m, 15m, 1h, 4h
 
@@ -273,15 +274,17 @@ def prefetch_candles_task():
             redis = await get_redis()
 
             # Get all tickers (hot + warm)
-            hot = await redis.smembers("tickers:hot")
-            warm = await redis.smembers("tickers:warm")
-            tickers = list((hot or set()) | (warm or set()))
+            tickers = list(await redis.sunion("tickers:hot", "tickers:warm") or [])
 
             if not tickers:
                 logger.info("no_tickers_to_prefetch_candles")
                 return {"tickers": 0, "candles_cached": 0}
 
             total_cached = 0
+            closed_through = None
+            planner = AggregateRefreshPlanner(CONTINUOUS_AGGREGATES)
+            # Candle cache writes go out in pipelined flushes, not one SETEX each
+            cache = RedisWriteBatch(redis)
 
             # ---- Step 1-3: Fetch 1m → TimescaleDB + Redis ----
             for ticker in tickers:
@@ -291,9 +294,13 @@ def prefetch_candles_task():
                     if not candles_1m:
                         continue
 
+                    ticker_closed = latest_closed_minute(candles_1m)
+                    if ticker_closed and (closed_through is None or ticker_closed > closed_through):
+                        closed_through = ticker_closed
+
                     # Write to TimescaleDB (non-blocking, don't fail task)
                     try:
-                        await write_candles(candles_1m, ticker, "1m")
+                        await write_candles(candles_1m, ticker, "1m", planner=planner)
                     except Exception as e:
                         logger.warning(
                             "timescale_write_failed",
@@ -303,11 +310,7 @@ def prefetch_candles_task():
 
                     # Cache 1m in Redis
                     ttl_1m = DataFetcher._get_candle_ttl("1m")
-                    await redis.setex(
-                        f"candles:1m:{ticker}",
-                        ttl_1m,
-                        json.dumps(candles_1m),
-                    )
+                    cache.setex_json(f"candles:1m:{ticker}", ttl_1m, candles_1m)
                     total_cached += 1
 
                 except Exception as e:
@@ -317,9 +320,16 @@ def prefetch_candles_task():
                         error=str(e),
                     )
 
-            # ---- Step 4: Refresh continuous aggregates (one call, DB-side) ----
             try:
-                await refresh_aggregates()
+                await cache.flush()
+            except Exception as e:
+                logger.warning("candle_cache_flush_failed", timeframe="1m", error=str(e))
+
+            # ---- Step 4: Refresh only the affected aggregate buckets ----
+            try:
+                windows = await planner.plan(redis)
+                refreshed = await refresh_aggregate_windows(windows)
+                await planner.commit(redis, refreshed)
             except Exception as e:
                 logger.warning("aggregate_refresh_failed", error=str(e))
 
@@ -330,11 +340,7 @@ def prefetch_candles_task():
                         candles = await read_aggregated_candles(ticker, tf, limit=200)
                         if candles:
                             ttl = DataFetcher._get_candle_ttl(tf)
-                            await redis.setex(
-                                f"candles:{tf}:{ticker}",
-                                ttl,
-                                json.dumps(candles),
-                            )
+                            cache.setex_json(f"candles:{tf}:{ticker}", ttl, candles)
                     except Exception as e:
                         logger.warning(
                             "aggregate_read_cache_failed",
@@ -343,6 +349,18 @@ def prefetch_candles_task():
                             error=str(e),
                         )
 
+            try:
+                await cache.flush()
+            except Exception as e:
+                logger.warning("candle_cache_flush_failed", timeframe="derived", error=str(e))
+
+            # ---- Step 6: Announce the bars that are now closed and cached ----
+            if closed_through is not None:
+                try:
+                    await advance_watermarks(redis, closed_through)
+                except Exception as e:
+                    logger.warning("bar_watermark_update_failed", error=str(e))
+
             return {"tickers": len(tickers), "candles_cached": total_cached}
 
         result = run_async(_prefetch())
@@ -390,9 +408,7 @@ def seed_eod_candles_task():
             redis = await get_redis()
 
             # Get all tickers (hot + warm)
-            hot = await redis.smembers("tickers:hot")
-            warm = await redis.smembers("tickers:warm")
-            tickers = list((hot or set()) | (warm or set()))
+            tickers = list(await redis.sunion("tickers:hot", "tickers:warm") or [])
 
             if not tickers:
                 logger.info("no_tickers_to_seed_eod")
@@ -442,6 +458,35 @@ def seed_eod_candles_task():
         raise
 
 
+@celery_app.task(name="data_plane.enforce_ohlcv_retention")
+def enforce_ohlcv_retention_task():
+    """
+    Enforce retention tiers for raw ``ohlcv`` rows (1m, seeded D).
+
+    Aggregate retention and all compression run as Timescale background
+    jobs (see storage_policy); raw rows share chunks across timeframes, so
+    expired chunks are dropped here once a day, keeping rows still in
+    their tier.
+    """
+    logger.info("task_enforce_ohlcv_retention_starting")
+
+    try:
+        from app.services.storage_policy import enforce_raw_retention, interval_days
+        from app.services.timescale_writer import CONTINUOUS_AGGREGATES
+
+        max_refresh_days = max(
+            interval_days(cfg["refresh_start"]) for cfg in CONTINUOUS_AGGREGATES.values()
+        )
+        stats = run_async(enforce_raw_retention(max_refresh_days))
+
+        logger.info("task_enforce_ohlcv_retention_completed", **stats)
+        return stats
+
+    except Exception as e:
+        logger.error("task_enforce_ohlcv_retention_failed", error=str(e))
+        raise
+
+
 @celery_app.task(name="data_plane.prefetch_indicators")
 def prefetch_indicators_task():
     """
@@ -457,6 +502,7 @@ def prefetch_indicators_task():
 
     try:
         from app.services.data_fetcher import DataFetcher
+        from app.services.redis_batch import RedisWriteBatch
         from app.database import get_redis
         from app.telemetry import get_meter
 
@@ -479,9 +525,7 @@ def prefetch_indicators_task():
             redis = await get_redis()
 
             # Get all tickers (hot + warm)
-            hot = await redis.smembers("tickers:hot")
-            warm = await redis.smembers("tickers:warm")
-            tickers = list((hot or set()) | (warm or set()))
+            tickers = list(await redis.sunion("tickers:hot", "tickers:warm") or [])
 
             if not tickers:
                 logger.info("no_tickers_to_prefetch")
@@ -491,16 +535,47 @@ def prefetch_indicators_task():
 
             total_fetched = 0
 
-            # Batch: one candle fetch per ticker+timeframe, all indicators at once
+            # Batch: one MGET per timeframe for all tickers' candles (misses
+            # fall back to the provider), one MGET per ticker+timeframe for
+            # cached indicators, and pipelined indicator cache writes.
+            # Failures stay per ticker: a ticker whose batched candle read
+            # failed is fetched on its own by fetch_all_indicators.
+            fetchers = {}
+            candles_by_tf = {tf: {} for tf in TIMEFRAMES}
+            for group in ([t for t in tickers if "_" in t], [t for t in tickers if "_" not in t]):
+                if not group:
+                    continue
+                try:
+                    fetcher = DataFetcher(_get_provider_for_ticker(group[0]), redis, meter)
+                except Exception as e:
+                    logger.warning("indicator_prefetch_provider_unavailable", tickers=len(group), error=str(e))
+                    continue
+                fetchers.update({ticker: fetcher for ticker in group})
+                for timeframe in TIMEFRAMES:
+                    try:
+                        candles_by_tf[timeframe].update(
+                            await fetcher.fetch_candles_many(group, timeframe, limit=200)
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            "indicator_prefetch_candles_failed",
+                            timeframe=timeframe,
+                            tickers=len(group),
+                            error=str(e),
+                        )
+
+            cache = RedisWriteBatch(redis)
             for ticker in tickers:
-                provider = _get_provider_for_ticker(ticker)
-                fetcher = DataFetcher(provider, redis, meter)
+                if ticker not in fetchers:
+                    continue
                 for timeframe in TIMEFRAMES:
                     try:
-                        result = await fetcher.fetch_all_indicators(
+                        result = await fetchers[ticker].fetch_all_indicators(
                             ticker=ticker,
                             timeframe=timeframe,
                             indicator_configs=INDICATORS,
+                            candles=candles_by_tf[timeframe].get(ticker),
+                            write_batch=cache,
                         )
                         if result and result.get("indicators"):
                             total_fetched += len(result["indicators"])
@@ -512,6 +587,16 @@ def prefetch_indicators_task():
                             error=str(e),
                         )
                         continue
+                if len(cache) >= cache.chunk_size:
+                    try:
+                        await cache.flush()
+                    except Exception as e:
+                        logger.warning("indicator_cache_flush_failed", error=str(e))
+
+            try:
+                await cache.flush()
+            except Exception as e:
+                logger.warning("indicator_cache_flush_failed", error=str(e))
 
             return {
                 "tickers": len(tickers),
@@ -561,6 +646,10 @@ celery_app.conf.beat_schedule = {
         "task": "data_plane.seed_eod_candles",
         "schedule": 86400.0,  # Once daily — refresh to pick up newly closed day
     },
+    "enforce-ohlcv-retention": {
+        "task": "data_plane.enforce_ohlcv_retention",
+        "schedule": 86400.0,  # Once daily — drop raw rows past their retention tier
+    },
     "prefetch-indicators": {
         "task": "data_plane.prefetch_indicators",
         "schedule": 300.0,  # Every 5 minutes
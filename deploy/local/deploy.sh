@@ -30,10 +30,10 @@ COMPOSE="docker compose --env-file .env.prod -f docker-compose.prod.yml"
 IMAGES=(backend signal-generator trigger-dispatcher data-plane frontend)
 DOCKERFILES=("deploy/Dockerfile.prod" "signal-generator/Dockerfile" "trigger-dispatcher/Dockerfile" "data-plane/Dockerfile" "frontend/Dockerfile")
 CONTEXTS=("." "signal-generator" "trigger-dispatcher" "data-plane" "frontend")
-IMAGE_SERVICES=("backend celery-worker celery-beat flower" "signal-generator" "trigger-dispatcher" "data-plane data-plane-worker data-plane-beat" "frontend")
+IMAGE_SERVICES=("backend celery-worker celery-reports-worker celery-beat flower" "signal-generator" "trigger-dispatcher" "data-plane data-plane-worker data-plane-beat" "frontend")
 
 # All compose service names (for restart sub-menu)
-ALL_SERVICES=(backend celery-worker celery-beat flower signal-generator trigger-dispatcher data-plane data-plane-worker data-plane-beat frontend redis kafka zookeeper grafana prometheus langfuse-postgres langfuse-clickhouse langfuse-minio langfuse-web langfuse-worker)
+ALL_SERVICES=(backend celery-worker celery-reports-worker celery-beat flower signal-generator trigger-dispatcher data-plane data-plane-worker data-plane-beat frontend redis kafka zookeeper grafana prometheus langfuse-postgres langfuse-clickhouse langfuse-minio langfuse-web langfuse-worker)
 
 # Observability stack (Langfuse + Grafana + Prometheus + supporting infra)
 # Used by start_observability_stack to bring up all observability services in one command.
@@ -109,7 +109,7 @@ check_ssh() {
 # ============================================================
 deploy_images() {
     header "Deploy Images"
-    echo " 1) backend              (backend, celery-worker, celery-beat, flower)"
+    echo " 1) backend              (backend, celery-worker, celery-reports-worker, celery-beat, flower)"
     echo " 2) signal-generator     (signal-generator)"
     echo " 3) trigger-dispatcher   (trigger-dispatcher)"
     echo " 4) data-plane           (data-plane, data-plane-worker, data-plane-beat)"
@@ -219,6 +219,33 @@ class Settings(BaseSettings):
     HTF_TREND_MIN_ALIGNMENT: int = 2
     HTF_TREND_TIMEFRAME: str = "15"  # Current timeframe
     
+    # Per-cycle ticker fan-out inside generators (overridable per generator
+    # via the scan_concurrency / scan_deadline_seconds config keys)
+    GENERATOR_SCAN_CONCURRENCY: int = Field(
+        default=16,
+        description="Maximum tickers a generator fetches market data for at once"
+    )
+    GENERATOR_SCAN_DEADLINE_SECONDS: float = Field(
+        default=90.0,
+        description="Wall-clock budget for one generator cycle; unfinished tickers are skipped until the next cycle"
+    )
+    
+    # Bar-close scheduling: run each generator once per closed bar of its
+    # timeframe (data plane watermark, else wall clock + grace) instead of
+    # on a fixed interval
+    BAR_CLOSE_SCHEDULING_ENABLED: bool = Field(
+        default=True,
+        description="Wake generators on bar close and skip runs with no new bar"
+    )
+    BAR_WATERMARK_POLL_SECONDS: float = Field(
+        default=5.0,
+        description="How often to read the data plane's closed-bar watermarks"
+    )
+    BAR_CLOSE_INGEST_GRACE_SECONDS: float = Field(
+        default=75.0,
+        description="Wall-clock fallback: wait this long after a bar closes for it to be ingested"
+    )
+    
     # Config file paths
     WATCHLIST_CONFIG_PATH: str = "config/watchlist.json"
     
@@ -93,7 +93,6 @@ class AccumulationDistributionSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate accumulation/distribution signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "accumulation_distribution_scan_started",
@@ -101,128 +100,135 @@ class AccumulationDistributionSignalGenerator(BaseSignalGenerator):
             lookback_periods=self.lookback_periods
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch candles
-                lookback_days = self.lookback_periods + 10
-                candles_df = await self.market_data.fetch_candles(
-                    symbol=ticker,
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days
-                )
-                
-                # Convert DataFrame to list of dicts
-                candles = self._dataframe_to_candles(candles_df)
-                
-                if not candles or len(candles) < self.lookback_periods:
-                    logger.debug("insufficient_candle_data", ticker=ticker)
-                    continue
-                
-                # Calculate A/D Line
-                ad_line = self._calculate_ad_line(candles)
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info(
+            "accumulation_distribution_scan_completed",
+            signals_generated=len(signals),
+            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
+        )
+        
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch candles
+            lookback_days = self.lookback_periods + 10
+            candles_df = await self.market_data.fetch_candles(
+                symbol=ticker,
+                resolution=self.timeframe,
+                lookback_days=lookback_days
+            )
+            
+            # Convert DataFrame to list of dicts
+            candles = self._dataframe_to_candles(candles_df)
+            
+            if not candles or len(candles) < self.lookback_periods:
+                logger.debug("insufficient_candle_data", ticker=ticker)
+                return signals
+            
+            # Calculate A/D Line
+            ad_line = self._calculate_ad_line(candles)
+            
+            if len(ad_line) < self.lookback_periods:
+                return signals
+            
+            # Calculate recent slope
+            recent_ad = ad_line[-self.lookback_periods:]
+            ad_slope = self._calculate_slope(recent_ad)
+            
+            # Normalize slope by price for comparison
+            avg_price = sum([c["c"] for c in candles[-self.lookback_periods:]]) / self.lookback_periods
+            normalized_slope = ad_slope / avg_price if avg_price != 0 else 0
+            
+            # Check for accumulation (strong positive slope)
+            if normalized_slope > self.min_slope_threshold:
+                current_price = candles[-1]["c"]
+                ad_change_pct = ((recent_ad[-1] - recent_ad[0]) / abs(recent_ad[0]) * 100) if recent_ad[0] != 0 else 0
                 
-                if len(ad_line) < self.lookback_periods:
-                    continue
+                logger.info(
+                    "accumulation_detected",
+                    ticker=ticker,
+                    ad_slope=ad_slope,
+                    normalized_slope=normalized_slope,
+                    ad_change_pct=ad_change_pct,
+                    current_price=current_price
+                )
                 
-                # Calculate recent slope
-                recent_ad = ad_line[-self.lookback_periods:]
-                ad_slope = self._calculate_slope(recent_ad)
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=min(self.confidence * 100 + abs(ad_change_pct), 95),
+                    reasoning=(
+                        f"Accumulation Phase: A/D line rising ({ad_change_pct:.1f}% over {self.lookback_periods} periods). "
+                        f"Strong buying pressure detected at {current_price:.5f}. "
+                        f"Institutional accumulation likely."
+                    )
+                )
                 
-                # Normalize slope by price for comparison
-                avg_price = sum([c["c"] for c in candles[-self.lookback_periods:]]) / self.lookback_periods
-                normalized_slope = ad_slope / avg_price if avg_price != 0 else 0
+                signal = Signal(
+                    signal_type=SignalType.ACCUMULATION_SIGNAL,
+                    source="accumulation_distribution_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "ad_slope": ad_slope,
+                        "normalized_slope": normalized_slope,
+                        "ad_change_pct": ad_change_pct,
+                        "current_price": current_price,
+                        "lookback_periods": self.lookback_periods
+                    })
+                )
+                signals.append(signal)
+            
+            # Check for distribution (strong negative slope)
+            elif normalized_slope < -self.min_slope_threshold:
+                current_price = candles[-1]["c"]
+                ad_change_pct = ((recent_ad[-1] - recent_ad[0]) / abs(recent_ad[0]) * 100) if recent_ad[0] != 0 else 0
                 
-                # Check for accumulation (strong positive slope)
-                if normalized_slope > self.min_slope_threshold:
-                    current_price = candles[-1]["c"]
-                    ad_change_pct = ((recent_ad[-1] - recent_ad[0]) / abs(recent_ad[0]) * 100) if recent_ad[0] != 0 else 0
-                    
-                    logger.info(
-                        "accumulation_detected",
-                        ticker=ticker,
-                        ad_slope=ad_slope,
-                        normalized_slope=normalized_slope,
-                        ad_change_pct=ad_change_pct,
-                        current_price=current_price
-                    )
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=min(self.confidence * 100 + abs(ad_change_pct), 95),
-                        reasoning=(
-                            f"Accumulation Phase: A/D line rising ({ad_change_pct:.1f}% over {self.lookback_periods} periods). "
-                            f"Strong buying pressure detected at {current_price:.5f}. "
-                            f"Institutional accumulation likely."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.ACCUMULATION_SIGNAL,
-                        source="accumulation_distribution_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "ad_slope": ad_slope,
-                            "normalized_slope": normalized_slope,
-                            "ad_change_pct": ad_change_pct,
-                            "current_price": current_price,
-                            "lookback_periods": self.lookback_periods
-                        })
-                    )
-                    signals.append(signal)
+                logger.info(
+                    "distribution_detected",
+                    ticker=ticker,
+                    ad_slope=ad_slope,
+                    normalized_slope=normalized_slope,
+                    ad_change_pct=ad_change_pct,
+                    current_price=current_price
+                )
                 
-                # Check for distribution (strong negative slope)
-                elif normalized_slope < -self.min_slope_threshold:
-                    current_price = candles[-1]["c"]
-                    ad_change_pct = ((recent_ad[-1] - recent_ad[0]) / abs(recent_ad[0]) * 100) if recent_ad[0] != 0 else 0
-                    
-                    logger.info(
-                        "distribution_detected",
-                        ticker=ticker,
-                        ad_slope=ad_slope,
-                        normalized_slope=normalized_slope,
-                        ad_change_pct=ad_change_pct,
-                        current_price=current_price
-                    )
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=min(self.confidence * 100 + abs(ad_change_pct), 95),
-                        reasoning=(
-                            f"Distribution Phase: A/D line falling ({ad_change_pct:.1f}% over {self.lookback_periods} periods). "
-                            f"Strong selling pressure detected at {current_price:.5f}. "
-                            f"Institutional distribution likely."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.DISTRIBUTION_SIGNAL,
-                        source="accumulation_distribution_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "ad_slope": ad_slope,
-                            "normalized_slope": normalized_slope,
-                            "ad_change_pct": ad_change_pct,
-                            "current_price": current_price,
-                            "lookback_periods": self.lookback_periods
-                        })
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=min(self.confidence * 100 + abs(ad_change_pct), 95),
+                    reasoning=(
+                        f"Distribution Phase: A/D line falling ({ad_change_pct:.1f}% over {self.lookback_periods} periods). "
+                        f"Strong selling pressure detected at {current_price:.5f}. "
+                        f"Institutional distribution likely."
                     )
-                    signals.append(signal)
+                )
                 
-            except Exception as e:
-                logger.error(
-                    "accumulation_distribution_error",
-                    ticker=ticker,
-                    error=str(e),
-                    exc_info=True
+                signal = Signal(
+                    signal_type=SignalType.DISTRIBUTION_SIGNAL,
+                    source="accumulation_distribution_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "ad_slope": ad_slope,
+                        "normalized_slope": normalized_slope,
+                        "ad_change_pct": ad_change_pct,
+                        "current_price": current_price,
+                        "lookback_periods": self.lookback_periods
+                    })
                 )
-                continue
-        
-        logger.info(
-            "accumulation_distribution_scan_completed",
-            signals_generated=len(signals),
-            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
-        )
+                signals.append(signal)
+            
+        except Exception as e:
+            logger.error(
+                "accumulation_distribution_error",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
         
         return signals
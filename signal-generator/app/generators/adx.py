@@ -65,7 +65,6 @@ class ADXSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate ADX trend strength signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "adx_scan_started",
@@ -75,93 +74,100 @@ class ADXSignalGenerator(BaseSignalGenerator):
             weak_threshold=self.weak_trend
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch ADX from Finnhub
-                lookback_days = 90
-                adx_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="adx",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.timeperiod
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("adx_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch ADX from Finnhub
+            lookback_days = 90
+            adx_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="adx",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.timeperiod
+            )
+            
+            if not adx_data or "adx" not in adx_data:
+                logger.warning("adx_data_unavailable", ticker=ticker)
+                return signals
+            
+            adx_values = adx_data["adx"]
+            
+            if len(adx_values) < 2:
+                logger.warning("insufficient_adx_data", ticker=ticker)
+                return signals
+            
+            current_adx = adx_values[-1]
+            previous_adx = adx_values[-2]
+            
+            current_price = adx_data.get("c", [None])[-1] if "c" in adx_data else None
+            
+            # Strong trend emerging
+            if current_adx > self.strong_trend and previous_adx <= self.strong_trend:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.NEUTRAL,  # ADX doesn't indicate direction
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"ADX strong trend detected: ADX ({current_adx:.1f}) crossed above "
+                        f"{self.strong_trend}. Strong trend starting - confirm direction with price action."
+                    )
                 )
                 
-                if not adx_data or "adx" not in adx_data:
-                    logger.warning("adx_data_unavailable", ticker=ticker)
-                    continue
-                
-                adx_values = adx_data["adx"]
-                
-                if len(adx_values) < 2:
-                    logger.warning("insufficient_adx_data", ticker=ticker)
-                    continue
-                
-                current_adx = adx_values[-1]
-                previous_adx = adx_values[-2]
-                
-                current_price = adx_data.get("c", [None])[-1] if "c" in adx_data else None
+                signal = Signal(
+                    signal_type=SignalType.ADX_STRONG_TREND,
+                    source="adx_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_adx": round(current_adx, 2),
+                        "previous_adx": round(previous_adx, 2),
+                        "strong_threshold": self.strong_trend,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # Strong trend emerging
-                if current_adx > self.strong_trend and previous_adx <= self.strong_trend:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.NEUTRAL,  # ADX doesn't indicate direction
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"ADX strong trend detected: ADX ({current_adx:.1f}) crossed above "
-                            f"{self.strong_trend}. Strong trend starting - confirm direction with price action."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.ADX_STRONG_TREND,
-                        source="adx_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_adx": round(current_adx, 2),
-                            "previous_adx": round(previous_adx, 2),
-                            "strong_threshold": self.strong_trend,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("adx_strong_trend_signal", ticker=ticker, adx=round(current_adx, 1))
+            
+            # Weak trend / choppy market
+            elif current_adx < self.weak_trend and previous_adx >= self.weak_trend:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.NEUTRAL,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"ADX weak trend detected: ADX ({current_adx:.1f}) crossed below "
+                        f"{self.weak_trend}. Choppy/weak trend - avoid trend-following strategies."
                     )
-                    
-                    signals.append(signal)
-                    logger.info("adx_strong_trend_signal", ticker=ticker, adx=round(current_adx, 1))
+                )
                 
-                # Weak trend / choppy market
-                elif current_adx < self.weak_trend and previous_adx >= self.weak_trend:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.NEUTRAL,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"ADX weak trend detected: ADX ({current_adx:.1f}) crossed below "
-                            f"{self.weak_trend}. Choppy/weak trend - avoid trend-following strategies."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.ADX_WEAK_TREND,
-                        source="adx_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_adx": round(current_adx, 2),
-                            "previous_adx": round(previous_adx, 2),
-                            "weak_threshold": self.weak_trend,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("adx_weak_trend_signal", ticker=ticker, adx=round(current_adx, 1))
-            
-            except Exception as e:
-                logger.error("adx_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+                signal = Signal(
+                    signal_type=SignalType.ADX_WEAK_TREND,
+                    source="adx_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_adx": round(current_adx, 2),
+                        "previous_adx": round(previous_adx, 2),
+                        "weak_threshold": self.weak_trend,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("adx_weak_trend_signal", ticker=ticker, adx=round(current_adx, 1))
+        
+        except Exception as e:
+            logger.error("adx_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("adx_scan_completed", signals_generated=len(signals))
         return signals
 
@@ -58,7 +58,6 @@ class AroonSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate AROON signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "aroon_scan_started",
@@ -67,106 +66,60 @@ class AroonSignalGenerator(BaseSignalGenerator):
             trend_threshold=self.trend_threshold
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch AROON from Finnhub
-                lookback_days = 90
-                aroon_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="aroon",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.timeperiod
-                )
-                
-                if not aroon_data or "aroonup" not in aroon_data or "aroondown" not in aroon_data:
-                    logger.warning("aroon_data_unavailable", ticker=ticker)
-                    continue
-                
-                aroon_up = aroon_data["aroonup"]
-                aroon_down = aroon_data["aroondown"]
-                
-                if len(aroon_up) < 2 or len(aroon_down) < 2:
-                    logger.warning("insufficient_aroon_data", ticker=ticker)
-                    continue
-                
-                current_up = aroon_up[-1]
-                current_down = aroon_down[-1]
-                previous_up = aroon_up[-2]
-                previous_down = aroon_down[-2]
-                
-                current_price = aroon_data.get("c", [None])[-1] if "c" in aroon_data else None
-                
-                # Strong uptrend
-                if current_up > self.trend_threshold and current_down < (100 - self.trend_threshold):
-                    if not (previous_up > self.trend_threshold and previous_down < (100 - self.trend_threshold)):
-                        ticker_signal = TickerSignal(
-                            ticker=ticker,
-                            signal=BiasType.BULLISH,
-                            confidence=self.confidence * 100,
-                            reasoning=(
-                                f"AROON strong uptrend: Aroon Up ({current_up:.0f}) > {self.trend_threshold}, "
-                                f"Aroon Down ({current_down:.0f}) < {100 - self.trend_threshold}"
-                            )
-                        )
-                        
-                        signal = Signal(
-                            signal_type=SignalType.AROON_UPTREND,
-                            source="aroon_generator",
-                            tickers=[ticker_signal],
-                            metadata=self._enrich_metadata({
-                                "aroon_up": round(current_up, 2),
-                                "aroon_down": round(current_down, 2),
-                                "timeframe": self.timeframe,
-                                "current_price": round(current_price, 2) if current_price else None
-                            })
-                        )
-                        
-                        signals.append(signal)
-                        logger.info("aroon_uptrend_signal", ticker=ticker)
-                
-                # Strong downtrend
-                elif current_down > self.trend_threshold and current_up < (100 - self.trend_threshold):
-                    if not (previous_down > self.trend_threshold and previous_up < (100 - self.trend_threshold)):
-                        ticker_signal = TickerSignal(
-                            ticker=ticker,
-                            signal=BiasType.BEARISH,
-                            confidence=self.confidence * 100,
-                            reasoning=(
-                                f"AROON strong downtrend: Aroon Down ({current_down:.0f}) > {self.trend_threshold}, "
-                                f"Aroon Up ({current_up:.0f}) < {100 - self.trend_threshold}"
-                            )
-                        )
-                        
-                        signal = Signal(
-                            signal_type=SignalType.AROON_DOWNTREND,
-                            source="aroon_generator",
-                            tickers=[ticker_signal],
-                            metadata=self._enrich_metadata({
-                                "aroon_up": round(current_up, 2),
-                                "aroon_down": round(current_down, 2),
-                                "timeframe": self.timeframe,
-                                "current_price": round(current_price, 2) if current_price else None
-                            })
-                        )
-                        
-                        signals.append(signal)
-                        logger.info("aroon_downtrend_signal", ticker=ticker)
-                
-                # Bullish crossover (Up crosses above Down)
-                elif current_up > current_down and previous_up <= previous_down:
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("aroon_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch AROON from Finnhub
+            lookback_days = 90
+            aroon_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="aroon",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.timeperiod
+            )
+            
+            if not aroon_data or "aroonup" not in aroon_data or "aroondown" not in aroon_data:
+                logger.warning("aroon_data_unavailable", ticker=ticker)
+                return signals
+            
+            aroon_up = aroon_data["aroonup"]
+            aroon_down = aroon_data["aroondown"]
+            
+            if len(aroon_up) < 2 or len(aroon_down) < 2:
+                logger.warning("insufficient_aroon_data", ticker=ticker)
+                return signals
+            
+            current_up = aroon_up[-1]
+            current_down = aroon_down[-1]
+            previous_up = aroon_up[-2]
+            previous_down = aroon_down[-2]
+            
+            current_price = aroon_data.get("c", [None])[-1] if "c" in aroon_data else None
+            
+            # Strong uptrend
+            if current_up > self.trend_threshold and current_down < (100 - self.trend_threshold):
+                if not (previous_up > self.trend_threshold and previous_down < (100 - self.trend_threshold)):
                     ticker_signal = TickerSignal(
                         ticker=ticker,
                         signal=BiasType.BULLISH,
-                        confidence=self.confidence * 0.9 * 100,
+                        confidence=self.confidence * 100,
                         reasoning=(
-                            f"AROON bullish crossover: Aroon Up ({current_up:.0f}) crossed above "
-                            f"Aroon Down ({current_down:.0f})"
+                            f"AROON strong uptrend: Aroon Up ({current_up:.0f}) > {self.trend_threshold}, "
+                            f"Aroon Down ({current_down:.0f}) < {100 - self.trend_threshold}"
                         )
                     )
                     
                     signal = Signal(
-                        signal_type=SignalType.AROON_BULLISH_CROSS,
+                        signal_type=SignalType.AROON_UPTREND,
                         source="aroon_generator",
                         tickers=[ticker_signal],
                         metadata=self._enrich_metadata({
@@ -178,22 +131,23 @@ class AroonSignalGenerator(BaseSignalGenerator):
                     )
                     
                     signals.append(signal)
-                    logger.info("aroon_bullish_cross", ticker=ticker)
-                
-                # Bearish crossover (Down crosses above Up)
-                elif current_down > current_up and previous_down <= previous_up:
+                    logger.info("aroon_uptrend_signal", ticker=ticker)
+            
+            # Strong downtrend
+            elif current_down > self.trend_threshold and current_up < (100 - self.trend_threshold):
+                if not (previous_down > self.trend_threshold and previous_up < (100 - self.trend_threshold)):
                     ticker_signal = TickerSignal(
                         ticker=ticker,
                         signal=BiasType.BEARISH,
-                        confidence=self.confidence * 0.9 * 100,
+                        confidence=self.confidence * 100,
                         reasoning=(
-                            f"AROON bearish crossover: Aroon Down ({current_down:.0f}) crossed above "
-                            f"Aroon Up ({current_up:.0f})"
+                            f"AROON strong downtrend: Aroon Down ({current_down:.0f}) > {self.trend_threshold}, "
+                            f"Aroon Up ({current_up:.0f}) < {100 - self.trend_threshold}"
                         )
                     )
                     
                     signal = Signal(
-                        signal_type=SignalType.AROON_BEARISH_CROSS,
+                        signal_type=SignalType.AROON_DOWNTREND,
                         source="aroon_generator",
                         tickers=[ticker_signal],
                         metadata=self._enrich_metadata({
@@ -205,40 +159,92 @@ class AroonSignalGenerator(BaseSignalGenerator):
                     )
                     
                     signals.append(signal)
-                    logger.info("aroon_bearish_cross", ticker=ticker)
+                    logger.info("aroon_downtrend_signal", ticker=ticker)
+            
+            # Bullish crossover (Up crosses above Down)
+            elif current_up > current_down and previous_up <= previous_down:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 0.9 * 100,
+                    reasoning=(
+                        f"AROON bullish crossover: Aroon Up ({current_up:.0f}) crossed above "
+                        f"Aroon Down ({current_down:.0f})"
+                    )
+                )
                 
-                # Consolidation (both low)
-                elif current_up < 50 and current_down < 50:
-                    if not (previous_up < 50 and previous_down < 50):
-                        ticker_signal = TickerSignal(
-                            ticker=ticker,
-                            signal=BiasType.NEUTRAL,
-                            confidence=self.confidence * 0.8 * 100,
-                            reasoning=(
-                                f"AROON consolidation: Both Aroon Up ({current_up:.0f}) and "
-                                f"Aroon Down ({current_down:.0f}) < 50. Choppy market."
-                            )
-                        )
-                        
-                        signal = Signal(
-                            signal_type=SignalType.AROON_CONSOLIDATION,
-                            source="aroon_generator",
-                            tickers=[ticker_signal],
-                            metadata=self._enrich_metadata({
-                                "aroon_up": round(current_up, 2),
-                                "aroon_down": round(current_down, 2),
-                                "timeframe": self.timeframe,
-                                "current_price": round(current_price, 2) if current_price else None
-                            })
-                        )
-                        
-                        signals.append(signal)
-                        logger.info("aroon_consolidation", ticker=ticker)
+                signal = Signal(
+                    signal_type=SignalType.AROON_BULLISH_CROSS,
+                    source="aroon_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "aroon_up": round(current_up, 2),
+                        "aroon_down": round(current_down, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("aroon_bullish_cross", ticker=ticker)
             
-            except Exception as e:
-                logger.error("aroon_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+            # Bearish crossover (Down crosses above Up)
+            elif current_down > current_up and previous_down <= previous_up:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 0.9 * 100,
+                    reasoning=(
+                        f"AROON bearish crossover: Aroon Down ({current_down:.0f}) crossed above "
+                        f"Aroon Up ({current_up:.0f})"
+                    )
+                )
+                
+                signal = Signal(
+                    signal_type=SignalType.AROON_BEARISH_CROSS,
+                    source="aroon_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "aroon_up": round(current_up, 2),
+                        "aroon_down": round(current_down, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("aroon_bearish_cross", ticker=ticker)
+            
+            # Consolidation (both low)
+            elif current_up < 50 and current_down < 50:
+                if not (previous_up < 50 and previous_down < 50):
+                    ticker_signal = TickerSignal(
+                        ticker=ticker,
+                        signal=BiasType.NEUTRAL,
+                        confidence=self.confidence * 0.8 * 100,
+                        reasoning=(
+                            f"AROON consolidation: Both Aroon Up ({current_up:.0f}) and "
+                            f"Aroon Down ({current_down:.0f}) < 50. Choppy market."
+                        )
+                    )
+                    
+                    signal = Signal(
+                        signal_type=SignalType.AROON_CONSOLIDATION,
+                        source="aroon_generator",
+                        tickers=[ticker_signal],
+                        metadata=self._enrich_metadata({
+                            "aroon_up": round(current_up, 2),
+                            "aroon_down": round(current_down, 2),
+                            "timeframe": self.timeframe,
+                            "current_price": round(current_price, 2) if current_price else None
+                        })
+                    )
+                    
+                    signals.append(signal)
+                    logger.info("aroon_consolidation", ticker=ticker)
+        
+        except Exception as e:
+            logger.error("aroon_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("aroon_scan_completed", signals_generated=len(signals))
         return signals
 
@@ -3,11 +3,14 @@ Base Signal Generator
 
 Abstract base class that all signal generators must inherit from.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
 import structlog
 import pandas as pd
 
+from app.config import settings
 from app.schemas.signal import Signal
 
 
@@ -19,6 +22,29 @@ class GeneratorError(Exception):
     pass
 
 
+@dataclass
+class TickerScanResult:
+    """
+    Outcome of one ``scan_tickers`` cycle.
+    
+    ``signals`` keeps the order of the scanned tickers. Tickers that were
+    still waiting on market data at the deadline are listed in ``timed_out``;
+    tickers whose scan raised are listed in ``failed``.
+    """
+    signals: List[Signal] = field(default_factory=list)
+    scanned: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    
+    @property
+    def complete(self) -> bool:
+        """True when every ticker finished within the deadline."""
+        return not self.timed_out and not self.failed
+
+
+TickerScan = Callable[[str], Awaitable[Union[Signal, List[Signal], None]]]
+
+
 class BaseSignalGenerator(ABC):
     """
     Base class for all signal generators.
@@ -67,6 +93,99 @@ class BaseSignalGenerator(ABC):
         """
         pass
     
+    async def scan_tickers(
+        self,
+        tickers: Iterable[str],
+        scan: TickerScan,
+        concurrency: Optional[int] = None,
+        deadline_seconds: Optional[float] = None
+    ) -> TickerScanResult:
+        """
+        Run ``scan(ticker)`` for every ticker concurrently.
+        
+        At most ``concurrency`` scans are in flight at once, so cycle time
+        grows with ``len(tickers) / concurrency`` instead of with the
+        universe size. Scans still running when the cycle deadline passes
+        are cancelled and reported in ``timed_out``; the signals of the
+        tickers that finished are returned either way.
+        
+        Both limits default to the generator config (``scan_concurrency``,
+        ``scan_deadline_seconds``) and then to the service settings.
+        
+        Args:
+            tickers: Tickers to scan
+            scan: Coroutine function returning a Signal, a list of Signals or None
+            concurrency: Maximum scans in flight
+            deadline_seconds: Wall-clock budget for the whole cycle
+            
+        Returns:
+            TickerScanResult with the collected signals and the unfinished tickers
+        """
+        tickers = list(dict.fromkeys(tickers))
+        result = TickerScanResult()
+        if not tickers:
+            return result
+        
+        concurrency = max(1, int(
+            concurrency
+            or self.config.get("scan_concurrency")
+            or settings.GENERATOR_SCAN_CONCURRENCY
+        ))
+        deadline_seconds = (
+            deadline_seconds
+            or self.config.get("scan_deadline_seconds")
+            or settings.GENERATOR_SCAN_DEADLINE_SECONDS
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _bounded(ticker: str):
+            async with semaphore:
+                return await scan(ticker)
+        
+        tasks = {ticker: asyncio.create_task(_bounded(ticker)) for ticker in tickers}
+        try:
+            _, pending = await asyncio.wait(tasks.values(), timeout=deadline_seconds)
+        finally:
+            # Also runs when the cycle itself is cancelled (service shutdown)
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        for ticker, task in tasks.items():
+            if task in pending:
+                result.timed_out.append(ticker)
+                continue
+            error = task.exception()
+            if error is not None:
+                result.failed.append(ticker)
+                logger.error(
+                    "ticker_scan_failed",
+                    generator=self.name,
+                    ticker=ticker,
+                    error=str(error)
+                )
+                continue
+            result.scanned.append(ticker)
+            signals = task.result()
+            if isinstance(signals, Signal):
+                result.signals.append(signals)
+            elif signals:
+                result.signals.extend(signals)
+        
+        if result.timed_out:
+            logger.warning(
+                "ticker_scan_deadline_exceeded",
+                generator=self.name,
+                deadline_seconds=deadline_seconds,
+                concurrency=concurrency,
+                scanned=len(result.scanned),
+                timed_out=result.timed_out
+            )
+        
+        return result
+    
     def _validate_config(self):
         """
         Validate generator configuration.
@@ -66,7 +66,6 @@ class CCISignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate CCI overbought/oversold signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "cci_scan_started",
@@ -76,151 +75,158 @@ class CCISignalGenerator(BaseSignalGenerator):
             oversold=self.oversold
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch CCI from Finnhub
-                lookback_days = 90
-                cci_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="cci",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.timeperiod
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("cci_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch CCI from Finnhub
+            lookback_days = 90
+            cci_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="cci",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.timeperiod
+            )
+            
+            if not cci_data or "cci" not in cci_data:
+                logger.warning("cci_data_unavailable", ticker=ticker)
+                return signals
+            
+            cci_values = cci_data["cci"]
+            
+            if len(cci_values) < 2:
+                logger.warning("insufficient_cci_data", ticker=ticker)
+                return signals
+            
+            current_cci = cci_values[-1]
+            previous_cci = cci_values[-2]
+            
+            current_price = cci_data.get("c", [None])[-1] if "c" in cci_data else None
+            
+            # CCI entering oversold zone (bullish reversal potential)
+            if current_cci < self.oversold and previous_cci >= self.oversold:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"CCI oversold: CCI ({current_cci:.1f}) crossed below {self.oversold}. "
+                        f"Potential bullish reversal."
+                    )
                 )
                 
-                if not cci_data or "cci" not in cci_data:
-                    logger.warning("cci_data_unavailable", ticker=ticker)
-                    continue
-                
-                cci_values = cci_data["cci"]
-                
-                if len(cci_values) < 2:
-                    logger.warning("insufficient_cci_data", ticker=ticker)
-                    continue
+                signal = Signal(
+                    signal_type=SignalType.CCI_OVERSOLD,
+                    source="cci_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "timeperiod": self.timeperiod,
+                        "current_cci": round(current_cci, 2),
+                        "previous_cci": round(previous_cci, 2),
+                        "oversold_threshold": self.oversold,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                current_cci = cci_values[-1]
-                previous_cci = cci_values[-2]
+                signals.append(signal)
+                logger.info("cci_oversold_signal", ticker=ticker, cci=round(current_cci, 1))
+            
+            # CCI entering overbought zone (bearish reversal potential)
+            elif current_cci > self.overbought and previous_cci <= self.overbought:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"CCI overbought: CCI ({current_cci:.1f}) crossed above {self.overbought}. "
+                        f"Potential bearish reversal."
+                    )
+                )
                 
-                current_price = cci_data.get("c", [None])[-1] if "c" in cci_data else None
+                signal = Signal(
+                    signal_type=SignalType.CCI_OVERBOUGHT,
+                    source="cci_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "timeperiod": self.timeperiod,
+                        "current_cci": round(current_cci, 2),
+                        "previous_cci": round(previous_cci, 2),
+                        "overbought_threshold": self.overbought,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # CCI entering oversold zone (bullish reversal potential)
-                if current_cci < self.oversold and previous_cci >= self.oversold:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"CCI oversold: CCI ({current_cci:.1f}) crossed below {self.oversold}. "
-                            f"Potential bullish reversal."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.CCI_OVERSOLD,
-                        source="cci_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "timeperiod": self.timeperiod,
-                            "current_cci": round(current_cci, 2),
-                            "previous_cci": round(previous_cci, 2),
-                            "oversold_threshold": self.oversold,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("cci_overbought_signal", ticker=ticker, cci=round(current_cci, 1))
+            
+            # CCI crossing zero line upward (bullish momentum)
+            elif current_cci > 0 and previous_cci <= 0:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 0.9 * 100,  # Slightly lower confidence
+                    reasoning=(
+                        f"CCI bullish zero cross: CCI ({current_cci:.1f}) crossed above zero. "
+                        f"Uptrend momentum."
                     )
-                    
-                    signals.append(signal)
-                    logger.info("cci_oversold_signal", ticker=ticker, cci=round(current_cci, 1))
+                )
                 
-                # CCI entering overbought zone (bearish reversal potential)
-                elif current_cci > self.overbought and previous_cci <= self.overbought:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"CCI overbought: CCI ({current_cci:.1f}) crossed above {self.overbought}. "
-                            f"Potential bearish reversal."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.CCI_OVERBOUGHT,
-                        source="cci_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "timeperiod": self.timeperiod,
-                            "current_cci": round(current_cci, 2),
-                            "previous_cci": round(previous_cci, 2),
-                            "overbought_threshold": self.overbought,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("cci_overbought_signal", ticker=ticker, cci=round(current_cci, 1))
+                signal = Signal(
+                    signal_type=SignalType.CCI_BULLISH_ZERO_CROSS,
+                    source="cci_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "timeperiod": self.timeperiod,
+                        "current_cci": round(current_cci, 2),
+                        "previous_cci": round(previous_cci, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # CCI crossing zero line upward (bullish momentum)
-                elif current_cci > 0 and previous_cci <= 0:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 0.9 * 100,  # Slightly lower confidence
-                        reasoning=(
-                            f"CCI bullish zero cross: CCI ({current_cci:.1f}) crossed above zero. "
-                            f"Uptrend momentum."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.CCI_BULLISH_ZERO_CROSS,
-                        source="cci_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "timeperiod": self.timeperiod,
-                            "current_cci": round(current_cci, 2),
-                            "previous_cci": round(previous_cci, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("cci_bullish_zero_cross", ticker=ticker, cci=round(current_cci, 1))
+            
+            # CCI crossing zero line downward (bearish momentum)
+            elif current_cci < 0 and previous_cci >= 0:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 0.9 * 100,  # Slightly lower confidence
+                    reasoning=(
+                        f"CCI bearish zero cross: CCI ({current_cci:.1f}) crossed below zero. "
+                        f"Downtrend momentum."
                     )
-                    
-                    signals.append(signal)
-                    logger.info("cci_bullish_zero_cross", ticker=ticker, cci=round(current_cci, 1))
+                )
                 
-                # CCI crossing zero line downward (bearish momentum)
-                elif current_cci < 0 and previous_cci >= 0:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 0.9 * 100,  # Slightly lower confidence
-                        reasoning=(
-                            f"CCI bearish zero cross: CCI ({current_cci:.1f}) crossed below zero. "
-                            f"Downtrend momentum."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.CCI_BEARISH_ZERO_CROSS,
-                        source="cci_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "timeperiod": self.timeperiod,
-                            "current_cci": round(current_cci, 2),
-                            "previous_cci": round(previous_cci, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("cci_bearish_zero_cross", ticker=ticker, cci=round(current_cci, 1))
-            
-            except Exception as e:
-                logger.error("cci_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+                signal = Signal(
+                    signal_type=SignalType.CCI_BEARISH_ZERO_CROSS,
+                    source="cci_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "timeperiod": self.timeperiod,
+                        "current_cci": round(current_cci, 2),
+                        "previous_cci": round(previous_cci, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("cci_bearish_zero_cross", ticker=ticker, cci=round(current_cci, 1))
+        
+        except Exception as e:
+            logger.error("cci_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("cci_scan_completed", signals_generated=len(signals))
         return signals
 
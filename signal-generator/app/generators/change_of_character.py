@@ -4,11 +4,13 @@ Change of Character (CHoCH) Signal Generator
 Detects market structure reversals (trend changes).
 """
 from typing import Dict, Any, List
+import numpy as np
 import structlog
 
 from app.generators.base import BaseSignalGenerator, GeneratorError
 from app.schemas.signal import Signal, TickerSignal, SignalType, BiasType
 from app.utils.market_data import MarketDataFetcher
+from app.utils.market_structure import swing_points
 
 
 logger = structlog.get_logger()
@@ -57,24 +59,11 @@ class ChangeOfCharacterSignalGenerator(BaseSignalGenerator):
     
     def _find_swing_points(self, highs: List[float], lows: List[float], strength: int) -> tuple:
         """Find all swing highs and lows."""
-        swing_highs = []
-        swing_lows = []
-        
-        for i in range(strength, len(highs) - strength):
-            # Check for swing high
-            is_high = all(highs[i] >= highs[i-j] for j in range(1, strength+1)) and \
-                     all(highs[i] >= highs[i+j] for j in range(1, strength+1))
-            
-            if is_high:
-                swing_highs.append((i, highs[i]))
-            
-            # Check for swing low
-            is_low = all(lows[i] <= lows[i-j] for j in range(1, strength+1)) and \
-                    all(lows[i] <= lows[i+j] for j in range(1, strength+1))
-            
-            if is_low:
-                swing_lows.append((i, lows[i]))
-        
+        high_idx, low_idx = swing_points(
+            np.asarray(highs, dtype=float), np.asarray(lows, dtype=float), strength, strict=False
+        )
+        swing_highs = [(i, highs[i]) for i in high_idx.tolist()]
+        swing_lows = [(i, lows[i]) for i in low_idx.tolist()]
         return swing_highs, swing_lows
     
     def _is_downtrend(self, swing_highs: List[tuple], swing_lows: List[tuple]) -> bool:
@@ -112,7 +101,6 @@ class ChangeOfCharacterSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate CHoCH signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "choch_scan_started",
@@ -121,136 +109,143 @@ class ChangeOfCharacterSignalGenerator(BaseSignalGenerator):
             swing_strength=self.min_swing_strength
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch candles
-                lookback_days = self.lookback_periods + self.min_swing_strength + 10
-                candles_df = await self.market_data.fetch_candles(
-                    symbol=ticker,
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days
-                )
-                
-                # Convert DataFrame to list of dicts
-                candles = self._dataframe_to_candles(candles_df)
-                
-                if not candles or len(candles) < self.lookback_periods:
-                    logger.debug("insufficient_candle_data", ticker=ticker)
-                    continue
-                
-                highs = [c["h"] for c in candles]
-                lows = [c["l"] for c in candles]
-                closes = [c["c"] for c in candles]
-                
-                # Find all swing points
-                swing_highs, swing_lows = self._find_swing_points(
-                    highs, lows, self.min_swing_strength
-                )
-                
-                if len(swing_highs) < 2 or len(swing_lows) < 2:
-                    logger.debug("insufficient_swing_points", ticker=ticker)
-                    continue
-                
-                current_close = closes[-1]
-                previous_close = closes[-2]
-                
-                # Check for Bullish CHoCH (in downtrend, price breaks previous lower high)
-                if self._is_downtrend(swing_highs, swing_lows):
-                    if len(swing_highs) >= 2:
-                        previous_lower_high = swing_highs[-2][1]
-                        
-                        # Check if price just broke above previous lower high
-                        bullish_choch = (
-                            current_close > previous_lower_high and 
-                            previous_close <= previous_lower_high
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info(
+            "choch_scan_completed",
+            signals_generated=len(signals),
+            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
+        )
+        
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch candles
+            lookback_days = self.lookback_periods + self.min_swing_strength + 10
+            candles_df = await self.market_data.fetch_candles(
+                symbol=ticker,
+                resolution=self.timeframe,
+                lookback_days=lookback_days
+            )
+            
+            # Convert DataFrame to list of dicts
+            candles = self._dataframe_to_candles(candles_df)
+            
+            if not candles or len(candles) < self.lookback_periods:
+                logger.debug("insufficient_candle_data", ticker=ticker)
+                return signals
+            
+            highs = [c["h"] for c in candles]
+            lows = [c["l"] for c in candles]
+            closes = [c["c"] for c in candles]
+            
+            # Find all swing points
+            swing_highs, swing_lows = self._find_swing_points(
+                highs, lows, self.min_swing_strength
+            )
+            
+            if len(swing_highs) < 2 or len(swing_lows) < 2:
+                logger.debug("insufficient_swing_points", ticker=ticker)
+                return signals
+            
+            current_close = closes[-1]
+            previous_close = closes[-2]
+            
+            # Check for Bullish CHoCH (in downtrend, price breaks previous lower high)
+            if self._is_downtrend(swing_highs, swing_lows):
+                if len(swing_highs) >= 2:
+                    previous_lower_high = swing_highs[-2][1]
+                    
+                    # Check if price just broke above previous lower high
+                    bullish_choch = (
+                        current_close > previous_lower_high and 
+                        previous_close <= previous_lower_high
+                    )
+                    
+                    if bullish_choch:
+                        logger.info(
+                            "bullish_choch_detected",
+                            ticker=ticker,
+                            previous_lower_high=previous_lower_high,
+                            current_close=current_close
                         )
                         
-                        if bullish_choch:
-                            logger.info(
-                                "bullish_choch_detected",
-                                ticker=ticker,
-                                previous_lower_high=previous_lower_high,
-                                current_close=current_close
-                            )
-                            
-                            ticker_signal = TickerSignal(
-                                ticker=ticker,
-                                signal=BiasType.BULLISH,
-                                confidence=self.confidence * 100,
-                                reasoning=(
-                                    f"Bullish CHoCH: In downtrend, price broke above previous lower high "
-                                    f"at {previous_lower_high:.5f}. Current: {current_close:.5f}. "
-                                    f"Trend reversal signal - potential shift to uptrend."
-                                )
-                            )
-                            
-                            signal = Signal(
-                                signal_type=SignalType.CHOCH_BULLISH,
-                                source="choch_generator",
-                                tickers=[ticker_signal],
-                                metadata=self._enrich_metadata({
-                                    "previous_lower_high": previous_lower_high,
-                                    "current_price": current_close,
-                                    "trend": "downtrend_to_uptrend"
-                                })
+                        ticker_signal = TickerSignal(
+                            ticker=ticker,
+                            signal=BiasType.BULLISH,
+                            confidence=self.confidence * 100,
+                            reasoning=(
+                                f"Bullish CHoCH: In downtrend, price broke above previous lower high "
+                                f"at {previous_lower_high:.5f}. Current: {current_close:.5f}. "
+                                f"Trend reversal signal - potential shift to uptrend."
                             )
-                            signals.append(signal)
-                
-                # Check for Bearish CHoCH (in uptrend, price breaks previous higher low)
-                if self._is_uptrend(swing_highs, swing_lows):
-                    if len(swing_lows) >= 2:
-                        previous_higher_low = swing_lows[-2][1]
+                        )
                         
-                        # Check if price just broke below previous higher low
-                        bearish_choch = (
-                            current_close < previous_higher_low and 
-                            previous_close >= previous_higher_low
+                        signal = Signal(
+                            signal_type=SignalType.CHOCH_BULLISH,
+                            source="choch_generator",
+                            tickers=[ticker_signal],
+                            metadata=self._enrich_metadata({
+                                "previous_lower_high": previous_lower_high,
+                                "current_price": current_close,
+                                "trend": "downtrend_to_uptrend"
+                            })
+                        )
+                        signals.append(signal)
+            
+            # Check for Bearish CHoCH (in uptrend, price breaks previous higher low)
+            if self._is_uptrend(swing_highs, swing_lows):
+                if len(swing_lows) >= 2:
+                    previous_higher_low = swing_lows[-2][1]
+                    
+                    # Check if price just broke below previous higher low
+                    bearish_choch = (
+                        current_close < previous_higher_low and 
+                        previous_close >= previous_higher_low
+                    )
+                    
+                    if bearish_choch:
+                        logger.info(
+                            "bearish_choch_detected",
+                            ticker=ticker,
+                            previous_higher_low=previous_higher_low,
+                            current_close=current_close
                         )
                         
-                        if bearish_choch:
-                            logger.info(
-                                "bearish_choch_detected",
-                                ticker=ticker,
-                                previous_higher_low=previous_higher_low,
-                                current_close=current_close
-                            )
-                            
-                            ticker_signal = TickerSignal(
-                                ticker=ticker,
-                                signal=BiasType.BEARISH,
-                                confidence=self.confidence * 100,
-                                reasoning=(
-                                    f"Bearish CHoCH: In uptrend, price broke below previous higher low "
-                                    f"at {previous_higher_low:.5f}. Current: {current_close:.5f}. "
-                                    f"Trend reversal signal - potential shift to downtrend."
-                                )
-                            )
-                            
-                            signal = Signal(
-                                signal_type=SignalType.CHOCH_BEARISH,
-                                source="choch_generator",
-                                tickers=[ticker_signal],
-                                metadata=self._enrich_metadata({
-                                    "previous_higher_low": previous_higher_low,
-                                    "current_price": current_close,
-                                    "trend": "uptrend_to_downtrend"
-                                })
+                        ticker_signal = TickerSignal(
+                            ticker=ticker,
+                            signal=BiasType.BEARISH,
+                            confidence=self.confidence * 100,
+                            reasoning=(
+                                f"Bearish CHoCH: In uptrend, price broke below previous higher low "
+                                f"at {previous_higher_low:.5f}. Current: {current_close:.5f}. "
+                                f"Trend reversal signal - potential shift to downtrend."
                             )
-                            signals.append(signal)
-                
-            except Exception as e:
-                logger.error(
-                    "choch_error",
-                    ticker=ticker,
-                    error=str(e),
-                    exc_info=True
-                )
-                continue
-        
-        logger.info(
-            "choch_scan_completed",
-            signals_generated=len(signals),
-            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
-        )
+                        )
+                        
+                        signal = Signal(
+                            signal_type=SignalType.CHOCH_BEARISH,
+                            source="choch_generator",
+                            tickers=[ticker_signal],
+                            metadata=self._enrich_metadata({
+                                "previous_higher_low": previous_higher_low,
+                                "current_price": current_close,
+                                "trend": "uptrend_to_downtrend"
+                            })
+                        )
+                        signals.append(signal)
+            
+        except Exception as e:
+            logger.error(
+                "choch_error",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
         
         return signals
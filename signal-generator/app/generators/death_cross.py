@@ -74,7 +74,6 @@ class DeathCrossSignalGenerator(BaseSignalGenerator):
             List of Signal objects for tickers with death cross detected
         """
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "death_cross_scan_started",
@@ -83,133 +82,8 @@ class DeathCrossSignalGenerator(BaseSignalGenerator):
             sma_long=self.sma_long
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch both SMAs from Finnhub
-                lookback_days = self.sma_long + self.lookback_days + 50
-                
-                # Fetch short SMA
-                sma_short_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="sma",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.sma_short,
-                    seriestype="c"
-                )
-                
-                # Fetch long SMA
-                sma_long_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="sma",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.sma_long,
-                    seriestype="c"
-                )
-                
-                if not sma_short_data or "sma" not in sma_short_data:
-                    logger.warning(
-                        "short_sma_data_unavailable",
-                        ticker=ticker
-                    )
-                    continue
-                
-                if not sma_long_data or "sma" not in sma_long_data:
-                    logger.warning(
-                        "long_sma_data_unavailable",
-                        ticker=ticker
-                    )
-                    continue
-                
-                sma_short_values = sma_short_data["sma"]
-                sma_long_values = sma_long_data["sma"]
-                
-                # Both should have same length, but use minimum to be safe
-                min_len = min(len(sma_short_values), len(sma_long_values))
-                
-                if min_len < self.lookback_days + 1:
-                    logger.warning(
-                        "insufficient_data_for_death_cross",
-                        ticker=ticker,
-                        required=self.lookback_days + 1,
-                        available=min_len
-                    )
-                    continue
-                
-                # Check recent data for death cross
-                has_death_cross = False
-                for i in range(1, min(self.lookback_days + 1, min_len)):
-                    idx = -i
-                    prev_idx = -(i + 1)
-                    
-                    current_short = sma_short_values[idx]
-                    current_long = sma_long_values[idx]
-                    prev_short = sma_short_values[prev_idx]
-                    prev_long = sma_long_values[prev_idx]
-                    
-                    # Death cross: short was above, now below
-                    if prev_short >= prev_long and current_short < current_long:
-                        has_death_cross = True
-                        logger.debug(
-                            "death_cross_detected",
-                            days_ago=i - 1,
-                            prev_short=round(prev_short, 2),
-                            prev_long=round(prev_long, 2),
-                            current_short=round(current_short, 2),
-                            current_long=round(current_long, 2)
-                        )
-                        break
-                
-                if has_death_cross:
-                    # Get current values
-                    current_short_sma = sma_short_values[-1]
-                    current_long_sma = sma_long_values[-1]
-                    current_price = sma_short_data.get("c", [None])[-1] if "c" in sma_short_data else None
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"Death cross detected: {self.sma_short}-day SMA "
-                            f"crossed below {self.sma_long}-day SMA"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.DEATH_CROSS,
-                        source="death_cross_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "sma_short": self.sma_short,
-                            "sma_long": self.sma_long,
-                            "timeframe": self.timeframe,
-                            "current_sma_short": round(current_short_sma, 2),
-                            "current_sma_long": round(current_long_sma, 2),
-                            "current_price": round(current_price, 2) if current_price else None,
-                            "lookback_days": self.lookback_days
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    
-                    logger.info(
-                        "death_cross_signal_generated",
-                        signal_id=str(signal.signal_id),
-                        ticker=ticker,
-                        sma_short_value=round(current_short_sma, 2),
-                        sma_long_value=round(current_long_sma, 2)
-                    )
-            
-            except Exception as e:
-                logger.error(
-                    "death_cross_check_failed",
-                    ticker=ticker,
-                    error=str(e),
-                    exc_info=True
-                )
-                continue
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
         
         if signals:
             logger.info(
@@ -225,3 +99,135 @@ class DeathCrossSignalGenerator(BaseSignalGenerator):
             )
         
         return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch both SMAs from Finnhub
+            lookback_days = self.sma_long + self.lookback_days + 50
+            
+            # Fetch short SMA
+            sma_short_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="sma",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.sma_short,
+                seriestype="c"
+            )
+            
+            # Fetch long SMA
+            sma_long_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="sma",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.sma_long,
+                seriestype="c"
+            )
+            
+            if not sma_short_data or "sma" not in sma_short_data:
+                logger.warning(
+                    "short_sma_data_unavailable",
+                    ticker=ticker
+                )
+                return signals
+            
+            if not sma_long_data or "sma" not in sma_long_data:
+                logger.warning(
+                    "long_sma_data_unavailable",
+                    ticker=ticker
+                )
+                return signals
+            
+            sma_short_values = sma_short_data["sma"]
+            sma_long_values = sma_long_data["sma"]
+            
+            # Both should have same length, but use minimum to be safe
+            min_len = min(len(sma_short_values), len(sma_long_values))
+            
+            if min_len < self.lookback_days + 1:
+                logger.warning(
+                    "insufficient_data_for_death_cross",
+                    ticker=ticker,
+                    required=self.lookback_days + 1,
+                    available=min_len
+                )
+                return signals
+            
+            # Check recent data for death cross
+            has_death_cross = False
+            for i in range(1, min(self.lookback_days + 1, min_len)):
+                idx = -i
+                prev_idx = -(i + 1)
+                
+                current_short = sma_short_values[idx]
+                current_long = sma_long_values[idx]
+                prev_short = sma_short_values[prev_idx]
+                prev_long = sma_long_values[prev_idx]
+                
+                # Death cross: short was above, now below
+                if prev_short >= prev_long and current_short < current_long:
+                    has_death_cross = True
+                    logger.debug(
+                        "death_cross_detected",
+                        days_ago=i - 1,
+                        prev_short=round(prev_short, 2),
+                        prev_long=round(prev_long, 2),
+                        current_short=round(current_short, 2),
+                        current_long=round(current_long, 2)
+                    )
+                    break
+            
+            if has_death_cross:
+                # Get current values
+                current_short_sma = sma_short_values[-1]
+                current_long_sma = sma_long_values[-1]
+                current_price = sma_short_data.get("c", [None])[-1] if "c" in sma_short_data else None
+                
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"Death cross detected: {self.sma_short}-day SMA "
+                        f"crossed below {self.sma_long}-day SMA"
+                    )
+                )
+                
+                signal = Signal(
+                    signal_type=SignalType.DEATH_CROSS,
+                    source="death_cross_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "sma_short": self.sma_short,
+                        "sma_long": self.sma_long,
+                        "timeframe": self.timeframe,
+                        "current_sma_short": round(current_short_sma, 2),
+                        "current_sma_long": round(current_long_sma, 2),
+                        "current_price": round(current_price, 2) if current_price else None,
+                        "lookback_days": self.lookback_days
+                    })
+                )
+                
+                signals.append(signal)
+                
+                logger.info(
+                    "death_cross_signal_generated",
+                    signal_id=str(signal.signal_id),
+                    ticker=ticker,
+                    sma_short_value=round(current_short_sma, 2),
+                    sma_long_value=round(current_long_sma, 2)
+                )
+        
+        except Exception as e:
+            logger.error(
+                "death_cross_check_failed",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
+        
+        return signals
@@ -63,7 +63,6 @@ class EMACrossoverSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate EMA crossover signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "ema_crossover_scan_started",
@@ -72,135 +71,142 @@ class EMACrossoverSignalGenerator(BaseSignalGenerator):
             ema_slow=self.ema_slow
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch both EMAs from Finnhub
-                lookback_days = self.ema_slow + self.lookback_days + 50
-                
-                # Fetch fast EMA
-                ema_fast_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="ema",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.ema_fast,
-                    seriestype="c"
-                )
-                
-                # Fetch slow EMA
-                ema_slow_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="ema",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.ema_slow,
-                    seriestype="c"
-                )
-                
-                if not ema_fast_data or "ema" not in ema_fast_data:
-                    logger.warning("fast_ema_data_unavailable", ticker=ticker)
-                    continue
-                
-                if not ema_slow_data or "ema" not in ema_slow_data:
-                    logger.warning("slow_ema_data_unavailable", ticker=ticker)
-                    continue
-                
-                ema_fast_values = ema_fast_data["ema"]
-                ema_slow_values = ema_slow_data["ema"]
-                
-                min_len = min(len(ema_fast_values), len(ema_slow_values))
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("ema_crossover_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch both EMAs from Finnhub
+            lookback_days = self.ema_slow + self.lookback_days + 50
+            
+            # Fetch fast EMA
+            ema_fast_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="ema",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.ema_fast,
+                seriestype="c"
+            )
+            
+            # Fetch slow EMA
+            ema_slow_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="ema",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.ema_slow,
+                seriestype="c"
+            )
+            
+            if not ema_fast_data or "ema" not in ema_fast_data:
+                logger.warning("fast_ema_data_unavailable", ticker=ticker)
+                return signals
+            
+            if not ema_slow_data or "ema" not in ema_slow_data:
+                logger.warning("slow_ema_data_unavailable", ticker=ticker)
+                return signals
+            
+            ema_fast_values = ema_fast_data["ema"]
+            ema_slow_values = ema_slow_data["ema"]
+            
+            min_len = min(len(ema_fast_values), len(ema_slow_values))
+            
+            if min_len < self.lookback_days + 1:
+                logger.warning("insufficient_ema_data", ticker=ticker, available=min_len)
+                return signals
+            
+            # Check for crossover in recent data
+            bullish_crossover = False
+            bearish_crossover = False
+            
+            for i in range(1, min(self.lookback_days + 1, min_len)):
+                idx = -i
+                prev_idx = -(i + 1)
                 
-                if min_len < self.lookback_days + 1:
-                    logger.warning("insufficient_ema_data", ticker=ticker, available=min_len)
-                    continue
+                current_fast = ema_fast_values[idx]
+                current_slow = ema_slow_values[idx]
+                prev_fast = ema_fast_values[prev_idx]
+                prev_slow = ema_slow_values[prev_idx]
                 
-                # Check for crossover in recent data
-                bullish_crossover = False
-                bearish_crossover = False
+                # Bullish crossover: fast was below, now above
+                if prev_fast <= prev_slow and current_fast > current_slow:
+                    bullish_crossover = True
+                    break
                 
-                for i in range(1, min(self.lookback_days + 1, min_len)):
-                    idx = -i
-                    prev_idx = -(i + 1)
-                    
-                    current_fast = ema_fast_values[idx]
-                    current_slow = ema_slow_values[idx]
-                    prev_fast = ema_fast_values[prev_idx]
-                    prev_slow = ema_slow_values[prev_idx]
-                    
-                    # Bullish crossover: fast was below, now above
-                    if prev_fast <= prev_slow and current_fast > current_slow:
-                        bullish_crossover = True
-                        break
-                    
-                    # Bearish crossover: fast was above, now below
-                    elif prev_fast >= prev_slow and current_fast < current_slow:
-                        bearish_crossover = True
-                        break
+                # Bearish crossover: fast was above, now below
+                elif prev_fast >= prev_slow and current_fast < current_slow:
+                    bearish_crossover = True
+                    break
+            
+            current_price = ema_fast_data.get("c", [None])[-1] if "c" in ema_fast_data else None
+            current_fast_ema = ema_fast_values[-1]
+            current_slow_ema = ema_slow_values[-1]
+            
+            if bullish_crossover:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"EMA bullish crossover: {self.ema_fast}-EMA crossed above "
+                        f"{self.ema_slow}-EMA ({current_fast_ema:.2f} > {current_slow_ema:.2f})"
+                    )
+                )
                 
-                current_price = ema_fast_data.get("c", [None])[-1] if "c" in ema_fast_data else None
-                current_fast_ema = ema_fast_values[-1]
-                current_slow_ema = ema_slow_values[-1]
+                signal = Signal(
+                    signal_type=SignalType.EMA_BULLISH_CROSSOVER,
+                    source="ema_crossover_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "ema_fast": self.ema_fast,
+                        "ema_slow": self.ema_slow,
+                        "current_fast_ema": round(current_fast_ema, 2),
+                        "current_slow_ema": round(current_slow_ema, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                if bullish_crossover:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"EMA bullish crossover: {self.ema_fast}-EMA crossed above "
-                            f"{self.ema_slow}-EMA ({current_fast_ema:.2f} > {current_slow_ema:.2f})"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.EMA_BULLISH_CROSSOVER,
-                        source="ema_crossover_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "ema_fast": self.ema_fast,
-                            "ema_slow": self.ema_slow,
-                            "current_fast_ema": round(current_fast_ema, 2),
-                            "current_slow_ema": round(current_slow_ema, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("ema_bullish_crossover_signal", ticker=ticker)
+            
+            elif bearish_crossover:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"EMA bearish crossover: {self.ema_fast}-EMA crossed below "
+                        f"{self.ema_slow}-EMA ({current_fast_ema:.2f} < {current_slow_ema:.2f})"
                     )
-                    
-                    signals.append(signal)
-                    logger.info("ema_bullish_crossover_signal", ticker=ticker)
+                )
                 
-                elif bearish_crossover:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"EMA bearish crossover: {self.ema_fast}-EMA crossed below "
-                            f"{self.ema_slow}-EMA ({current_fast_ema:.2f} < {current_slow_ema:.2f})"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.EMA_BEARISH_CROSSOVER,
-                        source="ema_crossover_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "ema_fast": self.ema_fast,
-                            "ema_slow": self.ema_slow,
-                            "current_fast_ema": round(current_fast_ema, 2),
-                            "current_slow_ema": round(current_slow_ema, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("ema_bearish_crossover_signal", ticker=ticker)
-            
-            except Exception as e:
-                logger.error("ema_crossover_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+                signal = Signal(
+                    signal_type=SignalType.EMA_BEARISH_CROSSOVER,
+                    source="ema_crossover_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "ema_fast": self.ema_fast,
+                        "ema_slow": self.ema_slow,
+                        "current_fast_ema": round(current_fast_ema, 2),
+                        "current_slow_ema": round(current_slow_ema, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("ema_bearish_crossover_signal", ticker=ticker)
+        
+        except Exception as e:
+            logger.error("ema_crossover_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("ema_crossover_scan_completed", signals_generated=len(signals))
         return signals
 
@@ -62,7 +62,6 @@ class FairValueGapSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate fair value gap signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "fair_value_gap_scan_started",
@@ -70,125 +69,132 @@ class FairValueGapSignalGenerator(BaseSignalGenerator):
             min_gap_pips=self.min_gap_pips
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch recent candles
-                candles_df = await self.market_data.fetch_candles(
-                    symbol=ticker,
-                    resolution=self.timeframe,
-                    lookback_days=10
-                )
-                
-                # Convert DataFrame to list of dicts
-                candles = self._dataframe_to_candles(candles_df)
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info(
+            "fair_value_gap_scan_completed",
+            signals_generated=len(signals),
+            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
+        )
+        
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch recent candles
+            candles_df = await self.market_data.fetch_candles(
+                symbol=ticker,
+                resolution=self.timeframe,
+                lookback_days=10
+            )
+            
+            # Convert DataFrame to list of dicts
+            candles = self._dataframe_to_candles(candles_df)
+            
+            if not candles or len(candles) < 3:
+                logger.debug("insufficient_candle_data", ticker=ticker)
+                return signals
+            
+            # Calculate pip value
+            pip_value = self._calculate_pip_value(ticker)
+            min_gap_price = self.min_gap_pips * pip_value
+            
+            # Check for FVG in recent 3 candles
+            candle_n_minus_2 = candles[-3]
+            candle_n_minus_1 = candles[-2]
+            candle_n = candles[-1]
+            
+            # Bullish FVG: Gap between candle[-3].high and candle[-1].low
+            bullish_gap = candle_n.get("l") - candle_n_minus_2.get("h")
+            
+            if bullish_gap > min_gap_price:
+                gap_pips = bullish_gap / pip_value
                 
-                if not candles or len(candles) < 3:
-                    logger.debug("insufficient_candle_data", ticker=ticker)
-                    continue
+                logger.info(
+                    "bullish_fvg_detected",
+                    ticker=ticker,
+                    gap_pips=gap_pips,
+                    gap_low=candle_n_minus_2.get("h"),
+                    gap_high=candle_n.get("l")
+                )
                 
-                # Calculate pip value
-                pip_value = self._calculate_pip_value(ticker)
-                min_gap_price = self.min_gap_pips * pip_value
+                # Higher confidence for larger gaps
+                confidence = min(self.confidence + (gap_pips / 100), 0.90)
                 
-                # Check for FVG in recent 3 candles
-                candle_n_minus_2 = candles[-3]
-                candle_n_minus_1 = candles[-2]
-                candle_n = candles[-1]
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=confidence * 100,
+                    reasoning=(
+                        f"Bullish Fair Value Gap detected: {gap_pips:.1f} pips gap "
+                        f"between {candle_n_minus_2.get('h'):.5f} and {candle_n.get('l'):.5f}. "
+                        f"Price likely to fill gap and continue upward."
+                    )
+                )
                 
-                # Bullish FVG: Gap between candle[-3].high and candle[-1].low
-                bullish_gap = candle_n.get("l") - candle_n_minus_2.get("h")
+                signal = Signal(
+                    signal_type=SignalType.FVG_BULLISH,
+                    source="fvg_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "gap_pips": gap_pips,
+                        "gap_low": candle_n_minus_2.get("h"),
+                        "gap_high": candle_n.get("l"),
+                        "middle_candle_time": str(candle_n_minus_1.get("t"))
+                    })
+                )
+                signals.append(signal)
+            
+            # Bearish FVG: Gap between candle[-3].low and candle[-1].high
+            bearish_gap = candle_n_minus_2.get("l") - candle_n.get("h")
+            
+            if bearish_gap > min_gap_price:
+                gap_pips = bearish_gap / pip_value
                 
-                if bullish_gap > min_gap_price:
-                    gap_pips = bullish_gap / pip_value
-                    
-                    logger.info(
-                        "bullish_fvg_detected",
-                        ticker=ticker,
-                        gap_pips=gap_pips,
-                        gap_low=candle_n_minus_2.get("h"),
-                        gap_high=candle_n.get("l")
-                    )
-                    
-                    # Higher confidence for larger gaps
-                    confidence = min(self.confidence + (gap_pips / 100), 0.90)
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=confidence * 100,
-                        reasoning=(
-                            f"Bullish Fair Value Gap detected: {gap_pips:.1f} pips gap "
-                            f"between {candle_n_minus_2.get('h'):.5f} and {candle_n.get('l'):.5f}. "
-                            f"Price likely to fill gap and continue upward."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.FVG_BULLISH,
-                        source="fvg_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "gap_pips": gap_pips,
-                            "gap_low": candle_n_minus_2.get("h"),
-                            "gap_high": candle_n.get("l"),
-                            "middle_candle_time": str(candle_n_minus_1.get("t"))
-                        })
-                    )
-                    signals.append(signal)
+                logger.info(
+                    "bearish_fvg_detected",
+                    ticker=ticker,
+                    gap_pips=gap_pips,
+                    gap_high=candle_n_minus_2.get("l"),
+                    gap_low=candle_n.get("h")
+                )
                 
-                # Bearish FVG: Gap between candle[-3].low and candle[-1].high
-                bearish_gap = candle_n_minus_2.get("l") - candle_n.get("h")
+                confidence = min(self.confidence + (gap_pips / 100), 0.90)
                 
-                if bearish_gap > min_gap_price:
-                    gap_pips = bearish_gap / pip_value
-                    
-                    logger.info(
-                        "bearish_fvg_detected",
-                        ticker=ticker,
-                        gap_pips=gap_pips,
-                        gap_high=candle_n_minus_2.get("l"),
-                        gap_low=candle_n.get("h")
-                    )
-                    
-                    confidence = min(self.confidence + (gap_pips / 100), 0.90)
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=confidence * 100,
-                        reasoning=(
-                            f"Bearish Fair Value Gap detected: {gap_pips:.1f} pips gap "
-                            f"between {candle_n.get('h'):.5f} and {candle_n_minus_2.get('l'):.5f}. "
-                            f"Price likely to fill gap and continue downward."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.FVG_BEARISH,
-                        source="fvg_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "gap_pips": gap_pips,
-                            "gap_high": candle_n_minus_2.get("l"),
-                            "gap_low": candle_n.get("h"),
-                            "middle_candle_time": str(candle_n_minus_1.get("t"))
-                        })
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=confidence * 100,
+                    reasoning=(
+                        f"Bearish Fair Value Gap detected: {gap_pips:.1f} pips gap "
+                        f"between {candle_n.get('h'):.5f} and {candle_n_minus_2.get('l'):.5f}. "
+                        f"Price likely to fill gap and continue downward."
                     )
-                    signals.append(signal)
+                )
                 
-            except Exception as e:
-                logger.error(
-                    "fair_value_gap_error",
-                    ticker=ticker,
-                    error=str(e),
-                    exc_info=True
+                signal = Signal(
+                    signal_type=SignalType.FVG_BEARISH,
+                    source="fvg_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "gap_pips": gap_pips,
+                        "gap_high": candle_n_minus_2.get("l"),
+                        "gap_low": candle_n.get("h"),
+                        "middle_candle_time": str(candle_n_minus_1.get("t"))
+                    })
                 )
-                continue
-        
-        logger.info(
-            "fair_value_gap_scan_completed",
-            signals_generated=len(signals),
-            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
-        )
+                signals.append(signal)
+            
+        except Exception as e:
+            logger.error(
+                "fair_value_gap_error",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
         
         return signals
@@ -98,7 +98,6 @@ class HTFTrendAlignmentSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate HTF trend alignment signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "htf_trend_alignment_scan_started",
@@ -108,113 +107,120 @@ class HTFTrendAlignmentSignalGenerator(BaseSignalGenerator):
             min_alignment=self.min_alignment
         )
         
-        for ticker in tickers:
-            try:
-                # Get EMA slopes for all HTF timeframes
-                slopes = {}
-                for tf in self.htf_timeframes:
-                    slope = await self._get_ema_slope(ticker, tf)
-                    slopes[tf] = slope
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info(
+            "htf_trend_alignment_scan_completed",
+            signals_generated=len(signals),
+            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
+        )
+        
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Get EMA slopes for all HTF timeframes
+            slopes = {}
+            for tf in self.htf_timeframes:
+                slope = await self._get_ema_slope(ticker, tf)
+                slopes[tf] = slope
+            
+            # Count bullish and bearish alignments
+            bullish_count = sum(1 for slope in slopes.values() if slope > 0.001)
+            bearish_count = sum(1 for slope in slopes.values() if slope < -0.001)
+            
+            # Check for bullish alignment
+            if bullish_count >= self.min_alignment:
+                aligned_tfs = [tf for tf, slope in slopes.items() if slope > 0.001]
+                avg_slope = sum([slopes[tf] for tf in aligned_tfs]) / len(aligned_tfs)
+                slope_pct = avg_slope * 100
                 
-                # Count bullish and bearish alignments
-                bullish_count = sum(1 for slope in slopes.values() if slope > 0.001)
-                bearish_count = sum(1 for slope in slopes.values() if slope < -0.001)
+                logger.info(
+                    "bullish_htf_alignment_detected",
+                    ticker=ticker,
+                    aligned_timeframes=aligned_tfs,
+                    alignment_count=bullish_count,
+                    avg_slope_pct=slope_pct
+                )
                 
-                # Check for bullish alignment
-                if bullish_count >= self.min_alignment:
-                    aligned_tfs = [tf for tf, slope in slopes.items() if slope > 0.001]
-                    avg_slope = sum([slopes[tf] for tf in aligned_tfs]) / len(aligned_tfs)
-                    slope_pct = avg_slope * 100
-                    
-                    logger.info(
-                        "bullish_htf_alignment_detected",
-                        ticker=ticker,
-                        aligned_timeframes=aligned_tfs,
-                        alignment_count=bullish_count,
-                        avg_slope_pct=slope_pct
-                    )
-                    
-                    confidence_boost = (bullish_count / len(self.htf_timeframes)) * 15
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=min(self.confidence * 100 + confidence_boost, 95),
-                        reasoning=(
-                            f"Bullish HTF Alignment: {bullish_count}/{len(self.htf_timeframes)} higher timeframes aligned. "
-                            f"Timeframes: {', '.join(aligned_tfs)}. "
-                            f"Average slope: {slope_pct:.2f}%. Strong uptrend confirmation."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.HTF_TREND_ALIGNED_BULLISH,
-                        source="htf_trend_alignment_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "aligned_timeframes": aligned_tfs,
-                            "alignment_count": bullish_count,
-                            "total_timeframes": len(self.htf_timeframes),
-                            "avg_slope_pct": slope_pct,
-                            "ema_period": self.ema_period
-                        })
-                    )
-                    signals.append(signal)
+                confidence_boost = (bullish_count / len(self.htf_timeframes)) * 15
                 
-                # Check for bearish alignment
-                elif bearish_count >= self.min_alignment:
-                    aligned_tfs = [tf for tf, slope in slopes.items() if slope < -0.001]
-                    avg_slope = sum([slopes[tf] for tf in aligned_tfs]) / len(aligned_tfs)
-                    slope_pct = avg_slope * 100
-                    
-                    logger.info(
-                        "bearish_htf_alignment_detected",
-                        ticker=ticker,
-                        aligned_timeframes=aligned_tfs,
-                        alignment_count=bearish_count,
-                        avg_slope_pct=slope_pct
-                    )
-                    
-                    confidence_boost = (bearish_count / len(self.htf_timeframes)) * 15
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=min(self.confidence * 100 + confidence_boost, 95),
-                        reasoning=(
-                            f"Bearish HTF Alignment: {bearish_count}/{len(self.htf_timeframes)} higher timeframes aligned. "
-                            f"Timeframes: {', '.join(aligned_tfs)}. "
-                            f"Average slope: {slope_pct:.2f}%. Strong downtrend confirmation."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.HTF_TREND_ALIGNED_BEARISH,
-                        source="htf_trend_alignment_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "aligned_timeframes": aligned_tfs,
-                            "alignment_count": bearish_count,
-                            "total_timeframes": len(self.htf_timeframes),
-                            "avg_slope_pct": slope_pct,
-                            "ema_period": self.ema_period
-                        })
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=min(self.confidence * 100 + confidence_boost, 95),
+                    reasoning=(
+                        f"Bullish HTF Alignment: {bullish_count}/{len(self.htf_timeframes)} higher timeframes aligned. "
+                        f"Timeframes: {', '.join(aligned_tfs)}. "
+                        f"Average slope: {slope_pct:.2f}%. Strong uptrend confirmation."
                     )
-                    signals.append(signal)
+                )
+                
+                signal = Signal(
+                    signal_type=SignalType.HTF_TREND_ALIGNED_BULLISH,
+                    source="htf_trend_alignment_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "aligned_timeframes": aligned_tfs,
+                        "alignment_count": bullish_count,
+                        "total_timeframes": len(self.htf_timeframes),
+                        "avg_slope_pct": slope_pct,
+                        "ema_period": self.ema_period
+                    })
+                )
+                signals.append(signal)
+            
+            # Check for bearish alignment
+            elif bearish_count >= self.min_alignment:
+                aligned_tfs = [tf for tf, slope in slopes.items() if slope < -0.001]
+                avg_slope = sum([slopes[tf] for tf in aligned_tfs]) / len(aligned_tfs)
+                slope_pct = avg_slope * 100
                 
-            except Exception as e:
-                logger.error(
-                    "htf_trend_alignment_error",
+                logger.info(
+                    "bearish_htf_alignment_detected",
                     ticker=ticker,
-                    error=str(e),
-                    exc_info=True
+                    aligned_timeframes=aligned_tfs,
+                    alignment_count=bearish_count,
+                    avg_slope_pct=slope_pct
                 )
-                continue
-        
-        logger.info(
-            "htf_trend_alignment_scan_completed",
-            signals_generated=len(signals),
-            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
-        )
+                
+                confidence_boost = (bearish_count / len(self.htf_timeframes)) * 15
+                
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=min(self.confidence * 100 + confidence_boost, 95),
+                    reasoning=(
+                        f"Bearish HTF Alignment: {bearish_count}/{len(self.htf_timeframes)} higher timeframes aligned. "
+                        f"Timeframes: {', '.join(aligned_tfs)}. "
+                        f"Average slope: {slope_pct:.2f}%. Strong downtrend confirmation."
+                    )
+                )
+                
+                signal = Signal(
+                    signal_type=SignalType.HTF_TREND_ALIGNED_BEARISH,
+                    source="htf_trend_alignment_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "aligned_timeframes": aligned_tfs,
+                        "alignment_count": bearish_count,
+                        "total_timeframes": len(self.htf_timeframes),
+                        "avg_slope_pct": slope_pct,
+                        "ema_period": self.ema_period
+                    })
+                )
+                signals.append(signal)
+            
+        except Exception as e:
+            logger.error(
+                "htf_trend_alignment_error",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
         
         return signals
@@ -77,7 +77,6 @@ class MACDSignalGenerator(BaseSignalGenerator):
             List of Signal objects for tickers with MACD crossovers
         """
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "macd_scan_started",
@@ -87,173 +86,180 @@ class MACDSignalGenerator(BaseSignalGenerator):
             signal=self.signal_period
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch MACD from Finnhub (pre-calculated)
-                lookback_days = 120  # Enough for MACD analysis
-                macd_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="macd",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    fastperiod=self.fast_period,
-                    slowperiod=self.slow_period,
-                    signalperiod=self.signal_period,
-                    seriestype="c"  # close price
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        if signals:
+            logger.info(
+                "macd_scan_completed",
+                signals_generated=len(signals),
+                tickers_with_signal=[s.tickers[0].ticker for s in signals]
+            )
+        else:
+            logger.info(
+                "macd_scan_completed",
+                signals_generated=0,
+                message="No MACD crossovers detected"
+            )
+        
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch MACD from Finnhub (pre-calculated)
+            lookback_days = 120  # Enough for MACD analysis
+            macd_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="macd",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                fastperiod=self.fast_period,
+                slowperiod=self.slow_period,
+                signalperiod=self.signal_period,
+                seriestype="c"  # close price
+            )
+            
+            if not macd_data or "macd" not in macd_data or "macdSignal" not in macd_data:
+                logger.warning(
+                    "macd_data_unavailable",
+                    ticker=ticker
                 )
-                
-                if not macd_data or "macd" not in macd_data or "macdSignal" not in macd_data:
-                    logger.warning(
-                        "macd_data_unavailable",
-                        ticker=ticker
-                    )
-                    continue
-                
-                macd_values = macd_data["macd"]
-                signal_values = macd_data["macdSignal"]
-                histogram_values = macd_data.get("macdHist", [])
-                
-                # Need at least 2 values to detect crossover
-                if len(macd_values) < 2 or len(signal_values) < 2:
-                    logger.warning(
-                        "insufficient_macd_data",
+                return signals
+            
+            macd_values = macd_data["macd"]
+            signal_values = macd_data["macdSignal"]
+            histogram_values = macd_data.get("macdHist", [])
+            
+            # Need at least 2 values to detect crossover
+            if len(macd_values) < 2 or len(signal_values) < 2:
+                logger.warning(
+                    "insufficient_macd_data",
+                    ticker=ticker,
+                    available=len(macd_values)
+                )
+                return signals
+            
+            # Get current and previous values
+            current_macd = macd_values[-1]
+            current_signal = signal_values[-1]
+            current_histogram = histogram_values[-1] if histogram_values else (current_macd - current_signal)
+            
+            previous_macd = macd_values[-2]
+            previous_signal = signal_values[-2]
+            previous_histogram = histogram_values[-2] if len(histogram_values) > 1 else (previous_macd - previous_signal)
+            
+            # Get current price
+            current_price = macd_data.get("c", [None])[-1] if "c" in macd_data else None
+            
+            # Detect bullish crossover (MACD crosses above signal line)
+            if current_macd > current_signal and previous_macd <= previous_signal:
+                # Optional: Require histogram to be positive for confirmation
+                if self.require_histogram and current_histogram <= 0:
+                    logger.debug(
+                        "macd_bullish_crossover_rejected",
                         ticker=ticker,
-                        available=len(macd_values)
+                        reason="histogram not positive",
+                        histogram=round(current_histogram, 4)
                     )
-                    continue
+                    return signals
                 
-                # Get current and previous values
-                current_macd = macd_values[-1]
-                current_signal = signal_values[-1]
-                current_histogram = histogram_values[-1] if histogram_values else (current_macd - current_signal)
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"MACD bullish crossover: MACD line ({current_macd:.4f}) crossed above "
+                        f"signal line ({current_signal:.4f}). Histogram: {current_histogram:.4f}"
+                    )
+                )
                 
-                previous_macd = macd_values[-2]
-                previous_signal = signal_values[-2]
-                previous_histogram = histogram_values[-2] if len(histogram_values) > 1 else (previous_macd - previous_signal)
+                signal = Signal(
+                    signal_type=SignalType.MACD_BULLISH,
+                    source="macd_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "fast_period": self.fast_period,
+                        "slow_period": self.slow_period,
+                        "signal_period": self.signal_period,
+                        "current_macd": round(current_macd, 4),
+                        "current_signal": round(current_signal, 4),
+                        "current_histogram": round(current_histogram, 4),
+                        "previous_macd": round(previous_macd, 4),
+                        "previous_signal": round(previous_signal, 4),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # Get current price
-                current_price = macd_data.get("c", [None])[-1] if "c" in macd_data else None
+                signals.append(signal)
                 
-                # Detect bullish crossover (MACD crosses above signal line)
-                if current_macd > current_signal and previous_macd <= previous_signal:
-                    # Optional: Require histogram to be positive for confirmation
-                    if self.require_histogram and current_histogram <= 0:
-                        logger.debug(
-                            "macd_bullish_crossover_rejected",
-                            ticker=ticker,
-                            reason="histogram not positive",
-                            histogram=round(current_histogram, 4)
-                        )
-                        continue
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"MACD bullish crossover: MACD line ({current_macd:.4f}) crossed above "
-                            f"signal line ({current_signal:.4f}). Histogram: {current_histogram:.4f}"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.MACD_BULLISH,
-                        source="macd_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "fast_period": self.fast_period,
-                            "slow_period": self.slow_period,
-                            "signal_period": self.signal_period,
-                            "current_macd": round(current_macd, 4),
-                            "current_signal": round(current_signal, 4),
-                            "current_histogram": round(current_histogram, 4),
-                            "previous_macd": round(previous_macd, 4),
-                            "previous_signal": round(previous_signal, 4),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    
-                    logger.info(
-                        "macd_bullish_signal_generated",
-                        signal_id=str(signal.signal_id),
+                logger.info(
+                    "macd_bullish_signal_generated",
+                    signal_id=str(signal.signal_id),
+                    ticker=ticker,
+                    macd=round(current_macd, 4),
+                    signal_line=round(current_signal, 4)
+                )
+            
+            # Detect bearish crossover (MACD crosses below signal line)
+            elif current_macd < current_signal and previous_macd >= previous_signal:
+                # Optional: Require histogram to be negative for confirmation
+                if self.require_histogram and current_histogram >= 0:
+                    logger.debug(
+                        "macd_bearish_crossover_rejected",
                         ticker=ticker,
-                        macd=round(current_macd, 4),
-                        signal_line=round(current_signal, 4)
+                        reason="histogram not negative",
+                        histogram=round(current_histogram, 4)
                     )
+                    return signals
                 
-                # Detect bearish crossover (MACD crosses below signal line)
-                elif current_macd < current_signal and previous_macd >= previous_signal:
-                    # Optional: Require histogram to be negative for confirmation
-                    if self.require_histogram and current_histogram >= 0:
-                        logger.debug(
-                            "macd_bearish_crossover_rejected",
-                            ticker=ticker,
-                            reason="histogram not negative",
-                            histogram=round(current_histogram, 4)
-                        )
-                        continue
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"MACD bearish crossover: MACD line ({current_macd:.4f}) crossed below "
-                            f"signal line ({current_signal:.4f}). Histogram: {current_histogram:.4f}"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.MACD_BEARISH,
-                        source="macd_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "fast_period": self.fast_period,
-                            "slow_period": self.slow_period,
-                            "signal_period": self.signal_period,
-                            "current_macd": round(current_macd, 4),
-                            "current_signal": round(current_signal, 4),
-                            "current_histogram": round(current_histogram, 4),
-                            "previous_macd": round(previous_macd, 4),
-                            "previous_signal": round(previous_signal, 4),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    
-                    logger.info(
-                        "macd_bearish_signal_generated",
-                        signal_id=str(signal.signal_id),
-                        ticker=ticker,
-                        macd=round(current_macd, 4),
-                        signal_line=round(current_signal, 4)
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"MACD bearish crossover: MACD line ({current_macd:.4f}) crossed below "
+                        f"signal line ({current_signal:.4f}). Histogram: {current_histogram:.4f}"
                     )
-            
-            except Exception as e:
-                logger.error(
-                    "macd_check_failed",
+                )
+                
+                signal = Signal(
+                    signal_type=SignalType.MACD_BEARISH,
+                    source="macd_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "fast_period": self.fast_period,
+                        "slow_period": self.slow_period,
+                        "signal_period": self.signal_period,
+                        "current_macd": round(current_macd, 4),
+                        "current_signal": round(current_signal, 4),
+                        "current_histogram": round(current_histogram, 4),
+                        "previous_macd": round(previous_macd, 4),
+                        "previous_signal": round(previous_signal, 4),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                
+                logger.info(
+                    "macd_bearish_signal_generated",
+                    signal_id=str(signal.signal_id),
                     ticker=ticker,
-                    error=str(e),
-                    exc_info=True
+                    macd=round(current_macd, 4),
+                    signal_line=round(current_signal, 4)
                 )
-                continue
         
-        if signals:
-            logger.info(
-                "macd_scan_completed",
-                signals_generated=len(signals),
-                tickers_with_signal=[s.tickers[0].ticker for s in signals]
-            )
-        else:
-            logger.info(
-                "macd_scan_completed",
-                signals_generated=0,
-                message="No MACD crossovers detected"
+        except Exception as e:
+            logger.error(
+                "macd_check_failed",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
             )
         
         return signals
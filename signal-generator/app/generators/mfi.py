@@ -66,7 +66,6 @@ class MFISignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate MFI signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "mfi_scan_started",
@@ -76,93 +75,100 @@ class MFISignalGenerator(BaseSignalGenerator):
             oversold=self.oversold
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch MFI from Finnhub
-                lookback_days = 90
-                mfi_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="mfi",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.timeperiod
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("mfi_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch MFI from Finnhub
+            lookback_days = 90
+            mfi_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="mfi",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.timeperiod
+            )
+            
+            if not mfi_data or "mfi" not in mfi_data:
+                logger.warning("mfi_data_unavailable", ticker=ticker)
+                return signals
+            
+            mfi_values = mfi_data["mfi"]
+            
+            if len(mfi_values) < 2:
+                logger.warning("insufficient_mfi_data", ticker=ticker)
+                return signals
+            
+            current_mfi = mfi_values[-1]
+            previous_mfi = mfi_values[-2]
+            
+            current_price = mfi_data.get("c", [None])[-1] if "c" in mfi_data else None
+            
+            # Oversold condition (bullish - money flowing out, potential reversal)
+            if current_mfi < self.oversold and previous_mfi >= self.oversold:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"MFI oversold: MFI ({current_mfi:.1f}) crossed below {self.oversold}. "
+                        f"Heavy selling, potential reversal up."
+                    )
                 )
                 
-                if not mfi_data or "mfi" not in mfi_data:
-                    logger.warning("mfi_data_unavailable", ticker=ticker)
-                    continue
-                
-                mfi_values = mfi_data["mfi"]
-                
-                if len(mfi_values) < 2:
-                    logger.warning("insufficient_mfi_data", ticker=ticker)
-                    continue
-                
-                current_mfi = mfi_values[-1]
-                previous_mfi = mfi_values[-2]
-                
-                current_price = mfi_data.get("c", [None])[-1] if "c" in mfi_data else None
+                signal = Signal(
+                    signal_type=SignalType.MFI_OVERSOLD,
+                    source="mfi_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_mfi": round(current_mfi, 2),
+                        "previous_mfi": round(previous_mfi, 2),
+                        "oversold_threshold": self.oversold,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # Oversold condition (bullish - money flowing out, potential reversal)
-                if current_mfi < self.oversold and previous_mfi >= self.oversold:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"MFI oversold: MFI ({current_mfi:.1f}) crossed below {self.oversold}. "
-                            f"Heavy selling, potential reversal up."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.MFI_OVERSOLD,
-                        source="mfi_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_mfi": round(current_mfi, 2),
-                            "previous_mfi": round(previous_mfi, 2),
-                            "oversold_threshold": self.oversold,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("mfi_oversold_signal", ticker=ticker, mfi=round(current_mfi, 1))
+            
+            # Overbought condition (bearish - money flowing in, potential reversal)
+            elif current_mfi > self.overbought and previous_mfi <= self.overbought:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"MFI overbought: MFI ({current_mfi:.1f}) crossed above {self.overbought}. "
+                        f"Heavy buying, potential reversal down."
                     )
-                    
-                    signals.append(signal)
-                    logger.info("mfi_oversold_signal", ticker=ticker, mfi=round(current_mfi, 1))
+                )
                 
-                # Overbought condition (bearish - money flowing in, potential reversal)
-                elif current_mfi > self.overbought and previous_mfi <= self.overbought:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"MFI overbought: MFI ({current_mfi:.1f}) crossed above {self.overbought}. "
-                            f"Heavy buying, potential reversal down."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.MFI_OVERBOUGHT,
-                        source="mfi_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_mfi": round(current_mfi, 2),
-                            "previous_mfi": round(previous_mfi, 2),
-                            "overbought_threshold": self.overbought,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("mfi_overbought_signal", ticker=ticker, mfi=round(current_mfi, 1))
-            
-            except Exception as e:
-                logger.error("mfi_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+                signal = Signal(
+                    signal_type=SignalType.MFI_OVERBOUGHT,
+                    source="mfi_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_mfi": round(current_mfi, 2),
+                        "previous_mfi": round(previous_mfi, 2),
+                        "overbought_threshold": self.overbought,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("mfi_overbought_signal", ticker=ticker, mfi=round(current_mfi, 1))
+        
+        except Exception as e:
+            logger.error("mfi_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("mfi_scan_completed", signals_generated=len(signals))
         return signals
 
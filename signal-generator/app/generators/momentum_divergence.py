@@ -84,7 +84,6 @@ class MomentumDivergenceSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate momentum divergence signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "momentum_divergence_scan_started",
@@ -93,176 +92,183 @@ class MomentumDivergenceSignalGenerator(BaseSignalGenerator):
             lookback_periods=self.lookback_periods
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch price data
-                lookback_days = self.lookback_periods + 20
-                candles_df = await self.market_data.fetch_candles(
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info(
+            "momentum_divergence_scan_completed",
+            signals_generated=len(signals),
+            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
+        )
+        
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch price data
+            lookback_days = self.lookback_periods + 20
+            candles_df = await self.market_data.fetch_candles(
+                symbol=ticker,
+                resolution=self.timeframe,
+                lookback_days=lookback_days
+            )
+            
+            # Convert DataFrame to list of dicts
+            candles = self._dataframe_to_candles(candles_df)
+            
+            if not candles or len(candles) < self.lookback_periods:
+                logger.debug("insufficient_candle_data", ticker=ticker)
+                return signals
+            
+            # Fetch indicator data
+            if self.indicator == "rsi":
+                indicator_data = await self.market_data.fetch_indicator(
                     symbol=ticker,
+                    indicator="rsi",
                     resolution=self.timeframe,
-                    lookback_days=lookback_days
+                    lookback_days=lookback_days,
+                    timeperiod=self.rsi_period
                 )
                 
-                # Convert DataFrame to list of dicts
-                candles = self._dataframe_to_candles(candles_df)
-                
-                if not candles or len(candles) < self.lookback_periods:
-                    logger.debug("insufficient_candle_data", ticker=ticker)
-                    continue
+                if not indicator_data or "rsi" not in indicator_data:
+                    logger.debug("rsi_data_unavailable", ticker=ticker)
+                    return signals
                 
-                # Fetch indicator data
-                if self.indicator == "rsi":
-                    indicator_data = await self.market_data.fetch_indicator(
-                        symbol=ticker,
-                        indicator="rsi",
-                        resolution=self.timeframe,
-                        lookback_days=lookback_days,
-                        timeperiod=self.rsi_period
-                    )
-                    
-                    if not indicator_data or "rsi" not in indicator_data:
-                        logger.debug("rsi_data_unavailable", ticker=ticker)
-                        continue
-                    
-                    indicator_values = indicator_data["rsi"]
-                    signal_type_bullish = SignalType.RSI_BULLISH_DIVERGENCE
-                    signal_type_bearish = SignalType.RSI_BEARISH_DIVERGENCE
-                
-                else:  # macd
-                    indicator_data = await self.market_data.fetch_indicator(
-                        symbol=ticker,
-                        indicator="macd",
-                        resolution=self.timeframe,
-                        lookback_days=lookback_days
-                    )
-                    
-                    if not indicator_data or "macd" not in indicator_data:
-                        logger.debug("macd_data_unavailable", ticker=ticker)
-                        continue
-                    
-                    indicator_values = indicator_data["macd"]
-                    signal_type_bullish = SignalType.MACD_BULLISH_DIVERGENCE
-                    signal_type_bearish = SignalType.MACD_BEARISH_DIVERGENCE
-                
-                # Filter out None values
-                valid_indicator = [(i, v) for i, v in enumerate(indicator_values) if v is not None]
-                if len(valid_indicator) < self.lookback_periods:
-                    logger.debug("insufficient_indicator_values", ticker=ticker)
-                    continue
-                
-                # Align price and indicator data
-                closes = [c["c"] for c in candles[-len(valid_indicator):]]
-                indicator_clean = [v for _, v in valid_indicator]
+                indicator_values = indicator_data["rsi"]
+                signal_type_bullish = SignalType.RSI_BULLISH_DIVERGENCE
+                signal_type_bearish = SignalType.RSI_BEARISH_DIVERGENCE
+            
+            else:  # macd
+                indicator_data = await self.market_data.fetch_indicator(
+                    symbol=ticker,
+                    indicator="macd",
+                    resolution=self.timeframe,
+                    lookback_days=lookback_days
+                )
                 
-                if len(closes) != len(indicator_clean):
-                    logger.debug("data_alignment_mismatch", ticker=ticker)
-                    continue
+                if not indicator_data or "macd" not in indicator_data:
+                    logger.debug("macd_data_unavailable", ticker=ticker)
+                    return signals
                 
-                # Find local extremes in both series
-                price_highs, price_lows = self._find_local_extremes(closes, window=2)
-                ind_highs, ind_lows = self._find_local_extremes(indicator_clean, window=2)
+                indicator_values = indicator_data["macd"]
+                signal_type_bullish = SignalType.MACD_BULLISH_DIVERGENCE
+                signal_type_bearish = SignalType.MACD_BEARISH_DIVERGENCE
+            
+            # Filter out None values
+            valid_indicator = [(i, v) for i, v in enumerate(indicator_values) if v is not None]
+            if len(valid_indicator) < self.lookback_periods:
+                logger.debug("insufficient_indicator_values", ticker=ticker)
+                return signals
+            
+            # Align price and indicator data
+            closes = [c["c"] for c in candles[-len(valid_indicator):]]
+            indicator_clean = [v for _, v in valid_indicator]
+            
+            if len(closes) != len(indicator_clean):
+                logger.debug("data_alignment_mismatch", ticker=ticker)
+                return signals
+            
+            # Find local extremes in both series
+            price_highs, price_lows = self._find_local_extremes(closes, window=2)
+            ind_highs, ind_lows = self._find_local_extremes(indicator_clean, window=2)
+            
+            # Check for bullish divergence (price lower low, indicator higher low)
+            if len(price_lows) >= 2 and len(ind_lows) >= 2:
+                recent_price_lows = price_lows[-2:]
+                recent_ind_lows = ind_lows[-2:]
                 
-                # Check for bullish divergence (price lower low, indicator higher low)
-                if len(price_lows) >= 2 and len(ind_lows) >= 2:
-                    recent_price_lows = price_lows[-2:]
-                    recent_ind_lows = ind_lows[-2:]
-                    
-                    # Price makes lower low
-                    if recent_price_lows[1][1] < recent_price_lows[0][1]:
-                        # Indicator makes higher low
-                        if recent_ind_lows[1][1] > recent_ind_lows[0][1]:
-                            logger.info(
-                                "bullish_divergence_detected",
-                                ticker=ticker,
-                                indicator=self.indicator,
-                                price_low_1=recent_price_lows[0][1],
-                                price_low_2=recent_price_lows[1][1],
-                                ind_low_1=recent_ind_lows[0][1],
-                                ind_low_2=recent_ind_lows[1][1]
-                            )
-                            
-                            ticker_signal = TickerSignal(
-                                ticker=ticker,
-                                signal=BiasType.BULLISH,
-                                confidence=self.confidence * 100,
-                                reasoning=(
-                                    f"Bullish divergence: Price made lower low ({recent_price_lows[0][1]:.5f} → {recent_price_lows[1][1]:.5f}), "
-                                    f"but {self.indicator.upper()} made higher low ({recent_ind_lows[0][1]:.2f} → {recent_ind_lows[1][1]:.2f}). "
-                                    f"Strong reversal signal."
-                                )
+                # Price makes lower low
+                if recent_price_lows[1][1] < recent_price_lows[0][1]:
+                    # Indicator makes higher low
+                    if recent_ind_lows[1][1] > recent_ind_lows[0][1]:
+                        logger.info(
+                            "bullish_divergence_detected",
+                            ticker=ticker,
+                            indicator=self.indicator,
+                            price_low_1=recent_price_lows[0][1],
+                            price_low_2=recent_price_lows[1][1],
+                            ind_low_1=recent_ind_lows[0][1],
+                            ind_low_2=recent_ind_lows[1][1]
+                        )
+                        
+                        ticker_signal = TickerSignal(
+                            ticker=ticker,
+                            signal=BiasType.BULLISH,
+                            confidence=self.confidence * 100,
+                            reasoning=(
+                                f"Bullish divergence: Price made lower low ({recent_price_lows[0][1]:.5f} → {recent_price_lows[1][1]:.5f}), "
+                                f"but {self.indicator.upper()} made higher low ({recent_ind_lows[0][1]:.2f} → {recent_ind_lows[1][1]:.2f}). "
+                                f"Strong reversal signal."
                             )
-                            
-                            signal = Signal(
-                                signal_type=signal_type_bullish,
-                                source=f"{self.indicator}_divergence_generator",
-                                tickers=[ticker_signal],
-                                metadata=self._enrich_metadata({
-                                    "indicator": self.indicator,
-                                    "price_low_1": recent_price_lows[0][1],
-                                    "price_low_2": recent_price_lows[1][1],
-                                    "indicator_low_1": recent_ind_lows[0][1],
-                                    "indicator_low_2": recent_ind_lows[1][1]
-                                })
-                            )
-                            signals.append(signal)
+                        )
+                        
+                        signal = Signal(
+                            signal_type=signal_type_bullish,
+                            source=f"{self.indicator}_divergence_generator",
+                            tickers=[ticker_signal],
+                            metadata=self._enrich_metadata({
+                                "indicator": self.indicator,
+                                "price_low_1": recent_price_lows[0][1],
+                                "price_low_2": recent_price_lows[1][1],
+                                "indicator_low_1": recent_ind_lows[0][1],
+                                "indicator_low_2": recent_ind_lows[1][1]
+                            })
+                        )
+                        signals.append(signal)
+            
+            # Check for bearish divergence (price higher high, indicator lower high)
+            if len(price_highs) >= 2 and len(ind_highs) >= 2:
+                recent_price_highs = price_highs[-2:]
+                recent_ind_highs = ind_highs[-2:]
                 
-                # Check for bearish divergence (price higher high, indicator lower high)
-                if len(price_highs) >= 2 and len(ind_highs) >= 2:
-                    recent_price_highs = price_highs[-2:]
-                    recent_ind_highs = ind_highs[-2:]
-                    
-                    # Price makes higher high
-                    if recent_price_highs[1][1] > recent_price_highs[0][1]:
-                        # Indicator makes lower high
-                        if recent_ind_highs[1][1] < recent_ind_highs[0][1]:
-                            logger.info(
-                                "bearish_divergence_detected",
-                                ticker=ticker,
-                                indicator=self.indicator,
-                                price_high_1=recent_price_highs[0][1],
-                                price_high_2=recent_price_highs[1][1],
-                                ind_high_1=recent_ind_highs[0][1],
-                                ind_high_2=recent_ind_highs[1][1]
+                # Price makes higher high
+                if recent_price_highs[1][1] > recent_price_highs[0][1]:
+                    # Indicator makes lower high
+                    if recent_ind_highs[1][1] < recent_ind_highs[0][1]:
+                        logger.info(
+                            "bearish_divergence_detected",
+                            ticker=ticker,
+                            indicator=self.indicator,
+                            price_high_1=recent_price_highs[0][1],
+                            price_high_2=recent_price_highs[1][1],
+                            ind_high_1=recent_ind_highs[0][1],
+                            ind_high_2=recent_ind_highs[1][1]
+                        )
+                        
+                        ticker_signal = TickerSignal(
+                            ticker=ticker,
+                            signal=BiasType.BEARISH,
+                            confidence=self.confidence * 100,
+                            reasoning=(
+                                f"Bearish divergence: Price made higher high ({recent_price_highs[0][1]:.5f} → {recent_price_highs[1][1]:.5f}), "
+                                f"but {self.indicator.upper()} made lower high ({recent_ind_highs[0][1]:.2f} → {recent_ind_highs[1][1]:.2f}). "
+                                f"Strong reversal signal."
                             )
-                            
-                            ticker_signal = TickerSignal(
-                                ticker=ticker,
-                                signal=BiasType.BEARISH,
-                                confidence=self.confidence * 100,
-                                reasoning=(
-                                    f"Bearish divergence: Price made higher high ({recent_price_highs[0][1]:.5f} → {recent_price_highs[1][1]:.5f}), "
-                                    f"but {self.indicator.upper()} made lower high ({recent_ind_highs[0][1]:.2f} → {recent_ind_highs[1][1]:.2f}). "
-                                    f"Strong reversal signal."
-                                )
-                            )
-                            
-                            signal = Signal(
-                                signal_type=signal_type_bearish,
-                                source=f"{self.indicator}_divergence_generator",
-                                tickers=[ticker_signal],
-                                metadata=self._enrich_metadata({
-                                    "indicator": self.indicator,
-                                    "price_high_1": recent_price_highs[0][1],
-                                    "price_high_2": recent_price_highs[1][1],
-                                    "indicator_high_1": recent_ind_highs[0][1],
-                                    "indicator_high_2": recent_ind_highs[1][1]
-                                })
-                            )
-                            signals.append(signal)
-                
-            except Exception as e:
-                logger.error(
-                    "momentum_divergence_error",
-                    ticker=ticker,
-                    error=str(e),
-                    exc_info=True
-                )
-                continue
-        
-        logger.info(
-            "momentum_divergence_scan_completed",
-            signals_generated=len(signals),
-            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
-        )
+                        )
+                        
+                        signal = Signal(
+                            signal_type=signal_type_bearish,
+                            source=f"{self.indicator}_divergence_generator",
+                            tickers=[ticker_signal],
+                            metadata=self._enrich_metadata({
+                                "indicator": self.indicator,
+                                "price_high_1": recent_price_highs[0][1],
+                                "price_high_2": recent_price_highs[1][1],
+                                "indicator_high_1": recent_ind_highs[0][1],
+                                "indicator_high_2": recent_ind_highs[1][1]
+                            })
+                        )
+                        signals.append(signal)
+            
+        except Exception as e:
+            logger.error(
+                "momentum_divergence_error",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
         
         return signals
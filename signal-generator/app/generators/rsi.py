@@ -77,7 +77,6 @@ class RSISignalGenerator(BaseSignalGenerator):
             List of Signal objects for tickers with RSI extremes
         """
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "rsi_scan_started",
@@ -87,121 +86,8 @@ class RSISignalGenerator(BaseSignalGenerator):
             overbought=self.overbought_threshold
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch RSI from Finnhub (pre-calculated)
-                lookback_days = 90  # Enough for RSI analysis
-                rsi_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="rsi",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.period,
-                    seriestype="c"  # close price
-                )
-                
-                if not rsi_data or "rsi" not in rsi_data:
-                    logger.warning(
-                        "rsi_data_unavailable",
-                        ticker=ticker
-                    )
-                    continue
-                
-                rsi_values = rsi_data["rsi"]
-                
-                # Need at least 2 values to detect crossover
-                if len(rsi_values) < 2:
-                    logger.warning(
-                        "insufficient_rsi_data",
-                        ticker=ticker,
-                        available=len(rsi_values)
-                    )
-                    continue
-                
-                current_rsi = rsi_values[-1]
-                previous_rsi = rsi_values[-2]
-                
-                # Get current price from candle data
-                current_price = rsi_data.get("c", [None])[-1] if "c" in rsi_data else None
-                
-                # Check for oversold condition (bullish signal)
-                if current_rsi < self.oversold_threshold and previous_rsi >= self.oversold_threshold:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"RSI oversold: RSI={current_rsi:.1f} crossed below {self.oversold_threshold} "
-                            f"(was {previous_rsi:.1f} previously)"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.RSI_OVERSOLD,
-                        source="rsi_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "rsi_period": self.period,
-                            "current_rsi": round(current_rsi, 2),
-                            "previous_rsi": round(previous_rsi, 2),
-                            "oversold_threshold": self.oversold_threshold,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    
-                    logger.info(
-                        "rsi_oversold_signal_generated",
-                        signal_id=str(signal.signal_id),
-                        ticker=ticker,
-                        rsi=round(current_rsi, 2)
-                    )
-                
-                # Check for overbought condition (bearish signal)
-                elif current_rsi > self.overbought_threshold and previous_rsi <= self.overbought_threshold:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"RSI overbought: RSI={current_rsi:.1f} crossed above {self.overbought_threshold} "
-                            f"(was {previous_rsi:.1f} previously)"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.RSI_OVERBOUGHT,
-                        source="rsi_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "rsi_period": self.period,
-                            "current_rsi": round(current_rsi, 2),
-                            "previous_rsi": round(previous_rsi, 2),
-                            "overbought_threshold": self.overbought_threshold,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    
-                    logger.info(
-                        "rsi_overbought_signal_generated",
-                        signal_id=str(signal.signal_id),
-                        ticker=ticker,
-                        rsi=round(current_rsi, 2)
-                    )
-            
-            except Exception as e:
-                logger.error(
-                    "rsi_check_failed",
-                    ticker=ticker,
-                    error=str(e),
-                    exc_info=True
-                )
-                continue
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
         
         if signals:
             logger.info(
@@ -217,4 +103,124 @@ class RSISignalGenerator(BaseSignalGenerator):
             )
         
         return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch RSI from Finnhub (pre-calculated)
+            lookback_days = 90  # Enough for RSI analysis
+            rsi_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="rsi",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.period,
+                seriestype="c"  # close price
+            )
+            
+            if not rsi_data or "rsi" not in rsi_data:
+                logger.warning(
+                    "rsi_data_unavailable",
+                    ticker=ticker
+                )
+                return signals
+            
+            rsi_values = rsi_data["rsi"]
+            
+            # Need at least 2 values to detect crossover
+            if len(rsi_values) < 2:
+                logger.warning(
+                    "insufficient_rsi_data",
+                    ticker=ticker,
+                    available=len(rsi_values)
+                )
+                return signals
+            
+            current_rsi = rsi_values[-1]
+            previous_rsi = rsi_values[-2]
+            
+            # Get current price from candle data
+            current_price = rsi_data.get("c", [None])[-1] if "c" in rsi_data else None
+            
+            # Check for oversold condition (bullish signal)
+            if current_rsi < self.oversold_threshold and previous_rsi >= self.oversold_threshold:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"RSI oversold: RSI={current_rsi:.1f} crossed below {self.oversold_threshold} "
+                        f"(was {previous_rsi:.1f} previously)"
+                    )
+                )
+                
+                signal = Signal(
+                    signal_type=SignalType.RSI_OVERSOLD,
+                    source="rsi_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "rsi_period": self.period,
+                        "current_rsi": round(current_rsi, 2),
+                        "previous_rsi": round(previous_rsi, 2),
+                        "oversold_threshold": self.oversold_threshold,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                
+                logger.info(
+                    "rsi_oversold_signal_generated",
+                    signal_id=str(signal.signal_id),
+                    ticker=ticker,
+                    rsi=round(current_rsi, 2)
+                )
+            
+            # Check for overbought condition (bearish signal)
+            elif current_rsi > self.overbought_threshold and previous_rsi <= self.overbought_threshold:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"RSI overbought: RSI={current_rsi:.1f} crossed above {self.overbought_threshold} "
+                        f"(was {previous_rsi:.1f} previously)"
+                    )
+                )
+                
+                signal = Signal(
+                    signal_type=SignalType.RSI_OVERBOUGHT,
+                    source="rsi_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "rsi_period": self.period,
+                        "current_rsi": round(current_rsi, 2),
+                        "previous_rsi": round(previous_rsi, 2),
+                        "overbought_threshold": self.overbought_threshold,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                
+                logger.info(
+                    "rsi_overbought_signal_generated",
+                    signal_id=str(signal.signal_id),
+                    ticker=ticker,
+                    rsi=round(current_rsi, 2)
+                )
+        
+        except Exception as e:
+            logger.error(
+                "rsi_check_failed",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
+        
+        return signals
 
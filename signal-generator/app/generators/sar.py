@@ -63,7 +63,6 @@ class SARSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate Parabolic SAR signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "sar_scan_started",
@@ -72,100 +71,107 @@ class SARSignalGenerator(BaseSignalGenerator):
             maximum=self.maximum
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch SAR from Finnhub
-                lookback_days = 90
-                sar_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="sar",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    acceleration=self.acceleration,
-                    maximum=self.maximum
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("sar_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch SAR from Finnhub
+            lookback_days = 90
+            sar_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="sar",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                acceleration=self.acceleration,
+                maximum=self.maximum
+            )
+            
+            if not sar_data or "sar" not in sar_data:
+                logger.warning("sar_data_unavailable", ticker=ticker)
+                return signals
+            
+            sar_values = sar_data["sar"]
+            close_prices = sar_data.get("c", [])
+            
+            if len(sar_values) < 2 or len(close_prices) < 2:
+                logger.warning("insufficient_sar_data", ticker=ticker)
+                return signals
+            
+            current_sar = sar_values[-1]
+            previous_sar = sar_values[-2]
+            current_price = close_prices[-1]
+            previous_price = close_prices[-2]
+            
+            # Calculate distance to SAR (risk/stop level)
+            sar_distance_pct = abs((current_price - current_sar) / current_price) * 100
+            
+            # Bullish reversal (price crosses above SAR)
+            if current_price > current_sar and previous_price <= previous_sar:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"Parabolic SAR bullish reversal: Price (${current_price:.2f}) crossed above "
+                        f"SAR (${current_sar:.2f}). New uptrend starting."
+                    )
                 )
                 
-                if not sar_data or "sar" not in sar_data:
-                    logger.warning("sar_data_unavailable", ticker=ticker)
-                    continue
-                
-                sar_values = sar_data["sar"]
-                close_prices = sar_data.get("c", [])
-                
-                if len(sar_values) < 2 or len(close_prices) < 2:
-                    logger.warning("insufficient_sar_data", ticker=ticker)
-                    continue
-                
-                current_sar = sar_values[-1]
-                previous_sar = sar_values[-2]
-                current_price = close_prices[-1]
-                previous_price = close_prices[-2]
-                
-                # Calculate distance to SAR (risk/stop level)
-                sar_distance_pct = abs((current_price - current_sar) / current_price) * 100
+                signal = Signal(
+                    signal_type=SignalType.SAR_BULLISH_REVERSAL,
+                    source="sar_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_sar": round(current_sar, 2),
+                        "current_price": round(current_price, 2),
+                        "sar_distance_pct": round(sar_distance_pct, 2),
+                        "acceleration": self.acceleration,
+                        "maximum": self.maximum,
+                        "timeframe": self.timeframe
+                    })
+                )
                 
-                # Bullish reversal (price crosses above SAR)
-                if current_price > current_sar and previous_price <= previous_sar:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"Parabolic SAR bullish reversal: Price (${current_price:.2f}) crossed above "
-                            f"SAR (${current_sar:.2f}). New uptrend starting."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.SAR_BULLISH_REVERSAL,
-                        source="sar_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_sar": round(current_sar, 2),
-                            "current_price": round(current_price, 2),
-                            "sar_distance_pct": round(sar_distance_pct, 2),
-                            "acceleration": self.acceleration,
-                            "maximum": self.maximum,
-                            "timeframe": self.timeframe
-                        })
+                signals.append(signal)
+                logger.info("sar_bullish_reversal", ticker=ticker, price=round(current_price, 2))
+            
+            # Bearish reversal (price crosses below SAR)
+            elif current_price < current_sar and previous_price >= previous_sar:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"Parabolic SAR bearish reversal: Price (${current_price:.2f}) crossed below "
+                        f"SAR (${current_sar:.2f}). New downtrend starting."
                     )
-                    
-                    signals.append(signal)
-                    logger.info("sar_bullish_reversal", ticker=ticker, price=round(current_price, 2))
+                )
                 
-                # Bearish reversal (price crosses below SAR)
-                elif current_price < current_sar and previous_price >= previous_sar:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"Parabolic SAR bearish reversal: Price (${current_price:.2f}) crossed below "
-                            f"SAR (${current_sar:.2f}). New downtrend starting."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.SAR_BEARISH_REVERSAL,
-                        source="sar_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_sar": round(current_sar, 2),
-                            "current_price": round(current_price, 2),
-                            "sar_distance_pct": round(sar_distance_pct, 2),
-                            "acceleration": self.acceleration,
-                            "maximum": self.maximum,
-                            "timeframe": self.timeframe
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("sar_bearish_reversal", ticker=ticker, price=round(current_price, 2))
-            
-            except Exception as e:
-                logger.error("sar_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+                signal = Signal(
+                    signal_type=SignalType.SAR_BEARISH_REVERSAL,
+                    source="sar_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_sar": round(current_sar, 2),
+                        "current_price": round(current_price, 2),
+                        "sar_distance_pct": round(sar_distance_pct, 2),
+                        "acceleration": self.acceleration,
+                        "maximum": self.maximum,
+                        "timeframe": self.timeframe
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("sar_bearish_reversal", ticker=ticker, price=round(current_price, 2))
+        
+        except Exception as e:
+            logger.error("sar_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("sar_scan_completed", signals_generated=len(signals))
         return signals
 
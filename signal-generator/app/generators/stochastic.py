@@ -72,7 +72,6 @@ class StochasticSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate Stochastic signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "stochastic_scan_started",
@@ -82,112 +81,119 @@ class StochasticSignalGenerator(BaseSignalGenerator):
             slowd=self.slowd_period
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch Stochastic from Finnhub
-                lookback_days = 90
-                stoch_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="stoch",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    fastk_period=self.fastk_period,
-                    slowk_period=self.slowk_period,
-                    slowd_period=self.slowd_period
-                )
-                
-                if not stoch_data or "slowk" not in stoch_data or "slowd" not in stoch_data:
-                    logger.warning("stochastic_data_unavailable", ticker=ticker)
-                    continue
-                
-                slowk_values = stoch_data["slowk"]  # %K line
-                slowd_values = stoch_data["slowd"]  # %D line (signal)
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("stochastic_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch Stochastic from Finnhub
+            lookback_days = 90
+            stoch_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="stoch",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                fastk_period=self.fastk_period,
+                slowk_period=self.slowk_period,
+                slowd_period=self.slowd_period
+            )
+            
+            if not stoch_data or "slowk" not in stoch_data or "slowd" not in stoch_data:
+                logger.warning("stochastic_data_unavailable", ticker=ticker)
+                return signals
+            
+            slowk_values = stoch_data["slowk"]  # %K line
+            slowd_values = stoch_data["slowd"]  # %D line (signal)
+            
+            if len(slowk_values) < 2 or len(slowd_values) < 2:
+                logger.warning("insufficient_stoch_data", ticker=ticker)
+                return signals
+            
+            current_k = slowk_values[-1]
+            current_d = slowd_values[-1]
+            previous_k = slowk_values[-2]
+            previous_d = slowd_values[-2]
+            
+            current_price = stoch_data.get("c", [None])[-1] if "c" in stoch_data else None
+            
+            # Bullish crossover (%K crosses above %D)
+            if current_k > current_d and previous_k <= previous_d:
+                # Extra confirmation if in oversold zone
+                in_oversold = current_k < self.oversold
+                conf_boost = 1.1 if in_oversold else 1.0
                 
-                if len(slowk_values) < 2 or len(slowd_values) < 2:
-                    logger.warning("insufficient_stoch_data", ticker=ticker)
-                    continue
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=min(self.confidence * conf_boost * 100, 100),
+                    reasoning=(
+                        f"Stochastic bullish crossover: %K ({current_k:.1f}) crossed above "
+                        f"%D ({current_d:.1f})" +
+                        (" in oversold zone" if in_oversold else "")
+                    )
+                )
                 
-                current_k = slowk_values[-1]
-                current_d = slowd_values[-1]
-                previous_k = slowk_values[-2]
-                previous_d = slowd_values[-2]
+                signal = Signal(
+                    signal_type=SignalType.STOCH_BULLISH,
+                    source="stochastic_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_k": round(current_k, 2),
+                        "current_d": round(current_d, 2),
+                        "previous_k": round(previous_k, 2),
+                        "previous_d": round(previous_d, 2),
+                        "in_oversold": in_oversold,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                current_price = stoch_data.get("c", [None])[-1] if "c" in stoch_data else None
+                signals.append(signal)
+                logger.info("stoch_bullish_signal", ticker=ticker, k=round(current_k, 1))
+            
+            # Bearish crossover (%K crosses below %D)
+            elif current_k < current_d and previous_k >= previous_d:
+                # Extra confirmation if in overbought zone
+                in_overbought = current_k > self.overbought
+                conf_boost = 1.1 if in_overbought else 1.0
                 
-                # Bullish crossover (%K crosses above %D)
-                if current_k > current_d and previous_k <= previous_d:
-                    # Extra confirmation if in oversold zone
-                    in_oversold = current_k < self.oversold
-                    conf_boost = 1.1 if in_oversold else 1.0
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=min(self.confidence * conf_boost * 100, 100),
-                        reasoning=(
-                            f"Stochastic bullish crossover: %K ({current_k:.1f}) crossed above "
-                            f"%D ({current_d:.1f})" +
-                            (" in oversold zone" if in_oversold else "")
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.STOCH_BULLISH,
-                        source="stochastic_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_k": round(current_k, 2),
-                            "current_d": round(current_d, 2),
-                            "previous_k": round(previous_k, 2),
-                            "previous_d": round(previous_d, 2),
-                            "in_oversold": in_oversold,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=min(self.confidence * conf_boost * 100, 100),
+                    reasoning=(
+                        f"Stochastic bearish crossover: %K ({current_k:.1f}) crossed below "
+                        f"%D ({current_d:.1f})" +
+                        (" in overbought zone" if in_overbought else "")
                     )
-                    
-                    signals.append(signal)
-                    logger.info("stoch_bullish_signal", ticker=ticker, k=round(current_k, 1))
+                )
                 
-                # Bearish crossover (%K crosses below %D)
-                elif current_k < current_d and previous_k >= previous_d:
-                    # Extra confirmation if in overbought zone
-                    in_overbought = current_k > self.overbought
-                    conf_boost = 1.1 if in_overbought else 1.0
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=min(self.confidence * conf_boost * 100, 100),
-                        reasoning=(
-                            f"Stochastic bearish crossover: %K ({current_k:.1f}) crossed below "
-                            f"%D ({current_d:.1f})" +
-                            (" in overbought zone" if in_overbought else "")
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.STOCH_BEARISH,
-                        source="stochastic_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_k": round(current_k, 2),
-                            "current_d": round(current_d, 2),
-                            "previous_k": round(previous_k, 2),
-                            "previous_d": round(previous_d, 2),
-                            "in_overbought": in_overbought,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("stoch_bearish_signal", ticker=ticker, k=round(current_k, 1))
-            
-            except Exception as e:
-                logger.error("stochastic_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+                signal = Signal(
+                    signal_type=SignalType.STOCH_BEARISH,
+                    source="stochastic_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_k": round(current_k, 2),
+                        "current_d": round(current_d, 2),
+                        "previous_k": round(previous_k, 2),
+                        "previous_d": round(previous_d, 2),
+                        "in_overbought": in_overbought,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("stoch_bearish_signal", ticker=ticker, k=round(current_k, 1))
+        
+        except Exception as e:
+            logger.error("stochastic_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("stochastic_scan_completed", signals_generated=len(signals))
         return signals
 
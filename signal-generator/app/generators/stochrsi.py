@@ -73,7 +73,6 @@ class StochRSISignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate Stochastic RSI signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "stochrsi_scan_started",
@@ -82,154 +81,161 @@ class StochRSISignalGenerator(BaseSignalGenerator):
             fastk_period=self.fastk_period
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch StochRSI from Finnhub
-                lookback_days = 90
-                stochrsi_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="stochrsi",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.timeperiod,
-                    fastk_period=self.fastk_period,
-                    fastd_period=self.fastd_period
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("stochrsi_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch StochRSI from Finnhub
+            lookback_days = 90
+            stochrsi_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="stochrsi",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.timeperiod,
+                fastk_period=self.fastk_period,
+                fastd_period=self.fastd_period
+            )
+            
+            if not stochrsi_data or "fastk" not in stochrsi_data:
+                logger.warning("stochrsi_data_unavailable", ticker=ticker)
+                return signals
+            
+            fastk_values = stochrsi_data["fastk"]
+            fastd_values = stochrsi_data.get("fastd", [])
+            
+            if len(fastk_values) < 2:
+                logger.warning("insufficient_stochrsi_data", ticker=ticker)
+                return signals
+            
+            current_k = fastk_values[-1]
+            previous_k = fastk_values[-2]
+            current_d = fastd_values[-1] if fastd_values and len(fastd_values) >= 1 else None
+            previous_d = fastd_values[-2] if fastd_values and len(fastd_values) >= 2 else None
+            
+            current_price = stochrsi_data.get("c", [None])[-1] if "c" in stochrsi_data else None
+            
+            # Oversold condition (bullish)
+            if current_k < self.oversold and previous_k >= self.oversold:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"StochRSI oversold: FastK ({current_k:.1f}) crossed below {self.oversold}. "
+                        f"Potential reversal up."
+                    )
                 )
                 
-                if not stochrsi_data or "fastk" not in stochrsi_data:
-                    logger.warning("stochrsi_data_unavailable", ticker=ticker)
-                    continue
-                
-                fastk_values = stochrsi_data["fastk"]
-                fastd_values = stochrsi_data.get("fastd", [])
-                
-                if len(fastk_values) < 2:
-                    logger.warning("insufficient_stochrsi_data", ticker=ticker)
-                    continue
+                signal = Signal(
+                    signal_type=SignalType.STOCHRSI_OVERSOLD,
+                    source="stochrsi_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_k": round(current_k, 2),
+                        "previous_k": round(previous_k, 2),
+                        "current_d": round(current_d, 2) if current_d else None,
+                        "oversold_threshold": self.oversold,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                current_k = fastk_values[-1]
-                previous_k = fastk_values[-2]
-                current_d = fastd_values[-1] if fastd_values and len(fastd_values) >= 1 else None
-                previous_d = fastd_values[-2] if fastd_values and len(fastd_values) >= 2 else None
+                signals.append(signal)
+                logger.info("stochrsi_oversold_signal", ticker=ticker, k=round(current_k, 1))
+            
+            # Overbought condition (bearish)
+            elif current_k > self.overbought and previous_k <= self.overbought:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"StochRSI overbought: FastK ({current_k:.1f}) crossed above {self.overbought}. "
+                        f"Potential reversal down."
+                    )
+                )
                 
-                current_price = stochrsi_data.get("c", [None])[-1] if "c" in stochrsi_data else None
+                signal = Signal(
+                    signal_type=SignalType.STOCHRSI_OVERBOUGHT,
+                    source="stochrsi_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_k": round(current_k, 2),
+                        "previous_k": round(previous_k, 2),
+                        "current_d": round(current_d, 2) if current_d else None,
+                        "overbought_threshold": self.overbought,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # Oversold condition (bullish)
-                if current_k < self.oversold and previous_k >= self.oversold:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"StochRSI oversold: FastK ({current_k:.1f}) crossed below {self.oversold}. "
-                            f"Potential reversal up."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.STOCHRSI_OVERSOLD,
-                        source="stochrsi_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_k": round(current_k, 2),
-                            "previous_k": round(previous_k, 2),
-                            "current_d": round(current_d, 2) if current_d else None,
-                            "oversold_threshold": self.oversold,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("stochrsi_overbought_signal", ticker=ticker, k=round(current_k, 1))
+            
+            # Bullish crossover (K crosses above D)
+            elif current_d and previous_d and current_k > current_d and previous_k <= previous_d:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 0.9 * 100,
+                    reasoning=(
+                        f"StochRSI bullish crossover: FastK ({current_k:.1f}) crossed above "
+                        f"FastD ({current_d:.1f})"
                     )
-                    
-                    signals.append(signal)
-                    logger.info("stochrsi_oversold_signal", ticker=ticker, k=round(current_k, 1))
+                )
                 
-                # Overbought condition (bearish)
-                elif current_k > self.overbought and previous_k <= self.overbought:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"StochRSI overbought: FastK ({current_k:.1f}) crossed above {self.overbought}. "
-                            f"Potential reversal down."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.STOCHRSI_OVERBOUGHT,
-                        source="stochrsi_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_k": round(current_k, 2),
-                            "previous_k": round(previous_k, 2),
-                            "current_d": round(current_d, 2) if current_d else None,
-                            "overbought_threshold": self.overbought,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("stochrsi_overbought_signal", ticker=ticker, k=round(current_k, 1))
+                signal = Signal(
+                    signal_type=SignalType.STOCHRSI_BULLISH_CROSS,
+                    source="stochrsi_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_k": round(current_k, 2),
+                        "current_d": round(current_d, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # Bullish crossover (K crosses above D)
-                elif current_d and previous_d and current_k > current_d and previous_k <= previous_d:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 0.9 * 100,
-                        reasoning=(
-                            f"StochRSI bullish crossover: FastK ({current_k:.1f}) crossed above "
-                            f"FastD ({current_d:.1f})"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.STOCHRSI_BULLISH_CROSS,
-                        source="stochrsi_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_k": round(current_k, 2),
-                            "current_d": round(current_d, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("stochrsi_bullish_cross", ticker=ticker)
+            
+            # Bearish crossover (K crosses below D)
+            elif current_d and previous_d and current_k < current_d and previous_k >= previous_d:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 0.9 * 100,
+                    reasoning=(
+                        f"StochRSI bearish crossover: FastK ({current_k:.1f}) crossed below "
+                        f"FastD ({current_d:.1f})"
                     )
-                    
-                    signals.append(signal)
-                    logger.info("stochrsi_bullish_cross", ticker=ticker)
+                )
                 
-                # Bearish crossover (K crosses below D)
-                elif current_d and previous_d and current_k < current_d and previous_k >= previous_d:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 0.9 * 100,
-                        reasoning=(
-                            f"StochRSI bearish crossover: FastK ({current_k:.1f}) crossed below "
-                            f"FastD ({current_d:.1f})"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.STOCHRSI_BEARISH_CROSS,
-                        source="stochrsi_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_k": round(current_k, 2),
-                            "current_d": round(current_d, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("stochrsi_bearish_cross", ticker=ticker)
-            
-            except Exception as e:
-                logger.error("stochrsi_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+                signal = Signal(
+                    signal_type=SignalType.STOCHRSI_BEARISH_CROSS,
+                    source="stochrsi_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_k": round(current_k, 2),
+                        "current_d": round(current_d, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("stochrsi_bearish_cross", ticker=ticker)
+        
+        except Exception as e:
+            logger.error("stochrsi_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("stochrsi_scan_completed", signals_generated=len(signals))
         return signals
 
@@ -4,11 +4,13 @@ Swing Point Break Signal Generator
 Detects when price breaks above previous swing highs or below previous swing lows.
 """
 from typing import Dict, Any, List
+import numpy as np
 import structlog
 
 from app.generators.base import BaseSignalGenerator, GeneratorError
 from app.schemas.signal import Signal, TickerSignal, SignalType, BiasType
 from app.utils.market_data import MarketDataFetcher
+from app.utils.market_structure import swing_points
 
 
 logger = structlog.get_logger()
@@ -59,48 +61,29 @@ class SwingPointBreakSignalGenerator(BaseSignalGenerator):
         if swing_strength < 1:
             raise ValueError("min_swing_strength must be >= 1")
     
-    def _find_swing_high(self, highs: List[float], idx: int, strength: int) -> bool:
-        """Check if index is a swing high."""
-        if idx < strength or idx >= len(highs) - strength:
-            return False
-        
-        pivot_high = highs[idx]
-        
-        # Check left side
-        for i in range(idx - strength, idx):
-            if highs[i] >= pivot_high:
-                return False
-        
-        # Check right side
-        for i in range(idx + 1, idx + strength + 1):
-            if highs[i] >= pivot_high:
-                return False
-        
-        return True
-    
-    def _find_swing_low(self, lows: List[float], idx: int, strength: int) -> bool:
-        """Check if index is a swing low."""
-        if idx < strength or idx >= len(lows) - strength:
-            return False
-        
-        pivot_low = lows[idx]
-        
-        # Check left side
-        for i in range(idx - strength, idx):
-            if lows[i] <= pivot_low:
-                return False
-        
-        # Check right side
-        for i in range(idx + 1, idx + strength + 1):
-            if lows[i] <= pivot_low:
-                return False
-        
-        return True
+    def _find_last_swings(self, highs: List[float], lows: List[float], strength: int) -> tuple:
+        """
+        Most recent confirmed swing high and swing low.
+
+        A swing must be strictly above (below) the ``strength`` bars on each
+        side; the oldest candidate bar (index ``strength``) is not considered.
+
+        Returns:
+            (swing_high_idx, swing_low_idx), None when not found
+        """
+        high_idx, low_idx = swing_points(
+            np.asarray(highs, dtype=float), np.asarray(lows, dtype=float), strength, strict=True
+        )
+        high_idx = high_idx[high_idx > strength]
+        low_idx = low_idx[low_idx > strength]
+        return (
+            int(high_idx[-1]) if high_idx.size else None,
+            int(low_idx[-1]) if low_idx.size else None,
+        )
     
     async def generate(self) -> List[Signal]:
         """Generate swing point break signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "swing_point_break_scan_started",
@@ -109,155 +92,149 @@ class SwingPointBreakSignalGenerator(BaseSignalGenerator):
             swing_strength=self.min_swing_strength
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch candles
-                lookback_days = self.lookback_periods + self.min_swing_strength + 10
-                candles_df = await self.market_data.fetch_candles(
-                    symbol=ticker,
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info(
+            "swing_point_break_scan_completed",
+            signals_generated=len(signals),
+            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
+        )
+        
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch candles
+            lookback_days = self.lookback_periods + self.min_swing_strength + 10
+            candles_df = await self.market_data.fetch_candles(
+                symbol=ticker,
+                resolution=self.timeframe,
+                lookback_days=lookback_days
+            )
+            
+            # Convert DataFrame to list of dicts
+            candles = self._dataframe_to_candles(candles_df)
+            
+            if not candles or len(candles) < self.lookback_periods + self.min_swing_strength:
+                logger.debug("insufficient_candle_data", ticker=ticker)
+                return signals
+            
+            highs = [c["h"] for c in candles]
+            lows = [c["l"] for c in candles]
+            closes = [c["c"] for c in candles]
+            
+            # Find most recent swing high/low (the last few bars can't be confirmed swings)
+            last_swing_high_idx, last_swing_low_idx = self._find_last_swings(
+                highs, lows, self.min_swing_strength
+            )
+            last_swing_high = highs[last_swing_high_idx] if last_swing_high_idx is not None else None
+            last_swing_low = lows[last_swing_low_idx] if last_swing_low_idx is not None else None
+            
+            if last_swing_high is None and last_swing_low is None:
+                logger.debug("no_swing_points_found", ticker=ticker)
+                return signals
+            
+            # Check if current price breaks swing points
+            current_close = closes[-1]
+            previous_close = closes[-2]
+            
+            # Bullish break: price breaks above swing high
+            if last_swing_high is not None:
+                bullish_break = (
+                    current_close > last_swing_high and 
+                    previous_close <= last_swing_high
                 )
                 
-                # Convert DataFrame to list of dicts
-                candles = self._dataframe_to_candles(candles_df)
-                
-                if not candles or len(candles) < self.lookback_periods + self.min_swing_strength:
-                    logger.debug("insufficient_candle_data", ticker=ticker)
-                    continue
-                
-                highs = [c["h"] for c in candles]
-                lows = [c["l"] for c in candles]
-                closes = [c["c"] for c in candles]
-                
-                # Find most recent swing high/low
-                last_swing_high = None
-                last_swing_low = None
-                last_swing_high_idx = None
-                last_swing_low_idx = None
-                
-                # Search backwards from recent (excluding last few bars which can't be confirmed swings)
-                for i in range(len(highs) - self.min_swing_strength - 1, self.min_swing_strength, -1):
-                    if last_swing_high is None and self._find_swing_high(highs, i, self.min_swing_strength):
-                        last_swing_high = highs[i]
-                        last_swing_high_idx = i
+                if bullish_break:
+                    logger.info(
+                        "swing_high_break_detected",
+                        ticker=ticker,
+                        current_close=current_close,
+                        swing_high=last_swing_high,
+                        bars_ago=len(highs) - last_swing_high_idx - 1
+                    )
                     
-                    if last_swing_low is None and self._find_swing_low(lows, i, self.min_swing_strength):
-                        last_swing_low = lows[i]
-                        last_swing_low_idx = i
+                    # Higher confidence if swing was recent and strong
+                    bars_ago = len(highs) - last_swing_high_idx - 1
+                    recency_factor = max(0, 1 - (bars_ago / self.lookback_periods))
+                    confidence = self.confidence + recency_factor * 0.15
                     
-                    # Stop if we found both
-                    if last_swing_high is not None and last_swing_low is not None:
-                        break
-                
-                if last_swing_high is None and last_swing_low is None:
-                    logger.debug("no_swing_points_found", ticker=ticker)
-                    continue
-                
-                # Check if current price breaks swing points
-                current_close = closes[-1]
-                previous_close = closes[-2]
-                
-                # Bullish break: price breaks above swing high
-                if last_swing_high is not None:
-                    bullish_break = (
-                        current_close > last_swing_high and 
-                        previous_close <= last_swing_high
+                    ticker_signal = TickerSignal(
+                        ticker=ticker,
+                        signal=BiasType.BULLISH,
+                        confidence=min(confidence * 100, 95),
+                        reasoning=(
+                            f"Price broke above swing high at {last_swing_high:.5f} "
+                            f"({bars_ago} bars ago). Current: {current_close:.5f}. "
+                            f"Bullish momentum confirmed."
+                        )
                     )
                     
-                    if bullish_break:
-                        logger.info(
-                            "swing_high_break_detected",
-                            ticker=ticker,
-                            current_close=current_close,
-                            swing_high=last_swing_high,
-                            bars_ago=len(highs) - last_swing_high_idx - 1
-                        )
-                        
-                        # Higher confidence if swing was recent and strong
-                        bars_ago = len(highs) - last_swing_high_idx - 1
-                        recency_factor = max(0, 1 - (bars_ago / self.lookback_periods))
-                        confidence = self.confidence + recency_factor * 0.15
-                        
-                        ticker_signal = TickerSignal(
-                            ticker=ticker,
-                            signal=BiasType.BULLISH,
-                            confidence=min(confidence * 100, 95),
-                            reasoning=(
-                                f"Price broke above swing high at {last_swing_high:.5f} "
-                                f"({bars_ago} bars ago). Current: {current_close:.5f}. "
-                                f"Bullish momentum confirmed."
-                            )
-                        )
-                        
-                        signal = Signal(
-                            signal_type=SignalType.SWING_POINT_BREAK_BULLISH,
-                            source="swing_point_generator",
-                            tickers=[ticker_signal],
-                            metadata=self._enrich_metadata({
-                                "swing_high": last_swing_high,
-                                "bars_ago": bars_ago,
-                                "current_price": current_close
-                            })
-                        )
-                        signals.append(signal)
+                    signal = Signal(
+                        signal_type=SignalType.SWING_POINT_BREAK_BULLISH,
+                        source="swing_point_generator",
+                        tickers=[ticker_signal],
+                        metadata=self._enrich_metadata({
+                            "swing_high": last_swing_high,
+                            "bars_ago": bars_ago,
+                            "current_price": current_close
+                        })
+                    )
+                    signals.append(signal)
+            
+            # Bearish break: price breaks below swing low
+            if last_swing_low is not None:
+                bearish_break = (
+                    current_close < last_swing_low and 
+                    previous_close >= last_swing_low
+                )
                 
-                # Bearish break: price breaks below swing low
-                if last_swing_low is not None:
-                    bearish_break = (
-                        current_close < last_swing_low and 
-                        previous_close >= last_swing_low
+                if bearish_break:
+                    logger.info(
+                        "swing_low_break_detected",
+                        ticker=ticker,
+                        current_close=current_close,
+                        swing_low=last_swing_low,
+                        bars_ago=len(lows) - last_swing_low_idx - 1
                     )
                     
-                    if bearish_break:
-                        logger.info(
-                            "swing_low_break_detected",
-                            ticker=ticker,
-                            current_close=current_close,
-                            swing_low=last_swing_low,
-                            bars_ago=len(lows) - last_swing_low_idx - 1
-                        )
-                        
-                        bars_ago = len(lows) - last_swing_low_idx - 1
-                        recency_factor = max(0, 1 - (bars_ago / self.lookback_periods))
-                        confidence = self.confidence + recency_factor * 0.15
-                        
-                        ticker_signal = TickerSignal(
-                            ticker=ticker,
-                            signal=BiasType.BEARISH,
-                            confidence=min(confidence * 100, 95),
-                            reasoning=(
-                                f"Price broke below swing low at {last_swing_low:.5f} "
-                                f"({bars_ago} bars ago). Current: {current_close:.5f}. "
-                                f"Bearish momentum confirmed."
-                            )
-                        )
-                        
-                        signal = Signal(
-                            signal_type=SignalType.SWING_POINT_BREAK_BEARISH,
-                            source="swing_point_generator",
-                            tickers=[ticker_signal],
-                            metadata=self._enrich_metadata({
-                                "swing_low": last_swing_low,
-                                "bars_ago": bars_ago,
-                                "current_price": current_close
-                            })
+                    bars_ago = len(lows) - last_swing_low_idx - 1
+                    recency_factor = max(0, 1 - (bars_ago / self.lookback_periods))
+                    confidence = self.confidence + recency_factor * 0.15
+                    
+                    ticker_signal = TickerSignal(
+                        ticker=ticker,
+                        signal=BiasType.BEARISH,
+                        confidence=min(confidence * 100, 95),
+                        reasoning=(
+                            f"Price broke below swing low at {last_swing_low:.5f} "
+                            f"({bars_ago} bars ago). Current: {current_close:.5f}. "
+                            f"Bearish momentum confirmed."
                         )
-                        signals.append(signal)
-                
-            except Exception as e:
-                logger.error(
-                    "swing_point_break_error",
-                    ticker=ticker,
-                    error=str(e),
-                    exc_info=True
-                )
-                continue
-        
-        logger.info(
-            "swing_point_break_scan_completed",
-            signals_generated=len(signals),
-            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
-        )
+                    )
+                    
+                    signal = Signal(
+                        signal_type=SignalType.SWING_POINT_BREAK_BEARISH,
+                        source="swing_point_generator",
+                        tickers=[ticker_signal],
+                        metadata=self._enrich_metadata({
+                            "swing_low": last_swing_low,
+                            "bars_ago": bars_ago,
+                            "current_price": current_close
+                        })
+                    )
+                    signals.append(signal)
+            
+        except Exception as e:
+            logger.error(
+                "swing_point_break_error",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
         
         return signals
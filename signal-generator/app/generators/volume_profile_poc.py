@@ -72,7 +72,6 @@ class VolumeProfilePOCSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate POC break signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "poc_break_scan_started",
@@ -80,122 +79,129 @@ class VolumeProfilePOCSignalGenerator(BaseSignalGenerator):
             lookback_periods=self.lookback_periods
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch candles
-                lookback_days = self.lookback_periods + 10
-                candles_df = await self.market_data.fetch_candles(
-                    symbol=ticker,
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days
-                )
-                
-                # Convert DataFrame to list of dicts
-                candles = self._dataframe_to_candles(candles_df)
-                
-                if not candles or len(candles) < self.lookback_periods + 2:
-                    logger.debug("insufficient_candle_data", ticker=ticker)
-                    continue
-                
-                # Calculate POC for lookback period (excluding last 2 candles)
-                lookback_candles = candles[-(self.lookback_periods+2):-2]
-                poc = self._calculate_vwap(lookback_candles)
-                
-                # Check current and previous close relative to POC
-                current_close = candles[-1]["c"]
-                previous_close = candles[-2]["c"]
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info(
+            "poc_break_scan_completed",
+            signals_generated=len(signals),
+            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
+        )
+        
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch candles
+            lookback_days = self.lookback_periods + 10
+            candles_df = await self.market_data.fetch_candles(
+                symbol=ticker,
+                resolution=self.timeframe,
+                lookback_days=lookback_days
+            )
+            
+            # Convert DataFrame to list of dicts
+            candles = self._dataframe_to_candles(candles_df)
+            
+            if not candles or len(candles) < self.lookback_periods + 2:
+                logger.debug("insufficient_candle_data", ticker=ticker)
+                return signals
+            
+            # Calculate POC for lookback period (excluding last 2 candles)
+            lookback_candles = candles[-(self.lookback_periods+2):-2]
+            poc = self._calculate_vwap(lookback_candles)
+            
+            # Check current and previous close relative to POC
+            current_close = candles[-1]["c"]
+            previous_close = candles[-2]["c"]
+            
+            # Bullish POC Break (price was below, now above)
+            bullish_break = previous_close < poc and current_close > poc
+            
+            if bullish_break:
+                distance_pips = abs(current_close - poc) / (0.01 if "JPY" in ticker.upper() else 0.0001)
                 
-                # Bullish POC Break (price was below, now above)
-                bullish_break = previous_close < poc and current_close > poc
+                logger.info(
+                    "bullish_poc_break_detected",
+                    ticker=ticker,
+                    poc=poc,
+                    previous_close=previous_close,
+                    current_close=current_close,
+                    distance_pips=distance_pips
+                )
                 
-                if bullish_break:
-                    distance_pips = abs(current_close - poc) / (0.01 if "JPY" in ticker.upper() else 0.0001)
-                    
-                    logger.info(
-                        "bullish_poc_break_detected",
-                        ticker=ticker,
-                        poc=poc,
-                        previous_close=previous_close,
-                        current_close=current_close,
-                        distance_pips=distance_pips
-                    )
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"Bullish POC Break: Price broke above Point of Control at {poc:.5f}. "
-                            f"Previous: {previous_close:.5f}, Current: {current_close:.5f}. "
-                            f"Strong resistance turned support - bullish continuation expected."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.POC_BREAK_BULLISH,
-                        source="poc_break_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "poc": poc,
-                            "previous_close": previous_close,
-                            "current_close": current_close,
-                            "distance_pips": distance_pips
-                        })
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"Bullish POC Break: Price broke above Point of Control at {poc:.5f}. "
+                        f"Previous: {previous_close:.5f}, Current: {current_close:.5f}. "
+                        f"Strong resistance turned support - bullish continuation expected."
                     )
-                    signals.append(signal)
+                )
                 
-                # Bearish POC Break (price was above, now below)
-                bearish_break = previous_close > poc and current_close < poc
+                signal = Signal(
+                    signal_type=SignalType.POC_BREAK_BULLISH,
+                    source="poc_break_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "poc": poc,
+                        "previous_close": previous_close,
+                        "current_close": current_close,
+                        "distance_pips": distance_pips
+                    })
+                )
+                signals.append(signal)
+            
+            # Bearish POC Break (price was above, now below)
+            bearish_break = previous_close > poc and current_close < poc
+            
+            if bearish_break:
+                distance_pips = abs(current_close - poc) / (0.01 if "JPY" in ticker.upper() else 0.0001)
                 
-                if bearish_break:
-                    distance_pips = abs(current_close - poc) / (0.01 if "JPY" in ticker.upper() else 0.0001)
-                    
-                    logger.info(
-                        "bearish_poc_break_detected",
-                        ticker=ticker,
-                        poc=poc,
-                        previous_close=previous_close,
-                        current_close=current_close,
-                        distance_pips=distance_pips
-                    )
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"Bearish POC Break: Price broke below Point of Control at {poc:.5f}. "
-                            f"Previous: {previous_close:.5f}, Current: {current_close:.5f}. "
-                            f"Strong support turned resistance - bearish continuation expected."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.POC_BREAK_BEARISH,
-                        source="poc_break_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "poc": poc,
-                            "previous_close": previous_close,
-                            "current_close": current_close,
-                            "distance_pips": distance_pips
-                        })
-                    )
-                    signals.append(signal)
+                logger.info(
+                    "bearish_poc_break_detected",
+                    ticker=ticker,
+                    poc=poc,
+                    previous_close=previous_close,
+                    current_close=current_close,
+                    distance_pips=distance_pips
+                )
                 
-            except Exception as e:
-                logger.error(
-                    "poc_break_error",
+                ticker_signal = TickerSignal(
                     ticker=ticker,
-                    error=str(e),
-                    exc_info=True
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"Bearish POC Break: Price broke below Point of Control at {poc:.5f}. "
+                        f"Previous: {previous_close:.5f}, Current: {current_close:.5f}. "
+                        f"Strong support turned resistance - bearish continuation expected."
+                    )
                 )
-                continue
-        
-        logger.info(
-            "poc_break_scan_completed",
-            signals_generated=len(signals),
-            tickers_with_signal=[s.tickers[0].ticker for s in signals] if signals else []
-        )
+                
+                signal = Signal(
+                    signal_type=SignalType.POC_BREAK_BEARISH,
+                    source="poc_break_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "poc": poc,
+                        "previous_close": previous_close,
+                        "current_close": current_close,
+                        "distance_pips": distance_pips
+                    })
+                )
+                signals.append(signal)
+            
+        except Exception as e:
+            logger.error(
+                "poc_break_error",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
         
         return signals
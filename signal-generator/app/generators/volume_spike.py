@@ -75,7 +75,6 @@ class VolumeSpikeSignalGenerator(BaseSignalGenerator):
             List of Signal objects for tickers with volume spikes
         """
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "volume_spike_scan_started",
@@ -84,99 +83,8 @@ class VolumeSpikeSignalGenerator(BaseSignalGenerator):
             threshold=self.spike_threshold
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch historical data
-                lookback_days = self.volume_period + 50
-                df = await self.market_data.fetch_candles(
-                    symbol=ticker,
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days
-                )
-                
-                if df is None or len(df) < self.volume_period + 1:
-                    logger.warning(
-                        "insufficient_data_for_volume_spike",
-                        ticker=ticker,
-                        required=self.volume_period + 1,
-                        available=len(df) if df is not None else 0
-                    )
-                    continue
-                
-                # Calculate average volume
-                avg_volume = df["volume"].rolling(window=self.volume_period).mean()
-                current_volume = df.iloc[-1]["volume"]
-                avg_volume_value = avg_volume.iloc[-1]
-                
-                # Check for volume spike
-                volume_ratio = current_volume / avg_volume_value if avg_volume_value > 0 else 0
-                
-                if volume_ratio >= self.spike_threshold:
-                    # Determine bias based on price direction
-                    current_close = df.iloc[-1]["close"]
-                    current_open = df.iloc[-1]["open"]
-                    price_change_pct = ((current_close - current_open) / current_open) * 100
-                    
-                    if self.use_price_direction:
-                        if abs(price_change_pct) < self.min_price_change_pct:
-                            # Price change too small, use NEUTRAL
-                            bias = BiasType.NEUTRAL
-                            bias_reason = "neutral price action"
-                        elif price_change_pct > 0:
-                            bias = BiasType.BULLISH
-                            bias_reason = f"price up {price_change_pct:.1f}%"
-                        else:
-                            bias = BiasType.BEARISH
-                            bias_reason = f"price down {abs(price_change_pct):.1f}%"
-                    else:
-                        bias = BiasType.NEUTRAL
-                        bias_reason = "price direction not considered"
-                    
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=bias,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"Volume spike detected: {volume_ratio:.2f}x average volume "
-                            f"({int(current_volume):,} vs {int(avg_volume_value):,}). "
-                            f"Price: {bias_reason}"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.VOLUME_SPIKE,
-                        source="volume_spike_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "volume_period": self.volume_period,
-                            "spike_threshold": self.spike_threshold,
-                            "current_volume": int(current_volume),
-                            "average_volume": int(avg_volume_value),
-                            "volume_ratio": round(volume_ratio, 2),
-                            "price_change_pct": round(price_change_pct, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_close, 2)
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    
-                    logger.info(
-                        "volume_spike_signal_generated",
-                        signal_id=str(signal.signal_id),
-                        ticker=ticker,
-                        volume_ratio=round(volume_ratio, 2),
-                        bias=bias.value
-                    )
-            
-            except Exception as e:
-                logger.error(
-                    "volume_spike_check_failed",
-                    ticker=ticker,
-                    error=str(e),
-                    exc_info=True
-                )
-                continue
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
         
         if signals:
             logger.info(
@@ -192,4 +100,102 @@ class VolumeSpikeSignalGenerator(BaseSignalGenerator):
             )
         
         return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch historical data
+            lookback_days = self.volume_period + 50
+            df = await self.market_data.fetch_candles(
+                symbol=ticker,
+                resolution=self.timeframe,
+                lookback_days=lookback_days
+            )
+            
+            if df is None or len(df) < self.volume_period + 1:
+                logger.warning(
+                    "insufficient_data_for_volume_spike",
+                    ticker=ticker,
+                    required=self.volume_period + 1,
+                    available=len(df) if df is not None else 0
+                )
+                return signals
+            
+            # Calculate average volume
+            avg_volume = df["volume"].rolling(window=self.volume_period).mean()
+            current_volume = df.iloc[-1]["volume"]
+            avg_volume_value = avg_volume.iloc[-1]
+            
+            # Check for volume spike
+            volume_ratio = current_volume / avg_volume_value if avg_volume_value > 0 else 0
+            
+            if volume_ratio >= self.spike_threshold:
+                # Determine bias based on price direction
+                current_close = df.iloc[-1]["close"]
+                current_open = df.iloc[-1]["open"]
+                price_change_pct = ((current_close - current_open) / current_open) * 100
+                
+                if self.use_price_direction:
+                    if abs(price_change_pct) < self.min_price_change_pct:
+                        # Price change too small, use NEUTRAL
+                        bias = BiasType.NEUTRAL
+                        bias_reason = "neutral price action"
+                    elif price_change_pct > 0:
+                        bias = BiasType.BULLISH
+                        bias_reason = f"price up {price_change_pct:.1f}%"
+                    else:
+                        bias = BiasType.BEARISH
+                        bias_reason = f"price down {abs(price_change_pct):.1f}%"
+                else:
+                    bias = BiasType.NEUTRAL
+                    bias_reason = "price direction not considered"
+                
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=bias,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"Volume spike detected: {volume_ratio:.2f}x average volume "
+                        f"({int(current_volume):,} vs {int(avg_volume_value):,}). "
+                        f"Price: {bias_reason}"
+                    )
+                )
+                
+                signal = Signal(
+                    signal_type=SignalType.VOLUME_SPIKE,
+                    source="volume_spike_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "volume_period": self.volume_period,
+                        "spike_threshold": self.spike_threshold,
+                        "current_volume": int(current_volume),
+                        "average_volume": int(avg_volume_value),
+                        "volume_ratio": round(volume_ratio, 2),
+                        "price_change_pct": round(price_change_pct, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_close, 2)
+                    })
+                )
+                
+                signals.append(signal)
+                
+                logger.info(
+                    "volume_spike_signal_generated",
+                    signal_id=str(signal.signal_id),
+                    ticker=ticker,
+                    volume_ratio=round(volume_ratio, 2),
+                    bias=bias.value
+                )
+        
+        except Exception as e:
+            logger.error(
+                "volume_spike_check_failed",
+                ticker=ticker,
+                error=str(e),
+                exc_info=True
+            )
+        
+        return signals
 
@@ -66,7 +66,6 @@ class WilliamsRSignalGenerator(BaseSignalGenerator):
     async def generate(self) -> List[Signal]:
         """Generate Williams %R signals."""
         tickers = self.config.get("tickers", ["AAPL"])
-        signals = []
         
         logger.info(
             "willr_scan_started",
@@ -76,143 +75,150 @@ class WilliamsRSignalGenerator(BaseSignalGenerator):
             oversold=self.oversold
         )
         
-        for ticker in tickers:
-            try:
-                # Fetch Williams %R from Finnhub
-                lookback_days = 90
-                willr_data = await self.market_data.fetch_indicator(
-                    symbol=ticker,
-                    indicator="willr",
-                    resolution=self.timeframe,
-                    lookback_days=lookback_days,
-                    timeperiod=self.timeperiod
+        scan = await self.scan_tickers(tickers, self._scan_ticker)
+        signals = scan.signals
+        
+        logger.info("willr_scan_completed", signals_generated=len(signals))
+        return signals
+    
+    async def _scan_ticker(self, ticker: str) -> List[Signal]:
+        """Fetch market data for one ticker and return the signals it triggers."""
+        signals = []
+        
+        try:
+            # Fetch Williams %R from Finnhub
+            lookback_days = 90
+            willr_data = await self.market_data.fetch_indicator(
+                symbol=ticker,
+                indicator="willr",
+                resolution=self.timeframe,
+                lookback_days=lookback_days,
+                timeperiod=self.timeperiod
+            )
+            
+            if not willr_data or "willr" not in willr_data:
+                logger.warning("willr_data_unavailable", ticker=ticker)
+                return signals
+            
+            willr_values = willr_data["willr"]
+            
+            if len(willr_values) < 2:
+                logger.warning("insufficient_willr_data", ticker=ticker)
+                return signals
+            
+            current_willr = willr_values[-1]
+            previous_willr = willr_values[-2]
+            
+            current_price = willr_data.get("c", [None])[-1] if "c" in willr_data else None
+            
+            # Oversold condition (bullish)
+            if current_willr < self.oversold and previous_willr >= self.oversold:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"Williams %R oversold: WillR ({current_willr:.1f}) crossed below {self.oversold}. "
+                        f"Potential reversal up."
+                    )
                 )
                 
-                if not willr_data or "willr" not in willr_data:
-                    logger.warning("willr_data_unavailable", ticker=ticker)
-                    continue
-                
-                willr_values = willr_data["willr"]
-                
-                if len(willr_values) < 2:
-                    logger.warning("insufficient_willr_data", ticker=ticker)
-                    continue
+                signal = Signal(
+                    signal_type=SignalType.WILLR_OVERSOLD,
+                    source="willr_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_willr": round(current_willr, 2),
+                        "previous_willr": round(previous_willr, 2),
+                        "oversold_threshold": self.oversold,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                current_willr = willr_values[-1]
-                previous_willr = willr_values[-2]
+                signals.append(signal)
+                logger.info("willr_oversold_signal", ticker=ticker, willr=round(current_willr, 1))
+            
+            # Overbought condition (bearish)
+            elif current_willr > self.overbought and previous_willr <= self.overbought:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 100,
+                    reasoning=(
+                        f"Williams %R overbought: WillR ({current_willr:.1f}) crossed above {self.overbought}. "
+                        f"Potential reversal down."
+                    )
+                )
                 
-                current_price = willr_data.get("c", [None])[-1] if "c" in willr_data else None
+                signal = Signal(
+                    signal_type=SignalType.WILLR_OVERBOUGHT,
+                    source="willr_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_willr": round(current_willr, 2),
+                        "previous_willr": round(previous_willr, 2),
+                        "overbought_threshold": self.overbought,
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # Oversold condition (bullish)
-                if current_willr < self.oversold and previous_willr >= self.oversold:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"Williams %R oversold: WillR ({current_willr:.1f}) crossed below {self.oversold}. "
-                            f"Potential reversal up."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.WILLR_OVERSOLD,
-                        source="willr_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_willr": round(current_willr, 2),
-                            "previous_willr": round(previous_willr, 2),
-                            "oversold_threshold": self.oversold,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("willr_overbought_signal", ticker=ticker, willr=round(current_willr, 1))
+            
+            # Crossing -50 midline upward (bullish momentum)
+            elif current_willr > -50 and previous_willr <= -50:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BULLISH,
+                    confidence=self.confidence * 0.85 * 100,
+                    reasoning=(
+                        f"Williams %R bullish momentum: WillR ({current_willr:.1f}) crossed above -50 midline"
                     )
-                    
-                    signals.append(signal)
-                    logger.info("willr_oversold_signal", ticker=ticker, willr=round(current_willr, 1))
+                )
                 
-                # Overbought condition (bearish)
-                elif current_willr > self.overbought and previous_willr <= self.overbought:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 100,
-                        reasoning=(
-                            f"Williams %R overbought: WillR ({current_willr:.1f}) crossed above {self.overbought}. "
-                            f"Potential reversal down."
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.WILLR_OVERBOUGHT,
-                        source="willr_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_willr": round(current_willr, 2),
-                            "previous_willr": round(previous_willr, 2),
-                            "overbought_threshold": self.overbought,
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("willr_overbought_signal", ticker=ticker, willr=round(current_willr, 1))
+                signal = Signal(
+                    signal_type=SignalType.WILLR_BULLISH_MOMENTUM,
+                    source="willr_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_willr": round(current_willr, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
                 
-                # Crossing -50 midline upward (bullish momentum)
-                elif current_willr > -50 and previous_willr <= -50:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BULLISH,
-                        confidence=self.confidence * 0.85 * 100,
-                        reasoning=(
-                            f"Williams %R bullish momentum: WillR ({current_willr:.1f}) crossed above -50 midline"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.WILLR_BULLISH_MOMENTUM,
-                        source="willr_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_willr": round(current_willr, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
+                signals.append(signal)
+                logger.info("willr_bullish_momentum", ticker=ticker)
+            
+            # Crossing -50 midline downward (bearish momentum)
+            elif current_willr < -50 and previous_willr >= -50:
+                ticker_signal = TickerSignal(
+                    ticker=ticker,
+                    signal=BiasType.BEARISH,
+                    confidence=self.confidence * 0.85 * 100,
+                    reasoning=(
+                        f"Williams %R bearish momentum: WillR ({current_willr:.1f}) crossed below -50 midline"
                     )
-                    
-                    signals.append(signal)
-                    logger.info("willr_bullish_momentum", ticker=ticker)
+                )
                 
-                # Crossing -50 midline downward (bearish momentum)
-                elif current_willr < -50 and previous_willr >= -50:
-                    ticker_signal = TickerSignal(
-                        ticker=ticker,
-                        signal=BiasType.BEARISH,
-                        confidence=self.confidence * 0.85 * 100,
-                        reasoning=(
-                            f"Williams %R bearish momentum: WillR ({current_willr:.1f}) crossed below -50 midline"
-                        )
-                    )
-                    
-                    signal = Signal(
-                        signal_type=SignalType.WILLR_BEARISH_MOMENTUM,
-                        source="willr_generator",
-                        tickers=[ticker_signal],
-                        metadata=self._enrich_metadata({
-                            "current_willr": round(current_willr, 2),
-                            "timeframe": self.timeframe,
-                            "current_price": round(current_price, 2) if current_price else None
-                        })
-                    )
-                    
-                    signals.append(signal)
-                    logger.info("willr_bearish_momentum", ticker=ticker)
-            
-            except Exception as e:
-                logger.error("willr_check_failed", ticker=ticker, error=str(e), exc_info=True)
-                continue
+                signal = Signal(
+                    signal_type=SignalType.WILLR_BEARISH_MOMENTUM,
+                    source="willr_generator",
+                    tickers=[ticker_signal],
+                    metadata=self._enrich_metadata({
+                        "current_willr": round(current_willr, 2),
+                        "timeframe": self.timeframe,
+                        "current_price": round(current_price, 2) if current_price else None
+                    })
+                )
+                
+                signals.append(signal)
+                logger.info("willr_bearish_momentum", ticker=ticker)
+        
+        except Exception as e:
+            logger.error("willr_check_failed", ticker=ticker, error=str(e), exc_info=True)
         
-        logger.info("willr_scan_completed", signals_generated=len(signals))
         return signals
 
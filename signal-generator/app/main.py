@@ -53,6 +53,7 @@ from app.generators import (
 from app.schemas.signal import Signal
 from app.telemetry import setup_telemetry
 from app.utils.backtest_context import use_backtest_ts
+from app.utils.bar_schedule import BarCloseClock, TIMEFRAME_SECONDS
 
 
 # Configure structured logging
@@ -89,6 +90,15 @@ class SignalGeneratorService:
         # Recent signals buffer (keep last 50 signals)
         self.recent_signals = deque(maxlen=50)
         
+        # Bar-close clock: wakes generators when their timeframe's bar closes
+        self.bar_clock: Optional[BarCloseClock] = None
+        if settings.BAR_CLOSE_SCHEDULING_ENABLED:
+            self.bar_clock = BarCloseClock(
+                settings.DATA_PLANE_URL if settings.MARKET_DATA_PROVIDER == "data_plane" else None,
+                poll_seconds=settings.BAR_WATERMARK_POLL_SECONDS,
+                ingest_grace_seconds=settings.BAR_CLOSE_INGEST_GRACE_SECONDS
+            )
+        
         # Initialize Scanner Universe Manager if DB URL provided
         if settings.BACKEND_DB_URL:
             try:
@@ -246,17 +256,7 @@ class SignalGeneratorService:
         This ensures we check shortly before a new candle closes but never
         more frequently than the base interval.
         """
-        tf_seconds = {
-            "1": 60, "1m": 60,
-            "5": 300, "5m": 300,
-            "15": 900, "15m": 900,
-            "30": 1800, "30m": 1800,
-            "60": 3600, "1h": 3600,
-            "240": 14400, "4h": 14400,
-            "D": 86400,
-            "W": 604800,
-        }
-        candle_seconds = tf_seconds.get(timeframe, base_interval)
+        candle_seconds = TIMEFRAME_SECONDS.get(timeframe, base_interval)
         return max(base_interval, int(candle_seconds * 0.8))
 
     def _initialize_generators(self):
@@ -271,7 +271,8 @@ class SignalGeneratorService:
         # Get watchlist from Scanner Universe Manager or fallback to static config
         if self.scanner_universe:
             try:
-                watchlist = self.scanner_universe.get_active_scanner_tickers()
+                # Also warms the routing index used by _emit_signals
+                watchlist = self.scanner_universe.refresh_routing_index().tickers
                 if not watchlist:
                     logger.warning("no_active_scanner_tickers", 
                                   message="No tickers found from active scanners, falling back to static watchlist")
@@ -868,12 +869,19 @@ class SignalGeneratorService:
         Re-reads tickers from generator config each iteration so that 
         universe changes (from _universe_refresh_loop) take effect immediately.
         
+        With bar-close scheduling enabled, the generator wakes when a new bar
+        of its timeframe has closed and been ingested, and skips the run when
+        there is no new bar since its last evaluation. ``interval`` then only
+        bounds how long it waits for one.
+        
         Args:
             generator_info: Dict with generator, interval, and name
         """
         generator = generator_info["generator"]
         interval = generator_info["interval"]
         name = generator_info["name"]
+        timeframe = generator.config.get("timeframe")
+        last_bar = None  # Close time of the last bar this generator evaluated
         
         # Import market hours checker
         from app.utils.market_hours import MarketHoursChecker
@@ -903,6 +911,20 @@ class SignalGeneratorService:
                         await asyncio.sleep(settings.MARKET_HOURS_CHECK_INTERVAL_SECONDS)
                         continue
                 
+                bar = self.bar_clock.latest_close(timeframe) if self.bar_clock and timeframe else None
+                if bar is not None and bar == last_bar:
+                    logger.debug(
+                        "generator_skipped_no_new_bar",
+                        generator=name,
+                        timeframe=timeframe,
+                        bar_close=bar.isoformat()
+                    )
+                    await self.bar_clock.wait_for_new_bar(timeframe, last_bar, timeout=interval)
+                    continue
+                
+                # A failed run is retried on the next bar, not immediately
+                last_bar = bar
+                
                 # Track scan
                 if self.meter:
                     self.generator_scans_total.add(1, {"generator": name})
@@ -940,9 +962,11 @@ class SignalGeneratorService:
                     exc_info=True
                 )
             
-            # Wait for next interval (use shorter interval if all markets closed)
+            # Wait for next bar close / interval (use shorter interval if all markets closed)
             if settings.ENABLE_MARKET_HOURS_CHECK and tickers and not MarketHoursChecker.any_ticker_tradeable(tickers):
                 await asyncio.sleep(settings.MARKET_HOURS_CHECK_INTERVAL_SECONDS)
+            elif self.bar_clock and last_bar is not None:
+                await self.bar_clock.wait_for_new_bar(timeframe, last_bar, timeout=interval)
             else:
                 await asyncio.sleep(interval)
     
@@ -959,13 +983,8 @@ class SignalGeneratorService:
             signals: List of signals to emit
             generator_name: Name of the generator that produced signals
         """
-        # Get pipeline-scanner mapping for enrichment
-        pipeline_scanner_mapping = {}
-        if self.scanner_universe:
-            try:
-                pipeline_scanner_mapping = self.scanner_universe.get_pipeline_scanner_mapping()
-            except Exception as e:
-                logger.warning("failed_to_get_pipeline_mapping", error=str(e))
+        # In-memory ticker -> pipelines index (refreshed by _universe_refresh_loop)
+        routing_index = self.scanner_universe.routing_index if self.scanner_universe else None
         
         for signal in signals:
             # Enrich signal with pipeline routing info
@@ -975,15 +994,7 @@ class SignalGeneratorService:
                 ticker = ticker_signal.ticker
                 
                 # Find matching pipelines for this ticker
-                matched_pipelines = []
-                for pipeline_id, pipeline_data in pipeline_scanner_mapping.items():
-                    if ticker in pipeline_data.get('tickers', []):
-                        matched_pipelines.append({
-                            'pipeline_id': pipeline_id,
-                            'pipeline_name': pipeline_data['pipeline_name'],
-                            'scanner_id': pipeline_data['scanner_id'],
-                            'scanner_name': pipeline_data['scanner_name']
-                        })
+                matched_pipelines = routing_index.pipelines_for(ticker) if routing_index else []
                 
                 if matched_pipelines:
                     ticker_to_pipelines[ticker] = matched_pipelines
@@ -1152,6 +1163,9 @@ class SignalGeneratorService:
         print(f"   Watchlist: {settings.get_watchlist()}")
         print(f"   Log Level: {settings.LOG_LEVEL}\n")
         
+        if self.bar_clock:
+            await self.bar_clock.start()
+        
         # Start all generators as concurrent tasks
         tasks = [
             asyncio.create_task(self.run_generator(gen_info))
@@ -1172,7 +1186,7 @@ class SignalGeneratorService:
             raise
     
     async def _universe_refresh_loop(self):
-        """Periodically refresh the ticker universe from active scanners.
+        """Periodically refresh the ticker universe and signal routing index.
         
         Instead of re-creating generators (which would leave new ones without
         running asyncio tasks), this updates existing generators' ticker configs
@@ -1186,8 +1200,10 @@ class SignalGeneratorService:
                 if not self.scanner_universe:
                     break
                 
-                # Refresh universe from active scanners
-                new_tickers = self.scanner_universe.get_active_scanner_tickers()
+                # Refresh universe and routing index from active scanners
+                # (blocking DB query — keep it off the generators' event loop)
+                routing_index = await asyncio.to_thread(self.scanner_universe.refresh_routing_index)
+                new_tickers = routing_index.tickers
                 
                 if not new_tickers:
                     logger.debug("universe_refresh_no_tickers_found")
@@ -1268,6 +1284,9 @@ class SignalGeneratorService:
         """Stop all generators and cleanup resources."""
         self.running = False
         
+        if self.bar_clock:
+            await self.bar_clock.stop()
+        
         # Close Kafka producer
         if self.kafka_producer:
             try:
@@ -3,8 +3,13 @@ Scanner Universe Manager
 
 Queries the backend database to discover tickers from active pipelines' scanners.
 Only includes tickers from scanners that are attached to active pipelines.
+
+Signal routing reads ``ScannerUniverseManager.routing_index``, an immutable
+ticker → pipelines index rebuilt off the event loop by the service's
+universe refresh loop, so emitting a signal never queries Postgres.
 """
-from typing import List, Set, Dict
+from dataclasses import dataclass, field
+from typing import List, Set, Dict, Tuple
 from datetime import datetime
 import structlog
 from sqlalchemy import create_engine, select, and_
@@ -13,6 +18,32 @@ from sqlalchemy.orm import sessionmaker
 logger = structlog.get_logger()
 
 
+@dataclass(frozen=True)
+class PipelineRoutingIndex:
+    """
+    Snapshot of which active pipelines watch which ticker.
+
+    Never mutated after construction; a refresh swaps in a new instance.
+    ``version`` only changes when the routing content changes.
+    """
+    version: int = 0
+    by_ticker: Dict[str, Tuple[Dict[str, str], ...]] = field(default_factory=dict)
+    loaded_at: datetime = None
+
+    @property
+    def tickers(self) -> List[str]:
+        """Sorted ticker universe covered by the index."""
+        return sorted(self.by_ticker)
+
+    @property
+    def pipeline_count(self) -> int:
+        return len({route["pipeline_id"] for routes in self.by_ticker.values() for route in routes})
+
+    def pipelines_for(self, ticker: str) -> List[Dict[str, str]]:
+        """Routing entries for a ticker (copies, safe to attach to a signal)."""
+        return [dict(route) for route in self.by_ticker.get(ticker, ())]
+
+
 class ScannerUniverseManager:
     """
     Manages the universe of tickers to monitor based on active pipelines and their scanners.
@@ -36,6 +67,7 @@ class ScannerUniverseManager:
         self.Session = None
         self.last_refresh = None
         self.current_tickers = set()
+        self.routing_index = PipelineRoutingIndex()
         
     def connect(self):
         """Establish connection to backend database."""
@@ -152,10 +184,14 @@ class ScannerUniverseManager:
         finally:
             session.close()
     
-    def get_pipeline_scanner_mapping(self) -> Dict[str, Dict]:
+    def get_pipeline_scanner_mapping(self, raise_errors: bool = False) -> Dict[str, Dict]:
         """
         Get mapping of pipeline_id -> scanner info for signal routing.
         
+        Args:
+            raise_errors: Raise query errors instead of returning an empty
+                mapping (so a refresh can keep its previous index)
+        
         Returns:
             Dict mapping pipeline_id to {scanner_id, scanner_name, tickers}
         """
@@ -211,7 +247,55 @@ class ScannerUniverseManager:
         
         except Exception as e:
             logger.error("pipeline_scanner_mapping_failed", error=str(e), exc_info=True)
+            if raise_errors:
+                raise
             return {}
         
         finally:
             session.close()
+
+    def refresh_routing_index(self) -> PipelineRoutingIndex:
+        """
+        Rebuild the ticker → pipelines index and ticker universe in one query.
+
+        Blocking — run it off the event loop (``asyncio.to_thread``). On
+        failure the previous index is kept.
+
+        Returns:
+            The current index (new, or the previous one if unchanged/failed)
+        """
+        try:
+            mapping = self.get_pipeline_scanner_mapping(raise_errors=True)
+        except Exception as e:
+            logger.error("routing_index_refresh_failed", error=str(e), version=self.routing_index.version)
+            return self.routing_index
+
+        by_ticker: Dict[str, List[Dict[str, str]]] = {}
+        for pipeline_id in sorted(mapping):
+            pipeline_data = mapping[pipeline_id]
+            route = {
+                "pipeline_id": pipeline_id,
+                "pipeline_name": pipeline_data["pipeline_name"],
+                "scanner_id": pipeline_data["scanner_id"],
+                "scanner_name": pipeline_data["scanner_name"],
+            }
+            for ticker in dict.fromkeys(pipeline_data.get("tickers") or []):
+                by_ticker.setdefault(ticker, []).append(route)
+        frozen = {ticker: tuple(routes) for ticker, routes in by_ticker.items()}
+
+        current = self.routing_index
+        now = datetime.utcnow()
+        if frozen == current.by_ticker and current.loaded_at is not None:
+            self.routing_index = PipelineRoutingIndex(current.version, current.by_ticker, now)
+        else:
+            self.routing_index = PipelineRoutingIndex(current.version + 1, frozen, now)
+            logger.info(
+                "routing_index_rebuilt",
+                version=self.routing_index.version,
+                ticker_count=len(frozen),
+                pipeline_count=self.routing_index.pipeline_count,
+            )
+
+        self.current_tickers = set(frozen)
+        self.last_refresh = now
+        return self.routing_index
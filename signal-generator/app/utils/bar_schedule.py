@@ -0,0 +1,201 @@
+"""
+Bar Close Scheduling
+
+Wakes generators right after the bars of their timeframe have closed and
+been ingested, instead of on a fixed interval at an arbitrary offset from
+the candle close.
+
+The data plane advances a per-timeframe watermark (close time of the newest
+fully-ingested bar) at the end of every prefetch cycle and serves it at
+``GET /api/v1/data/watermarks``. ``BarCloseClock`` polls that one small
+endpoint for the whole service and wakes the generators whose timeframe
+moved. When the data plane has no watermark for a timeframe (other market
+data provider, nothing ingested yet), it falls back to the wall-clock bar
+close plus an ingest grace period.
+
+Bars are aligned to UTC epoch boundaries, matching the data plane's
+continuous aggregates (the daily bar closes at 00:00 UTC).
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import httpx
+import structlog
+
+
+logger = structlog.get_logger()
+
+
+TIMEFRAME_SECONDS: Dict[str, int] = {
+    "1": 60, "1m": 60,
+    "5": 300, "5m": 300,
+    "15": 900, "15m": 900,
+    "30": 1800, "30m": 1800,
+    "60": 3600, "1h": 3600,
+    "240": 14400, "4h": 14400,
+    "D": 86400,
+    "W": 604800,
+}
+
+# Generator timeframe -> data plane watermark key
+_WATERMARK_TIMEFRAMES: Dict[str, str] = {
+    "1": "1m", "1m": "1m",
+    "5": "5m", "5m": "5m",
+    "15": "15m", "15m": "15m",
+    "60": "1h", "1h": "1h",
+    "240": "4h", "4h": "4h",
+    "D": "D",
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def last_bar_close(timeframe: str, now: datetime) -> Optional[datetime]:
+    """Close time of the newest bar of ``timeframe`` that closed at or before ``now``."""
+    seconds = TIMEFRAME_SECONDS.get(timeframe)
+    if seconds is None or timeframe == "W":
+        # Weekly bars don't align to the epoch (a Thursday)
+        return None
+    elapsed = int((now - _EPOCH).total_seconds())
+    return _EPOCH + timedelta(seconds=elapsed - elapsed % seconds)
+
+
+def _parse(value: str) -> Optional[datetime]:
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+class BarCloseClock:
+    """
+    Shared source of "newest closed bar" per timeframe.
+
+    Example:
+        clock = BarCloseClock(settings.DATA_PLANE_URL)
+        await clock.start()
+
+        last_bar = None
+        while running:
+            bar = clock.latest_close("5m")
+            if bar != last_bar:
+                await generator.generate()
+                last_bar = bar
+            await clock.wait_for_new_bar("5m", last_bar, timeout=300)
+    """
+
+    def __init__(
+        self,
+        data_plane_url: Optional[str],
+        poll_seconds: float = 5.0,
+        ingest_grace_seconds: float = 75.0
+    ):
+        """
+        Args:
+            data_plane_url: Data plane base URL (None disables watermark polling)
+            poll_seconds: How often to read the data plane watermarks
+            ingest_grace_seconds: Wall-clock fallback delay after a bar closes
+        """
+        self.data_plane_url = data_plane_url.rstrip("/") if data_plane_url else None
+        self.poll_seconds = poll_seconds
+        self.ingest_grace_seconds = ingest_grace_seconds
+        self._watermarks: Dict[str, datetime] = {}
+        self._changed = asyncio.Condition()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start polling the data plane watermarks."""
+        if self._task is None and self.data_plane_url:
+            self._task = asyncio.create_task(self._poll_loop())
+            logger.info("bar_close_clock_started", poll_seconds=self.poll_seconds)
+
+    async def stop(self):
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def latest_close(self, timeframe: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Close time of the newest bar of ``timeframe`` that is ready to evaluate.
+
+        Returns:
+            The data plane watermark when available, else the wall-clock
+            bar close once the ingest grace period has passed. None for
+            timeframes without a fixed bar length.
+        """
+        key = _WATERMARK_TIMEFRAMES.get(timeframe)
+        if key in self._watermarks:
+            return self._watermarks[key]
+        now = now or datetime.now(timezone.utc)
+        return last_bar_close(timeframe, now - timedelta(seconds=self.ingest_grace_seconds))
+
+    async def wait_for_new_bar(
+        self,
+        timeframe: str,
+        after: Optional[datetime],
+        timeout: float
+    ) -> Optional[datetime]:
+        """
+        Wait until a bar newer than ``after`` is ready, or ``timeout`` passes.
+
+        Returns:
+            ``latest_close(timeframe)`` at wake-up (may still equal ``after``
+            on timeout)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            latest = self.latest_close(timeframe)
+            if latest is None or after is None or latest > after:
+                return latest
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return latest
+
+            wait_seconds = remaining
+            if _WATERMARK_TIMEFRAMES.get(timeframe) not in self._watermarks:
+                # Wall-clock fallback: next close + grace
+                next_ready = after + timedelta(
+                    seconds=TIMEFRAME_SECONDS[timeframe] + self.ingest_grace_seconds
+                )
+                until_ready = (next_ready - datetime.now(timezone.utc)).total_seconds()
+                wait_seconds = min(remaining, max(until_ready, 0.05))
+
+            async with self._changed:
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=wait_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def update(self, watermarks: Dict[str, str]):
+        """Merge watermarks read from the data plane and wake waiters if any moved."""
+        moved = False
+        for key, value in watermarks.items():
+            close = _parse(value)
+            if close and (key not in self._watermarks or close > self._watermarks[key]):
+                self._watermarks[key] = close
+                moved = True
+        if moved:
+            async with self._changed:
+                self._changed.notify_all()
+
+    async def _poll_loop(self):
+        url = f"{self.data_plane_url}/api/v1/data/watermarks"
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            while True:
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    await self.update(response.json().get("watermarks") or {})
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.debug("bar_watermark_poll_failed", error=str(e))
+                await asyncio.sleep(self.poll_seconds)
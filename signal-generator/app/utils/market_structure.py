@@ -0,0 +1,359 @@
+"""
+Market Structure Kernel
+
+Vectorized swing / structure primitives over OHLC NumPy arrays: swing
+highs and lows, first breaks of swing levels (BOS / CHoCH), liquidity
+grabs, fair value gaps and order blocks. Every function is a handful of
+array operations over the whole series instead of a Python loop per bar.
+
+The signal generators and the backend strategy tools both run on this
+kernel so live signals, agent tools and backtests agree bar for bar. The
+file is duplicated verbatim in backend/app/utils/ and
+signal-generator/app/utils/ (like market_hours.py); keep the copies
+identical.
+
+Sizes are ``price difference * pip_multiplier``; the strategy tools use a
+multiplier of 100 for their "pips".
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+BULLISH = 1
+BEARISH = -1
+
+
+def ohlc_arrays(
+    candles: Sequence[Dict[str, Any]],
+    keys: Iterable[str] = ("open", "high", "low", "close")
+) -> Tuple[np.ndarray, ...]:
+    """Convert candle dicts to one float64 array per key."""
+    return tuple(
+        np.fromiter((float(c[key]) for c in candles), dtype=np.float64, count=len(candles))
+        for key in keys
+    )
+
+
+def swing_points(
+    high: np.ndarray,
+    low: np.ndarray,
+    strength: int,
+    strict: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices of swing highs and swing lows.
+
+    A swing high is a bar whose high is above the highs of the ``strength``
+    bars on each side (``>=`` when ``strict`` is False); swing lows mirror
+    it. Bars without a full window on both sides are never swings.
+
+    Returns:
+        (swing_high_idx, swing_low_idx), ascending
+    """
+    width = 2 * strength + 1
+    if strength < 1 or len(high) < width:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    high_windows = sliding_window_view(high, width)
+    low_windows = sliding_window_view(low, width)
+    centre_high = high_windows[:, strength]
+    centre_low = low_windows[:, strength]
+    neighbours_high = np.maximum(
+        high_windows[:, :strength].max(axis=1), high_windows[:, strength + 1:].max(axis=1)
+    )
+    neighbours_low = np.minimum(
+        low_windows[:, :strength].min(axis=1), low_windows[:, strength + 1:].min(axis=1)
+    )
+
+    if strict:
+        is_high = centre_high > neighbours_high
+        is_low = centre_low < neighbours_low
+    else:
+        is_high = centre_high >= neighbours_high
+        is_low = centre_low <= neighbours_low
+
+    return np.flatnonzero(is_high) + strength, np.flatnonzero(is_low) + strength
+
+
+def first_beyond(
+    series: np.ndarray,
+    level_idx: np.ndarray,
+    levels: np.ndarray,
+    direction: int,
+    min_distance: Optional[float] = None,
+    pip_multiplier: float = 1.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For each level, the first later bar where ``series`` moves beyond it.
+
+    All levels are scanned forward together in doubling windows, so the
+    cost follows how soon levels are broken rather than the series length.
+
+    Args:
+        series: Prices to test (closes for breaks, highs / lows for wicks)
+        level_idx: Bar index each level was formed at; only later bars count
+        levels: Price levels
+        direction: BULLISH (above the level) or BEARISH (below it)
+        min_distance: Minimum ``distance * pip_multiplier`` beyond the level
+
+    Returns:
+        (bar index per level or -1 when never beyond, size at that bar)
+    """
+    n = len(series)
+    hit_idx = np.full(len(levels), -1, dtype=np.intp)
+    size = np.zeros(len(levels), dtype=np.float64)
+    pending = np.arange(len(levels))
+    offset, width = 1, 16
+
+    while pending.size:
+        cols = level_idx[pending, None] + np.arange(offset, offset + width)[None, :]
+        in_range = cols < n
+        beyond = (series[np.minimum(cols, n - 1)] - levels[pending, None]) * direction
+        hits = in_range & (beyond > 0)
+        if min_distance is not None:
+            hits &= beyond * pip_multiplier >= min_distance
+
+        found = hits.any(axis=1)
+        first = hits.argmax(axis=1)[found]
+        rows = pending[found]
+        hit_idx[rows] = cols[found, first]
+        size[rows] = beyond[found, first] * pip_multiplier
+
+        # Carry on with levels that are unresolved and have bars left
+        pending = pending[~found & in_range[:, -1]]
+        offset += width
+        width *= 2
+
+    return hit_idx, size
+
+
+def structure_events(
+    close: np.ndarray,
+    swing_high_idx: np.ndarray,
+    swing_low_idx: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    bullish_bias: bool
+) -> List[Dict[str, Any]]:
+    """
+    BOS / CHoCH events from the first close through each swing level.
+
+    A break in the direction of the running trend is a BOS; a break against
+    it is a CHoCH and flips the trend. Swing-high breaks are classified
+    first, then swing-low breaks, starting from ``bullish_bias``.
+
+    Returns:
+        [{"type", "direction", "level", "candle_index"}] sorted by candle_index
+    """
+    high_levels = high[swing_high_idx]
+    low_levels = low[swing_low_idx]
+    high_breaks, _ = first_beyond(close, swing_high_idx, high_levels, BULLISH)
+    low_breaks, _ = first_beyond(close, swing_low_idx, low_levels, BEARISH)
+
+    events = []
+    trend = "bullish" if bullish_bias else "bearish"
+    for direction, levels, breaks in (
+        ("bullish", high_levels, high_breaks),
+        ("bearish", low_levels, low_breaks),
+    ):
+        for level, bar in zip(levels.tolist(), breaks.tolist()):
+            if bar < 0:
+                continue
+            event_type = "BOS" if trend == direction else "CHoCH"
+            if event_type == "CHoCH":
+                trend = direction
+            events.append({
+                "type": event_type,
+                "direction": direction,
+                "level": level,
+                "candle_index": bar,
+            })
+
+    events.sort(key=lambda e: e["candle_index"])
+    return events
+
+
+def liquidity_grabs(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    swing_high_idx: np.ndarray,
+    swing_low_idx: np.ndarray,
+    min_distance: float,
+    pip_multiplier: float = 1.0
+) -> List[Dict[str, Any]]:
+    """
+    First wick through each swing level that reaches ``min_distance``.
+
+    Buy-side grabs spike above swing highs, sell-side grabs below swing
+    lows; a grab is ``reversed`` when the grab candle closes back inside.
+
+    Returns:
+        [{"type", "level", "candle_index", "distance", "reversed"}] sorted by candle_index
+    """
+    grabs = []
+    for grab_type, series, swing_idx, direction in (
+        ("buy_side", high, swing_high_idx, BULLISH),
+        ("sell_side", low, swing_low_idx, BEARISH),
+    ):
+        levels = series[swing_idx]
+        hit_idx, size = first_beyond(
+            series, swing_idx, levels, direction,
+            min_distance=min_distance, pip_multiplier=pip_multiplier
+        )
+        for row in np.flatnonzero(hit_idx >= 0).tolist():
+            bar = int(hit_idx[row])
+            grabs.append({
+                "type": grab_type,
+                "level": float(levels[row]),
+                "candle_index": bar,
+                "distance": float(size[row]),
+                # Closed back inside the swing level
+                "reversed": bool((close[bar] - levels[row]) * direction < 0),
+            })
+
+    grabs.sort(key=lambda g: g["candle_index"])
+    return grabs
+
+
+def _suffix_min(values: np.ndarray) -> np.ndarray:
+    return np.minimum.accumulate(values[::-1])[::-1]
+
+
+def _suffix_max(values: np.ndarray) -> np.ndarray:
+    return np.maximum.accumulate(values[::-1])[::-1]
+
+
+def fair_value_gaps(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    min_gap: float,
+    pip_multiplier: float = 1.0
+) -> List[Dict[str, Any]]:
+    """
+    Three-candle wick gaps with a displacement middle candle.
+
+    Bullish: candle 2 low > candle 0 high; bearish: candle 2 high < candle 0
+    low. The middle body must be at least as large as both outer bodies.
+    Fill is measured against the most extreme price after candle 2 (the
+    last close when candle 2 is the last bar).
+
+    Returns:
+        [{"direction", "index" (candle 2), "top", "bottom", "size", "fill_percentage"}]
+        in bar order
+    """
+    if len(high) < 3:
+        return []
+
+    body = np.abs(close - open_)
+    displacement = body[1:-1] >= np.maximum(body[:-2], body[2:])
+    bull_size = (low[2:] - high[:-2]) * pip_multiplier
+    bear_size = (low[:-2] - high[2:]) * pip_multiplier
+    bullish = displacement & (low[2:] > high[:-2])
+    bearish = displacement & ~bullish & (high[2:] < low[:-2])
+    bullish &= bull_size >= min_gap
+    bearish &= bear_size >= min_gap
+
+    last_close = close[-1]
+    future_low = np.append(_suffix_min(low)[3:], last_close)
+    future_high = np.append(_suffix_max(high)[3:], last_close)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Bullish gap spans [candle 0 high, candle 2 low]
+        bottom, top = high[:-2], low[2:]
+        bull_fill = np.where(
+            future_low >= top, 0.0,
+            np.where(future_low <= bottom, 100.0,
+                     np.minimum((top - np.maximum(future_low, bottom)) / (top - bottom) * 100, 100.0))
+        )
+        # Bearish gap spans [candle 2 high, candle 0 low]
+        bottom, top = high[2:], low[:-2]
+        bear_fill = np.where(
+            future_high <= bottom, 0.0,
+            np.where(future_high >= top, 100.0,
+                     np.minimum((np.minimum(future_high, top) - bottom) / (top - bottom) * 100, 100.0))
+        )
+
+    gaps = []
+    for k in np.flatnonzero(bullish | bearish).tolist():
+        if bullish[k]:
+            gaps.append({
+                "direction": "bullish",
+                "index": k + 2,
+                "top": float(low[k + 2]),
+                "bottom": float(high[k]),
+                "size": float(bull_size[k]),
+                "fill_percentage": float(bull_fill[k]),
+            })
+        else:
+            gaps.append({
+                "direction": "bearish",
+                "index": k + 2,
+                "top": float(low[k]),
+                "bottom": float(high[k + 2]),
+                "size": float(bear_size[k]),
+                "fill_percentage": float(bear_fill[k]),
+            })
+    return gaps
+
+
+def order_blocks(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    min_move: float,
+    pip_multiplier: float = 1.0
+) -> List[Dict[str, Any]]:
+    """
+    Last opposite candle before a displacement move.
+
+    Bullish: a bearish candle followed within 3 bars by a close above its
+    high, a body at least as large as its own and a move of ``min_move``
+    above its high. Bearish mirrors it. A block is retested when price
+    after the displacement window trades back into the candle body.
+
+    Returns:
+        [{"direction", "index", "body_high", "body_low", "move", "is_retested"}]
+        in bar order
+    """
+    count = len(high) - 4
+    if count <= 0:
+        return []
+
+    body = np.abs(close - open_)
+    window_high = sliding_window_view(high[1:], 3)[:count].max(axis=1)
+    window_low = sliding_window_view(low[1:], 3)[:count].min(axis=1)
+    window_close_max = sliding_window_view(close[1:], 3)[:count].max(axis=1)
+    window_close_min = sliding_window_view(close[1:], 3)[:count].min(axis=1)
+    window_body = sliding_window_view(body[1:], 3)[:count].max(axis=1)
+    after_low = _suffix_min(low)[4:]
+    after_high = _suffix_max(high)[4:]
+
+    o, h, l, c, b = open_[:count], high[:count], low[:count], close[:count], body[:count]
+    body_high = np.maximum(o, c)
+    body_low = np.minimum(o, c)
+    bull_move = (window_high - h) * pip_multiplier
+    bear_move = (l - window_low) * pip_multiplier
+    bullish = (c < o) & (window_close_max > h) & (window_body >= b) & (bull_move >= min_move)
+    bearish = (c > o) & (window_close_min < l) & (window_body >= b) & (bear_move >= min_move)
+
+    blocks = []
+    for i in np.flatnonzero(bullish | bearish).tolist():
+        is_bullish = bool(bullish[i])
+        blocks.append({
+            "direction": "bullish" if is_bullish else "bearish",
+            "index": i,
+            "body_high": float(body_high[i]),
+            "body_low": float(body_low[i]),
+            "move": float(bull_move[i] if is_bullish else bear_move[i]),
+            "is_retested": bool(
+                after_low[i] <= body_high[i] if is_bullish else after_high[i] >= body_low[i]
+            ),
+        })
+    return blocks
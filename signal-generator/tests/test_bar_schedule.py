@@ -0,0 +1,60 @@
+"""
+Tests for bar-close-aligned generator scheduling
+"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.bar_schedule import BarCloseClock, last_bar_close
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_last_bar_close_aligns_to_timeframe_boundaries():
+    now = _utc(2026, 4, 16, 14, 37, 12)
+    assert last_bar_close("5", now) == _utc(2026, 4, 16, 14, 35)
+    assert last_bar_close("60", now) == _utc(2026, 4, 16, 14, 0)
+    assert last_bar_close("240", now) == _utc(2026, 4, 16, 12, 0)
+    assert last_bar_close("D", now) == _utc(2026, 4, 16)
+    assert last_bar_close("W", now) is None
+    assert last_bar_close("bogus", now) is None
+
+
+def test_watermark_takes_precedence_over_wall_clock():
+    clock = BarCloseClock(None, ingest_grace_seconds=60)
+    now = _utc(2026, 4, 16, 14, 37, 30)
+
+    # Wall clock: 14:35 bar + 60s grace has passed
+    assert clock.latest_close("5m", now=now) == _utc(2026, 4, 16, 14, 35)
+
+    asyncio.run(clock.update({"5m": "2026-04-16T14:30:00+00:00"}))
+    # Data plane hasn't ingested the 14:35 bar yet
+    assert clock.latest_close("5", now=now) == _utc(2026, 4, 16, 14, 30)
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_when_watermark_advances_and_ignores_regressions():
+    clock = BarCloseClock(None)
+    await clock.update({"15m": "2026-04-16T14:15:00Z"})
+    last = clock.latest_close("15")
+
+    waiter = asyncio.create_task(clock.wait_for_new_bar("15", last, timeout=5))
+    await asyncio.sleep(0.01)
+    await clock.update({"15m": "2026-04-16T14:00:00Z"})  # older, ignored
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await clock.update({"15m": "2026-04-16T14:30:00Z"})
+    assert await asyncio.wait_for(waiter, 1) == _utc(2026, 4, 16, 14, 30)
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_same_bar_on_timeout():
+    clock = BarCloseClock(None)
+    await clock.update({"1h": "2026-04-16T14:00:00Z"})
+    last = clock.latest_close("60")
+
+    assert await clock.wait_for_new_bar("60", last, timeout=0.02) == last
@@ -0,0 +1,34 @@
+"""
+Tests for the shared market-structure kernel as used by the generators
+"""
+from app.generators.break_of_structure import BreakOfStructureSignalGenerator
+from app.generators.liquidity_sweep import LiquiditySweepSignalGenerator
+from app.generators.swing_point_break import SwingPointBreakSignalGenerator
+
+
+HIGHS = [1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 3.0, 3.0, 2.0, 1.0, 1.5]
+LOWS = [h - 0.5 for h in HIGHS]
+
+
+def test_structure_points_accept_equal_neighbours():
+    generator = BreakOfStructureSignalGenerator.__new__(BreakOfStructureSignalGenerator)
+
+    swing_highs, swing_lows = generator._find_structure_points(HIGHS, LOWS, 2)
+
+    assert swing_highs == [(2, 3.0), (6, 3.0), (7, 3.0)]
+    assert swing_lows == [(4, 0.5)]
+
+
+def test_swing_point_break_takes_latest_strict_swing():
+    generator = SwingPointBreakSignalGenerator.__new__(SwingPointBreakSignalGenerator)
+
+    # Equal highs at 6/7 are not strict swings, so the latest swing high is 2
+    assert generator._find_last_swings(HIGHS, LOWS, 1) == (2, 9)
+
+
+def test_liquidity_sweep_skips_oldest_candidate_bar():
+    generator = LiquiditySweepSignalGenerator.__new__(LiquiditySweepSignalGenerator)
+
+    # Index 2 is the first bar with a full window; the sweep search starts after it
+    assert generator._find_recent_swing_points(HIGHS[:6], LOWS[:6], window=2) == (None, None, None, None)
+    assert generator._find_recent_swing_points(HIGHS, LOWS, window=2) == (3.0, 0.5, 7, 4)
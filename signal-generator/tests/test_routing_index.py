@@ -0,0 +1,97 @@
+import importlib
+import sys
+from collections import deque
+from datetime import datetime
+
+import pytest
+
+from app.scanner_universe import ScannerUniverseManager
+from app.schemas.signal import BiasType, Signal, SignalType, TickerSignal
+
+
+def _mapping(*entries):
+    return {
+        pipeline_id: {
+            "pipeline_name": f"Pipeline {pipeline_id}",
+            "scanner_id": f"scanner-{pipeline_id}",
+            "scanner_name": f"Scanner {pipeline_id}",
+            "tickers": tickers,
+        }
+        for pipeline_id, tickers in entries
+    }
+
+
+def _manager(monkeypatch, *mappings):
+    manager = ScannerUniverseManager("postgresql://unused")
+    results = list(mappings)
+
+    def _fake_mapping(raise_errors=False):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(manager, "get_pipeline_scanner_mapping", _fake_mapping)
+    return manager
+
+
+def test_index_routes_tickers_and_only_bumps_version_on_change(monkeypatch):
+    first = _mapping(("p1", ["AAPL", "MSFT"]), ("p2", ["AAPL"]))
+    manager = _manager(monkeypatch, first, dict(first), _mapping(("p1", ["AAPL"])))
+
+    index = manager.refresh_routing_index()
+    assert index.version == 1
+    assert index.tickers == ["AAPL", "MSFT"]
+    assert [route["pipeline_id"] for route in index.pipelines_for("AAPL")] == ["p1", "p2"]
+    assert index.pipelines_for("TSLA") == []
+
+    assert manager.refresh_routing_index().version == 1
+
+    changed = manager.refresh_routing_index()
+    assert changed.version == 2
+    assert changed.tickers == ["AAPL"]
+    assert manager.current_tickers == {"AAPL"}
+
+
+def test_failed_refresh_keeps_previous_index(monkeypatch):
+    manager = _manager(monkeypatch, _mapping(("p1", ["EUR_USD"])), RuntimeError("db down"))
+
+    before = manager.refresh_routing_index()
+    after = manager.refresh_routing_index()
+
+    assert after is before
+    assert after.pipelines_for("EUR_USD")[0]["scanner_name"] == "Scanner p1"
+
+
+@pytest.mark.asyncio
+async def test_emit_signals_routes_from_index_without_querying(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    sys.modules.pop("app.main", None)
+    main_module = importlib.import_module("app.main")
+
+    manager = _manager(monkeypatch, _mapping(("p1", ["AUD_USD"])))
+    manager.refresh_routing_index()  # consumes the only mapping; another query would fail
+
+    service = main_module.SignalGeneratorService.__new__(main_module.SignalGeneratorService)
+    service.kafka_producer = None
+    service.scanner_universe = manager
+    service.recent_signals = deque(maxlen=50)
+    service.meter = None
+    service.metrics = None
+
+    signal = Signal(
+        signal_type=SignalType.CCI_OVERBOUGHT,
+        source="cci_generator",
+        timestamp=datetime(2026, 4, 16, 0, 49, 27),
+        tickers=[TickerSignal(ticker="AUD_USD", signal=BiasType.BEARISH, confidence=70.0)],
+        metadata={},
+    )
+    await service._emit_signals([signal], generator_name="cci_generator")
+
+    routes = signal.metadata["ticker_pipelines"]["AUD_USD"]
+    assert routes == [{
+        "pipeline_id": "p1",
+        "pipeline_name": "Pipeline p1",
+        "scanner_id": "scanner-p1",
+        "scanner_name": "Scanner p1",
+    }]
@@ -0,0 +1,94 @@
+"""
+Tests for bounded-concurrency ticker scanning in BaseSignalGenerator
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.generators.base import BaseSignalGenerator
+from app.generators.rsi import RSISignalGenerator
+from app.schemas.signal import SignalType
+
+
+class _ScanOnlyGenerator(BaseSignalGenerator):
+    async def generate(self):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_scan_respects_concurrency_and_keeps_ticker_order():
+    generator = _ScanOnlyGenerator({"scan_concurrency": 3})
+    in_flight = 0
+    peak = 0
+
+    async def scan(ticker):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return [ticker]
+
+    tickers = [f"T{i}" for i in range(12)]
+    start = time.perf_counter()
+    result = await generator.scan_tickers(tickers, scan)
+    elapsed = time.perf_counter() - start
+
+    assert peak == 3
+    assert result.signals == tickers
+    assert result.complete
+    # 12 tickers / 3 at a time = 4 rounds, not 12
+    assert elapsed < 0.02 * 8
+
+
+@pytest.mark.asyncio
+async def test_deadline_returns_partial_results_and_lists_timed_out_tickers():
+    generator = _ScanOnlyGenerator({"scan_concurrency": 4, "scan_deadline_seconds": 0.05})
+
+    async def scan(ticker):
+        if ticker == "RAISE":
+            raise RuntimeError("provider error")
+        if ticker.startswith("SLOW"):
+            await asyncio.sleep(5)
+        return [ticker] if ticker != "NONE" else None
+
+    result = await generator.scan_tickers(["AAPL", "SLOW1", "RAISE", "NONE", "SLOW2", "MSFT"], scan)
+
+    assert result.signals == ["AAPL", "MSFT"]
+    assert result.timed_out == ["SLOW1", "SLOW2"]
+    assert result.failed == ["RAISE"]
+    assert result.scanned == ["AAPL", "NONE", "MSFT"]
+    assert not result.complete
+
+
+@pytest.mark.asyncio
+async def test_rsi_generator_fetches_tickers_concurrently(monkeypatch):
+    class FakeMarketData:
+        def __init__(self):
+            self.in_flight = 0
+            self.peak = 0
+
+        async def fetch_indicator(self, symbol, **kwargs):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            # Oversold cross for AAPL only
+            return {"rsi": [35.0, 25.0] if symbol == "AAPL" else [50.0, 51.0], "c": [190.0, 188.0]}
+
+    generator = RSISignalGenerator.__new__(RSISignalGenerator)
+    generator.config = {"tickers": ["MSFT", "AAPL", "GOOGL", "AMZN"], "scan_concurrency": 4}
+    generator.name = "RSISignalGenerator"
+    generator.market_data = FakeMarketData()
+    generator.period = 14
+    generator.oversold_threshold = 30
+    generator.overbought_threshold = 70
+    generator.timeframe = "D"
+    generator.confidence = 0.75
+
+    signals = await generator.generate()
+
+    assert generator.market_data.peak == 4
+    assert [s.tickers[0].ticker for s in signals] == ["AAPL"]
+    assert signals[0].signal_type == SignalType.RSI_OVERSOLD